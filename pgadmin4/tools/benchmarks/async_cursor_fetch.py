@@ -0,0 +1,96 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2025, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+# This utility compares the fetch latency of the asynchronous cursor when
+# every call creates its own event loop (asyncio.run) against the
+# persistent, per-thread event loop used by the psycopg3 driver.
+#
+# Usage:
+#   python async_cursor_fetch.py --dsn "host=localhost dbname=postgres"
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+import psycopg
+
+sys.path.insert(
+    0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..',
+                    'web')
+)
+
+from pgadmin.utils.driver.psycopg3.event_loop import run_coroutine  # noqa
+
+
+async def _connect(dsn):
+    return await psycopg.AsyncConnection.connect(dsn, autocommit=True)
+
+
+async def _execute(cur, rows):
+    await cur.execute(
+        'SELECT g AS id, md5(g::text) AS val FROM generate_series(1, %s) g',
+        (rows,)
+    )
+
+
+async def _fetchwindow(cur, position, size):
+    await cur.scroll(position, mode='absolute')
+    return await cur.fetchmany(size)
+
+
+def bench(runner, dsn, rows, page_size):
+    conn = runner(_connect(dsn))
+    try:
+        cur = conn.cursor(scrollable=True)
+        runner(_execute(cur, rows))
+
+        start = time.perf_counter()
+        pages = 0
+        for position in range(0, rows, page_size):
+            runner(_fetchwindow(cur, position, page_size))
+            pages += 1
+        elapsed = time.perf_counter() - start
+        runner(cur.close())
+    finally:
+        runner(conn.close())
+
+    return elapsed, pages
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Benchmark the async cursor fetch latency.')
+    parser.add_argument('--dsn', required=True,
+                        help='libpq connection string of the test server')
+    parser.add_argument('--page-size', type=int, default=1000,
+                        help='number of rows fetched per call')
+    parser.add_argument('--rows', type=int, nargs='+',
+                        default=[1000, 100000],
+                        help='result set sizes to benchmark')
+    args = parser.parse_args()
+
+    if os.name == 'nt':
+        asyncio.set_event_loop_policy(
+            asyncio.WindowsSelectorEventLoopPolicy()
+        )
+
+    print('{0:>10} {1:>16} {2:>12} {3:>12}'.format(
+        'rows', 'runner', 'total (ms)', 'fetch (us)'))
+    for rows in args.rows:
+        for name, runner in (('asyncio.run', asyncio.run),
+                             ('persistent loop', run_coroutine)):
+            elapsed, pages = bench(runner, args.dsn, rows, args.page_size)
+            print('{0:>10} {1:>16} {2:>12.2f} {3:>12.1f}'.format(
+                rows, name, elapsed * 1000, elapsed * 1000000 / pages))
+
+
+if __name__ == '__main__':
+    main()
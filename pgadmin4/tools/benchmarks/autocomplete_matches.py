@@ -0,0 +1,111 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2025, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+# This utility measures the latency of completing the table names in the
+# Query Tool, over synthetic catalogs of growing sizes, comparing looking at
+# every table (as when the autocomplete metadata is not shared) with using
+# the index of the table names (built once per metadata refresh, its build
+# time is reported separately). No database server is needed, the names
+# are generated in memory.
+#
+# Usage:
+#   python autocomplete_matches.py --names 10000 100000 1000000
+
+import argparse
+import os
+import random
+import re
+import sys
+import time
+
+sys.path.insert(
+    0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..',
+                    'web')
+)
+
+import config  # noqa
+from pgadmin.utils.sqlautocomplete.autocomplete import SQLAutoComplete  # noqa
+from pgadmin.utils.sqlautocomplete.metadata_cache import \
+    CatalogMetadata  # noqa
+from pgadmin.utils.sqlautocomplete.prioritization import \
+    PrevalenceCounter  # noqa
+from pgadmin.utils.sqlautocomplete.sqlcompletion import Table  # noqa
+
+WORDS = ['customer', 'order', 'invoice', 'product', 'account', 'payment',
+         'shipment', 'audit', 'log', 'user', 'role', 'event', 'stock',
+         'price', 'tax', 'region', 'history', 'archive', 'line', 'item']
+TEXTS = ['SELECT * FROM c', 'SELECT * FROM cust',
+         'SELECT * FROM customer_order_', 'SELECT * FROM zzz']
+
+
+def create_completer(count, shared):
+    rand = random.Random(count)
+    completer = SQLAutoComplete.__new__(SQLAutoComplete)
+    completer.metadata = CatalogMetadata(shared=shared)
+    completer.keywords = []
+    completer.functions = []
+    completer.reserved_words = set()
+    completer.name_pattern = re.compile(r"^[_a-z][_a-z0-9\$]*$")
+    completer.prioritizer = PrevalenceCounter([])
+    completer.search_path = ['public']
+    completer.search_path_filter = True
+    completer.generate_aliases = False
+    # The metadata is already loaded.
+    completer.fetch_schema_objects = lambda schema, obj_type: None
+
+    completer.extend_schemata(['public'])
+    completer.extend_relations([
+        ('public', '{0}_{1}_{2}'.format(
+            rand.choice(WORDS), rand.choice(WORDS), idx))
+        for idx in range(count)
+    ], 'tables')
+    return completer
+
+
+def bench(completer, repeat):
+    suggestion = Table(schema=None, table_refs=(), local_tables=())
+    results = []
+    for text in TEXTS:
+        start = time.perf_counter()
+        for _ in range(repeat):
+            matches = completer.get_table_matches(suggestion, text)
+        elapsed = (time.perf_counter() - start) / repeat
+        results.append((text.split()[-1], len(matches), elapsed))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Benchmark the autocomplete of the table names.')
+    parser.add_argument('--names', type=int, nargs='+',
+                        default=[10000, 100000, 1000000],
+                        help='number of the tables in the catalog')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='number of times each text is completed')
+    args = parser.parse_args()
+
+    for count in args.names:
+        scan = create_completer(count, shared=False)
+        indexed = create_completer(count, shared=True)
+
+        start = time.perf_counter()
+        indexed._object_names('tables', 'public', '')
+        print('{0} tables, index built in {1:.1f} ms'.format(
+            count, (time.perf_counter() - start) * 1000))
+
+        for (text, found, scan_time), (_, _, index_time) in zip(
+                bench(scan, args.repeat), bench(indexed, args.repeat)):
+            print('  {0:>18} ({1:>7} matches): scan {2:9.2f} ms, '
+                  'index {3:9.2f} ms'.format(
+                      repr(text), found, scan_time * 1000,
+                      index_time * 1000))
+
+
+if __name__ == '__main__':
+    main()
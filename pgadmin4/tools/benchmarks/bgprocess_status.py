@@ -0,0 +1,146 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2025, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+# This utility compares following the logs of the running background
+# processes by polling (each open Processes panel reading the log files
+# every second, as the browser used to do), and with the ProcessWatcher (a
+# single watcher per process, pushing the new lines):
+#
+# - the CPU time used (not counting the HTTP requests of the polling),
+# - the delay between writing a log line, and sending it to the browser.
+#
+# Usage:
+#   python bgprocess_status.py --processes 10 --clients 3 --seconds 5
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+
+WEB_DIR = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), '..', '..', 'web'
+)
+sys.path.insert(0, WEB_DIR)
+
+import config  # noqa
+from pgadmin.misc.bgprocess.processes import BatchProcess, \
+    get_current_time  # noqa
+from pgadmin.misc.bgprocess.watcher import WatcherRegistry  # noqa
+
+POLL_INTERVAL = 1
+LINE_INTERVAL = 0.01
+TIME_FORMAT = '%y%m%d%H%M%S%f'
+
+
+class Delays:
+    def __init__(self):
+        self.delays = []
+        self.lock = threading.Lock()
+
+    def received(self, lines):
+        now = time.time()
+        with self.lock:
+            # The log line is the time it was written at.
+            self.delays.extend(now - float(line[1]) for line in lines)
+
+
+def write_logs(logdir, stopped):
+    with open(os.path.join(logdir, 'out'), 'a') as fp:
+        while not stopped.is_set():
+            fp.write('{0},{1}\n'.format(get_current_time(TIME_FORMAT),
+                                        time.time()))
+            fp.flush()
+            time.sleep(LINE_INTERVAL)
+
+
+def poll(logdirs, delays, stopped):
+    process = BatchProcess.__new__(BatchProcess)
+    pos = [0] * len(logdirs)
+    while not stopped.wait(POLL_INTERVAL):
+        for idx, logdir in enumerate(logdirs):
+            # Like the status request of the Processes panel.
+            lines = []
+            pos[idx], _ = process.read_log(
+                os.path.join(logdir, 'out'), lines, pos[idx],
+                get_current_time(TIME_FORMAT))
+            delays.received(lines)
+
+
+def run(logdirs, clients, seconds, watch):
+    stopped = threading.Event()
+    delays = Delays()
+    threads = [threading.Thread(target=write_logs, args=(logdir, stopped))
+               for logdir in logdirs]
+
+    if watch:
+        def emit(event, data, to):
+            if event == 'process_log':
+                delays.received(data['out']['lines'])
+
+        def start(target):
+            threads.append(threading.Thread(target=target))
+            threads[-1].start()
+
+        registry = WatcherRegistry()
+        for client in range(clients):
+            for idx, logdir in enumerate(logdirs):
+                registry.subscribe(client, idx, logdir, emit, start,
+                                   logs=True)
+    else:
+        threads.extend(
+            threading.Thread(target=poll, args=(logdirs, delays, stopped))
+            for _ in range(clients))
+
+    start_cpu = time.process_time()
+    for thread in threads:
+        if not thread.is_alive():
+            thread.start()
+    time.sleep(seconds)
+    stopped.set()
+    if watch:
+        for client in range(clients):
+            registry.unsubscribe(client)
+    for thread in threads:
+        thread.join()
+    return time.process_time() - start_cpu, delays
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Benchmark following the background process logs.')
+    parser.add_argument('--processes', type=int, default=10,
+                        help='number of the running processes')
+    parser.add_argument('--clients', type=int, default=3,
+                        help='number of the open Processes panels')
+    parser.add_argument('--seconds', type=float, default=5,
+                        help='seconds the processes run')
+    args = parser.parse_args()
+
+    print('{0} processes, {1} clients, {2} s, watch interval {3} s'.format(
+        args.processes, args.clients, args.seconds,
+        config.BGPROCESS_WATCH_INTERVAL))
+    for name, watch in (('polling', False), ('watcher', True)):
+        logdirs = [tempfile.mkdtemp() for _ in range(args.processes)]
+        try:
+            cpu, delays = run(logdirs, args.clients, args.seconds, watch)
+        finally:
+            for logdir in logdirs:
+                shutil.rmtree(logdir, ignore_errors=True)
+        print('{0:>8}: {1:.2f} s CPU, {2} lines, mean delay {3:.0f} ms, '
+              'max delay {4:.0f} ms'.format(
+                  name, cpu, len(delays.delays),
+                  sum(delays.delays) / max(len(delays.delays), 1) * 1000,
+                  max(delays.delays or [0]) * 1000))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,125 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2025, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+# This utility measures the time taken by the file manager to list a large
+# directory - using os.listdir, and os.path/os.access calls for every entry
+# (as before), using os.scandir, and the first page, and the next page
+# (from the cached listing) of it.
+#
+# Usage:
+#   python file_manager_listing.py --entries 100000 --dir /tmp/fm-bench
+
+import argparse
+import os
+import sys
+import time
+from unittest.mock import patch
+
+WEB_DIR = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), '..', '..', 'web'
+)
+sys.path.insert(0, WEB_DIR)
+
+import config  # noqa
+from pgadmin.misc.file_manager import Filemanager, is_folder_hidden, \
+    splitext, sizeof_fmt, getsize  # noqa
+from pgadmin.misc.file_manager.directory_listing import \
+    DirectoryListingCache  # noqa
+
+
+def create_entries(path, entries):
+    os.makedirs(path, exist_ok=True)
+    existing = len(os.listdir(path))
+    for i in range(existing, entries):
+        if i % 100 == 0:
+            os.mkdir(os.path.join(path, 'dir{0:06d}'.format(i)))
+        else:
+            with open(os.path.join(path, 'dump{0:06d}.sql'.format(i)), 'w'):
+                pass
+
+
+def listdir_listing(path):
+    """The listing using os.listdir, and os.path calls for every entry."""
+    files = []
+    for f in sorted(os.listdir(path)):
+        system_path = os.path.join(path, f)
+        if is_folder_hidden(system_path):
+            continue
+        created = time.ctime(os.path.getctime(system_path))
+        modified = time.ctime(os.path.getmtime(system_path))
+        file_extension = str(splitext(system_path))
+        protected = 0
+        if (not os.access(system_path, os.R_OK) or
+                not os.access(system_path, os.W_OK)):
+            protected = 1
+        if os.path.isdir(system_path):
+            file_extension = "dir"
+        elif file_extension != 'sql':
+            continue
+        files.append({
+            "Filename": f,
+            "Path": system_path,
+            "file_type": file_extension,
+            "Protected": protected,
+            "Properties": {
+                "Date Created": created,
+                "Date Modified": modified,
+                "Size": sizeof_fmt(getsize(system_path))
+            }
+        })
+    return files
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Benchmark the listing of a large directory in the file '
+                    'manager.')
+    parser.add_argument('--entries', type=int, default=100000,
+                        help='number of the files and dirs')
+    parser.add_argument('--dir', default='/tmp/pgadmin-fm-bench',
+                        help='directory to create the entries in (kept)')
+    parser.add_argument('--page-size', type=int, default=500,
+                        help='number of the files and dirs in a page')
+    args = parser.parse_args()
+
+    create_entries(args.dir, args.entries)
+    cache = DirectoryListingCache()
+
+    def page(number):
+        total, files = Filemanager.iter_files_in_path(
+            False, False, False, [], 'sql', '/', args.dir,
+            entries=cache.listing('bench', args.dir),
+            offset=number * args.page_size, limit=args.page_size
+        )
+        return total, list(files)
+
+    with patch.object(config, 'FILE_MANAGER_LISTING_CACHE_TIMEOUT', 60), \
+            patch.object(config, 'FILE_MANAGER_LISTING_CACHE_SIZE', 1):
+        results = [
+            ('listdir', timed(lambda: listdir_listing(args.dir))),
+            ('scandir', timed(lambda: Filemanager.get_files_in_path(
+                False, False, False, [], 'sql', '/', args.dir))),
+            ('first page', timed(lambda: page(0))),
+            ('next page (cached)', timed(lambda: page(1))),
+        ]
+
+    for name, (elapsed, result) in results:
+        count = len(result[1]) if isinstance(result, tuple) else len(result)
+        print('{0:>20}: {1:8.1f} ms, {2} entries'.format(
+            name, elapsed * 1000, count))
+
+
+if __name__ == '__main__':
+    main()
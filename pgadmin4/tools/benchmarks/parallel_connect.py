@@ -0,0 +1,79 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2025, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+# This utility opens many connections in parallel, and compares the total
+# time taken when every connection attempt is serialized behind a process
+# wide lock (as ConnectionLocker used to do in server mode) against the
+# shared lock used for the non Kerberos connections.
+#
+# Usage:
+#   python parallel_connect.py --dsn "host=db.example.com dbname=postgres"
+
+import argparse
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import psycopg
+
+sys.path.insert(
+    0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..',
+                    'web')
+)
+
+import config  # noqa
+from pgadmin.utils.locker import SharedExclusiveLock  # noqa
+
+
+def connect_serialized(lock, dsn):
+    with lock:
+        return psycopg.connect(dsn)
+
+
+def connect_shared(lock, dsn):
+    lock.acquire_shared()
+    try:
+        return psycopg.connect(dsn)
+    finally:
+        lock.release_shared()
+
+
+def bench(fn, lock, dsn, count):
+    with ThreadPoolExecutor(max_workers=count) as executor:
+        start = time.perf_counter()
+        conns = list(executor.map(lambda _: fn(lock, dsn), range(count)))
+        elapsed = time.perf_counter() - start
+
+    for conn in conns:
+        conn.close()
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Benchmark opening connections in parallel.')
+    parser.add_argument('--dsn', required=True,
+                        help='libpq connection string of the test server')
+    parser.add_argument('--connections', type=int, default=50,
+                        help='number of connections opened in parallel')
+    args = parser.parse_args()
+
+    for name, fn, lock in (
+        ('global lock', connect_serialized, threading.Lock()),
+        ('shared lock', connect_shared, SharedExclusiveLock()),
+    ):
+        elapsed = bench(fn, lock, args.dsn, args.connections)
+        print('{0:>12}: {1} connections in {2:.2f} ms'.format(
+            name, args.connections, elapsed * 1000))
+
+
+if __name__ == '__main__':
+    main()
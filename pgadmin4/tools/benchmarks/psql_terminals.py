@@ -0,0 +1,146 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2025, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+# This utility compares reading the output of the PSQL terminals with a
+# thread per terminal, polling it every 10 ms (as the PSQL tool used to do),
+# and with the PtyMultiplexer (a single thread for all the terminals):
+#
+# - the CPU time used while the terminals are idle,
+# - the number of the messages sent for a large output (like \copy, or a
+#   large result), and the number of them that split a UTF-8 character.
+#
+# Usage:
+#   python psql_terminals.py --terminals 50 --idle 5 --output-mb 20
+
+import argparse
+import os
+import pty
+import select
+import sys
+import threading
+import time
+
+WEB_DIR = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), '..', '..', 'web'
+)
+sys.path.insert(0, WEB_DIR)
+
+import config  # noqa
+from pgadmin.tools.psql.pty_multiplexer import PtyMultiplexer  # noqa
+
+LEGACY_MAX_READ_BYTES = 1024 * 20
+
+
+class Client:
+    def __init__(self):
+        self.messages = 0
+        self.chars = 0
+        self.split_characters = 0
+
+    def emit(self, output, ack=None):
+        self.messages += 1
+        if isinstance(output, bytes):
+            try:
+                output = output.decode()
+            except UnicodeDecodeError:
+                self.split_characters += 1
+                output = output.decode(errors='replace')
+        self.chars += len(output)
+        if ack:
+            ack()
+
+
+class LegacyReaders:
+    """A thread per terminal, polling it every 10 ms."""
+
+    def __init__(self):
+        self.stopped = threading.Event()
+        self.threads = []
+
+    def register(self, fd, emit):
+        thread = threading.Thread(target=self._run, args=(fd, emit),
+                                  daemon=True)
+        thread.start()
+        self.threads.append(thread)
+
+    def _run(self, fd, emit):
+        while not self.stopped.is_set():
+            time.sleep(0.01)
+            (data_ready, _, _) = select.select([fd], [], [], 0)
+            if fd in data_ready:
+                emit(os.read(fd, LEGACY_MAX_READ_BYTES))
+
+    def stop(self):
+        self.stopped.set()
+        for thread in self.threads:
+            thread.join()
+
+
+class Multiplexer(PtyMultiplexer):
+    def __init__(self):
+        super().__init__(
+            lambda target: threading.Thread(target=target,
+                                            daemon=True).start())
+
+    def stop(self):
+        pass
+
+
+def run(reader, terminals, idle, output_mb):
+    ptys = [pty.openpty() for _ in range(terminals)]
+    clients = [Client() for _ in range(terminals)]
+    for (parent, _), client in zip(ptys, clients):
+        reader.register(parent, client.emit)
+
+    start = time.process_time()
+    time.sleep(idle)
+    idle_cpu = time.process_time() - start
+
+    # A large output, with the multibyte characters.
+    line = 'row {0:08d} | café | 12,50 €\n'
+    output = ''.join(line.format(idx) for idx in range(1000))
+    client = clients[0]
+    expected = 0
+    start = time.perf_counter()
+    while expected < output_mb * 1024 * 1024:
+        os.write(ptys[0][1], output.encode())
+        # The terminal converts \n to \r\n.
+        expected += len(output) + output.count('\n')
+    while client.chars < expected:
+        time.sleep(0.001)
+    elapsed = time.perf_counter() - start
+
+    reader.stop()
+    return idle_cpu, elapsed, client
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Benchmark reading the output of the PSQL terminals.')
+    parser.add_argument('--terminals', type=int, default=50,
+                        help='number of the open terminals')
+    parser.add_argument('--idle', type=float, default=5,
+                        help='seconds the terminals are idle')
+    parser.add_argument('--output-mb', type=int, default=20,
+                        help='size of the large output (in MB)')
+    args = parser.parse_args()
+
+    print('{0} terminals, idle for {1} s'.format(args.terminals, args.idle))
+    for name, reader in (('polling', LegacyReaders()),
+                         ('multiplexed', Multiplexer())):
+        idle_cpu, elapsed, client = run(reader, args.terminals, args.idle,
+                                        args.output_mb)
+        print('{0:>12}: {1:6.1f}% CPU while idle, {2} MB output in '
+              '{3:.2f} s, {4} messages, {5} with split characters'.format(
+                  name, idle_cpu / args.idle * 100, args.output_mb, elapsed,
+                  client.messages, client.split_characters))
+
+
+if __name__ == '__main__':
+    main()
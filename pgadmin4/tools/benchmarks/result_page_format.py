@@ -0,0 +1,131 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2025, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+# This utility compares the time taken to encode a result page of the Query
+# Tool (as the poll, and the fetch_window requests send it), and the size of
+# the response, in the row format, and in the columnar format.
+#
+# The generated page has the columns of the values loaded as text (i.e.
+# numeric, timestamp, and the text columns, with and without many repeated
+# values), integer, boolean, and (with --typed) the columns of the values
+# converted by DataTypeJSONEncoder.default() (Decimal, date, bytes).
+#
+# Usage:
+#   python result_page_format.py --rows 10000 --columns 50
+
+import argparse
+import datetime
+import decimal
+import gzip
+import json
+import os
+import sys
+import time
+
+WEB_DIR = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), '..', '..', 'web'
+)
+sys.path.insert(0, WEB_DIR)
+
+import config  # noqa
+from pgadmin.utils.ajax import DataTypeJSONEncoder  # noqa
+from pgadmin.tools.sqleditor.utils.columnar_result import \
+    encode_columnar_result  # noqa
+
+STATUSES = ('active', 'inactive', 'pending', 'blocked')
+
+
+def column_values(col, rows, typed):
+    kind = col % (8 if typed else 5)
+    if kind == 0:
+        return [row * col for row in range(rows)]
+    if kind == 1:
+        return ['customer {0} of column {1}'.format(row, col)
+                for row in range(rows)]
+    if kind == 2:
+        return [STATUSES[(row + col) % len(STATUSES)] for row in range(rows)]
+    if kind == 3:
+        return ['{0}.{1:02d}'.format(row * col, row % 100)
+                for row in range(rows)]
+    if kind == 4:
+        return [None if row % 3 else row % 2 == 0 for row in range(rows)]
+    if kind == 5:
+        return [decimal.Decimal(row * col) / 8 for row in range(rows)]
+    if kind == 6:
+        return [datetime.date(2025, 1, 1) +
+                datetime.timedelta(days=row + col) for row in range(rows)]
+    return ['{0:08x}'.format(row * col).encode() for row in range(rows)]
+
+
+def encode_rows(rows):
+    return json.dumps({'data': {'result': rows}}, cls=DataTypeJSONEncoder,
+                      separators=(',', ':'))
+
+
+def encode_columnar(rows):
+    return json.dumps({'data': {'result': encode_columnar_result(rows),
+                                'result_format': 'columnar'}},
+                      cls=DataTypeJSONEncoder, separators=(',', ':'))
+
+
+def bench(encode, rows, repeat):
+    elapsed = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        response = encode(rows)
+        elapsed.append(time.perf_counter() - start)
+    return min(elapsed), response.encode()
+
+
+class DefaultCounter(DataTypeJSONEncoder):
+    calls = 0
+
+    def default(self, obj):
+        DefaultCounter.calls += 1
+        return super().default(obj)
+
+
+def default_calls(encode_result):
+    DefaultCounter.calls = 0
+    json.dumps(encode_result, cls=DefaultCounter)
+    return DefaultCounter.calls
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Benchmark the formats of the Query Tool result pages.')
+    parser.add_argument('--rows', type=int, default=10000,
+                        help='number of the rows of the page')
+    parser.add_argument('--columns', type=int, default=50,
+                        help='number of the columns of the page')
+    parser.add_argument('--typed', action='store_true',
+                        help='add the Decimal, date, and bytes columns')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='number of the times every format is encoded')
+    args = parser.parse_args()
+
+    columns = [column_values(col, args.rows, args.typed)
+               for col in range(args.columns)]
+    # Rows are fetched as tuples.
+    rows = list(zip(*columns))
+
+    print('{0} rows x {1} columns'.format(args.rows, args.columns))
+    for name, encode, result in (
+            ('rows', encode_rows, rows),
+            ('columnar', encode_columnar, encode_columnar_result(rows))):
+        elapsed, response = bench(encode, rows, args.repeat)
+        print('{0:>10}: {1:8.2f} ms, {2:8.1f} KiB, {3:8.1f} KiB gzipped, '
+              '{4} default() calls'.format(
+                  name, elapsed * 1000, len(response) / 1024,
+                  len(gzip.compress(response, 6)) / 1024,
+                  default_calls(result)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,101 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2025, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+# This utility simulates pasting rows into the data grid of the Query Tool,
+# and compares the time taken to save them one by one (an INSERT returning
+# the primary key, followed by a SELECT of the added row for every row) with
+# sending all the INSERT ... RETURNING * statements in a single round trip
+# using the pipeline mode, as save_changed_data does now.
+#
+# Usage:
+#   python save_changed_data.py --dsn "host=db.example.com dbname=postgres"
+
+import argparse
+import time
+
+import psycopg
+from psycopg.rows import dict_row
+
+CREATE_SQL = 'CREATE TEMPORARY TABLE bench_save_data (' \
+    'id integer PRIMARY KEY, name text, amount numeric, ' \
+    'created timestamptz DEFAULT now())'
+INSERT_SQL = 'INSERT INTO bench_save_data (id, name, amount) ' \
+    'VALUES (%(id)s::integer, %(name)s::text, %(amount)s::numeric)'
+SELECT_SQL = 'SELECT * FROM bench_save_data WHERE id = %(id)s'
+
+
+def pasted_rows(count):
+    return [
+        {'id': idx, 'name': 'row {0}'.format(idx), 'amount': str(idx * 1.5)}
+        for idx in range(count)
+    ]
+
+
+def save_row_by_row(conn, rows):
+    added = []
+    with conn.cursor(row_factory=dict_row) as cur:
+        for row in rows:
+            cur.execute(INSERT_SQL + ' RETURNING id', row)
+            cur.execute(SELECT_SQL, cur.fetchone())
+            added.append(cur.fetchone())
+    return added
+
+
+def save_pipelined(conn, rows):
+    cursors = []
+    with conn.pipeline():
+        for row in rows:
+            cur = psycopg.Cursor(conn, row_factory=dict_row)
+            cur.execute(INSERT_SQL + ' RETURNING *', row)
+            cursors.append(cur)
+
+    added = []
+    for cur in cursors:
+        added.append(cur.fetchone())
+        cur.close()
+    return added
+
+
+def bench(conn, fn, rows):
+    conn.execute('BEGIN')
+    conn.execute(CREATE_SQL)
+    start = time.perf_counter()
+    added = fn(conn, rows)
+    elapsed = time.perf_counter() - start
+    conn.execute('ROLLBACK')
+
+    assert len(added) == len(rows)
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Benchmark saving the rows pasted in the data grid.')
+    parser.add_argument('--dsn', required=True,
+                        help='libpq connection string of the test server')
+    parser.add_argument('--rows', type=int, default=10000,
+                        help='number of the pasted rows')
+    args = parser.parse_args()
+
+    if not psycopg.Pipeline.is_supported():
+        parser.error('pipeline mode requires libpq 14, or later')
+
+    rows = pasted_rows(args.rows)
+    with psycopg.connect(args.dsn, autocommit=True) as conn:
+        for name, fn in (
+            ('row by row', save_row_by_row),
+            ('pipelined', save_pipelined),
+        ):
+            elapsed = bench(conn, fn, rows)
+            print('{0:>12}: {1} rows in {2:.2f} ms ({3:.0f} rows/s)'.format(
+                name, args.rows, elapsed * 1000, args.rows / elapsed))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,90 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2025, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+# This utility measures the time taken to build the in-process search index
+# of the Search Objects tool (SEARCH_OBJECTS_INDEX) for a database with a
+# large number of objects, and to search it (contains, prefix, and similar
+# names), returning the first page of the ranked objects.
+#
+# Usage:
+#   python search_objects_index.py --objects 500000 --page-size 50
+
+import argparse
+import os
+import random
+import sys
+import time
+
+WEB_DIR = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), '..', '..', 'web'
+)
+sys.path.insert(0, WEB_DIR)
+
+import config  # noqa
+from pgadmin.tools.search_objects.search_index import SearchIndex  # noqa
+
+WORDS = ['customer', 'order', 'invoice', 'payment', 'product', 'stock',
+         'employee', 'account', 'audit', 'event', 'session', 'address']
+TYPES = ['table', 'column', 'index', 'function', 'view', 'sequence']
+
+
+def make_rows(objects):
+    rnd = random.Random(0)
+    rows = []
+    for i in range(objects):
+        obj_type = TYPES[i % len(TYPES)]
+        name = '{0}_{1}_{2}'.format(
+            rnd.choice(WORDS), rnd.choice(WORDS), i)
+        rows.append(dict(
+            name=name, type=obj_type, type_label=obj_type,
+            path=':schema.2200:/public/:{0}.{1}:/{2}'.format(
+                obj_type, i, name),
+            show_node=True, other_info=None, catalog_level='N'
+        ))
+    rows.sort(key=lambda row: (row['type'], row['name'], row['path']))
+    return rows
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Benchmark the search index of the Search Objects tool.')
+    parser.add_argument('--objects', type=int, default=500000,
+                        help='number of the objects in the database')
+    parser.add_argument('--page-size', type=int, default=50,
+                        help='number of the objects in a page')
+    args = parser.parse_args()
+
+    rows = make_rows(args.objects)
+    elapsed, index = timed(lambda: SearchIndex(rows))
+    print('{0:>28}: {1:8.1f} ms, {2} objects'.format(
+        'build', elapsed * 1000, len(index)))
+
+    for name, text, obj_types, match in (
+        ('contains', 'voice_pay', None, 'contains'),
+        ('contains (tables)', 'voice_pay', ['table'], 'contains'),
+        ('contains (wildcard)', 'inv%pay', None, 'contains'),
+        ('prefix', 'audit_ev', None, 'prefix'),
+        ('similar (first, builds)', 'paymnt_adress', None, 'similar'),
+        ('similar', 'custmer_ordr', None, 'similar'),
+    ):
+        elapsed, result = timed(lambda: index.search(
+            text, obj_types, match, ranked=True)[:args.page_size])
+        total = len(index.search(text, obj_types, match))
+        print('{0:>28}: {1:8.1f} ms, {2} matches'.format(
+            name, elapsed * 1000, total))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,135 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2025, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+# This utility measures the latency of reading a session, and writing it
+# back after updating the transaction of a single Query Tool tab (as the
+# poll requests do), for a growing number of open tabs. It compares the
+# file backed session manager with the key-value session manager using the
+# directory and the memory stores.
+#
+# Usage:
+#   python session_store.py --path /dev/shm/pgadmin_bench
+
+import argparse
+import os
+import secrets
+import shutil
+import sys
+import tempfile
+import time
+
+from flask import Flask
+
+sys.path.insert(
+    0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..',
+                    'web')
+)
+
+import config  # noqa
+from pgadmin.utils.session import DirectorySessionStore, \
+    FileBackedSessionManager, KeyValueSessionManager, \
+    MemorySessionStore  # noqa
+
+
+MANAGERS = (
+    ('file', lambda path: FileBackedSessionManager(
+        os.path.join(path, 'file'), 'secret', 0)),
+    ('directory', lambda path: KeyValueSessionManager(
+        DirectorySessionStore(os.path.join(path, 'directory')),
+        'secret', 0)),
+    ('memory', lambda path: KeyValueSessionManager(
+        MemorySessionStore(), 'secret', 0)),
+)
+
+
+def track_written(manager):
+    """
+    Count the bytes written to the storage by the session manager.
+    """
+    written = [0]
+    if isinstance(manager, KeyValueSessionManager):
+        update = manager.store.update
+
+        def tracked_update(sid, changed, removed):
+            written[0] += sum(len(value) for value in changed.values())
+            return update(sid, changed, removed)
+
+        manager.store.update = tracked_update
+    else:
+        put = manager.put
+
+        def tracked_put(session):
+            put(session)
+            written[0] += os.path.getsize(
+                os.path.join(manager.path, session.sid))
+
+        manager.put = tracked_put
+    return written
+
+
+def bench(manager, tabs, command_size, repeat):
+    session = manager.new_session()
+    session['_user_id'] = 1
+    session['gridData'] = dict(
+        (str(tab), {'command_obj': secrets.token_bytes(command_size)})
+        for tab in range(tabs)
+    )
+    manager.put(session)
+
+    written = track_written(manager)
+    read_time = write_time = 0
+    for idx in range(repeat):
+        start = time.perf_counter()
+        session = manager.get(session.sid, session.hmac_digest)
+        read_time += time.perf_counter() - start
+
+        session['gridData'][str(idx % tabs)] = {
+            'command_obj': secrets.token_bytes(command_size)
+        }
+        start = time.perf_counter()
+        manager.put(session)
+        write_time += time.perf_counter() - start
+
+    manager.remove(session.sid)
+    return read_time / repeat, write_time / repeat, written[0] / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Benchmark the session read/write latency.')
+    parser.add_argument('--path', default=None,
+                        help='directory to store the sessions in')
+    parser.add_argument('--tabs', type=int, nargs='+',
+                        default=[1, 10, 50, 100],
+                        help='number of the open Query Tool tabs')
+    parser.add_argument('--command-size', type=int, default=20000,
+                        help='size of the pickled transaction object')
+    parser.add_argument('--repeat', type=int, default=50,
+                        help='number of the read/write cycles')
+    args = parser.parse_args()
+
+    path = tempfile.mkdtemp(dir=args.path)
+    app = Flask(__name__)
+    try:
+        with app.test_request_context('/sqleditor/poll'):
+            for name, create_manager in MANAGERS:
+                for tabs in args.tabs:
+                    read_time, write_time, written = bench(
+                        create_manager(path), tabs, args.command_size,
+                        args.repeat)
+                    print('{0:>10} {1:>4} tabs: read {2:.3f} ms, '
+                          'write {3:.3f} ms ({4:.0f} kB)'.format(
+                              name, tabs, read_time * 1000,
+                              write_time * 1000, written / 1000))
+    finally:
+        shutil.rmtree(path, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
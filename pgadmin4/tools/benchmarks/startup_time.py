@@ -0,0 +1,91 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2025, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+# This utility measures the startup time of pgAdmin (like a new worker
+# process of the WSGI server), with the URL builders of the routes compiled
+# at startup, and on demand (LAZY_URL_BUILDERS). Every run uses a new python
+# process.
+#
+# Usage:
+#   python startup_time.py --runs 5 --data-dir /tmp/pgadmin-bench --desktop
+#
+# In server mode, the configuration database must have been set up, i.e.
+# python setup.py setup-db.
+
+import argparse
+import os
+import statistics
+import sys
+
+WEB_DIR = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), '..', '..', 'web'
+)
+sys.path.insert(0, WEB_DIR)
+
+import config  # noqa
+from pgadmin.utils.startup_profile import run_startup  # noqa
+
+
+def data_dir_settings(data_dir):
+    """Store the configuration database, sessions, and logs in data_dir."""
+    os.makedirs(data_dir, exist_ok=True)
+    return {
+        'DATA_DIR': data_dir,
+        'SQLITE_PATH': os.path.join(data_dir, 'pgadmin4.db'),
+        'SESSION_DB_PATH': os.path.join(data_dir, 'sessions'),
+        'STORAGE_DIR': os.path.join(data_dir, 'storage'),
+        'LOG_FILE': os.path.join(data_dir, 'pgadmin4.log'),
+        'AZURE_CREDENTIAL_CACHE_DIR': os.path.join(
+            data_dir, 'azurecredentialcache'),
+        'KERBEROS_CCACHE_DIR': os.path.join(data_dir, 'krbccache'),
+    }
+
+
+def bench(runs, settings):
+    results = [run_startup(config.APP_NAME, settings)[0]
+               for _ in range(runs)]
+    return dict(
+        (name, [result[name] for result in results])
+        for name in ('import', 'create_app', 'total')
+    ), results[-1]
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Benchmark the startup time of pgAdmin.')
+    parser.add_argument('--runs', type=int, default=5,
+                        help='number of processes started for every mode')
+    parser.add_argument('--data-dir', default=None,
+                        help='directory of the configuration database, '
+                             'sessions, and logs (default: as configured)')
+    parser.add_argument('--desktop', action='store_true',
+                        help='start in desktop mode (SERVER_MODE = False)')
+    args = parser.parse_args()
+
+    settings = data_dir_settings(args.data_dir) if args.data_dir else dict()
+    if args.desktop:
+        settings['SERVER_MODE'] = False
+    # Create the configuration database (when required), before measuring.
+    run_startup(config.APP_NAME, settings)
+
+    for name, lazy in (('eager', False), ('lazy', True)):
+        timings, last = bench(
+            args.runs, dict(settings, LAZY_URL_BUILDERS=lazy)
+        )
+        print('{0:>5}: {1}, {2} blueprints, {3} routes'.format(
+            name, ', '.join(
+                '{0} {1:.3f}s (min {2:.3f}s)'.format(
+                    timing, statistics.mean(values), min(values))
+                for timing, values in timings.items()
+            ), last['blueprints'], last['rules']
+        ))
+
+
+if __name__ == '__main__':
+    main()
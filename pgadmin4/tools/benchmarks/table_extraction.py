@@ -0,0 +1,245 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2025, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+# This utility generates a schema with many tables (with the columns, the
+# primary, unique and foreign keys, check constraints, indexes, triggers,
+# rules, and policies) on the test server, and compares the number of the
+# round trips, the queries, and the time taken by BaseTableView.fetch_tables
+# (used by Schema Diff, and the ERD tool) to fetch all the tables, one after
+# another, and in batches (TABLES_BATCH_FETCH_SIZE).
+#
+# Usage:
+#   python table_extraction.py --dsn "host=db.example.com dbname=postgres \
+#       user=postgres password=secret" --tables 2000
+#
+# The schema (bench_table_extraction) is dropped at the end, and the
+# configuration database of pgAdmin is created in --data-dir.
+
+import argparse
+import functools
+import json
+import os
+import sys
+import time
+
+import psycopg
+from psycopg.conninfo import conninfo_to_dict
+
+WEB_DIR = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), '..', '..', 'web'
+)
+sys.path.insert(0, WEB_DIR)
+
+import config  # noqa
+
+SCHEMA = 'bench_table_extraction'
+
+
+def create_schema(dsn, tables, columns):
+    statements = [
+        'DROP SCHEMA IF EXISTS {0} CASCADE'.format(SCHEMA),
+        'CREATE SCHEMA {0}'.format(SCHEMA),
+        'CREATE FUNCTION {0}.touch() RETURNS trigger LANGUAGE plpgsql AS '
+        '$$BEGIN RETURN NEW; END$$'.format(SCHEMA),
+    ]
+    for idx in range(tables):
+        table = '{0}.t{1}'.format(SCHEMA, idx)
+        cols = ['id serial PRIMARY KEY', 'code text UNIQUE',
+                'amount numeric CHECK (amount >= 0)']
+        cols.extend('c{0} varchar(32)'.format(col)
+                    for col in range(max(columns - 3, 0)))
+        if idx > 0:
+            cols.append('parent_id integer REFERENCES {0}.t{1} (id)'.format(
+                SCHEMA, idx - 1))
+
+        statements.extend([
+            'CREATE TABLE {0} ({1})'.format(table, ', '.join(cols)),
+            'CREATE INDEX ON {0} (amount)'.format(table),
+            'CREATE TRIGGER t{0}_touch BEFORE UPDATE ON {1} FOR EACH ROW '
+            'EXECUTE FUNCTION {2}.touch()'.format(idx, table, SCHEMA),
+        ])
+        if idx % 10 == 0:
+            statements.extend([
+                'CREATE RULE t{0}_nodelete AS ON DELETE TO {1} DO INSTEAD '
+                'NOTHING'.format(idx, table),
+                'ALTER TABLE {0} ENABLE ROW LEVEL SECURITY'.format(table),
+                'CREATE POLICY t{0}_positive ON {1} USING (amount > 0)'
+                .format(idx, table),
+            ])
+
+    with psycopg.connect(dsn, autocommit=True) as conn:
+        with conn.transaction():
+            for statement in statements:
+                conn.execute(statement)
+        conn.execute('ANALYZE')
+        did = conn.execute(
+            'SELECT oid FROM pg_catalog.pg_database '
+            'WHERE datname = current_database()').fetchone()[0]
+        scid = conn.execute(
+            'SELECT oid FROM pg_catalog.pg_namespace WHERE nspname = %s',
+            (SCHEMA,)).fetchone()[0]
+    return did, scid
+
+
+def drop_schema(dsn):
+    with psycopg.connect(dsn, autocommit=True) as conn:
+        conn.execute('DROP SCHEMA IF EXISTS {0} CASCADE'.format(SCHEMA))
+
+
+def create_app(data_dir):
+    os.makedirs(data_dir, exist_ok=True)
+    config.SERVER_MODE = False
+    config.MASTER_PASSWORD_REQUIRED = False
+    config.USE_OS_SECRET_STORAGE = False
+    config.DATA_DIR = data_dir
+    config.SQLITE_PATH = os.path.join(data_dir, 'pgadmin4.db')
+    config.SESSION_DB_PATH = os.path.join(data_dir, 'sessions')
+    config.STORAGE_DIR = os.path.join(data_dir, 'storage')
+    config.LOG_FILE = os.path.join(data_dir, 'pgadmin4.log')
+    config.AZURE_CREDENTIAL_CACHE_DIR = os.path.join(
+        data_dir, 'azurecredentialcache')
+    config.KERBEROS_CCACHE_DIR = os.path.join(data_dir, 'krbccache')
+
+    from pgadmin import create_app as create_pgadmin_app
+    return create_pgadmin_app()
+
+
+def add_server(dsn):
+    from pgadmin.model import db, Server, ServerGroup, User
+
+    params = conninfo_to_dict(dsn)
+    user = User.query.filter_by(email=config.DESKTOP_USER).first()
+    group = ServerGroup.query.filter_by(user_id=user.id).first()
+    server = Server(
+        user_id=user.id, servergroup_id=group.id, name='bench',
+        host=params.get('host', 'localhost'),
+        port=int(params.get('port', 5432)),
+        maintenance_db=params.get('dbname', 'postgres'),
+        username=params.get('user', os.environ.get('PGUSER', 'postgres')),
+        save_password=0, use_ssh_tunnel=0, tunnel_authentication=0,
+        connection_params={'sslmode': params.get('sslmode', 'prefer')}
+    )
+    db.session.add(server)
+    db.session.commit()
+    return user, server.id, params.get('password')
+
+
+class QueryCounter():
+    """
+    Counts the round trips, and the queries run by the pgAdmin connections.
+    """
+
+    def __init__(self):
+        from pgadmin.utils.driver.psycopg3.connection import Connection
+
+        self.round_trips = 0
+        self.queries = 0
+        self.patched = []
+        self._patch(Connection, '_Connection__internal_blocking_execute',
+                    lambda args: 1)
+        self._patch(Connection, 'execute_pipeline',
+                    lambda args: len(args[0]))
+
+    def _patch(self, cls, name, queries):
+        func = getattr(cls, name)
+
+        @functools.wraps(func)
+        def wrap(conn, *args, **kwargs):
+            self.round_trips += 1
+            self.queries += queries(args)
+            return func(conn, *args, **kwargs)
+
+        setattr(cls, name, wrap)
+        self.patched.append((cls, name, func))
+
+    def reset(self):
+        self.round_trips = self.queries = 0
+
+    def restore(self):
+        for cls, name, func in self.patched:
+            setattr(cls, name, func)
+
+
+def bench(view, counter, sid, did, scid, batch_size):
+    config.TABLES_BATCH_FETCH_SIZE = batch_size
+    counter.reset()
+    start = time.perf_counter()
+    tables = view.fetch_tables(sid=sid, did=did, scid=scid,
+                               with_serial_cols=True)
+    elapsed = time.perf_counter() - start
+    return elapsed, counter.round_trips, counter.queries, tables
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Benchmark fetching all the tables of a schema.')
+    parser.add_argument('--dsn', required=True,
+                        help='libpq connection string of the test server')
+    parser.add_argument('--tables', type=int, default=2000,
+                        help='number of the tables in the schema')
+    parser.add_argument('--columns', type=int, default=8,
+                        help='number of the columns of every table')
+    parser.add_argument('--batch-size', type=int, default=1000,
+                        help='maximum number of the queries per round trip')
+    parser.add_argument('--data-dir', default='/tmp/pgadmin-bench',
+                        help='directory of the configuration database')
+    args = parser.parse_args()
+
+    if not psycopg.Pipeline.is_supported():
+        parser.error('pipeline mode requires libpq 14, or later')
+
+    did, scid = create_schema(args.dsn, args.tables, args.columns)
+    app = create_app(args.data_dir)
+
+    try:
+        with app.test_request_context():
+            from flask_security import login_user
+            from pgadmin.utils.driver import get_driver
+            from pgadmin.tools.schema_diff.node_registry import \
+                SchemaDiffRegistry
+
+            user, sid, password = add_server(args.dsn)
+            login_user(user)
+
+            manager = get_driver(config.PG_DEFAULT_DRIVER).\
+                connection_manager(sid)
+            # The maintenance database first, to find the database.
+            for conn_did in (None, did):
+                conn = manager.connection(did=conn_did)
+                status, errmsg = conn.connect(user=manager.user,
+                                              password=password)
+                if not status:
+                    parser.error(errmsg)
+
+            view = SchemaDiffRegistry.get_node_view('table')
+            counter = QueryCounter()
+            try:
+                results = dict()
+                for name, batch_size in (('one by one', 0),
+                                         ('batched', args.batch_size)):
+                    elapsed, round_trips, queries, tables = bench(
+                        view, counter, sid, did, scid, batch_size)
+                    results[name] = json.dumps(tables, sort_keys=True,
+                                               default=str)
+                    print('{0:>12}: {1} tables in {2:.2f} ms, {3} round '
+                          'trips, {4} queries'.format(
+                              name, len(tables), elapsed * 1000,
+                              round_trips, queries))
+            finally:
+                counter.restore()
+
+            print('{0:>12}: {1}'.format(
+                'same tables',
+                results['one by one'] == results['batched']))
+    finally:
+        drop_schema(args.dsn)
+
+
+if __name__ == '__main__':
+    main()
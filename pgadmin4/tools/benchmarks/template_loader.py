@@ -0,0 +1,100 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2025, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+# This utility measures the time taken by VersionedTemplateLoader to load
+# the versioned templates of the object explorer nodes, with and without
+# reusing the resolved template path and loader. Every node module is
+# registered as a blueprint with its own template folder, like in pgAdmin.
+#
+# Usage:
+#   python template_loader.py --version 160000
+
+import argparse
+import os
+import sys
+import time
+
+from flask import Blueprint, Flask
+from jinja2 import TemplateNotFound
+
+WEB_DIR = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), '..', '..', 'web'
+)
+sys.path.insert(0, WEB_DIR)
+
+import config  # noqa
+from pgadmin.utils.versioned_template_loader import \
+    VersionedTemplateLoader, get_version_mapping_directories  # noqa
+
+VERSION_DIRS = set(
+    mapping['name'] for mapping in get_version_mapping_directories()
+)
+
+
+def create_app():
+    app = Flask(__name__)
+    templates = set()
+    browser_dir = os.path.join(WEB_DIR, 'pgadmin', 'browser')
+
+    for root, dirs, _ in os.walk(browser_dir):
+        if os.path.basename(root) != 'templates':
+            continue
+        dirs[:] = []
+
+        app.register_blueprint(Blueprint(
+            'bp_{0}'.format(len(app.blueprints)), __name__,
+            template_folder=root
+        ))
+
+        for tmpl_root, _, files in os.walk(root):
+            parts = os.path.relpath(tmpl_root, root).split(os.sep)
+            if parts[-1] not in VERSION_DIRS:
+                continue
+            for file_name in files:
+                templates.add('/'.join(parts[:-1] + ['#{0}#', file_name]))
+
+    return app, sorted(templates)
+
+
+def bench(loader, templates, version, repeat, cached):
+    environment = loader.app.jinja_env
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for template in templates:
+            if not cached:
+                loader.clear_cache()
+            try:
+                loader.get_source(environment, template.format(version))
+            except TemplateNotFound:
+                # Only exists for the higher server versions.
+                pass
+    return (time.perf_counter() - start) / (repeat * len(templates))
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Benchmark the loading of the versioned templates.')
+    parser.add_argument('--version', type=int, default=160000,
+                        help='server version number')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='number of times every template is loaded')
+    args = parser.parse_args()
+
+    app, templates = create_app()
+    loader = VersionedTemplateLoader(app)
+    print('{0} blueprints, {1} versioned templates'.format(
+        len(app.blueprints), len(templates)))
+
+    for name, cached in (('uncached', False), ('cached', True)):
+        elapsed = bench(loader, templates, args.version, args.repeat, cached)
+        print('{0:>10}: {1:.1f} us per template'.format(name, elapsed * 1e6))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,118 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2025, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+# This utility measures the decode throughput of the text loaders used for
+# the results of the Query Tool (text, numeric, bigint, timestamp,
+# interval, bytea and json values are all loaded as text), for a UTF-8 and
+# a SQL_ASCII connection. The loader resolving the encoding of the
+# connection for every value (as TextLoaderpgAdmin used to do) is compared
+# with the loader chosen once per result.
+#
+# Usage:
+#   python text_loaders.py --values 1000000
+
+import argparse
+import os
+import sys
+import time
+from types import SimpleNamespace
+
+WEB_DIR = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), '..', '..', 'web'
+)
+sys.path.insert(0, WEB_DIR)
+
+import config  # noqa
+from psycopg.types.string import TextLoader  # noqa
+from pgadmin.utils.driver.psycopg3.encoding import get_encoding  # noqa
+from pgadmin.utils.driver.psycopg3.typecast import TextLoaderpgAdmin  # noqa
+
+FAMILIES = {
+    'text': 'customer name {0}',
+    'numeric': '{0}.125',
+    'bigint': '9007199254{0}',
+    'timestamp': '2025-01-01 12:34:56.{0:06d}+05:30',
+    'interval': '{0} days 01:02:03',
+    'bytea': '\\x' + '{0:08x}' * 8,
+    'json': '{{"id": {0}, "name": "customer", "tags": ["a", "b"]}}',
+}
+
+ENCODINGS = {
+    'UTF-8': 'utf-8',
+    'SQL_ASCII': 'raw-unicode-escape',
+}
+
+
+class LegacyTextLoader(TextLoader):
+    """The loader resolving the encoding of the connection for every
+    value."""
+
+    def load(self, data):
+        postgres_encoding, python_encoding = get_encoding(
+            self.connection.info.encoding)
+        if postgres_encoding not in ['SQLASCII', 'SQL_ASCII']:
+            if isinstance(data, memoryview):
+                return bytes(data).decode(self._encoding, errors='replace')
+            else:
+                return data.decode(self._encoding, errors='replace')
+        else:
+            try:
+                if isinstance(data, memoryview):
+                    return bytes(data).decode(python_encoding)
+                return data.decode(python_encoding)
+            except Exception:
+                if isinstance(data, memoryview):
+                    return bytes(data).decode('UTF-8')
+                return data.decode('UTF-8')
+
+
+def make_context(encoding):
+    connection = SimpleNamespace(
+        info=SimpleNamespace(encoding=encoding),
+        pgconn=SimpleNamespace(_encoding=encoding)
+    )
+    return SimpleNamespace(connection=connection)
+
+
+def bench(loader_class, context, values):
+    start = time.perf_counter()
+    # psycopg creates the loaders once per result.
+    load = loader_class(25, context).load
+    for value in values:
+        load(value)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Benchmark the text loaders of the query results.')
+    parser.add_argument('--values', type=int, default=1000000,
+                        help='number of the values decoded per type')
+    args = parser.parse_args()
+
+    for encoding_name, encoding in ENCODINGS.items():
+        context = make_context(encoding)
+        print('{0} ({1})'.format(
+            encoding_name, type(TextLoaderpgAdmin(25, context)).__name__))
+
+        for family, template in FAMILIES.items():
+            values = [
+                memoryview(template.format(idx).encode())
+                for idx in range(args.values)
+            ]
+            legacy = bench(LegacyTextLoader, context, values)
+            current = bench(TextLoaderpgAdmin, context, values)
+            print('{0:>12}: {1:7.2f} M values/s per value encoding, '
+                  '{2:7.2f} M values/s per result encoding ({3:.1f}x)'.format(
+                      family, args.values / legacy / 1e6,
+                      args.values / current / 1e6, legacy / current))
+
+
+if __name__ == '__main__':
+    main()
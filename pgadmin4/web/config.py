@@ -300,6 +300,28 @@ PG_DEFAULT_DRIVER = 'psycopg3'
 # for the particular session. (in minutes)
 MAX_SESSION_IDLE_TIME = 60
 
+# Share the database connections used by the object browser (and the other
+# non-transactional metadata requests) between the sessions connected to the
+# same server with the same credentials (host, port, database, user, role and
+# password). A session borrows a connection from the pool for the duration of
+# a request only. The Query Tool, the View/Edit Data, the debugger and the
+# other tools always use connections of their own. The connections using
+# Kerberos authentication, or an SSH tunnel are never shared.
+BROWSER_CONNECTION_POOL = False
+
+# Maximum number of the connections opened by the pool for the same
+# credentials. A request waits for a connection to be returned to the pool,
+# once the limit is reached.
+BROWSER_CONNECTION_POOL_MAX_SIZE = 5
+
+# Idle connections (not borrowed by any request) are closed after this many
+# seconds.
+BROWSER_CONNECTION_POOL_IDLE_TIMEOUT = 300
+
+# Maximum time (in seconds) a request waits for a connection from the pool,
+# before failing.
+BROWSER_CONNECTION_POOL_WAIT_TIMEOUT = 10
+
 ##########################################################################
 # External Database Settings
 #
@@ -340,6 +362,15 @@ ALLOW_SAVE_PASSWORD = True
 # Maximum number of history queries stored per user/server/database
 MAX_QUERY_HIST_STORED = 20
 
+# Number of seconds the new history queries are buffered in memory, before
+# they are written to the configuration database in a batch (by a background
+# thread). The position in the history is read in the transaction writing
+# the batch, so the processes serving pgAdmin do not overwrite the entries of
+# each other, and a batch failed to be written is kept for the next one.
+# The buffered entries are lost if the process is killed. Set it to 0 to
+# write every history query right away.
+QUERY_HISTORY_FLUSH_INTERVAL = 1
+
 ##########################################################################
 # Server-side session storage path
 #
@@ -362,6 +393,32 @@ MAX_QUERY_HIST_STORED = 20
 ##########################################################################
 SESSION_DB_PATH = os.path.join(DATA_DIR, 'sessions')
 
+##########################################################################
+# Server-side session store
+##########################################################################
+#
+# SESSION_STORE_TYPE selects how the sessions are stored:
+#   'file'      - Every session is pickled as a whole in a file under the
+#                 SESSION_DB_PATH directory on every write.
+#   'directory' - Every key of a session (and, every Query Tool transaction)
+#                 is stored in a separate file under SESSION_STORE_PATH
+#                 (Default: <SESSION_DB_PATH>/store), and only the changed
+#                 ones are written. Use a shared memory (tmpfs) directory
+#                 for the best performance with multiple worker processes.
+#   'redis'     - Same as 'directory', but the sessions are stored in the
+#                 Redis (or a compatible) server at SESSION_STORE_REDIS_URL.
+#                 Requires the 'redis' package, which is not installed with
+#                 pgAdmin - install it in the pgAdmin environment using
+#                 'pip install redis'.
+#   'memory'    - Same as 'directory', but the sessions are kept in the
+#                 memory of the process. Use it only when pgAdmin is served
+#                 by a single process.
+#
+##########################################################################
+SESSION_STORE_TYPE = 'file'
+SESSION_STORE_PATH = None
+SESSION_STORE_REDIS_URL = 'redis://localhost:6379/0'
+
 SESSION_COOKIE_NAME = 'pga4_session'
 
 ##########################################################################
@@ -438,6 +495,20 @@ CHECK_SUPPORTED_BROWSER = True
 ##########################################################################
 STORAGE_DIR = os.path.join(DATA_DIR, 'storage')
 
+##########################################################################
+# Number of seconds the file manager dialog keeps the listing of a directory
+# (to page, and sort it), 0 disables the cache. The listing is read again
+# as soon as the modification time of the directory changes, i.e. a file is
+# added, deleted, or renamed in it.
+##########################################################################
+FILE_MANAGER_LISTING_CACHE_TIMEOUT = 30
+
+##########################################################################
+# Maximum number of the directory listings cached by the file manager
+# dialogs (of all the users).
+##########################################################################
+FILE_MANAGER_LISTING_CACHE_SIZE = 16
+
 ##########################################################################
 # Default locations for binary utilities (pg_dump, pg_restore etc)
 #
@@ -516,6 +587,146 @@ SQLALCHEMY_TRACK_MODIFICATIONS = False
 ##########################################################################
 DATA_RESULT_ROWS_PER_PAGE = 1000
 
+##########################################################################
+# Keep the result set of the query tool in a server side (named) cursor,
+# and fetch the rows on demand instead of loading the complete result set
+# in pgAdmin's memory. It is used only for the queries with a single SELECT
+# statement.
+# QUERY_TOOL_SERVER_CURSOR_READ_AHEAD is the maximum number of extra rows
+# fetched (and, buffered) with every page of the result set.
+##########################################################################
+QUERY_TOOL_SERVER_CURSOR = False
+QUERY_TOOL_SERVER_CURSOR_READ_AHEAD = 1000
+
+##########################################################################
+# Send all the changes of the data grid to the database server in a single
+# round trip (using the pipeline mode of libpq) when saving them. When a
+# change fails, it is rolled back, and the changes are saved again one by
+# one to report the failing row.
+##########################################################################
+QUERY_TOOL_SAVE_PIPELINE = True
+
+##########################################################################
+# Maximum number of users, whose preference values are cached in memory
+# across the requests. Set it to 0 to load them from the configuration
+# database once for every request.
+#
+# The cache of a process is only invalidated when the preferences are saved
+# by that process. The preferences saved by another process (i.e. another
+# worker serving pgAdmin, or 'setup.py set-prefs') are seen after at most
+# PREFERENCES_CACHE_TTL seconds. Set it to 0 to cache them until saved,
+# when pgAdmin is served by a single process.
+##########################################################################
+PREFERENCES_CACHE_SIZE = 256
+PREFERENCES_CACHE_TTL = 5
+
+##########################################################################
+# Maximum number of the registered servers, known to exist, cached in memory
+# across the requests (to look up the connection manager of a server without
+# querying the configuration database). Set it to 0 to query it every time.
+##########################################################################
+SERVER_CACHE_SIZE = 1024
+
+##########################################################################
+# Compile the URL builder of a route (used by url_for) only when it is first
+# used, instead of compiling the builders of all the routes at startup. This
+# reduces the startup time of the application (and, of every worker
+# process) significantly. Only the building of the URLs is affected, not the
+# matching of the requests.
+##########################################################################
+LAZY_URL_BUILDERS = True
+
+##########################################################################
+# Fetch the counts of the collection nodes (used to hide the empty
+# collections in the object explorer) of a parent node using a single query
+# instead of one query for each collection.
+##########################################################################
+BROWSER_BATCH_COLLECTION_COUNTS = True
+
+##########################################################################
+# Search the objects of a database (in the Search Objects dialog) using an
+# index of the names, types and paths of the objects kept in the memory of
+# the pgAdmin process, instead of querying all the catalogs on every search.
+# The index is built when a database is first searched, and the objects of
+# the changed catalogs are fetched again when the statistics of the catalogs
+# (track_counts) show a change. The live query is used when the statistics
+# are not collected, or the index is being built by another request.
+##########################################################################
+SEARCH_OBJECTS_INDEX = False
+
+##########################################################################
+# Number of the databases indexed by every pgAdmin process, and the minimum
+# number of seconds between the checks of the statistics of the catalogs of
+# an indexed database. A change is seen once it is reported to the
+# statistics by the server, i.e. within a few seconds. Until then, the
+# search results may be stale - miss a new object, or show a dropped or
+# renamed one (only a search matching nothing is checked using the live
+# query). An index is rebuilt from scratch after SEARCH_OBJECTS_INDEX_MAX_AGE
+# seconds.
+##########################################################################
+SEARCH_OBJECTS_INDEX_SIZE = 8
+SEARCH_OBJECTS_INDEX_CHECK_INTERVAL = 2
+SEARCH_OBJECTS_INDEX_MAX_AGE = 3600
+
+##########################################################################
+# Maximum number of the objects types, Schema Diff compares at the same
+# time. Every worker uses its own connection to the source and the target
+# database, hence this is also the maximum number of the additional
+# connections opened on each server during the comparison. Set it to 1 to
+# compare the objects one after another using the existing connections.
+##########################################################################
+SCHEMA_DIFF_MAX_WORKERS = 4
+
+##########################################################################
+# Schema Diff and the ERD tool fetch the details of all the tables of a
+# schema at once. The catalog queries of all the tables are sent to the
+# database server together using the pipeline mode (of libpq 14, or later),
+# at most TABLES_BATCH_FETCH_SIZE queries per round trip, instead of a round
+# trip per query. Set it to 0 to fetch the tables one after another.
+##########################################################################
+TABLES_BATCH_FETCH_SIZE = 1000
+
+##########################################################################
+# The catalog metadata (keywords, schemas, tables, columns, functions, etc.)
+# used by the autocomplete in the Query Tool is cached in memory, and shared
+# by all the tabs connected to the same database as the same role using the
+# same search path. SQL_AUTOCOMPLETE_CACHE_SIZE is the maximum number of the
+# cached databases (the least recently used one is evicted first), set it
+# to 0 to fetch the metadata from the database server for every request.
+# The catalogs are checked for changes, and the changed objects are fetched
+# again, at most once every SQL_AUTOCOMPLETE_CACHE_CHECK_INTERVAL seconds.
+# The changes are detected using the row counters of the catalogs in the
+# cumulative statistics (pg_stat_sys_tables), which the database server
+# reports with a delay (of up to several seconds). When track_counts is off,
+# the metadata is fetched again on every check.
+##########################################################################
+SQL_AUTOCOMPLETE_CACHE_SIZE = 32
+SQL_AUTOCOMPLETE_CACHE_CHECK_INTERVAL = 5
+
+##########################################################################
+# Shared dashboard sampler. When enabled, the dashboards of a server (or a
+# database) opened by the users connected as the same role are served by a
+# single background collector, instead of running the statistics queries
+# for every open dashboard. The collector samples the graphs and the server
+# activity every DASHBOARD_SAMPLER_INTERVAL seconds, and keeps the last
+# DASHBOARD_SAMPLER_HISTORY samples, so that the graphs of a newly opened
+# dashboard start with the recent history. It uses a connection of its own,
+# which is closed when the last dashboard watching it is closed.
+##########################################################################
+DASHBOARD_SHARED_SAMPLER = False
+DASHBOARD_SAMPLER_INTERVAL = 5
+DASHBOARD_SAMPLER_HISTORY = 75
+
+##########################################################################
+# Background process watchers. The Processes panel receives the new log
+# lines, and the state transitions of the running background processes
+# (i.e. backup, restore) over a socket, from a single watcher per process,
+# which checks the log files, and the status of the process every
+# BGPROCESS_WATCH_INTERVAL seconds. The panel polls the server instead,
+# when the socket is not available.
+##########################################################################
+BGPROCESS_WATCH_INTERVAL = 0.5
+
 ##########################################################################
 # Allow users to display Gravatar image for their username in Server mode
 ##########################################################################
@@ -953,6 +1164,19 @@ MAX_SERVER_TAGS_ALLOWED = 5
 
 ON_DEMAND_LOG_COUNT = 10000
 
+##########################################################################
+# The entries of the server log files shown on the dashboard are indexed
+# (byte offset, length, timestamp and severity of each entry) as the log
+# file grows, so that only the new bytes are read from the server, and a
+# page of the entries is read using their offsets. DASHBOARD_LOG_READ_SIZE
+# is the maximum number of the new bytes read for a request (the rest is
+# indexed by the next requests), DASHBOARD_LOG_INDEX_SIZE is the maximum
+# number of the indexed log files kept in memory, set it to 0 to index the
+# log file again for every request.
+##########################################################################
+DASHBOARD_LOG_READ_SIZE = 8 * 1024 * 1024
+DASHBOARD_LOG_INDEX_SIZE = 16
+
 #############################################################################
 # Patch the default config with custom config and other manipulations
 #############################################################################
@@ -43,6 +43,7 @@ from pgadmin.model import db, Role, Server, SharedServer, ServerGroup, \
 from pgadmin.utils import PgAdminModule, driver, KeyManager, heartbeat
 from pgadmin.utils.preferences import Preferences
 from pgadmin.utils.session import create_session_interface, pga_unauthorised
+from pgadmin.utils.url_rule import LazyBuilderRule, lazy_builder_supported
 from pgadmin.utils.versioned_template_loader import VersionedTemplateLoader
 from datetime import timedelta, datetime
 from pgadmin.setup import get_version, set_version, check_db_tables
@@ -213,6 +214,10 @@ def create_app(app_name=None):
     """Create the Flask application, startup logging and dynamically load
     additional modules (blueprints) that are found in this directory."""
     app = PgAdmin(__name__, static_url_path='/static')
+    # Compile the URL builders of the routes on demand
+    if getattr(config, 'LAZY_URL_BUILDERS', False) and \
+            lazy_builder_supported():
+        app.url_rule_class = LazyBuilderRule
     # Removes unwanted whitespace from render_template function
     app.jinja_env.trim_blocks = True
     app.config.from_object(config)
@@ -19,7 +19,6 @@ from pgadmin.utils.constants import MIMETYPE_APP_JS
 from pgadmin.utils.ajax import make_json_response
 import config
 from pgadmin.model import User
-from user_agents import parse
 import platform
 import re
 import sys
@@ -133,7 +132,7 @@ def detect_browser(request):
     except Exception as _:
         os_details = ''
 
-    os_details += parse(platform.platform()).ua_string
+    os_details += platform.platform()
 
     if 'Electron' in agent:
         electron_version = re.findall('Electron/([\\d.]+\\d+)', agent)[0]
@@ -11,11 +11,6 @@
 
 import ssl
 import config
-from ldap3 import Connection, Server, Tls, ALL, ALL_ATTRIBUTES, ANONYMOUS,\
-    SIMPLE, AUTO_BIND_TLS_BEFORE_BIND, AUTO_BIND_NO_TLS, set_config_parameter
-from ldap3.core.exceptions import LDAPSocketOpenError, LDAPBindError,\
-    LDAPInvalidScopeError, LDAPAttributeError, LDAPInvalidFilterError,\
-    LDAPStartTLSError, LDAPSSLConfigurationError
 from flask_babel import gettext
 from urllib.parse import urlparse
 
@@ -33,10 +28,6 @@ ERROR_SEARCHING_LDAP_DIRECTORY = gettext(
 ERROR_CONNECTING_LDAP_SERVER = gettext(
     "Error connecting to the LDAP server: {}\n")
 
-if config.LDAP_IGNORE_MALFORMED_SCHEMA:
-    set_config_parameter('IGNORE_MALFORMED_SCHEMA',
-                         config.LDAP_IGNORE_MALFORMED_SCHEMA)
-
 
 class LDAPAuthentication(BaseAuthentication):
     """Ldap Authentication Class"""
@@ -115,6 +106,17 @@ class LDAPAuthentication(BaseAuthentication):
     def connect(self):
         """Setup the connection to the LDAP server and authenticate the user.
         """
+        # ldap3 is imported on demand, as it takes a significant part of the
+        # application startup time, even when LDAP is not used.
+        from ldap3 import Connection, ANONYMOUS, SIMPLE, \
+            AUTO_BIND_TLS_BEFORE_BIND, AUTO_BIND_NO_TLS, set_config_parameter
+        from ldap3.core.exceptions import LDAPSocketOpenError, \
+            LDAPBindError, LDAPStartTLSError
+
+        if config.LDAP_IGNORE_MALFORMED_SCHEMA:
+            set_config_parameter('IGNORE_MALFORMED_SCHEMA',
+                                 config.LDAP_IGNORE_MALFORMED_SCHEMA)
+
         status, server = self._configure_server()
 
         if not status:
@@ -209,6 +211,9 @@ class LDAPAuthentication(BaseAuthentication):
         return True, None
 
     def __configure_tls(self):
+        from ldap3 import Tls
+        from ldap3.core.exceptions import LDAPSSLConfigurationError
+
         ca_cert_file = getattr(config, 'LDAP_CA_CERT_FILE', None)
         cert_file = getattr(config, 'LDAP_CERT_FILE', None)
         key_file = getattr(config, 'LDAP_KEY_FILE', None)
@@ -232,6 +237,8 @@ class LDAPAuthentication(BaseAuthentication):
         return True, tls
 
     def _configure_server(self):
+        from ldap3 import Server, ALL
+
         # Parse the server URI
         uri = getattr(config, 'LDAP_SERVER_URI', None)
 
@@ -269,6 +276,10 @@ class LDAPAuthentication(BaseAuthentication):
     def search_ldap_user(self):
         """Get a list of users from the LDAP server based on config
          search criteria."""
+        from ldap3 import ALL_ATTRIBUTES
+        from ldap3.core.exceptions import LDAPInvalidScopeError, \
+            LDAPAttributeError, LDAPInvalidFilterError
+
         try:
             search_base_dn = config.LDAP_SEARCH_BASE_DN
             if (not search_base_dn or search_base_dn == '<Search-Base-DN>')\
@@ -18,7 +18,8 @@ from pgadmin.utils.preferences import Preferences
 from pgadmin.utils.constants import PGADMIN_NODE
 from pgadmin.utils.driver import get_driver
 from config import PG_DEFAULT_DRIVER
-from pgadmin.browser.utils import PGChildNodeView
+from pgadmin.browser.utils import PGChildNodeView, \
+    get_collection_count_batch
 
 
 class CollectionNodeModule(PgAdminModule, PGChildModule, metaclass=ABCMeta):
@@ -126,6 +127,16 @@ class CollectionNodeModule(PgAdminModule, PGChildModule, metaclass=ABCMeta):
                 conn=conn
             )
 
+            batch = get_collection_count_batch()
+            if batch is not None:
+                if batch.collecting:
+                    batch.add(conn, sql)
+                    return True
+
+                count = batch.get(conn, sql)
+                if count is not None:
+                    return count > 0
+
             status, res = conn.execute_dict(sql)
 
             return int(res['rows'][0]['count']) > 0 if status \
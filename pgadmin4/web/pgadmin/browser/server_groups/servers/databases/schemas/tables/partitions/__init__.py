@@ -220,7 +220,7 @@ class PartitionsView(BaseTableView, DataTypeReader, SchemaDiffObjectCompare):
                       'vacuum_toast', 'edit_types', 'oid-2']
 
     def get_children_nodes(self, manager, **kwargs):
-        nodes = []
+        modules = []
         # treat partition table as normal table.
         # replace tid with ptid and pop ptid from kwargs
         if 'ptid' in kwargs:
@@ -231,15 +231,15 @@ class PartitionsView(BaseTableView, DataTypeReader, SchemaDiffObjectCompare):
             if isinstance(module, PGChildModule):
                 if manager is not None and \
                         module.backend_supported(manager, **kwargs):
-                    nodes.extend(module.get_nodes(**kwargs))
+                    modules.append(module)
             else:
-                nodes.extend(module.get_nodes(**kwargs))
+                modules.append(module)
 
         if manager is not None and \
                 self.blueprint.backend_supported(manager, **kwargs):
-            nodes.extend(self.blueprint.get_nodes(**kwargs))
+            modules.append(self.blueprint)
 
-        return nodes
+        return self.get_modules_nodes(modules, **kwargs)
 
     @BaseTableView.check_precondition
     def list(self, gid, sid, did, scid, tid):
@@ -13,7 +13,7 @@ import re
 import copy
 from functools import wraps
 import json
-from flask import render_template, jsonify, request
+from flask import render_template, jsonify, request, current_app
 from flask_babel import gettext
 
 from pgadmin.browser.server_groups.servers.databases.schemas\
@@ -27,6 +27,8 @@ from pgadmin.browser.server_groups.servers.utils import parse_priv_from_db, \
 from pgadmin.browser.utils import PGChildNodeView
 from pgadmin.utils.compile_template_name import compile_template_path
 from pgadmin.utils.driver import get_driver
+from pgadmin.utils.driver.psycopg3.batched_fetch import BatchedFetch
+import config
 from config import PG_DEFAULT_DRIVER
 from pgadmin.browser.server_groups.servers.databases.schemas.tables.\
     columns import utils as column_utils
@@ -524,25 +526,51 @@ class BaseTableView(PGChildNodeView, BasePartitionTable, VacuumSettings):
             if not status:
                 return False, tables
 
-            for row in tables['rows']:
-                status, data = \
-                    self._fetch_table_properties(did, scid, row['oid'])
+            def fetch_table(row):
+                return BaseTableView._fetch_table_for_compare(
+                    self, sid, did, scid, row, with_serial_cols)
+
+            # Fetch all the tables at once, instead of running the queries
+            # of every table one by one.
+            batch_size = getattr(config, 'TABLES_BATCH_FETCH_SIZE', 0)
+            if batch_size and len(tables['rows']) > 1 and \
+                    BatchedFetch.supported(self.conn):
+                batch = BatchedFetch(batch_size)
+                results = batch.run(fetch_table, tables['rows'])
+                current_app.logger.debug(
+                    'Fetched {0} tables of the schema ({1}): {2}'.format(
+                        len(tables['rows']), scid, batch.info()))
+            else:
+                results = map(fetch_table, tables['rows'])
 
+            for row, (status, data) in zip(tables['rows'], results):
                 if status:
-                    data = BaseTableView.properties(
-                        self, 0, sid, did, scid, row['oid'], res=data,
-                        with_serial_cols=with_serial_cols,
-                        return_ajax_response=False
-                    )
-
-                    # Get sub module data of a specified table for object
-                    # comparison
-                    BaseTableView._get_sub_module_data_for_compare(
-                        self, sid, did, scid, data, row)
                     res[row['name']] = data
 
             return True, res
 
+    def _fetch_table_for_compare(self, sid, did, scid, row,
+                                 with_serial_cols=False):
+        """
+        This function is used to fetch the properties, and the sub module
+        data of the specified table for object comparison.
+        """
+        status, data = self._fetch_table_properties(did, scid, row['oid'])
+        if not status:
+            return False, data
+
+        data = BaseTableView.properties(
+            self, 0, sid, did, scid, row['oid'], res=data,
+            with_serial_cols=with_serial_cols,
+            return_ajax_response=False
+        )
+
+        # Get sub module data of a specified table for object
+        # comparison
+        BaseTableView._get_sub_module_data_for_compare(
+            self, sid, did, scid, data, row)
+        return True, data
+
     def _get_sub_module_data_for_compare(self, sid, did, scid, data, row):
         # Get sub module data of a specified table for object
         # comparison
@@ -63,6 +63,9 @@ define('pgadmin.browser.utils',
 
   pgAdmin['fixed_binary_paths'] = {{ current_app.config.get('FIXED_BINARY_PATHS') }};
 
+  /* GET the shared dashboard sampler config */
+  pgAdmin['dashboard_shared_sampler'] = '{{ current_app.config.get('DASHBOARD_SHARED_SAMPLER') }}' == 'True';
+
   /* GET the pgadmin server's locale */
   pgAdmin['pgadmin_server_locale'] =  '{{pgadmin_server_locale}}';
 
@@ -0,0 +1,63 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2025, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+from unittest.mock import MagicMock
+
+from pgadmin.browser.utils import CollectionCountBatch
+from pgadmin.utils.route import BaseTestGenerator
+
+
+class TestCollectionCountBatch(BaseTestGenerator):
+    """ This class will test the batching of the collection count queries. """
+
+    scenarios = [
+        ('Execute multiple count queries as a single query',
+         dict(queries=['SELECT COUNT(*) FROM a;', 'SELECT COUNT(*) FROM b'],
+              status=True, row={'count_0': 3, 'count_1': 0},
+              expected_calls=1, expected_counts=[3, 0])),
+        ('Do not batch a single count query',
+         dict(queries=['SELECT COUNT(*) FROM a'],
+              status=True, row={'count_0': 3},
+              expected_calls=0, expected_counts=[None])),
+        ('Leave the counts unknown, when the batched query fails',
+         dict(queries=['SELECT COUNT(*) FROM a', 'SELECT COUNT(*) FROM b'],
+              status=False, row=None,
+              expected_calls=1, expected_counts=[None, None])),
+    ]
+
+    def setUp(self):
+        pass
+
+    def runTest(self):
+        conn = MagicMock()
+        conn.execute_2darray.return_value = (
+            self.status,
+            {'rows': [self.row]} if self.status else 'error'
+        )
+
+        batch = CollectionCountBatch()
+        for query in self.queries:
+            batch.add(conn, query)
+        # Same query registered twice must only be executed once.
+        batch.add(conn, self.queries[0])
+
+        self.assertEqual(batch.requests, len(self.queries) + 1)
+        batch.execute()
+        self.assertFalse(batch.collecting)
+
+        self.assertEqual(conn.execute_2darray.call_count, self.expected_calls)
+        if self.expected_calls:
+            sql = conn.execute_2darray.call_args[0][0]
+            self.assertNotIn(';', sql)
+            self.assertEqual(sql.count('COUNT(*)'), len(self.queries))
+
+        self.assertEqual(
+            [batch.get(conn, query) for query in self.queries],
+            self.expected_counts
+        )
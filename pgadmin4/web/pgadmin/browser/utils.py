@@ -12,10 +12,11 @@
 from abc import abstractmethod
 
 import flask
-from flask import render_template, current_app
+from flask import render_template, current_app, g
 from flask.views import View, MethodView
 from flask_babel import gettext
 
+import config
 from config import PG_DEFAULT_DRIVER
 from pgadmin.utils.ajax import make_json_response, precondition_required,\
     internal_server_error
@@ -367,6 +368,82 @@ class NodeView(View, metaclass=type(MethodView)):
         return children
 
 
+class CollectionCountBatch():
+    """
+    class CollectionCountBatch
+
+    Collects the count queries of the collection nodes, which are generated
+    for the same parent node, and executes them together as a single query
+    per connection.
+
+    Methods:
+    -------
+    * add(conn, sql)
+    - Register the count query to be executed on the connection.
+
+    * execute()
+    - Execute all the registered queries (one round trip per connection).
+
+    * get(conn, sql)
+    - Returns the count for the query, None if it could not be fetched.
+    """
+
+    def __init__(self):
+        self.collecting = True
+        self.requests = 0
+        self._queries = dict()
+        self._counts = dict()
+
+    def add(self, conn, sql):
+        self.requests += 1
+        _, queries = self._queries.setdefault(id(conn), (conn, []))
+        if sql not in queries:
+            queries.append(sql)
+
+    def get(self, conn, sql):
+        return self._counts.get((id(conn), sql))
+
+    def execute(self):
+        self.collecting = False
+
+        for key, (conn, queries) in self._queries.items():
+            # Nothing to gain for a single query, let the caller run it.
+            if len(queries) < 2:
+                continue
+
+            # Each count query returns a single row, and a single column,
+            # hence - it can be used as a scalar sub-query.
+            sql = "SELECT " + ",\n".join(
+                "(\n{0}\n) AS count_{1}".format(
+                    query.strip().rstrip(';'), idx
+                ) for idx, query in enumerate(queries)
+            )
+
+            try:
+                status, res = conn.execute_2darray(sql)
+            except Exception as e:
+                current_app.logger.exception(e)
+                continue
+
+            # The caller will execute the queries individually, and handle
+            # the errors (if any).
+            if not status or not res['rows']:
+                continue
+
+            row = res['rows'][0]
+            for idx, query in enumerate(queries):
+                count = row['count_{0}'.format(idx)]
+                if count is not None:
+                    self._counts[(key, query)] = int(count)
+
+
+def get_collection_count_batch():
+    """
+    Returns the collection count batch of the current request (if any).
+    """
+    return getattr(g, 'collection_count_batch', None)
+
+
 class PGChildNodeView(NodeView):
 
     _NODE_SQL = 'node.sql'
@@ -402,17 +479,63 @@ class PGChildNodeView(NodeView):
           node
         :return:
         """
-        nodes = []
+        modules = []
         for module in self.blueprint.submodules:
             if isinstance(module, PGChildModule):
                 if (
                     manager is not None and
                     module.backend_supported(manager, **kwargs)
                 ):
-                    nodes.extend(module.get_nodes(**kwargs))
+                    modules.append(module)
             else:
+                modules.append(module)
+
+        return self.get_modules_nodes(modules, **kwargs)
+
+    def get_modules_nodes(self, modules, **kwargs):
+        """
+        Returns the list of the nodes generated by the given modules.
+
+        When BROWSER_BATCH_COLLECTION_COUNTS is enabled, the count queries of
+        the collection nodes (used to hide the empty collections) are not
+        executed one by one. The modules generate their nodes once to
+        register those queries, which are then executed together, and the
+        modules, which had registered any, generate their nodes again using
+        the fetched counts.
+
+        :param modules: List of the child modules
+        :param kwargs: Parameters to generate the correct set of browser tree
+          node
+        :return: List of the nodes
+        """
+        if not config.BROWSER_BATCH_COLLECTION_COUNTS or \
+                get_collection_count_batch() is not None:
+            nodes = []
+            for module in modules:
                 nodes.extend(module.get_nodes(**kwargs))
-        return nodes
+            return nodes
+
+        batch = g.collection_count_batch = CollectionCountBatch()
+        try:
+            modules_nodes = []
+            for module in modules:
+                requests = batch.requests
+                module_nodes = list(module.get_nodes(**kwargs))
+                # The nodes generated without any count query are final.
+                modules_nodes.append(
+                    None if batch.requests > requests else module_nodes
+                )
+
+            batch.execute()
+
+            nodes = []
+            for module, module_nodes in zip(modules, modules_nodes):
+                if module_nodes is None:
+                    module_nodes = module.get_nodes(**kwargs)
+                nodes.extend(module_nodes)
+            return nodes
+        finally:
+            g.pop('collection_count_batch', None)
 
     def children(self, **kwargs):
         """Build a list of treeview nodes from the child nodes."""
@@ -9,7 +9,6 @@
 
 """A blueprint module implementing the dashboard frame."""
 import math
-import re
 
 from flask import render_template, Response, g, request
 from flask_babel import gettext
@@ -23,11 +22,18 @@ from pgadmin.utils.preferences import Preferences
 from pgadmin.utils.constants import PREF_LABEL_DISPLAY, MIMETYPE_APP_JS, \
     PREF_LABEL_REFRESH_RATES, ERROR_SERVER_ID_NOT_SPECIFIED
 
+from pgadmin.authenticate import socket_login_required
+
 from .precondition import check_precondition
 from .pgd_replication import blueprint as pgd_replication
-from config import PG_DEFAULT_DRIVER, ON_DEMAND_LOG_COUNT
+from .log_index import log_indexes, decode_chunk
+from .sampler import samplers
+from config import PG_DEFAULT_DRIVER, ON_DEMAND_LOG_COUNT, \
+    DASHBOARD_LOG_READ_SIZE
+from pgadmin import socketio
 
 MODULE_NAME = 'dashboard'
+SOCKETIO_NAMESPACE = '/{0}'.format(MODULE_NAME)
 
 
 class DashboardModule(PgAdminModule):
@@ -244,6 +250,7 @@ class DashboardModule(PgAdminModule):
             'dashboard.log_formats',
             'dashboard.logs',
             'dashboard.get_logs_by_server_id',
+            'dashboard.log_entries',
             'dashboard.check_system_statistics',
             'dashboard.check_system_statistics_sid',
             'dashboard.check_system_statistics_did',
@@ -338,13 +345,21 @@ def get_data(sid, did, template, check_long_running_query=False,
     if not sid:
         return internal_server_error(errormsg=ERROR_SERVER_ID_NOT_SPECIFIED)
 
-    sql = render_template(
-        "/".join([g.template_path, template]), did=did
-    )
-    status, res = g.conn.execute_dict(sql)
+    # Use the latest sample of the shared sampler, when running.
+    sample = samplers.latest(g.manager, did)
+    table_name = template[:-len('.sql')]
+    if sample is not None and table_name in sample['tables']:
+        res = {'rows': [
+            dict(row) for row in sample['tables'][table_name]
+        ]}
+    else:
+        sql = render_template(
+            "/".join([g.template_path, template]), did=did
+        )
+        status, res = g.conn.execute_dict(sql)
 
-    if not status:
-        return internal_server_error(errormsg=res)
+        if not status:
+            return internal_server_error(errormsg=res)
 
     # Check the long running query status and set the row type.
     if check_long_running_query:
@@ -408,6 +423,17 @@ def dashboard_stats(sid=None, did=None):
             return internal_server_error(
                 errormsg=ERROR_SERVER_ID_NOT_SPECIFIED)
 
+        # Use the latest sample of the shared sampler, when running.
+        sample = samplers.latest(g.manager, did)
+        if sample is not None:
+            return ajax_response(
+                response=dict(
+                    (name, sample['stats'][name])
+                    for name in chart_names if name in sample['stats']
+                ),
+                status=200
+            )
+
         sql = render_template(
             "/".join([g.template_path, 'dashboard_stats.sql']), did=did,
             chart_names=chart_names,
@@ -424,6 +450,66 @@ def dashboard_stats(sid=None, did=None):
     )
 
 
+@socketio.on('connect', namespace=SOCKETIO_NAMESPACE)
+@socket_login_required
+def connect():
+    """
+    Connect to the server through socket.
+    :return:
+    :rtype:
+    """
+    socketio.emit('connected', {'sid': request.sid},
+                  namespace=SOCKETIO_NAMESPACE,
+                  to=request.sid)
+
+
+def _emit_sample(event, data, to):
+    socketio.emit(event, data, namespace=SOCKETIO_NAMESPACE, to=to)
+
+
+@socketio.on('subscribe', namespace=SOCKETIO_NAMESPACE)
+@socket_login_required
+def subscribe(params):
+    """
+    Subscribe the dashboard to the shared sampler of the server (or the
+    database), the graph samples collected so far are sent back as the
+    history, the new ones are sent as the 'sample' events.
+    :param params: Server id (sid), and database id (did).
+    """
+    if not samplers.enabled():
+        socketio.emit('subscribe_failed',
+                      gettext('The shared dashboard sampler is disabled.'),
+                      namespace=SOCKETIO_NAMESPACE, to=request.sid)
+        return
+
+    sid = params.get('sid')
+    did = params.get('did') or None
+    manager = get_driver(PG_DEFAULT_DRIVER).connection_manager(sid) \
+        if sid else None
+    if manager is None or not manager.connection(did=did).connected():
+        socketio.emit('subscribe_failed',
+                      gettext('Please connect to the selected {0} to view '
+                              'the graph.').format(
+                          gettext('database') if did else gettext('server')),
+                      namespace=SOCKETIO_NAMESPACE, to=request.sid)
+        return
+
+    history = samplers.subscribe(request.sid, sid, did, manager,
+                                 _emit_sample, socketio.start_background_task)
+    socketio.emit('subscribe_success', history,
+                  namespace=SOCKETIO_NAMESPACE, to=request.sid)
+
+
+@socketio.on('unsubscribe', namespace=SOCKETIO_NAMESPACE)
+def unsubscribe():
+    samplers.unsubscribe(request.sid)
+
+
+@socketio.on('disconnect', namespace=SOCKETIO_NAMESPACE)
+def disconnect():
+    samplers.unsubscribe(request.sid)
+
+
 @blueprint.route('/activity/', endpoint='activity')
 @blueprint.route('/activity/<int:sid>', endpoint='get_activity_by_server_id')
 @blueprint.route(
@@ -514,6 +600,99 @@ def log_formats(sid=None):
     )
 
 
+def _get_log_format(log_format):
+    """
+    Returns the name of the requested log format, when the server logs in
+    it (or, '' for the default one).
+    """
+    sql = render_template(
+        "/".join([g.template_path, 'log_format.sql'])
+    )
+    status, _format = g.conn.execute_scalar(sql)
+
+    # Check the requested format is available or not
+    if log_format == 'C' and 'csvlog' in _format:
+        return 'csvlog'
+    elif log_format == 'J' and 'jsonlog' in _format:
+        return 'jsonlog'
+    return ''
+
+
+def _read_log_chunk(file_name, log_format, start, length):
+    sql = render_template(
+        "/".join([g.template_path, 'log_chunk.sql']),
+        file_name=file_name, log_format=log_format, st=start, length=length,
+        conn=g.conn
+    )
+    status, res = g.conn.execute_dict(sql)
+    if not status:
+        return False, res
+    return True, res['rows'][0] if res['rows'] else {}
+
+
+def _get_log_index(log_format):
+    """
+    Returns the index of the current log file (None, when the logging is
+    disabled), after indexing the bytes written since the last request.
+    """
+    status, res = _read_log_chunk(None, log_format, 0, 0)
+    if not status:
+        return False, res
+    if not res.get('file_name') or not res.get('size'):
+        return True, None
+
+    key = (g.manager.host, g.manager.port, log_format)
+    index = log_indexes.get(key, res['file_name'], log_format, res['size'])
+
+    with index.lock:
+        read_size = DASHBOARD_LOG_READ_SIZE
+        while res['size'] > index.offset:
+            status, chunk = _read_log_chunk(
+                index.file_name, log_format, index.offset, read_size
+            )
+            if not status:
+                return False, chunk
+
+            data = decode_chunk(chunk.get('data'))
+            if index.add_chunk(data, chunk.get('size') or res['size']) or \
+                    len(data) < read_size:
+                break
+            # Not even one entry is complete, read a larger chunk.
+            read_size *= 2
+
+    return True, index
+
+
+def _read_log_entries(index, positions):
+    """
+    Read the entries of the log file at the given positions of the index.
+    """
+    if not positions:
+        return True, []
+
+    ranges = index.ranges(positions)
+    sql = render_template(
+        "/".join([g.template_path, 'log_entries.sql']),
+        file_name=index.file_name,
+        offsets=[offset for offset, _ in ranges],
+        lengths=[length for _, length in ranges],
+        conn=g.conn
+    )
+    status, res = g.conn.execute_dict(sql)
+    if not status:
+        return False, res
+
+    encoding = getattr(g.conn, 'python_encoding', None) or 'utf-8'
+    entries = []
+    for entry in index.split(
+            positions, (decode_chunk(row['data']) for row in res['rows'])):
+        entry = index.parse(entry, encoding)
+        if entry is not None:
+            entries.append(entry)
+
+    return True, entries
+
+
 @blueprint.route('/logs/<log_format>/<disp_format>/<int:sid>', endpoint='logs')
 @blueprint.route('/logs/<log_format>/<disp_format>/<int:sid>/<int:page>',
                  endpoint='get_logs_by_server_id')
@@ -523,25 +702,33 @@ def logs(log_format=None, disp_format=None, sid=None, page=0):
     """
     This function returns server logs details
     """
-
-    LOG_STATEMENTS = 'DEBUG:|STATEMENT:|LOG:|WARNING:|NOTICE:|INFO:' \
-                     '|ERROR:|FATAL:|PANIC:'
     if not sid:
         return internal_server_error(
             errormsg=gettext('Server ID not specified.'))
 
-    sql = render_template(
-        "/".join([g.template_path, 'log_format.sql'])
-    )
-    status, _format = g.conn.execute_scalar(sql)
+    log_format = _get_log_format(log_format)
 
-    # Check the requested format is available or not
-    if log_format == 'C' and 'csvlog' in _format:
-        log_format = 'csvlog'
-    elif log_format == 'J' and 'jsonlog' in _format:
-        log_format = 'jsonlog'
-    else:
-        log_format = ''
+    if disp_format != 'plain':
+        # Page of the parsed entries, read using the index of the log file.
+        status, index = _get_log_index(log_format)
+        if not status:
+            return internal_server_error(errormsg=index)
+        if index is None:
+            return ajax_response(
+                response={'logs_disabled': True},
+                status=200
+            )
+
+        count = int(ON_DEMAND_LOG_COUNT)
+        positions, _ = index.find(int(page) * count, count)
+        status, entries = _read_log_entries(index, positions)
+        if not status:
+            return internal_server_error(errormsg=entries)
+
+        return ajax_response(
+            response=entries,
+            status=200
+        )
 
     sql = render_template(
         "/".join([g.template_path, 'log_stat.sql']),
@@ -565,70 +752,17 @@ def logs(log_format=None, disp_format=None, sid=None, page=0):
             status=200
         )
 
-    _start = 0
-    _end = ON_DEMAND_LOG_COUNT
-    page = int(page)
-    final_cols = []
-    if page > 0:
-        _start = page * int(ON_DEMAND_LOG_COUNT)
-        _end = _start + int(ON_DEMAND_LOG_COUNT)
-
+    final_response = []
+    _start = int(page) * int(ON_DEMAND_LOG_COUNT)
     if _start < file_stat:
-        if disp_format == 'plain':
-            _end = file_stat
         sql = render_template(
-            "/".join([g.template_path, 'logs.sql']), st=_start, ed=_end,
+            "/".join([g.template_path, 'logs.sql']), st=_start, ed=file_stat,
             log_format=log_format, conn=g.conn
         )
         status, res = g.conn.execute_dict(sql)
         if not status:
             return internal_server_error(errormsg=res)
-
-        final_res = res['rows'][0]['pg_read_file'].split('\n')
-        # Json format
-        if log_format == 'jsonlog':
-            for f in final_res:
-                try:
-                    _tmp_log = json.loads(f)
-                    final_cols.append(
-                        {"error_severity": _tmp_log['error_severity'],
-                         "timestamp": _tmp_log['timestamp'],
-                         "message": _tmp_log['message']})
-                except Exception:
-                    pass
-
-        # CSV format
-        elif log_format == 'csvlog':
-            for f in final_res:
-                try:
-                    _tmp_log = f.split(',')
-                    final_cols.append({"error_severity": _tmp_log[11],
-                                       "timestamp": _tmp_log[0],
-                                       "message": _tmp_log[13]})
-                except Exception:
-                    pass
-
-        else:
-            _pattern = re.compile(LOG_STATEMENTS)
-            for f in final_res:
-                tmp = re.search(LOG_STATEMENTS, f)
-                if not tmp or tmp.group((0)) == 'STATEMENT:':
-                    last_val = final_cols.pop() if len(final_cols) > 0\
-                        else {'message': ''}
-                    last_val['message'] += f
-                    final_cols.append(last_val)
-                else:
-                    _tmp = re.split(LOG_STATEMENTS, f)
-
-                    final_cols.append({
-                        "error_severity": tmp.group(0)[:len(tmp.group(0)) - 1],
-                        "timestamp": _tmp[0],
-                        "message": _tmp[1] if len(_tmp) > 1 else ''})
-
-    if disp_format == 'plain':
         final_response = res['rows']
-    else:
-        final_response = final_cols
 
     return ajax_response(
         response=final_response,
@@ -636,6 +770,61 @@ def logs(log_format=None, disp_format=None, sid=None, page=0):
     )
 
 
+@blueprint.route('/log_entries/<log_format>/<int:sid>',
+                 endpoint='log_entries')
+@pga_login_required
+@check_precondition
+def log_entries(log_format=None, sid=None):
+    """
+    This function returns the entries of the server log, starting at the
+    given position ('start'), or at the given time ('since'), optionally
+    only the ones with the given severities ('severity', comma separated).
+    The log can be followed, by asking for the entries starting at the
+    returned 'next' position, only the bytes written since the last request
+    are read from the server.
+    """
+    if not sid:
+        return internal_server_error(errormsg=ERROR_SERVER_ID_NOT_SPECIFIED)
+
+    status, index = _get_log_index(_get_log_format(log_format))
+    if not status:
+        return internal_server_error(errormsg=index)
+    if index is None:
+        return ajax_response(
+            response={'logs_disabled': True},
+            status=200
+        )
+
+    start = request.args.get('start', 0, type=int)
+    count = request.args.get('count', ON_DEMAND_LOG_COUNT, type=int)
+    since = request.args.get('since', None)
+    severities = [
+        severity for severity in request.args.get('severity', '').split(',')
+        if severity
+    ]
+
+    if since:
+        start = max(start, index.seek(since))
+    positions, next_pos = index.find(start, count, severities)
+
+    status, entries = _read_log_entries(index, positions)
+    if not status:
+        return internal_server_error(errormsg=entries)
+
+    return ajax_response(
+        response={
+            'file_name': index.file_name,
+            'entries': entries,
+            'next': next_pos,
+            'total': len(index),
+            # Bytes indexed so far, and the size of the log file.
+            'indexed': index.offset,
+            'size': index.size,
+        },
+        status=200
+    )
+
+
 @blueprint.route(
     '/cancel_query/<int:sid>/<int:pid>', methods=['DELETE']
 )
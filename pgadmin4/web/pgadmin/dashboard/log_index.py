@@ -0,0 +1,296 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2025, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""Incremental index of the entries of the server log files."""
+
+import base64
+import csv
+import io
+import json
+import re
+import threading
+from array import array
+from bisect import bisect_left
+
+from pgadmin.utils.lru_cache import LRUCache
+
+LOG_STATEMENTS = 'DEBUG:|STATEMENT:|LOG:|WARNING:|NOTICE:|INFO:' \
+                 '|ERROR:|FATAL:|PANIC:'
+LOG_STATEMENTS_RE = re.compile(LOG_STATEMENTS)
+TIMESTAMP_RE = re.compile(
+    r'(\d{4})-(\d\d)-(\d\d)[ T](\d\d):(\d\d):(\d\d)(?:\.(\d{1,3}))?'
+)
+
+
+def parse_timestamp(value):
+    """
+    Returns the timestamp (at the start of the given text) as an integer
+    (YYYYMMDDHHMMSSmmm) comparable with the other timestamps of the log, or
+    None when not found.
+    """
+    match = TIMESTAMP_RE.match(value.strip()) if value else None
+    if match is None:
+        return None
+
+    millis = (match.group(7) or '0').ljust(3, '0')
+    return int(''.join(match.groups()[:6]) + millis)
+
+
+class LogIndex():
+    """
+    class LogIndex
+
+        Index of the entries of a server log file - the byte offset, the
+        length, the timestamp and the severity of each of them. The file is
+        read once, the new bytes are indexed as it grows. An entry, which is
+        not complete yet (e.g. the last line, or a CSV record with the
+        quoted message spanning multiple lines) is indexed once complete.
+
+        The messages are not kept, the entries shown are read again using
+        their byte offset, and length.
+    """
+
+    def __init__(self, file_name, log_format):
+        self.lock = threading.Lock()
+        self.file_name = file_name
+        self.log_format = log_format
+        # Number of the bytes read (up to the end of the last complete
+        # entry), and the size of the file, when last checked.
+        self.offset = 0
+        self.size = 0
+        self.offsets = array('q')
+        self.lengths = array('q')
+        self.times = array('q')
+        self.levels = array('H')
+        self.severities = []
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def _level(self, severity):
+        try:
+            return self.severities.index(severity)
+        except ValueError:
+            self.severities.append(severity)
+            return len(self.severities) - 1
+
+    def _append(self, offset, length, timestamp, severity):
+        if timestamp is None:
+            # Keep the timestamps ordered, for seeking.
+            timestamp = self.times[-1] if self.times else 0
+        self.offsets.append(offset)
+        self.lengths.append(length)
+        self.times.append(timestamp)
+        self.levels.append(self._level(severity))
+
+    def _add_record(self, offset, record):
+        if self.log_format == 'jsonlog':
+            try:
+                entry = json.loads(record)
+                timestamp = entry.get('timestamp')
+                severity = entry.get('error_severity', '')
+            except Exception:
+                timestamp, severity = None, ''
+        else:
+            try:
+                fields = next(csv.reader(io.StringIO(
+                    record.decode('utf-8', errors='replace')
+                )))
+                timestamp, severity = fields[0], fields[11]
+            except Exception:
+                timestamp, severity = None, ''
+
+        self._append(offset, len(record), parse_timestamp(timestamp),
+                     severity)
+
+    def _add_line(self, offset, line):
+        text = line.decode('utf-8', errors='replace')
+        match = LOG_STATEMENTS_RE.search(text)
+        if (not match or match.group(0) == 'STATEMENT:') and self.offsets:
+            # Continuation of the previous entry.
+            self.lengths[-1] += len(line)
+            return
+
+        self._append(offset, len(line),
+                     parse_timestamp(text[:match.start()]) if match else None,
+                     match.group(0)[:-1] if match else '')
+
+    def add_chunk(self, data, size):
+        """
+        Index the complete entries of the given bytes, read at the current
+        offset of the index. The incomplete entry at the end is read again
+        next time.
+
+        :return: Number of the bytes consumed.
+        """
+        self.size = size
+        end = data.rfind(b'\n') + 1
+
+        consumed = 0
+        record_start = None
+        quotes = 0
+        pos = 0
+        while pos < end:
+            nl = data.find(b'\n', pos, end)
+            nl = end if nl == -1 else nl + 1
+            line = data[pos:nl]
+
+            if self.log_format == 'csvlog':
+                # A record is complete, when its quotes are balanced.
+                if record_start is None:
+                    record_start = pos
+                quotes += line.count(b'"')
+                if quotes % 2 == 0:
+                    self._add_record(self.offset + record_start,
+                                     data[record_start:nl])
+                    record_start = None
+                    consumed = nl
+            elif self.log_format == 'jsonlog':
+                if line.strip():
+                    self._add_record(self.offset + pos, line)
+                consumed = nl
+            else:
+                self._add_line(self.offset + pos, line)
+                consumed = nl
+            pos = nl
+
+        self.offset += consumed
+        return consumed
+
+    def seek(self, timestamp):
+        """
+        Returns the position of the first entry logged at, or after the
+        given timestamp.
+        """
+        value = parse_timestamp(timestamp)
+        if value is None:
+            return 0
+        return bisect_left(self.times, value)
+
+    def find(self, start=0, count=None, severities=None):
+        """
+        Returns the positions of (at most, count) entries, starting at the
+        given position, with one of the given severities (all, when not
+        specified), and the position to continue from.
+        """
+        levels = None
+        if severities:
+            levels = set(
+                idx for idx, name in enumerate(self.severities)
+                if name in severities
+            )
+
+        found = []
+        pos = max(start, 0)
+        total = len(self.offsets)
+        while pos < total and (count is None or len(found) < count):
+            if levels is None or self.levels[pos] in levels:
+                found.append(pos)
+            pos += 1
+
+        return found, pos
+
+    def ranges(self, positions):
+        """
+        Returns the byte ranges (offset, length) to read the entries at the
+        given positions, the adjacent entries are read together.
+        """
+        ranges = []
+        for pos in positions:
+            offset, length = self.offsets[pos], self.lengths[pos]
+            if ranges and ranges[-1][0] + ranges[-1][1] == offset:
+                ranges[-1][1] += length
+            else:
+                ranges.append([offset, length])
+        return ranges
+
+    def split(self, positions, chunks):
+        """
+        Split the bytes read for the ranges of the given positions into the
+        entries.
+        """
+        entries = []
+        chunks = iter(chunks)
+        chunk = b''
+        for pos in positions:
+            length = self.lengths[pos]
+            if not chunk:
+                chunk = next(chunks, b'')
+            entries.append(chunk[:length])
+            chunk = chunk[length:]
+        return entries
+
+    def parse(self, entry, encoding='utf-8'):
+        """
+        Returns the timestamp, the severity, and the message of an entry.
+        """
+        text = entry.decode(encoding, errors='replace')
+
+        if self.log_format == 'jsonlog':
+            try:
+                log = json.loads(text)
+                return {"error_severity": log['error_severity'],
+                        "timestamp": log['timestamp'],
+                        "message": log['message']}
+            except Exception:
+                return None
+
+        if self.log_format == 'csvlog':
+            try:
+                log = next(csv.reader(io.StringIO(text)))
+                return {"error_severity": log[11],
+                        "timestamp": log[0],
+                        "message": log[13]}
+            except Exception:
+                return None
+
+        lines = text.rstrip('\n').split('\n')
+        match = LOG_STATEMENTS_RE.search(lines[0])
+        if not match or match.group(0) == 'STATEMENT:':
+            return {'message': ''.join(lines)}
+
+        parts = LOG_STATEMENTS_RE.split(lines[0])
+        return {"error_severity": match.group(0)[:-1],
+                "timestamp": parts[0],
+                "message": (parts[1] if len(parts) > 1 else '') +
+                ''.join(lines[1:])}
+
+
+class LogIndexCache():
+    """
+    Indexes of the server log files shared by all the sessions, the most
+    recently used config.DASHBOARD_LOG_INDEX_SIZE of them are kept. The index
+    is only used after reading the (new) bytes of the log file using the
+    connection of the session, hence - only by the roles allowed to read it.
+    """
+
+    def __init__(self):
+        self._indexes = LRUCache('DASHBOARD_LOG_INDEX_SIZE')
+
+    def get(self, key, file_name, log_format, size):
+        """
+        Returns the index of the given log file for the given key (server
+        host, port, and log format). A new one is created when the log file
+        is rotated, or truncated.
+        """
+        return self._indexes.setdefault(
+            key, lambda: LogIndex(file_name, log_format),
+            valid=lambda index: index.file_name == file_name and
+            index.offset <= size
+        )
+
+    def clear(self):
+        self._indexes.discard()
+
+
+def decode_chunk(data):
+    return base64.b64decode(data) if data else b''
+
+
+log_indexes = LogIndexCache()
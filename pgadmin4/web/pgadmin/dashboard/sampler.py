@@ -0,0 +1,322 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2025, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""Shared sampler of the dashboard statistics of a server."""
+
+import json
+import threading
+import time
+from collections import deque, OrderedDict
+
+from flask import current_app, copy_current_request_context, \
+    render_template
+from flask_babel import get_locale
+
+import config
+from pgadmin.utils.ajax import DataTypeJSONEncoder
+from pgadmin.utils.driver import get_driver
+
+CHART_NAMES = ['session_stats', 'tps_stats', 'ti_stats', 'to_stats',
+               'bio_stats']
+TABLE_NAMES = ['activity', 'locks', 'prepared']
+
+
+def sampler_key(manager, did):
+    """
+    Returns the key of the sampler for the given server manager, and the
+    database id. The dashboards are shared only by the users connected to
+    the same server as the same role (hence - seeing the same rows of the
+    statistics views), using the same language (as the labels of the graphs
+    are translated by the queries).
+    """
+    return (manager.host, manager.port, manager.user, manager.role,
+            did or None, str(get_locale()))
+
+
+class _Subscriber():
+    """
+    Dashboard (a socket) watching a sampler. The sampler runs the queries
+    in the (copied) request context of one of the subscribers, using the
+    connection manager of its session.
+    """
+
+    def __init__(self, socket_id, sid):
+        self.socket_id = socket_id
+        self.sid = sid
+        self.connected = False
+        self.run = copy_current_request_context(
+            lambda func, *args: func(*args)
+        )
+
+
+class DashboardSampler():
+    """
+    class DashboardSampler
+
+        Collects the statistics of the graphs, and the server activity
+        (activity, locks, prepared transactions) of a server (or a database)
+        every config.DASHBOARD_SAMPLER_INTERVAL seconds, and keeps the last
+        config.DASHBOARD_SAMPLER_HISTORY samples of the graphs.
+
+        Every new sample of the graphs is sent to all the subscribers. The
+        queries are run on a connection of their own, opened by the oldest
+        subscriber, the next one takes over when it leaves.
+    """
+
+    def __init__(self, key, did, emit):
+        self.key = key
+        self.did = did or None
+        self.conn_id = 'dashboard.sampler.{0}'.format(self.did or 0)
+        self.emit = emit
+        self.history = deque(
+            maxlen=max(getattr(config, 'DASHBOARD_SAMPLER_HISTORY', 1), 1)
+        )
+        self.latest = None
+        self._subscribers = OrderedDict()
+        self._lock = threading.Lock()
+        self._collect_lock = threading.Lock()
+        self._stopped = threading.Event()
+
+    def __len__(self):
+        return len(self._subscribers)
+
+    def add(self, subscriber):
+        """
+        Add a subscriber, returns the graph samples collected so far (or,
+        None when the sampler is stopped).
+        """
+        with self._lock:
+            if self._stopped.is_set():
+                return None
+            self._subscribers[subscriber.socket_id] = subscriber
+            return list(self.history)
+
+    def remove(self, socket_id):
+        """
+        Remove the subscriber (it must be called in its request context),
+        and close the connection opened by it.
+        """
+        with self._lock:
+            subscriber = self._subscribers.pop(socket_id, None)
+
+        if subscriber is not None and subscriber.connected:
+            with self._collect_lock:
+                self._release(subscriber)
+
+        return subscriber
+
+    def stop(self):
+        self._stopped.set()
+
+    def is_fresh(self):
+        """
+        Returns True when the latest sample was collected in the last
+        interval.
+        """
+        latest = self.latest
+        return latest is not None and \
+            time.monotonic() - latest['collected'] <= \
+            config.DASHBOARD_SAMPLER_INTERVAL
+
+    def _release(self, subscriber):
+        manager = get_driver(config.PG_DEFAULT_DRIVER).connection_manager(
+            subscriber.sid
+        )
+        if manager is not None:
+            manager.release(did=self.did, conn_id=self.conn_id)
+        subscriber.connected = False
+
+    def _execute(self, conn, template_path, template, **kwargs):
+        sql = render_template(
+            "/".join([template_path, template]), did=self.did, **kwargs
+        )
+        status, res = conn.execute_dict(sql)
+        if not status:
+            raise RuntimeError(res)
+        return res['rows']
+
+    def collect(self, subscriber):
+        """
+        Collect a sample, using the connection of the given subscriber.
+        """
+        manager = get_driver(config.PG_DEFAULT_DRIVER).connection_manager(
+            subscriber.sid
+        )
+        if manager is None:
+            raise RuntimeError('The server does not exist.')
+
+        conn = manager.connection(
+            did=self.did, conn_id=self.conn_id, async_=False
+        )
+        if not conn.connected():
+            subscriber.connected = True
+            status, errmsg = conn.connect()
+            if not status:
+                raise RuntimeError(errmsg)
+
+        template_path = 'dashboard/sql/#{0}#'.format(manager.version)
+        stats = dict(
+            (row['chart_name'], json.loads(row['chart_data']))
+            for row in self._execute(conn, template_path,
+                                     'dashboard_stats.sql',
+                                     chart_names=CHART_NAMES)
+        )
+        tables = dict(
+            (name, self._execute(conn, template_path, name + '.sql'))
+            for name in TABLE_NAMES
+        )
+
+        return {
+            'time': time.time(),
+            'collected': time.monotonic(),
+            # Keep the plain values only, the rows are shared by all the
+            # requests.
+            'stats': json.loads(json.dumps(stats, cls=DataTypeJSONEncoder)),
+            'tables': json.loads(json.dumps(tables, cls=DataTypeJSONEncoder)),
+        }
+
+    def _sample(self):
+        """
+        Collect a sample using the oldest subscriber, which is removed when
+        it fails (e.g. its server is disconnected). Returns False when there
+        is no subscriber left.
+        """
+        while True:
+            with self._lock:
+                if not self._subscribers:
+                    # No new subscriber can be added once stopped.
+                    self._stopped.set()
+                    return False
+                subscriber = next(iter(self._subscribers.values()))
+
+            try:
+                with self._collect_lock:
+                    return subscriber.run(self.collect, subscriber)
+            except Exception as e:
+                subscriber.run(self._failed, subscriber, str(e))
+
+    def _failed(self, subscriber, errmsg):
+        current_app.logger.warning(
+            'Dashboard sampler could not collect the statistics using the '
+            'connection of the dashboard ({0}): {1}'.format(
+                subscriber.socket_id, errmsg)
+        )
+        self.emit('sampler_failed', errmsg, subscriber.socket_id)
+        self.remove(subscriber.socket_id)
+
+    def run(self):
+        """
+        Collect the samples until stopped, or no subscriber is left.
+        """
+        while not self._stopped.is_set():
+            started = time.monotonic()
+            sample = self._sample()
+            if not sample:
+                break
+
+            self.latest = sample
+            graph = {'time': sample['time'], 'stats': sample['stats']}
+            with self._lock:
+                self.history.append(graph)
+                socket_ids = list(self._subscribers)
+
+            for socket_id in socket_ids:
+                self.emit('sample', graph, socket_id)
+
+            self._stopped.wait(max(
+                config.DASHBOARD_SAMPLER_INTERVAL -
+                (time.monotonic() - started), 0
+            ))
+
+
+class SamplerRegistry():
+    """
+    Samplers running in this process, by their key.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._samplers = dict()
+        self._subscriptions = dict()
+
+    @staticmethod
+    def enabled():
+        return getattr(config, 'DASHBOARD_SHARED_SAMPLER', False)
+
+    def subscribe(self, socket_id, sid, did, manager, emit, start):
+        """
+        Subscribe the dashboard (socket) to the sampler of the given server,
+        and database (started using the given function, when not running).
+        Must be called in the request context of the socket.
+
+        :return: Sampling interval, and the graph samples collected so far.
+        """
+        self.unsubscribe(socket_id)
+
+        key = sampler_key(manager, did)
+        subscriber = _Subscriber(socket_id, sid)
+        with self._lock:
+            sampler = self._samplers.get(key)
+            history = sampler.add(subscriber) if sampler else None
+            if history is None:
+                # Not running, or stopped after its last subscriber failed.
+                sampler = self._samplers[key] = \
+                    DashboardSampler(key, did, emit)
+                history = sampler.add(subscriber)
+                start(sampler.run)
+            self._subscriptions[socket_id] = key
+
+        return {
+            'interval': config.DASHBOARD_SAMPLER_INTERVAL,
+            'samples': history,
+        }
+
+    def unsubscribe(self, socket_id):
+        """
+        Unsubscribe the dashboard (socket), the sampler is stopped when no
+        subscriber is left. Must be called in the request context of the
+        socket.
+        """
+        with self._lock:
+            key = self._subscriptions.pop(socket_id, None)
+            sampler = self._samplers.get(key)
+
+        if sampler is None:
+            return
+
+        sampler.remove(socket_id)
+        with self._lock:
+            if len(sampler) == 0 and self._samplers.get(key) is sampler:
+                del self._samplers[key]
+                sampler.stop()
+
+    def latest(self, manager, did):
+        """
+        Returns the latest sample of the given server, and database, when it
+        is collected in the last interval.
+        """
+        if not self.enabled():
+            return None
+
+        with self._lock:
+            sampler = self._samplers.get(sampler_key(manager, did))
+
+        if sampler is None or not sampler.is_fresh():
+            return None
+        return sampler.latest
+
+    def info(self):
+        with self._lock:
+            return {
+                'samplers': len(self._samplers),
+                'subscribers': len(self._subscriptions),
+            }
+
+
+samplers = SamplerRegistry()
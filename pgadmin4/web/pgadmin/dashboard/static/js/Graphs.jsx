@@ -18,6 +18,8 @@ import PropTypes from 'prop-types';
 import StreamingChart from '../../../static/js/components/PgChart/StreamingChart';
 import { Grid, useTheme } from '@mui/material';
 import { getChartColor, toPrettySize } from '../../../static/js/utils';
+import { openSocket, socketApiGet } from '../../../static/js/socket_instance';
+import pgAdmin from 'sources/pgadmin';
 
 export const X_AXIS_LENGTH = 75;
 
@@ -104,6 +106,25 @@ export default function Graphs({preferences, sid, did, pageVisible, enablePoll=t
   const [errorMsg, setErrorMsg] = useState(null);
   const [pollDelay, setPollDelay] = useState(1000);
   const [chartDrawnOnce, setChartDrawnOnce] = useState(false);
+  /* Refresh rate of the shared sampler, when the graphs are pushed by it */
+  const [samplerRate, setSamplerRate] = useState(null);
+  const sharedSampler = enablePoll && !isTest && Boolean(pgAdmin.dashboard_shared_sampler);
+
+  const resetStats = ()=>{
+    sessionStatsReduce({reset: chartsDefault['session_stats']});
+    tpsStatsReduce({reset:chartsDefault['tps_stats']});
+    tiStatsReduce({reset:chartsDefault['ti_stats']});
+    toStatsReduce({reset:chartsDefault['to_stats']});
+    bioStatsReduce({reset:chartsDefault['bio_stats']});
+  };
+
+  const applyStats = (data, prevData={})=>{
+    sessionStatsReduce({incoming: data['session_stats']});
+    tpsStatsReduce({incoming: data['tps_stats'], counter: true, counterData: prevData['tps_stats']});
+    tiStatsReduce({incoming: data['ti_stats'], counter: true, counterData: prevData['ti_stats']});
+    toStatsReduce({incoming: data['to_stats'], counter: true, counterData: prevData['to_stats']});
+    bioStatsReduce({incoming: data['bio_stats'], counter: true, counterData: prevData['bio_stats']});
+  };
 
   useEffect(()=>{
     let calcPollDelay = false;
@@ -145,6 +166,55 @@ export default function Graphs({preferences, sid, did, pageVisible, enablePoll=t
     }
   }, [pageVisible]);
 
+  useEffect(()=>{
+    /* The graphs of all the dashboards of the server are sampled once, and
+     * pushed by the server, starting with the samples collected so far. */
+    if(!sharedSampler || !sid) {
+      return;
+    }
+    let socket = null, closed = false;
+    openSocket('/dashboard')
+      .then((socketObj)=>{
+        socket = socketObj;
+        if(closed) {
+          socket.disconnect();
+          return;
+        }
+        return socketApiGet(socket, 'subscribe', {sid: sid, did: did > 0 ? did : null});
+      })
+      .then((res)=>{
+        if(closed || !res) {
+          return;
+        }
+        let prevData = {};
+        resetStats();
+        res.samples.forEach((sample)=>{
+          applyStats(sample.stats, prevData);
+          prevData = sample.stats;
+        });
+        setSamplerRate(res.interval);
+        setErrorMsg(null);
+
+        socket.on('sample', (sample)=>{
+          applyStats(sample.stats, prevData);
+          prevData = sample.stats;
+        });
+        socket.on('sampler_failed', ()=>{
+          resetStats();
+          setErrorMsg(gettext('An error occurred whilst rendering the graph.'));
+        });
+      })
+      .catch((error)=>{
+        resetStats();
+        setErrorMsg(error.message);
+      });
+
+    return ()=>{
+      closed = true;
+      socket?.disconnect();
+    };
+  }, [sid, did, sharedSampler]);
+
   useInterval(()=>{
     const currEpoch = getEpoch();
     if(refreshOn.current === null) {
@@ -171,11 +241,7 @@ export default function Graphs({preferences, sid, did, pageVisible, enablePoll=t
       .then((resp)=>{
         let data = resp.data;
         setErrorMsg(null);
-        sessionStatsReduce({incoming: data['session_stats']});
-        tpsStatsReduce({incoming: data['tps_stats'], counter: true, counterData: counterData['tps_stats']});
-        tiStatsReduce({incoming: data['ti_stats'], counter: true, counterData: counterData['ti_stats']});
-        toStatsReduce({incoming: data['to_stats'], counter: true, counterData: counterData['to_stats']});
-        bioStatsReduce({incoming: data['bio_stats'], counter: true, counterData: counterData['bio_stats']});
+        applyStats(data, counterData);
 
         setCounterData((prevCounterData)=>{
           return {
@@ -186,11 +252,7 @@ export default function Graphs({preferences, sid, did, pageVisible, enablePoll=t
       })
       .catch((error)=>{
         if(!errorMsg) {
-          sessionStatsReduce({reset: chartsDefault['session_stats']});
-          tpsStatsReduce({reset:chartsDefault['tps_stats']});
-          tiStatsReduce({reset:chartsDefault['ti_stats']});
-          toStatsReduce({reset:chartsDefault['to_stats']});
-          bioStatsReduce({reset:chartsDefault['bio_stats']});
+          resetStats();
           setCounterData({});
           if(error.response) {
             if (error.response.status === 428) {
@@ -206,18 +268,18 @@ export default function Graphs({preferences, sid, did, pageVisible, enablePoll=t
           }
         }
       });
-  }, enablePoll ? pollDelay : -1);
+  }, (enablePoll && !sharedSampler) ? pollDelay : -1);
 
   return (
     <>
       <div data-testid='graph-poll-delay' style={{display: 'none'}}>{pollDelay}</div>
       {chartDrawnOnce &&
         <GraphsWrapper
-          sessionStats={transformData(sessionStats, preferences['session_stats_refresh'], theme.name)}
-          tpsStats={transformData(tpsStats, preferences['tps_stats_refresh'], theme.name)}
-          tiStats={transformData(tiStats, preferences['ti_stats_refresh'], theme.name)}
-          toStats={transformData(toStats, preferences['to_stats_refresh'], theme.name)}
-          bioStats={transformData(bioStats, preferences['bio_stats_refresh'], theme.name)}
+          sessionStats={transformData(sessionStats, samplerRate ?? preferences['session_stats_refresh'], theme.name)}
+          tpsStats={transformData(tpsStats, samplerRate ?? preferences['tps_stats_refresh'], theme.name)}
+          tiStats={transformData(tiStats, samplerRate ?? preferences['ti_stats_refresh'], theme.name)}
+          toStats={transformData(toStats, samplerRate ?? preferences['to_stats_refresh'], theme.name)}
+          bioStats={transformData(bioStats, samplerRate ?? preferences['bio_stats_refresh'], theme.name)}
           errorMsg={errorMsg}
           showTooltip={preferences['graph_mouse_track']}
           showDataPoints={preferences['graph_data_points']}
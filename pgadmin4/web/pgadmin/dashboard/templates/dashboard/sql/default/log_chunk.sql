@@ -0,0 +1,12 @@
+/*pga4dash*/
+{% if file_name %}
+{% set log_file = file_name|qtLiteral(conn) %}
+{% elif log_format != '' %}
+{% set log_file = "pg_catalog.pg_current_logfile('" ~ log_format ~ "')" %}
+{% else %}
+{% set log_file = "pg_catalog.pg_current_logfile()" %}
+{% endif %}
+SELECT
+    {{ log_file }} AS file_name,
+    (pg_catalog.pg_stat_file({{ log_file }})).size AS size,
+    pg_catalog.encode(pg_catalog.pg_read_binary_file({{ log_file }}, {{ st }}, {{ length }}), 'base64') AS data
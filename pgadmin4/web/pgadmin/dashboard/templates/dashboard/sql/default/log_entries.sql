@@ -0,0 +1,7 @@
+/*pga4dash*/
+SELECT
+    pg_catalog.encode(pg_catalog.pg_read_binary_file({{ file_name|qtLiteral(conn) }}, r.st, r.length), 'base64') AS data
+FROM
+    pg_catalog.unnest(ARRAY[{{ offsets|join(', ') }}]::bigint[], ARRAY[{{ lengths|join(', ') }}]::bigint[]) WITH ORDINALITY AS r(st, length, pos)
+ORDER BY
+    r.pos
@@ -0,0 +1,200 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2025, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import json
+import threading
+import time
+from unittest.mock import patch
+
+from flask import Flask
+
+import config
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.dashboard import sampler as sampler_module
+from pgadmin.dashboard.sampler import SamplerRegistry
+
+
+class FakeConnection:
+    def __init__(self, test, sid):
+        self.test = test
+        self.sid = sid
+        self.is_connected = False
+
+    def connected(self):
+        return self.is_connected
+
+    def connect(self):
+        if self.sid in self.test.failing:
+            return False, 'connection refused'
+        self.is_connected = True
+        return True, None
+
+    def execute_dict(self, sql):
+        with self.test.lock:
+            self.test.queries.append((self.sid, sql))
+        if sql == 'dashboard_stats.sql':
+            return True, {'rows': [{
+                'chart_name': 'session_stats',
+                'chart_data': json.dumps({'Total': len(self.test.queries)})
+            }]}
+        return True, {'rows': [{'pid': 1, 'state': 'active'}]}
+
+
+class FakeManager:
+    def __init__(self, test, sid, role=None):
+        self.test = test
+        self.sid = sid
+        self.host = 'localhost'
+        self.port = 5432
+        self.user = 'postgres'
+        self.role = role
+        self.version = 160000
+
+    def connection(self, **kwargs):
+        return self.test.connections.setdefault(
+            self.sid, FakeConnection(self.test, self.sid))
+
+    def release(self, **kwargs):
+        self.test.released.append(self.sid)
+        self.connection().is_connected = False
+
+
+class FakeDriver:
+    def __init__(self, test):
+        self.test = test
+
+    def connection_manager(self, sid):
+        return self.test.managers[sid]
+
+
+class TestDashboardSampler(BaseTestGenerator):
+    """ This class tests sharing the dashboard sampler between the
+    dashboards of a server. """
+
+    scenarios = [
+        ('Share the sampler, the next dashboard takes over when the first '
+         'one leaves', dict(failing=set())),
+        ('The next dashboard takes over when the first one fails',
+         dict(failing={1})),
+    ]
+
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.lock = threading.Lock()
+        self.queries = []
+        self.events = []
+        self.released = []
+        self.threads = []
+        self.connections = {}
+        self.managers = {
+            1: FakeManager(self, 1),
+            2: FakeManager(self, 2),
+            3: FakeManager(self, 3, role='reader'),
+        }
+        self.registry = SamplerRegistry()
+
+        self.patches = [
+            patch.object(sampler_module, 'get_driver',
+                         return_value=FakeDriver(self)),
+            patch.object(sampler_module, 'render_template',
+                         lambda path, **kwargs: path.split('/')[-1]),
+            patch.object(sampler_module, 'get_locale', return_value='en'),
+            patch.object(config, 'DASHBOARD_SHARED_SAMPLER', True),
+            patch.object(config, 'DASHBOARD_SAMPLER_INTERVAL', 0.02),
+            patch.object(config, 'DASHBOARD_SAMPLER_HISTORY', 3),
+        ]
+        for p in self.patches:
+            p.start()
+
+    def tearDown(self):
+        for p in reversed(self.patches):
+            p.stop()
+
+    def emit(self, event, data, to):
+        with self.lock:
+            self.events.append((event, to))
+
+    def start(self, func):
+        thread = threading.Thread(target=func)
+        self.threads.append(thread)
+        thread.start()
+
+    def subscribe(self, socket_id, sid):
+        with self.app.test_request_context():
+            return self.registry.subscribe(socket_id, sid, None,
+                                           self.managers[sid], self.emit,
+                                           self.start)
+
+    def unsubscribe(self, socket_id):
+        with self.app.test_request_context():
+            self.registry.unsubscribe(socket_id)
+
+    def wait_for(self, check):
+        deadline = time.monotonic() + 5
+        while not check():
+            self.assertLess(time.monotonic(), deadline)
+            time.sleep(0.005)
+
+    def runTest(self):
+        self.subscribe('first', 1)
+        if self.failing:
+            # The first dashboard fails, and is removed.
+            self.wait_for(lambda: ('sampler_failed', 'first') in self.events)
+            self.wait_for(lambda: self.threads[0].is_alive() is False)
+            self.assertEqual(self.registry.info()['subscribers'], 1)
+
+            # A new sampler is started for the next dashboard.
+            res = self.subscribe('second', 2)
+            self.assertEqual(res['samples'], [])
+            self.assertEqual(len(self.threads), 2)
+            self.wait_for(lambda: ('sample', 'second') in self.events)
+            self.unsubscribe('first')
+            self.unsubscribe('second')
+            self.threads[1].join(5)
+            self.assertEqual(self.registry.info()['samplers'], 0)
+            return
+
+        self.wait_for(lambda: self.events.count(('sample', 'first')) >= 4)
+
+        # The second dashboard starts with the history, and is served by
+        # the same sampler.
+        res = self.subscribe('second', 2)
+        self.assertEqual(res['interval'], 0.02)
+        self.assertEqual(len(res['samples']), 3)
+        self.assertEqual(list(res['samples'][0]['stats']), ['session_stats'])
+        self.assertEqual(len(self.threads), 1)
+        self.assertIsNotNone(self.registry.latest(self.managers[2], None))
+
+        # Another role has its own sampler.
+        self.subscribe('third', 3)
+        self.assertEqual(len(self.threads), 2)
+        self.assertIsNone(self.registry.latest(self.managers[3], 1))
+        self.unsubscribe('third')
+
+        self.wait_for(lambda: ('sample', 'second') in self.events)
+        # Only the connection of the first dashboard is used.
+        self.assertEqual(set(sid for sid, _ in self.queries), {1, 3})
+        self.assertEqual(
+            set(sql for sid, sql in self.queries),
+            {'dashboard_stats.sql', 'activity.sql', 'locks.sql',
+             'prepared.sql'}
+        )
+
+        # The second dashboard takes over, once the first one leaves.
+        self.unsubscribe('first')
+        self.assertIn(1, self.released)
+        self.wait_for(lambda: any(sid == 2 for sid, _ in self.queries))
+
+        self.unsubscribe('second')
+        self.assertIn(2, self.released)
+        for thread in self.threads:
+            thread.join(5)
+            self.assertFalse(thread.is_alive())
+        self.assertEqual(self.registry.info(),
+                         {'samplers': 0, 'subscribers': 0})
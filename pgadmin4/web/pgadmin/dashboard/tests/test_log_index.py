@@ -0,0 +1,117 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2025, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import json
+
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.dashboard.log_index import LogIndex
+
+PLAIN_LOG = (
+    '2025-01-01 10:00:00.100 UTC [11] LOG:  database system is ready\n'
+    '2025-01-01 10:00:01.200 UTC [12] ERROR:  relation "t" does not exist\n'
+    '2025-01-01 10:00:01.200 UTC [12] STATEMENT:  SELECT * FROM t;\n'
+    '\tcontinued\n'
+    '2025-01-01 10:00:02.300 UTC [13] WARNING:  über warning\n'
+    '2025-01-01 10:00:03.400 UTC [14] LOG:  checkpoint starting\n'
+).encode('utf-8')
+
+CSV_LOG = (
+    '2025-01-01 10:00:00.100 UTC,,,11,,a,1,,,,,LOG,00000,'
+    '"database system is ready",,,,,,,,,"",postmaster,,0\n'
+    '2025-01-01 10:00:01.200 UTC,"postgres","postgres",12,,b,2,SELECT,,,,'
+    'ERROR,42P01,"relation ""t"" does not exist",,,,,,"SELECT *\n'
+    'FROM t;",15,,"psql","client backend",,0\n'
+    '2025-01-01 10:00:02.300 UTC,,,13,,c,3,,,,,WARNING,01000,'
+    '"über warning",,,,,,,,,"",,,0\n'
+    '2025-01-01 10:00:03.400 UTC,,,14,,d,4,,,,,LOG,00000,'
+    '"checkpoint starting",,,,,,,,,"",checkpointer,,0\n'
+).encode('utf-8')
+
+JSON_LOG = ''.join(json.dumps(entry) + '\n' for entry in [
+    {'timestamp': '2025-01-01 10:00:00.100 UTC', 'error_severity': 'LOG',
+     'message': 'database system is ready'},
+    {'timestamp': '2025-01-01 10:00:01.200 UTC', 'error_severity': 'ERROR',
+     'message': 'relation "t" does not exist'},
+    {'timestamp': '2025-01-01 10:00:02.300 UTC',
+     'error_severity': 'WARNING', 'message': 'über warning'},
+    {'timestamp': '2025-01-01 10:00:03.400 UTC', 'error_severity': 'LOG',
+     'message': 'checkpoint starting'},
+]).encode('utf-8')
+
+
+class TestLogIndex(BaseTestGenerator):
+    """ This class tests indexing the server log incrementally. """
+
+    scenarios = [
+        ('Index the plain text log', dict(
+            log_format='', log=PLAIN_LOG,
+            # The statement lines are appended to the message as is.
+            error_message='  relation "t" does not exist'
+                          '2025-01-01 10:00:01.200 UTC [12] STATEMENT:  '
+                          'SELECT * FROM t;\tcontinued',
+            warning_message='  über warning')),
+        ('Index the CSV log', dict(
+            log_format='csvlog', log=CSV_LOG,
+            error_message='relation "t" does not exist',
+            warning_message='über warning')),
+        ('Index the JSON log', dict(
+            log_format='jsonlog', log=JSON_LOG,
+            error_message='relation "t" does not exist',
+            warning_message='über warning')),
+    ]
+
+    def read(self, index, positions):
+        chunks = [
+            self.log[offset:offset + length]
+            for offset, length in index.ranges(positions)
+        ]
+        return [index.parse(entry)
+                for entry in index.split(positions, chunks)]
+
+    def runTest(self):
+        expected = LogIndex('postgresql.log', self.log_format)
+        expected.add_chunk(self.log, len(self.log))
+        self.assertEqual(len(expected), 4)
+        self.assertEqual(expected.offset, len(self.log))
+
+        # Read the log in chunks (larger than an entry), at any byte
+        # boundary.
+        for chunk_size in (200, 257, 333):
+            index = LogIndex('postgresql.log', self.log_format)
+            while index.offset < len(self.log):
+                data = self.log[index.offset:index.offset + chunk_size]
+                self.assertGreater(index.add_chunk(data, len(self.log)), 0)
+            self.assertEqual(list(index.offsets), list(expected.offsets))
+            self.assertEqual(list(index.lengths), list(expected.lengths))
+            self.assertEqual(list(index.times), list(expected.times))
+
+        # The incomplete last entry is indexed once complete.
+        index = LogIndex('postgresql.log', self.log_format)
+        index.add_chunk(self.log[:-5], len(self.log) - 5)
+        self.assertEqual(len(index), 3)
+        index.add_chunk(self.log[index.offset:], len(self.log))
+        self.assertEqual(len(index), 4)
+
+        entries = self.read(index, range(len(index)))
+        self.assertEqual([entry['error_severity'] for entry in entries],
+                         ['LOG', 'ERROR', 'WARNING', 'LOG'])
+        self.assertEqual(entries[1]['message'], self.error_message)
+        self.assertEqual(entries[2]['message'], self.warning_message)
+
+        # Seek by time, and filter by severity.
+        self.assertEqual(index.seek('2025-01-01 10:00:01.5'), 2)
+        self.assertEqual(index.seek('2025-01-01 10:00:01'), 1)
+        positions, next_pos = index.find(0, 1, ['ERROR', 'WARNING'])
+        self.assertEqual((positions, next_pos), ([1], 2))
+        positions, next_pos = index.find(next_pos, 10, ['ERROR', 'WARNING'])
+        self.assertEqual((positions, next_pos), ([2], 4))
+        self.assertEqual(
+            [entry['message'] for entry in self.read(index, [0, 2, 3])][1],
+            self.warning_message
+        )
@@ -11,15 +11,21 @@
 A blueprint module providing utility functions for the notify the user about
 the long running background-processes.
 """
-from flask import url_for
+from flask import url_for, request
+from flask_security import current_user
+from pgadmin import socketio
+from pgadmin.authenticate import socket_login_required
+from pgadmin.model import Process
 from pgadmin.user_login_check import pga_login_required
 from pgadmin.utils import PgAdminModule
 from pgadmin.utils.ajax import make_response, gone, success_return,\
     make_json_response
 
-from .processes import BatchProcess
+from .processes import BatchProcess, PROCESS_NOT_FOUND
+from .watcher import watchers
 
 MODULE_NAME = 'bgprocess'
+SOCKETIO_NAMESPACE = '/{0}'.format(MODULE_NAME)
 
 
 class BGProcessModule(PgAdminModule):
@@ -147,6 +153,64 @@ def stop_process(pid):
         return gone(errormsg=str(lerr))
 
 
+@socketio.on('connect', namespace=SOCKETIO_NAMESPACE)
+@socket_login_required
+def connect():
+    """
+    Connect to the server through socket.
+    :return:
+    :rtype:
+    """
+    socketio.emit('connected', {'sid': request.sid},
+                  namespace=SOCKETIO_NAMESPACE,
+                  to=request.sid)
+
+
+def _emit_process_event(event, data, to):
+    socketio.emit(event, data, namespace=SOCKETIO_NAMESPACE, to=to)
+
+
+@socketio.on('subscribe', namespace=SOCKETIO_NAMESPACE)
+@socket_login_required
+def subscribe(params):
+    """
+    Subscribe to the state transitions of the background process, and (if
+    logs) its new log lines, sent as the 'process_status', and the
+    'process_log' events. The status (and the log lines written since the
+    given positions) are sent back.
+    :param params: Process ID (pid), logs, and the positions of the last
+    stdout (out), and stderr (err) fetched.
+    """
+    pid = params.get('pid')
+    process = Process.query.filter_by(
+        pid=pid, user_id=current_user.id
+    ).first()
+    if process is None:
+        socketio.emit('subscribe_failed',
+                      {'pid': pid, 'errormsg': str(PROCESS_NOT_FOUND)},
+                      namespace=SOCKETIO_NAMESPACE, to=request.sid)
+        return
+
+    data = watchers.subscribe(
+        request.sid, process.pid, process.logdir, _emit_process_event,
+        socketio.start_background_task, logs=bool(params.get('logs')),
+        out=int(params.get('out') or 0), err=int(params.get('err') or 0)
+    )
+    socketio.emit('subscribe_success', data,
+                  namespace=SOCKETIO_NAMESPACE, to=request.sid)
+
+
+@socketio.on('unsubscribe', namespace=SOCKETIO_NAMESPACE)
+def unsubscribe(params):
+    watchers.unsubscribe(request.sid, params.get('pid'),
+                         bool(params.get('logs')))
+
+
+@socketio.on('disconnect', namespace=SOCKETIO_NAMESPACE)
+def disconnect():
+    watchers.unsubscribe(request.sid)
+
+
 def escape_dquotes_process_arg(arg):
     # Double quotes has special meaning for shell command line and they are
     # run without the double quotes. Add extra quotes to save our double
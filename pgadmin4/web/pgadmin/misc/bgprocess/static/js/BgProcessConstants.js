@@ -8,6 +8,8 @@
 //////////////////////////////////////////////////////////////
 export const BgProcessManagerEvents = {
   LIST_UPDATED: 'LIST_UPDATED',
+  PROCESS_LOG: 'PROCESS_LOG',
+  SOCKET_DISCONNECTED: 'SOCKET_DISCONNECTED',
 };
 
 export const BgProcessManagerProcessState = {
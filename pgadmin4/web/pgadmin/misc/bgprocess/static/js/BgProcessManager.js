@@ -7,6 +7,7 @@
 //
 //////////////////////////////////////////////////////////////
 import getApiInstance, { parseApiError } from '../../../../static/js/api_instance';
+import { openSocket } from '../../../../static/js/socket_instance';
 import url_for from 'sources/url_for';
 import EventBus from '../../../../static/js/helpers/EventBus';
 import gettext from 'sources/gettext';
@@ -35,6 +36,8 @@ export default class BgProcessManager {
     this._workerId = null;
     this._pendingJobId = [];
     this._eventManager = new EventBus();
+    this._socket = null;
+    this._socketConnected = false;
   }
 
   init() {
@@ -58,11 +61,74 @@ export default class BgProcessManager {
     await self.syncProcesses();
     /* Fill the pending jobs initially */
     self._pendingJobId = this.procList.filter((p)=>(p.process_state == BgProcessManagerProcessState.PROCESS_STARTED)).map((p)=>p.id);
+    /* Poll the server, only when the state transitions can not be pushed */
     this._workerId = setInterval(()=>{
-      if(self._pendingJobId.length > 0) {
+      if(self._pendingJobId.length > 0 && !self._socketConnected) {
         self.syncProcesses();
       }
     }, WORKER_INTERVAL);
+    await self.openSocket();
+  }
+
+  async openSocket() {
+    try {
+      this._socket = await openSocket('/bgprocess');
+    } catch (error) {
+      console.error(error);
+      return;
+    }
+    this.socketConnected();
+    /* Reconnected, the subscriptions are lost */
+    this._socket.on('connected', ()=>this.socketConnected());
+    this._socket.on('disconnect', ()=>{
+      this._socketConnected = false;
+      this._eventManager.fireEvent(BgProcessManagerEvents.SOCKET_DISCONNECTED);
+    });
+    this._socket.on('subscribe_success', (data)=>{
+      if(data.logs) {
+        this._eventManager.fireEvent(BgProcessManagerEvents.PROCESS_LOG, data);
+      } else if(data.exit_code != null) {
+        this.syncProcesses();
+      }
+    });
+    this._socket.on('process_status', ()=>{
+      this.syncProcesses();
+    });
+    this._socket.on('process_log', (data)=>{
+      this._eventManager.fireEvent(BgProcessManagerEvents.PROCESS_LOG, data);
+    });
+  }
+
+  socketConnected() {
+    this._socketConnected = true;
+    this._pendingJobId.forEach((jobId)=>this.watchProcess(jobId));
+  }
+
+  watchProcess(jobId) {
+    if(this._socketConnected) {
+      this._socket.emit('subscribe', {pid: jobId});
+    }
+  }
+
+  /* Returns the function to stop watching the logs, or null when the logs
+   * can not be pushed (the caller must poll the server instead). */
+  watchProcessLogs(jobId, out, err, callback) {
+    if(!this._socketConnected) {
+      return null;
+    }
+    const onLogs = (data)=>{
+      if(data.pid == jobId) {
+        callback(data);
+      }
+    };
+    this._eventManager.registerListener(BgProcessManagerEvents.PROCESS_LOG, onLogs);
+    this._socket.emit('subscribe', {pid: jobId, logs: true, out: out, err: err});
+    return ()=>{
+      this._eventManager.deregisterListener(BgProcessManagerEvents.PROCESS_LOG, onLogs);
+      if(this._socketConnected) {
+        this._socket.emit('unsubscribe', {pid: jobId, logs: true});
+      }
+    };
   }
 
   evaluateProcessState(p) {
@@ -105,6 +171,9 @@ export default class BgProcessManager {
     }).map((p)=>p.id);
     this._pendingJobId = this._pendingJobId.filter((id)=>{
       if(completedProcIds.includes(id)) {
+        if(this._socketConnected) {
+          this._socket.emit('unsubscribe', {pid: id});
+        }
         let p = this.procList.find((p)=>p.id==id);
         BgProcessNotify.processCompleted(p?.desc, p?.process_state, this.openProcessesPanel.bind(this));
         if(p.server_id != null) {
@@ -119,6 +188,7 @@ export default class BgProcessManager {
   startProcess(jobId, desc) {
     if(jobId) {
       this._pendingJobId.push(jobId);
+      this.watchProcess(jobId);
       BgProcessNotify.processStarted(desc, this.openProcessesPanel.bind(this));
     }
   }
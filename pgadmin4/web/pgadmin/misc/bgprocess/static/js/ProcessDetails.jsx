@@ -7,14 +7,14 @@
 //
 //////////////////////////////////////////////////////////////
 
-import React, { useState, useMemo } from 'react';
+import React, { useState, useMemo, useEffect } from 'react';
 import { styled } from '@mui/material/styles';
 import gettext from 'sources/gettext';
 import url_for from 'sources/url_for';
 import { Box } from '@mui/material';
 import PropTypes from 'prop-types';
 import { MESSAGE_TYPE, NotifierMessage } from '../../../../static/js/components/FormComponents';
-import { BgProcessManagerProcessState } from './BgProcessConstants';
+import { BgProcessManagerEvents, BgProcessManagerProcessState } from './BgProcessConstants';
 import { DefaultButton, PgIconButton } from '../../../../static/js/components/Buttons';
 import BlockRoundedIcon from '@mui/icons-material/BlockRounded';
 import AccessTimeRoundedIcon from '@mui/icons-material/AccessTimeRounded';
@@ -86,6 +86,7 @@ export default function ProcessDetails({data}) {
   const [exitCode, setExitCode] = useState(data.exit_code);
   const [timeTaken, setTimeTaken] = useState(data.execution_time);
   const [stopping, setStopping] = useState(false);
+  const [watching, setWatching] = useState(false);
 
   let notifyType = MESSAGE_TYPE.INFO;
   let notifyText = gettext('Not started');
@@ -117,11 +118,10 @@ export default function ProcessDetails({data}) {
     notifyText = gettext('Terminating the process...');
   }
 
-  useInterval(async ()=>{
+  const updateLogs = (resData)=>{
     const logsSortComp = (l1, l2)=>{
       return l1[0].localeCompare(l2[0]);
     };
-    let resData = await getDetailedStatus(api, data.id, outPos, errPos);
     resData.out.lines.sort(logsSortComp);
     resData.err.lines.sort(logsSortComp);
     if(resData.out?.done && resData.err?.done && resData.exit_code != null) {
@@ -137,8 +137,27 @@ export default function ProcessDetails({data}) {
         ...resData.err.lines.map((l)=>l[1]),
       ];
     });
+  };
+
+  /* The new logs are pushed by the server, when possible */
+  useEffect(()=>{
+    const manager = pgAdmin.Browser.BgProcessManager;
+    const stopWatching = manager.watchProcessLogs(data.id, outPos, errPos, updateLogs);
+    if(!stopWatching) {
+      return;
+    }
+    const onDisconnect = ()=>setWatching(false);
+    manager.registerListener(BgProcessManagerEvents.SOCKET_DISCONNECTED, onDisconnect);
+    setWatching(true);
+    return ()=>{
+      manager.deregisterListener(BgProcessManagerEvents.SOCKET_DISCONNECTED, onDisconnect);
+      stopWatching();
+    };
+  }, []);
 
-  }, completed ? -1 : 1000);
+  useInterval(async ()=>{
+    updateLogs(await getDetailedStatus(api, data.id, outPos, errPos));
+  }, (completed || watching) ? -1 : 1000);
 
   const onStopProcess = ()=>{
     setStopping(true);
@@ -0,0 +1,294 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2025, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import json
+import os
+import shutil
+import tempfile
+
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.misc.bgprocess.processes import get_current_time
+from pgadmin.misc.bgprocess.watcher import ProcessWatcher, WatcherRegistry
+
+
+class Client:
+    """ Collects the events sent to the sockets. """
+
+    def __init__(self):
+        self.events = []
+
+    def emit(self, event, data, to):
+        self.events.append((event, data, to))
+
+    def pop(self, event, to=None):
+        events = [data for name, data, socket_id in self.events
+                  if name == event and (to is None or socket_id == to)]
+        self.events = [e for e in self.events
+                       if e[0] != event or (to is not None and e[2] != to)]
+        return events
+
+
+class NotNone:
+    """ Equal to any value, but None. """
+
+    def __eq__(self, other):
+        return other is not None
+
+    def __repr__(self):
+        return 'NotNone()'
+
+
+class WatcherTestMixin:
+    """ Writes the log, and the status files of the process watched by the
+    process watcher tests. """
+
+    def setUp(self):
+        self.logdir = tempfile.mkdtemp()
+        self.client = Client()
+
+    def log(self, name, lines=(), partial=''):
+        with open(os.path.join(self.logdir, name), 'a') as fp:
+            for line in lines:
+                fp.write('{0},{1}\n'.format(get_current_time(
+                    format='%y%m%d%H%M%S%f'), line))
+            fp.write(partial)
+
+    def status(self, **kwargs):
+        path = os.path.join(self.logdir, 'status')
+        data = dict()
+        if os.path.exists(path):
+            with open(path) as fp:
+                data = json.load(fp)
+        data.update(kwargs)
+        with open(path, 'w') as fp:
+            json.dump(data, fp)
+        # The mtime may not change within the same tick.
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns,
+                           stat.st_mtime_ns + 1000000 * len(data)))
+
+    def tearDown(self):
+        shutil.rmtree(self.logdir, ignore_errors=True)
+
+
+class TestProcessWatcher(WatcherTestMixin, BaseTestGenerator):
+    """ This class tests watching the background processes.
+
+    The steps are:
+        ('log', name, lines, partial line)
+        ('start',) and ('exit', exit code) of the process
+        ('add', socket id, options, expected data) - the 'out_lines' option
+            is the position after that many lines of the out log, and the
+            'out' of the expected data is its lines
+        ('check', expected result, expected logs by the socket id, expected
+            statuses) - the expected logs of a socket are its out, and err
+            lines (when any), and done (when done)
+    """
+
+    scenarios = [
+        ('Send the complete log lines only',
+         dict(steps=[
+             ('start',),
+             ('add', 'sid', dict(logs=True), dict(out=[])),
+             ('log', 'out', ['line 1', 'line 2'], '123,line'),
+             ('log', 'err', ['error 1'], ''),
+             ('check', True,
+              dict(sid=dict(out=['line 1', 'line 2'], err=['error 1'])),
+              [dict(exit_code=None, done=False)]),
+             # The rest of the line is written.
+             ('log', 'out', [], ' 3\n'),
+             ('log', 'out', ['line 4'], ''),
+             ('check', True, dict(sid=dict(out=['line 3', 'line 4'])), []),
+             # Nothing new, nothing sent.
+             ('check', True, dict(), []),
+         ])),
+        ('Catch up the logs for another subscriber',
+         dict(steps=[
+             ('add', 'sid1', dict(logs=True), dict(out=[])),
+             ('log', 'out', ['line 1', 'line 2'], ''),
+             ('check', True, dict(sid1=dict(out=['line 1', 'line 2'])), []),
+             # Another tab opens the details, after the first line.
+             ('add', 'sid2', dict(logs=True, out_lines=1),
+              dict(out=['line 2'])),
+             ('log', 'out', ['line 3'], ''),
+             ('check', True,
+              dict(sid1=dict(out=['line 3']), sid2=dict(out=['line 3'])),
+              []),
+             # The status subscribers do not get the logs.
+             ('add', 'sid3', dict(), dict(exit_code=None)),
+             ('log', 'out', ['line 4'], ''),
+             ('check', True,
+              dict(sid1=dict(out=['line 4']), sid2=dict(out=['line 4'])),
+              []),
+         ])),
+        ('Send the lines from the position of every subscriber',
+         dict(steps=[
+             ('log', 'out', ['line 1', 'line 2'], ''),
+             ('add', 'sid1', dict(logs=True), dict(out=[])),
+             # Resumed after polling the logs, ahead of the other
+             # subscribers.
+             ('add', 'sid2', dict(logs=True, out_lines=1), dict(out=[])),
+             ('add', 'sid3', dict(logs=True), dict(out=[])),
+             ('check', True,
+              dict(sid1=dict(out=['line 1', 'line 2']),
+                   sid2=dict(out=['line 2']),
+                   sid3=dict(out=['line 1', 'line 2'])),
+              []),
+         ])),
+        ('Send the state transitions, and stop after the exit',
+         dict(steps=[
+             ('add', 'sid', dict(logs=True), dict(out=[])),
+             ('check', True, dict(), []),
+             ('start',),
+             ('check', True, dict(),
+              [dict(exit_code=None, execution_time=NotNone(), done=False)]),
+             # The exit code is written before the last lines are read.
+             ('log', 'out', ['last line'], ''),
+             ('exit', 1),
+             ('check', True, dict(sid=dict(out=['last line'])),
+              [dict(exit_code=1, execution_time=NotNone(), done=False)]),
+             ('check', False, dict(sid=dict(out=[], done=True)),
+              [dict(exit_code=1, done=True)]),
+             ('add', 'sid2', dict(), None),
+         ])),
+    ]
+
+    def runTest(self):
+        watcher = ProcessWatcher('12345', self.logdir, self.client.emit)
+
+        for step in self.steps:
+            if step[0] == 'log':
+                self.log(step[1], step[2], step[3])
+            elif step[0] == 'start':
+                self.status(start_time=get_current_time())
+            elif step[0] == 'exit':
+                self.status(end_time=get_current_time(), exit_code=step[1])
+            elif step[0] == 'add':
+                self.add(watcher, *step[1:])
+            else:
+                self.check(watcher, *step[1:])
+
+    def add(self, watcher, socket_id, options, expected):
+        options = dict(options)
+        if 'out_lines' in options:
+            with open(os.path.join(self.logdir, 'out')) as fp:
+                options['out'] = sum(
+                    len(fp.readline())
+                    for _ in range(options.pop('out_lines')))
+
+        data = watcher.add(socket_id, **options)
+        if expected is None:
+            self.assertIsNone(data)
+            return
+
+        if 'out' in data:
+            data['out'] = [line[1] for line in data['out']['lines']]
+        self.assertEqual(dict((name, data[name]) for name in expected),
+                         expected)
+
+    def check(self, watcher, expected, expected_logs, expected_status):
+        self.assertEqual(watcher.check(), expected)
+
+        path = os.path.join(self.logdir, 'out')
+        complete = 0
+        if os.path.exists(path):
+            with open(path) as fp:
+                complete = fp.read().rfind('\n') + 1
+
+        logs = dict()
+        for data, socket_id in [(data, to) for name, data, to
+                                in self.client.events
+                                if name == 'process_log']:
+            self.assertNotIn(socket_id, logs)
+            self.assertEqual(data['out']['pos'], complete)
+            logs[socket_id] = dict(
+                (name, [line[1] for line in data[name]['lines']])
+                for name in ('out', 'err')
+                if data[name]['lines'] or name == 'out'
+            )
+            if data['out']['done']:
+                logs[socket_id]['done'] = True
+        self.assertEqual(logs, expected_logs)
+
+        status = self.client.pop('process_status')
+        self.assertEqual(
+            [dict((name, data[name]) for name in expected)
+             for data, expected in zip(status, expected_status)],
+            expected_status
+        )
+        self.assertEqual(len(status), len(expected_status))
+        self.client.events = []
+
+
+class TestWatcherRegistry(WatcherTestMixin, BaseTestGenerator):
+    """ This class tests sharing a watcher per process, and stopping it
+    when unsubscribed.
+
+    The steps are:
+        ('subscribe', socket id, logs, expected data)
+        ('unsubscribe', socket id, pid)
+        ('exit',) of the first watcher stopped
+    and, the number of the watchers started, and the registry info
+    expected after them.
+    """
+
+    scenarios = [
+        ('Share a watcher per process',
+         dict(steps=[
+             ('subscribe', 'sid1', False,
+              dict(logs=False, start_time=NotNone())),
+             ('subscribe', 'sid2', True, dict(logs=True)),
+         ], expected_started=1,
+             expected_info=dict(watchers=1, subscribers=2))),
+        ('Keep the watcher of the remaining subscriber',
+         dict(steps=[
+             ('subscribe', 'sid1', False, dict(logs=False)),
+             ('subscribe', 'sid2', True, dict(logs=True)),
+             # The browser closed.
+             ('unsubscribe', 'sid2', None),
+         ], expected_started=1,
+             expected_info=dict(watchers=1, subscribers=1))),
+        ('Stop the watcher, when unsubscribed',
+         dict(steps=[
+             ('subscribe', 'sid1', False, dict(logs=False)),
+             ('subscribe', 'sid2', True, dict(logs=True)),
+             ('unsubscribe', 'sid2', None),
+             ('unsubscribe', 'sid1', '12345'),
+         ], expected_started=1,
+             expected_info=dict(watchers=0, subscribers=0))),
+        ('Start a new watcher, when the stopped one exits',
+         dict(steps=[
+             ('subscribe', 'sid1', False, dict(logs=False)),
+             ('unsubscribe', 'sid1', '12345'),
+             ('exit',),
+             ('subscribe', 'sid1', False, dict(logs=False)),
+         ], expected_started=2,
+             expected_info=dict(watchers=1, subscribers=1))),
+    ]
+
+    def runTest(self):
+        registry = WatcherRegistry()
+        started = []
+        self.status(start_time=get_current_time())
+
+        for step in self.steps:
+            if step[0] == 'subscribe':
+                _, socket_id, logs, expected = step
+                data = registry.subscribe(socket_id, '12345', self.logdir,
+                                          self.client.emit, started.append,
+                                          logs=logs)
+                self.assertEqual(
+                    dict((name, data[name]) for name in expected), expected)
+            elif step[0] == 'unsubscribe':
+                registry.unsubscribe(step[1], step[2])
+            else:
+                started[0]()
+
+        self.assertEqual(len(started), self.expected_started)
+        self.assertEqual(registry.info(), self.expected_info)
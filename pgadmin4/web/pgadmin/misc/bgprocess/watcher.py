@@ -0,0 +1,341 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2025, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""Watches the logs, and the status of the background processes."""
+
+import json
+import os
+import re
+import sys
+import threading
+
+from dateutil import parser
+
+import config
+from .processes import BatchProcess, get_current_time
+
+LOG_LINE = re.compile(r"(\d+),(.*$)")
+STATUS_KEYS = ('start_time', 'end_time', 'exit_code')
+
+
+def log_encoding():
+    enc = sys.getdefaultencoding()
+    return 'utf-8' if enc == 'ascii' else enc
+
+
+class _LogTail():
+    """
+    Reads the lines appended to a log file (stdout, or stderr) of the
+    process, keeping the file open.
+    """
+
+    def __init__(self, path, pos=0):
+        self.path = path
+        self.pos = pos
+        self._file = None
+
+    def read(self, end=None):
+        """
+        Returns the complete log lines (as [[time, line, start position]])
+        added since the last read (up to the end position, if given).
+        """
+        if self._file is None:
+            if not os.path.isfile(self.path):
+                return []
+            self._file = open(self.path, 'rb')
+
+        self._file.seek(self.pos)
+        data = self._file.read(-1 if end is None else max(end - self.pos, 0))
+        lines = []
+        start = 0
+        enc = log_encoding()
+        while True:
+            end_of_line = data.find(b'\n', start)
+            if end_of_line < 0:
+                # The last line is not completely written yet.
+                break
+            r = LOG_LINE.split(
+                data[start:end_of_line].decode(enc, 'replace'))
+            if len(r) >= 3:
+                lines.append([r[1], r[2], self.pos + start])
+            start = end_of_line + 1
+
+        self.pos += start
+        return lines
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class _Subscriber():
+    """
+    Socket watching a process - its status, and (if logs) the log lines
+    after the given positions.
+    """
+
+    def __init__(self, socket_id, logs, out, err):
+        self.socket_id = socket_id
+        self.logs = logs
+        self.pos = {'out': out, 'err': err}
+
+
+class ProcessWatcher():
+    """
+    class ProcessWatcher
+
+        Tails the log files, and checks the status file of a background
+        process every config.BGPROCESS_WATCH_INTERVAL seconds, and sends
+        the new log lines (to the subscribers watching the logs), and the
+        state transitions (start, and exit) to all the subscribers.
+
+        The watcher is stopped when the process has exited, and all of its
+        logs are sent, or when no subscriber is left.
+    """
+
+    def __init__(self, pid, logdir, emit, on_stop=None):
+        self.pid = pid
+        self.logdir = logdir
+        self.emit = emit
+        self.on_stop = on_stop
+        self.status = dict((key, None) for key in STATUS_KEYS)
+        self.done = False
+        self._tails = {
+            'out': _LogTail(os.path.join(logdir, 'out')),
+            'err': _LogTail(os.path.join(logdir, 'err')),
+        }
+        self._status_mtime = None
+        self._subscribers = dict()
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._read_status()
+
+    def __len__(self):
+        return len(self._subscribers)
+
+    def _status(self):
+        status = dict(self.status, pid=self.pid, execution_time=None)
+        if status['start_time'] is not None:
+            stime = parser.parse(status['start_time'])
+            etime = parser.parse(status['end_time'] or get_current_time())
+            status['execution_time'] = BatchProcess.total_seconds(
+                etime - stime)
+        return status
+
+    def _logs(self, lines, done, pos):
+        data = self._status()
+        for name in ('out', 'err'):
+            data[name] = {
+                'pos': pos[name],
+                'lines': [line[:2] for line in lines[name]],
+                'done': done
+            }
+        return data
+
+    def add(self, socket_id, logs=False, out=0, err=0):
+        """
+        Add a subscriber, returns the status of the process, and (if logs)
+        the log lines written since the given positions. Returns None, when
+        the watcher is stopped.
+        """
+        with self._lock:
+            if self._stopped.is_set():
+                return None
+
+            subscriber = _Subscriber(socket_id, logs, out, err)
+            if logs and not any(sub.logs for sub in
+                                self._subscribers.values()):
+                # Nobody is watching the logs, start from the positions of
+                # the subscriber.
+                for name, tail in self._tails.items():
+                    tail.pos = subscriber.pos[name]
+            self._subscribers[(socket_id, logs)] = subscriber
+            if not logs:
+                return self._status()
+
+            lines = dict()
+            for name, tail in self._tails.items():
+                lines[name] = []
+                if subscriber.pos[name] < tail.pos:
+                    # The lines already sent to the other subscribers.
+                    catchup = _LogTail(tail.path, subscriber.pos[name])
+                    lines[name] = catchup.read(tail.pos)
+                    catchup.close()
+                    subscriber.pos[name] = tail.pos
+            return self._logs(lines, False, subscriber.pos)
+
+    def remove(self, socket_id, logs=None):
+        with self._lock:
+            for key in [key for key in self._subscribers
+                        if key[0] == socket_id and
+                        (logs is None or key[1] == logs)]:
+                del self._subscribers[key]
+
+    def stop(self):
+        self._stopped.set()
+
+    def _read_status(self):
+        """
+        Returns True, when the status of the process has changed.
+        """
+        path = os.path.join(self.logdir, 'status')
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            return False
+        if mtime == self._status_mtime:
+            return False
+
+        try:
+            with open(path, 'r') as fp:
+                data = json.load(fp)
+        except ValueError:
+            # Being written, read it again the next time.
+            return False
+
+        self._status_mtime = mtime
+        status = dict((key, data.get(key)) for key in STATUS_KEYS)
+        if status == self.status:
+            return False
+        self.status = status
+        return True
+
+    def check(self):
+        """
+        Sends the new log lines, and the status changes to the subscribers.
+        Returns False, when the process is done.
+        """
+        with self._lock:
+            # The exit code is written after the last log lines, read the
+            # logs once more after that.
+            exited = self.status['exit_code'] is not None
+            changed = self._read_status()
+
+            watch_logs = any(sub.logs for sub in self._subscribers.values())
+            lines = dict(
+                (name, tail.read() if watch_logs else [])
+                for name, tail in self._tails.items()
+            )
+            self.done = exited and not any(lines.values())
+            if self.done:
+                # No subscriber can be added anymore.
+                self._stopped.set()
+
+            events = []
+            if changed or self.done:
+                status = self._status()
+                status['done'] = self.done
+                events.extend(
+                    ('process_status', status, socket_id)
+                    for socket_id in set(
+                        key[0] for key in self._subscribers)
+                )
+
+            if watch_logs and (self.done or any(lines.values())):
+                for sub in self._subscribers.values():
+                    if not sub.logs:
+                        continue
+                    # A subscriber may be ahead of the tail (i.e. it was
+                    # polling the logs), skip the lines it has seen.
+                    sub_lines = dict()
+                    for name, tail in self._tails.items():
+                        sub_lines[name] = [line for line in lines[name]
+                                           if line[2] >= sub.pos[name]]
+                        sub.pos[name] = max(sub.pos[name], tail.pos)
+                    data = self._logs(sub_lines, self.done, sub.pos)
+                    data['logs'] = True
+                    events.append(('process_log', data, sub.socket_id))
+
+        for event, data, socket_id in events:
+            self.emit(event, data, socket_id)
+
+        return not self.done
+
+    def run(self):
+        """
+        Watch the process until it is done, or stopped.
+        """
+        try:
+            while not self._stopped.is_set():
+                if not self.check():
+                    break
+                self._stopped.wait(config.BGPROCESS_WATCH_INTERVAL)
+        finally:
+            self._stopped.set()
+            for tail in self._tails.values():
+                tail.close()
+            if self.on_stop:
+                self.on_stop(self)
+
+
+class WatcherRegistry():
+    """
+    Process watchers running in this process, by the process id.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._watchers = dict()
+
+    def subscribe(self, socket_id, pid, logdir, emit, start, logs=False,
+                  out=0, err=0):
+        """
+        Subscribe the socket to the watcher of the process (started using
+        the given function, when not running).
+
+        :return: Status of the process, and (if logs) the log lines since
+            the given positions.
+        """
+        with self._lock:
+            watcher = self._watchers.get(pid)
+            data = watcher.add(socket_id, logs, out, err) \
+                if watcher else None
+            if data is None:
+                # Not running, or stopped after the process was done.
+                watcher = self._watchers[pid] = ProcessWatcher(
+                    pid, logdir, emit, self._stopped)
+                data = watcher.add(socket_id, logs, out, err)
+                start(watcher.run)
+
+        data['logs'] = logs
+        return data
+
+    def unsubscribe(self, socket_id, pid=None, logs=None):
+        """
+        Unsubscribe the socket from the watcher of the process (or, all the
+        watchers), the watcher is stopped when no subscriber is left.
+        """
+        with self._lock:
+            watchers = list(self._watchers.values()) if pid is None \
+                else [self._watchers[pid]] if pid in self._watchers else []
+
+        for watcher in watchers:
+            watcher.remove(socket_id, logs)
+            with self._lock:
+                if len(watcher) == 0 and \
+                        self._watchers.get(watcher.pid) is watcher:
+                    del self._watchers[watcher.pid]
+                    watcher.stop()
+
+    def _stopped(self, watcher):
+        with self._lock:
+            if self._watchers.get(watcher.pid) is watcher:
+                del self._watchers[watcher.pid]
+
+    def info(self):
+        with self._lock:
+            return {
+                'watchers': len(self._watchers),
+                'subscribers': sum(len(watcher) for watcher
+                                   in self._watchers.values()),
+            }
+
+
+watchers = WatcherRegistry()
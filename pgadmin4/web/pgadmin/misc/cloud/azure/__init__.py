@@ -19,19 +19,10 @@ import json
 from flask import session, current_app, request
 from flask_login import current_user
 from config import root
-from pgacloud.utils.azure_cache import load_persistent_cache, \
-    TokenCachePersistenceOptions
 import os
 
-
-from azure.mgmt.rdbms.postgresql_flexibleservers import \
-    PostgreSQLManagementClient
-from azure.identity import AzureCliCredential, DeviceCodeCredential,\
-    AuthenticationRecord
-from azure.mgmt.resource import ResourceManagementClient
-from azure.mgmt.subscription import SubscriptionClient
-from azure.mgmt.rdbms.postgresql_flexibleservers.models import \
-    NameAvailabilityRequest
+# The Azure SDK is imported on demand (by the Azure class), as it takes a
+# significant part of the application startup time.
 
 MODULE_NAME = 'azure'
 
@@ -283,6 +274,7 @@ class Azure:
 
     def _azure_cli_auth(self):
         if self._cli_credentials is None:
+            from azure.identity import AzureCliCredential
             self._cli_credentials = AzureCliCredential()
             self.list_subscriptions()
         return self._cli_credentials
@@ -296,6 +288,10 @@ class Azure:
         session['azure']['azure_auth_code'] = azure_auth_code
 
     def _azure_interactive_auth(self):
+        from azure.identity import DeviceCodeCredential, AuthenticationRecord
+        from pgacloud.utils.azure_cache import load_persistent_cache, \
+            TokenCachePersistenceOptions
+
         if self.authentication_record_json is None:
             _interactive_credential = DeviceCodeCredential(
                 tenant_id=self._tenant_id,
@@ -329,12 +325,16 @@ class Azure:
         _, _credentials = self._get_azure_credentials()
 
         if type == 'postgresql':
+            from azure.mgmt.rdbms.postgresql_flexibleservers import \
+                PostgreSQLManagementClient
             client = PostgreSQLManagementClient(_credentials,
                                                 self.subscription_id)
         elif type == 'resource':
+            from azure.mgmt.resource import ResourceManagementClient
             client = ResourceManagementClient(_credentials,
                                               self.subscription_id)
         elif type == 'subscription':
+            from azure.mgmt.subscription import SubscriptionClient
             client = SubscriptionClient(_credentials)
 
         self._clients[type] = client
@@ -345,6 +345,9 @@ class Azure:
         Checks whether given server name is available or not
         :param cluster_name
         """
+        from azure.mgmt.rdbms.postgresql_flexibleservers.models import \
+            NameAvailabilityRequest
+
         postgresql_client = self._get_azure_client('postgresql')
         res = postgresql_client.check_name_availability.execute(
             NameAvailabilityRequest(
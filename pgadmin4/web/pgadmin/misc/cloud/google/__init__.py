@@ -24,11 +24,9 @@ from pgadmin.user_login_check import pga_login_required
 from flask import session, current_app, request
 from flask_babel import gettext as _
 
-from oauthlib.oauth2 import AccessDeniedError
-from googleapiclient import discovery
-from googleapiclient.errors import HttpError
-from google_auth_oauthlib.flow import InstalledAppFlow
-from google.auth.transport.requests import Request
+# The Google API client libraries are imported on demand (by the
+# Google class), as they take a significant part of the application
+# startup time.
 
 MODULE_NAME = 'google'
 os.environ['OAUTHLIB_INSECURE_TRANSPORT'] = '1'  # Required for Oauth2
@@ -355,6 +353,8 @@ class Google:
         # authentication call
         self._verification_successful = False
         self._verification_error = None
+        from google_auth_oauthlib.flow import InstalledAppFlow
+
         try:
             self._redirect_url = host_url + 'google/callback'
             flow = InstalledAppFlow.from_client_config(
@@ -375,6 +375,9 @@ class Google:
         :param flask_request:
         :return: Success or error message
         """
+        from oauthlib.oauth2 import AccessDeniedError
+        from google_auth_oauthlib.flow import InstalledAppFlow
+
         try:
             authorization_response = flask_request.url
             if session['state'] != flask_request.args.get('state', None):
@@ -421,20 +424,31 @@ class Google:
             if self._credentials and self._credentials.expired and \
                     self._credentials.refresh_token and \
                     self._credentials.has_scopes(scopes):
+                from google.auth.transport.requests import Request
                 self._credentials.refresh(Request())
                 return self._credentials
         return self._credentials
 
+    def _get_service(self, name, version):
+        """
+        Provides the google api client of the given service
+        :param name: Name of the service
+        :param version: Version of the service api
+        :return:
+        """
+        from googleapiclient import discovery
+
+        return discovery.build(name, version,
+                               credentials=self._get_credentials(self._scopes))
+
     def get_projects(self):
         """
         List the google projects for authorised user
         :return:
         """
         projects = []
-        credentials = self._get_credentials(self._scopes)
-        service = discovery.build('cloudresourcemanager',
-                                  self._cloud_resource_manager_api_version,
-                                  credentials=credentials)
+        service = self._get_service('cloudresourcemanager',
+                                    self._cloud_resource_manager_api_version)
         req = service.projects().list()
         res = req.execute()
         for project in res.get('projects', []):
@@ -448,11 +462,11 @@ class Google:
         :param project: google cloud project id.
         :return:
         """
+        from googleapiclient.errors import HttpError
+
         self._project_id = project
-        credentials = self._get_credentials(self._scopes)
-        service = discovery.build('compute',
-                                  self._compute_api_version,
-                                  credentials=credentials)
+        service = self._get_service('compute',
+                                    self._compute_api_version)
         try:
             req = service.regions().list(project=project)
             res = req.execute()
@@ -489,10 +503,8 @@ class Google:
         standard_instances = []
         shared_instances = []
         high_mem = []
-        credentials = self._get_credentials(self._scopes)
-        service = discovery.build('sqladmin',
-                                  self._sqladmin_api_version,
-                                  credentials=credentials)
+        service = self._get_service('sqladmin',
+                                    self._sqladmin_api_version)
         req = service.tiers().list(project=project)
         res = req.execute()
         for item in res.get('items', []):
@@ -526,10 +538,8 @@ class Google:
         """
         pg_database_versions = []
         database_versions = []
-        credentials = self._get_credentials(self._scopes)
-        service = discovery.build('sqladmin',
-                                  self._sqladmin_api_version,
-                                  credentials=credentials)
+        service = self._get_service('sqladmin',
+                                    self._sqladmin_api_version)
         req = service.flags().list()
         res = req.execute()
         for item in res.get('items', []):
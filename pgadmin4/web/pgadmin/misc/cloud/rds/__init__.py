@@ -10,10 +10,8 @@
 # AWS RDS Cloud Deployment Implementation
 
 import requests
-import boto3
 import json
 import pickle
-from boto3.session import Session
 from flask_babel import gettext
 from flask import session, current_app, request
 from pgadmin.user_login_check import pga_login_required
@@ -146,6 +144,10 @@ def get_db_versions():
 def get_regions():
     """GET Regions for AWS."""
     try:
+        # boto3 is imported on demand, as it takes a significant part of
+        # the application startup time.
+        from boto3.session import Session
+
         clear_aws_session()
         _session = Session()
         res = _session.get_available_regions('rds')
@@ -187,6 +189,7 @@ class RDS():
         if type in self._clients:
             return self._clients[type]
 
+        import boto3
         session = boto3.Session(
             aws_access_key_id=self._access_key,
             aws_secret_access_key=self._secret_key,
@@ -30,11 +30,13 @@ from pgadmin.user_login_check import pga_login_required
 from pgadmin.utils import PgAdminModule
 from pgadmin.utils import get_storage_directory
 from pgadmin.utils.ajax import make_json_response, unauthorized, \
-    internal_server_error
+    internal_server_error, get_no_cache_header
 from pgadmin.utils.preferences import Preferences
 from pgadmin.utils.constants import PREF_LABEL_OPTIONS, MIMETYPE_APP_JS, \
     MY_STORAGE
 from pgadmin.settings.utils import get_file_type_setting
+from pgadmin.misc.file_manager.directory_listing import scan_directory, \
+    directory_listings
 
 # Checks if platform is Windows
 if _platform == "win32":
@@ -53,6 +55,16 @@ path_exists = os.path.exists
 split_path = os.path.split
 encode_json = json.JSONEncoder().encode
 
+# Stat result attribute of the columns, the files can be sorted by (besides
+# the name, and the type).
+FILE_SORT_ATTRIBUTES = {
+    'created': 'st_ctime',
+    'modified': 'st_mtime',
+    'size': 'st_size',
+}
+# Number of the files and dirs encoded at once, when streaming the listing.
+FILE_LIST_STREAM_CHUNK_SIZE = 500
+
 
 # utility functions
 # convert bytes type to human readable format
@@ -500,6 +512,8 @@ class Filemanager():
         Args:
             trans_id: unique transaction id
         """
+        directory_listings.invalidate(Filemanager.listing_key(trans_id))
+
         file_manager_data = session['fileManagerData']
         # Return from the function if transaction id not found
         if str(trans_id) not in file_manager_data:
@@ -512,6 +526,14 @@ class Filemanager():
 
         return make_json_response(status=200)
 
+    @staticmethod
+    def listing_key(trans_id):
+        """
+        Returns the key of the cached directory listings of the transaction
+        (see DirectoryListingCache).
+        """
+        return current_user.id, str(trans_id)
+
     @staticmethod
     def _get_drives_with_size(drive_name=None):
         """
@@ -579,6 +601,138 @@ class Filemanager():
             file_extension not in supported_types or
             file_type != file_extension)
 
+    @staticmethod
+    def _file_entries(
+            entries, show_hidden_files, files_only, folders_only,
+            supported_types, file_type):
+        """
+        Used internally by iter_files_in_path to filter the entries of the
+        directory, yields the entry and its file type (extension).
+        """
+        for entry in entries:
+            # continue if file/folder is hidden (based on user preference)
+            if not show_hidden_files and (
+                    is_folder_hidden(entry.path) if _platform == "win32"
+                    else entry.name.startswith('.')):
+                continue
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                continue
+
+            # list files only or folders only
+            if is_dir:
+                if files_only == 'true':
+                    continue
+                yield entry, "dir"
+                continue
+
+            file_extension = str(splitext(entry.name))
+            # filter files based on file_type
+            if Filemanager._skip_file_extension(
+                    file_type, supported_types, folders_only, file_extension):
+                continue
+            yield entry, file_extension
+
+    @staticmethod
+    def _sort_key(sort_by):
+        """
+        Used internally by iter_files_in_path to get the sort key of the
+        (entry, file type) items by the given column.
+        """
+        if sort_by == 'type':
+            return lambda item: (item[1], item[0].name)
+
+        attr = FILE_SORT_ATTRIBUTES[sort_by]
+
+        def _key(item):
+            try:
+                return getattr(item[0].stat(), attr), item[0].name
+            except OSError:
+                return 0, item[0].name
+
+        return _key
+
+    @staticmethod
+    def _file_properties(entry, file_extension, user_dir):
+        """
+        Used internally by iter_files_in_path to get the details of a file
+        or dir, returns None when it can not be accessed.
+        """
+        try:
+            st = entry.stat()
+        except OSError:
+            return None
+
+        # set protected to 1 if no write or read permission
+        protected = 0 if os.access(entry.path, os.R_OK | os.W_OK) else 1
+
+        return {
+            "Filename": entry.name,
+            "Path": os.path.join(user_dir, entry.name),
+            "file_type": file_extension,
+            "Protected": protected,
+            "Properties": {
+                "Date Created": time.ctime(st.st_ctime),
+                "Date Modified": time.ctime(st.st_mtime),
+                "Size": sizeof_fmt(st.st_size)
+            }
+        }
+
+    @staticmethod
+    def iter_files_in_path(
+        show_hidden_files, files_only, folders_only, supported_types,
+            file_type, user_dir, orig_path, entries=None, sort_by='name',
+            sort_order='asc', offset=0, limit=None):
+        """
+        Get the files and dirs in the path, sorted and paged
+        :param show_hidden_files: boolean
+        :param files_only: boolean
+        :param folders_only: boolean
+        :param supported_types: array of supported types
+        :param file_type: file type
+        :param user_dir: base user dir
+        :param orig_path: path after user dir
+        :param entries: entries of the directory (see scan_directory), the
+            directory is read when not specified
+        :param sort_by: name, type, created, modified or size
+        :param sort_order: asc or desc
+        :param offset: number of files and dirs to skip
+        :param limit: maximum number of files and dirs (all, when None)
+        :return: total number of the files and dirs, and the iterator of
+            the requested ones - only these are stat'ed (unless sorted by
+            the date, or the size), while iterating.
+        """
+        if entries is None:
+            entries = scan_directory(orig_path)
+
+        view = (show_hidden_files, files_only, folders_only,
+                tuple(supported_types), file_type, sort_by, sort_order)
+        views = getattr(entries, 'views', dict())
+        files = views.get(view)
+
+        if files is None:
+            files = list(Filemanager._file_entries(
+                entries, show_hidden_files, files_only, folders_only,
+                supported_types, file_type
+            ))
+
+            # The entries are sorted by name already.
+            if sort_by != 'name':
+                files.sort(key=Filemanager._sort_key(sort_by))
+            if sort_order == 'desc':
+                files.reverse()
+            views[view] = files
+
+        page = files[offset:None if limit is None else offset + limit]
+
+        return len(files), (
+            file for file in (
+                Filemanager._file_properties(entry, file_extension, user_dir)
+                for entry, file_extension in page
+            ) if file is not None
+        )
+
     @staticmethod
     def get_files_in_path(
         show_hidden_files, files_only, folders_only, supported_types,
@@ -594,58 +748,52 @@ class Filemanager():
         :param orig_path: path after user dir
         :return:
         """
-        files = []
-
-        for f in sorted(os.listdir(orig_path)):
-            system_path = os.path.join(os.path.join(orig_path, f))
-
-            # continue if file/folder is hidden (based on user preference)
-            if not show_hidden_files and is_folder_hidden(system_path):
-                continue
-            try:
-                user_path = os.path.join(os.path.join(user_dir, f))
-                created = time.ctime(os.path.getctime(system_path))
-                modified = time.ctime(os.path.getmtime(system_path))
-                file_extension = str(splitext(system_path))
-            except Exception:
-                continue
-
-            # set protected to 1 if no write or read permission
-            protected = 0
-            if (not os.access(system_path, os.R_OK) or
-                    not os.access(system_path, os.W_OK)):
-                protected = 1
-
-            # list files only or folders only
-            if os.path.isdir(system_path):
-                if files_only == 'true':
-                    continue
-                file_extension = "dir"
-            # filter files based on file_type
-            elif Filemanager._skip_file_extension(
-                    file_type, supported_types, folders_only, file_extension):
-                continue
+        _, files = Filemanager.iter_files_in_path(
+            show_hidden_files, files_only, folders_only, supported_types,
+            file_type, user_dir, orig_path
+        )
+        return list(files)
 
-            # create a list of files and folders
-            files.append({
-                "Filename": f,
-                "Path": user_path,
-                "file_type": file_extension,
-                "Protected": protected,
-                "Properties": {
-                    "Date Created": created,
-                    "Date Modified": modified,
-                    "Size": sizeof_fmt(getsize(system_path))
-                }
-            })
-
-        return files
+    @staticmethod
+    def stream_files(files):
+        """
+        Returns the JSON response (same as make_json_response) of the
+        listed files and dirs, streamed while they are stat'ed.
+        """
+        def gen():
+            yield json.dumps(dict(
+                success=1, errormsg='', info='', result=None
+            ), separators=(',', ':'))[:-1] + ',"data":{"result":['
+
+            chunk = []
+            separator = ''
+            for file in files:
+                chunk.append(json.dumps(file, separators=(',', ':')))
+                if len(chunk) == FILE_LIST_STREAM_CHUNK_SIZE:
+                    yield separator + ','.join(chunk)
+                    separator = ','
+                    chunk = []
+            if chunk:
+                yield separator + ','.join(chunk)
+
+            yield '],"status":true}}'
+
+        return Response(
+            response=gen(),
+            status=200,
+            mimetype="application/json",
+            headers=get_no_cache_header()
+        )
 
     @staticmethod
-    def list_filesystem(in_dir, path, trans_data, file_type, show_hidden):
+    def list_filesystem(in_dir, path, trans_data, file_type, show_hidden,
+                        listing_key=None, sort_by='name', sort_order='asc',
+                        offset=0, limit=None):
         """
         It lists all file and folders within the given
-        directory.
+        directory - the requested page of them, when the limit is specified
+        (with the total number of them), the iterator of all of them
+        otherwise.
         """
         Filemanager.suspend_windows_warning()
         is_show_hidden_files = show_hidden
@@ -690,9 +838,12 @@ class Filemanager():
 
         orig_path = unquote(orig_path)
         try:
-            files = Filemanager.get_files_in_path(
+            total, files = Filemanager.iter_files_in_path(
                 is_show_hidden_files, files_only, folders_only,
-                supported_types, file_type, user_dir, orig_path
+                supported_types, file_type, user_dir, orig_path,
+                entries=directory_listings.listing(listing_key, orig_path),
+                sort_by=sort_by, sort_order=sort_order, offset=offset,
+                limit=limit
             )
         except Exception as e:
             Filemanager.resume_windows_warning()
@@ -702,7 +853,16 @@ class Filemanager():
                 err_msg = str(e.strerror)
             return unauthorized(err_msg)
         Filemanager.resume_windows_warning()
-        return files
+
+        if limit is None:
+            return files
+
+        return {
+            'files': list(files),
+            'total': total,
+            'offset': offset,
+            'limit': limit
+        }
 
     @staticmethod
     def check_access_permission(in_dir, path, skip_permission_check=False):
@@ -769,9 +929,11 @@ class Filemanager():
         trans_data = Filemanager.get_trasaction_selection(self.trans_id)
         return False if capability not in trans_data['capabilities'] else True
 
-    def getfolder(self, path=None, file_type="", show_hidden=False):
+    def getfolder(self, path=None, file_type="", show_hidden=False,
+                  sort_by='name', sort_order='asc', offset=0, limit=None):
         """
-        Returns files and folders in give path
+        Returns files and folders in give path, a page of them (with the
+        total number of them), when the limit is specified.
         """
         trans_data = Filemanager.get_trasaction_selection(self.trans_id)
         the_dir = None
@@ -784,9 +946,21 @@ class Filemanager():
             if the_dir is not None and not the_dir.endswith('/'):
                 the_dir += '/'
 
+        if sort_by not in FILE_SORT_ATTRIBUTES and sort_by != 'type':
+            sort_by = 'name'
+        sort_order = 'desc' if sort_order == 'desc' else 'asc'
+        offset = max(int(offset or 0), 0)
+        if limit is not None:
+            limit = max(int(limit), 0)
+
         filelist = self.list_filesystem(
-            the_dir, path, trans_data, file_type, show_hidden)
-        return filelist
+            the_dir, path, trans_data, file_type, show_hidden,
+            listing_key=self.listing_key(self.trans_id), sort_by=sort_by,
+            sort_order=sort_order, offset=offset, limit=limit)
+
+        if isinstance(filelist, (list, dict, Response)):
+            return filelist
+        return self.stream_files(filelist)
 
     def check_access(self, ss):
         if self.shared_dir:
@@ -1162,6 +1336,11 @@ def file_manager(trans_id):
         res = func(**kwargs)
     except PermissionError as e:
         return unauthorized(str(e))
+    finally:
+        # The directory listings are read again, even if the modification
+        # time of the directory did not change (with a coarse resolution).
+        if mode in ['add', 'addfolder', 'rename', 'delete']:
+            directory_listings.invalidate(Filemanager.listing_key(trans_id))
 
     if isinstance(res, Response):
         return res
@@ -0,0 +1,113 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2025, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""
+Directory listings of the file manager dialogs.
+"""
+
+import os
+
+from pgadmin.utils.lru_cache import LRUCache
+
+
+class DirectoryListing(list):
+    """
+    class DirectoryListing
+
+        Entries of a directory (see scan_directory). The filtered, and
+        sorted views of them (by the file manager) are kept in views, so
+        that they are only built once for a cached listing.
+    """
+
+    def __init__(self, entries=()):
+        super().__init__(entries)
+        self.views = dict()
+
+
+def scan_directory(path):
+    """
+    Returns the entries (os.DirEntry) of the directory, sorted by name (as a
+    DirectoryListing).
+
+    An entry caches its type and its stat result when they are first used.
+    The directory is only read here, and every entry is only stat'ed once,
+    even if it is listed several times. A symbolic link is resolved right
+    away, so that the broken links can be skipped.
+    """
+    entries = DirectoryListing()
+    with os.scandir(path) as it:
+        for entry in it:
+            if entry.is_symlink():
+                try:
+                    entry.stat()
+                except OSError:
+                    continue
+            entries.append(entry)
+
+    entries.sort(key=lambda entry: entry.name)
+    return entries
+
+
+class DirectoryListingCache():
+    """
+    class DirectoryListingCache
+
+        Directory listings (see scan_directory) by the file manager dialog
+        (transaction) and the directory, the most recently used
+        config.FILE_MANAGER_LISTING_CACHE_SIZE of them are kept.
+
+        A listing is kept for config.FILE_MANAGER_LISTING_CACHE_TIMEOUT
+        seconds, while the modification time of the directory does not
+        change. The next pages of a large directory are listed without
+        reading it again, and without stat'ing the entries again.
+    """
+
+    def __init__(self):
+        self._listings = LRUCache('FILE_MANAGER_LISTING_CACHE_SIZE',
+                                  'FILE_MANAGER_LISTING_CACHE_TIMEOUT')
+
+    def listing(self, key, path):
+        """
+        Returns the entries of the directory, cached for the given key (of
+        the file manager dialog).
+        """
+        if key is None or not self._listings.ttl or \
+                not self._listings.enabled():
+            return scan_directory(path)
+
+        # Taken before reading the directory, so that a change made while
+        # reading it is seen the next time.
+        mtime = os.stat(path).st_mtime_ns
+        cache_key = (key, path)
+
+        cached = self._listings.get(
+            cache_key, valid=lambda cached: cached[0] == mtime)
+        if cached is not None:
+            return cached[1]
+
+        entries = scan_directory(path)
+        self._listings.put(cache_key, (mtime, entries))
+        return entries
+
+    def invalidate(self, key=None):
+        """
+        Forget the listings of the given file manager dialog (or, all the
+        listings, when not specified).
+        """
+        self._listings.discard(
+            None if key is None else lambda cache_key: cache_key[0] == key)
+
+    def info(self):
+        """
+        Returns the cache statistics.
+        """
+        return self._listings.info()
+
+
+directory_listings = DirectoryListingCache()
@@ -0,0 +1,195 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2025, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import json
+import os
+import shutil
+import tempfile
+from unittest.mock import patch
+
+import config
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.utils.ajax import make_json_response
+from pgadmin.misc import file_manager
+from pgadmin.misc.file_manager import Filemanager
+from pgadmin.misc.file_manager.directory_listing import \
+    DirectoryListingCache
+
+
+def names(files):
+    return [file['Filename'] for file in files]
+
+
+class DirectoryTestMixin:
+    """ Creates the directory listed by the directory listing tests. """
+
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+        for name, size in (('b.sql', 30), ('a.backup', 10), ('c.sql', 20),
+                           ('.hidden.sql', 0)):
+            with open(os.path.join(self.path, name), 'w') as f:
+                f.write('x' * size)
+        os.mkdir(os.path.join(self.path, 'dir'))
+        if hasattr(os, 'symlink'):
+            os.symlink(os.path.join(self.path, 'missing'),
+                       os.path.join(self.path, 'broken.sql'))
+
+    def tearDown(self):
+        shutil.rmtree(self.path)
+
+
+class TestDirectoryListing(DirectoryTestMixin, BaseTestGenerator):
+    """ This class tests the listing of the files and dirs in the file
+    manager. """
+
+    scenarios = [
+        ('List the files and dirs',
+         dict(show_hidden=False, supported_types=[], file_type='*',
+              expected=['a.backup', 'b.sql', 'c.sql', 'dir'],
+              expected_file=dict(Path='/user/b.sql', file_type='sql',
+                                 Protected=0),
+              expected_size='30.0 B')),
+        ('List the hidden files of the type',
+         dict(show_hidden=True, supported_types=['sql', 'backup'],
+              file_type='sql',
+              expected=['.hidden.sql', 'b.sql', 'c.sql', 'dir'],
+              expected_file=dict(Path='/user/b.sql', file_type='sql',
+                                 Protected=0),
+              expected_size='30.0 B')),
+    ]
+
+    def runTest(self):
+        files = Filemanager.get_files_in_path(
+            self.show_hidden, False, False, self.supported_types,
+            self.file_type, '/user/', self.path
+        )
+        self.assertEqual(names(files), self.expected)
+
+        file = files[names(files).index('b.sql')]
+        self.assertEqual(
+            dict((name, file[name]) for name in self.expected_file),
+            self.expected_file
+        )
+        self.assertEqual(file['Properties']['Size'], self.expected_size)
+        self.assertEqual(files[-1]['file_type'], 'dir')
+
+
+class TestDirectoryListingPage(DirectoryTestMixin, BaseTestGenerator):
+    """ This class tests sorting, and paging the files and dirs. """
+
+    scenarios = [
+        ('Sort the files by the size',
+         dict(file_type='*', options=dict(sort_by='size', sort_order='desc',
+                                          offset=1, limit=2),
+              expected_total=3, expected=['c.sql', 'a.backup'])),
+        ('Sort the files of the type by the name',
+         dict(file_type='sql', options=dict(sort_order='desc', offset=2),
+              expected_total=3, expected=['b.sql'])),
+    ]
+
+    def runTest(self):
+        total, files = Filemanager.iter_files_in_path(
+            False, 'true' if self.file_type == '*' else False, False, [],
+            self.file_type, '/', self.path, **self.options
+        )
+        self.assertEqual(total, self.expected_total)
+        self.assertEqual(names(files), self.expected)
+
+
+class TestDirectoryListingCache(DirectoryTestMixin, BaseTestGenerator):
+    """ This class tests the cache of the listings of the directories.
+
+    The operations are ('list', key, expected to be cached), ('change',),
+    and ('invalidate', key).
+    """
+
+    scenarios = [
+        ('Cache the listing of a directory',
+         dict(timeout=30, size=1,
+              operations=[('list', '1', False), ('list', '1', True)],
+              expected_info=dict(size=1, hits=1))),
+        ('List the changed directory again',
+         dict(timeout=30, size=1,
+              operations=[('list', '1', False), ('change',),
+                          ('list', '1', False)],
+              expected_info=dict(size=1, hits=0))),
+        ('Forget the least recently used listing',
+         dict(timeout=30, size=1,
+              operations=[('list', '1', False), ('list', '2', False),
+                          ('list', '1', False)],
+              expected_info=dict(size=1, hits=0))),
+        ('Forget the listings of the dialog',
+         dict(timeout=30, size=2,
+              operations=[('list', '1', False), ('list', '2', False),
+                          ('invalidate', '2'), ('list', '1', True),
+                          ('list', '2', False)],
+              expected_info=dict(size=2, hits=1))),
+        ('Do not cache the listing, when disabled',
+         dict(timeout=0, size=1,
+              operations=[('list', '2', False), ('list', '2', False)],
+              expected_info=dict(size=0, hits=0))),
+    ]
+
+    def runTest(self):
+        cache = DirectoryListingCache()
+        listings = dict()
+        changed = False
+
+        with patch.object(config, 'FILE_MANAGER_LISTING_CACHE_TIMEOUT',
+                          self.timeout), \
+                patch.object(config, 'FILE_MANAGER_LISTING_CACHE_SIZE',
+                             self.size):
+            for operation in self.operations:
+                if operation[0] == 'change':
+                    with open(os.path.join(self.path, 'd.sql'), 'w'):
+                        pass
+                    mtime = os.stat(self.path).st_mtime_ns
+                    os.utime(self.path, ns=(mtime, mtime + 1000000000))
+                    changed = True
+                elif operation[0] == 'invalidate':
+                    cache.invalidate((1, operation[1]))
+                else:
+                    _, key, cached = operation
+                    entries = cache.listing((1, key), self.path)
+                    self.assertEqual(entries is listings.get(key), cached)
+                    self.assertEqual(
+                        'd.sql' in [entry.name for entry in entries],
+                        changed)
+                    listings[key] = entries
+
+            info = cache.info()
+        self.assertEqual(
+            dict((name, info[name]) for name in self.expected_info),
+            self.expected_info
+        )
+
+
+class TestDirectoryListingStream(DirectoryTestMixin, BaseTestGenerator):
+    """ This class tests streaming the listing as the JSON response. """
+
+    scenarios = [
+        ('Stream the listing in the chunks',
+         dict(chunk_size=2, empty=False)),
+        ('Stream the listing in a chunk', dict(chunk_size=500, empty=False)),
+        ('Stream the empty listing', dict(chunk_size=2, empty=True)),
+    ]
+
+    def runTest(self):
+        files = [] if self.empty else Filemanager.get_files_in_path(
+            True, False, False, [], '*', '/', self.path
+        )
+        expected = json.loads(make_json_response(
+            data={'result': files, 'status': True}).data)
+
+        with patch.object(file_manager, 'FILE_LIST_STREAM_CHUNK_SIZE',
+                          self.chunk_size):
+            response = Filemanager.stream_files(iter(files))
+
+        self.assertEqual(response.mimetype, 'application/json')
+        self.assertEqual(json.loads(response.get_data()), expected)
@@ -0,0 +1,20 @@
+{# SQL query for getting the watermarks (number of the rows inserted,
+   updated, and deleted, as per the cumulative statistics) of the catalogs
+   used by autocomplete. Without the statistics (track_counts off), the
+   watermark changes on every check. #}
+SELECT CASE relname
+        WHEN 'pg_namespace' THEN 'schemas'
+        WHEN 'pg_proc' THEN 'functions'
+        WHEN 'pg_type' THEN 'datatypes'
+        ELSE 'relations'
+    END AS name,
+    CASE WHEN pg_catalog.current_setting('track_counts')::boolean THEN
+        n_tup_ins::text || ':' || n_tup_upd::text || ':' || n_tup_del::text
+    ELSE pg_catalog.clock_timestamp()::text
+    END AS watermark
+FROM pg_catalog.pg_stat_sys_tables
+WHERE schemaname = 'pg_catalog' AND relname IN (
+    'pg_namespace', 'pg_class', 'pg_attribute', 'pg_constraint', 'pg_proc',
+    'pg_type'
+)
+ORDER BY relname
@@ -13,6 +13,7 @@ import struct
 import config
 import re
 import subprocess
+from functools import partial
 from sys import platform as _platform
 from config import PG_DEFAULT_DRIVER
 from flask import Response, request
@@ -28,6 +29,7 @@ from pgadmin.utils.driver import get_driver
 from ... import socketio as sio
 from pgadmin.utils import get_complete_file_path
 from pgadmin.authenticate import socket_login_required
+from pgadmin.tools.psql.pty_multiplexer import PtyMultiplexer
 
 
 if _platform == 'win32':
@@ -42,6 +44,7 @@ else:
     import termios
     import pty
 
+pty_reader = PtyMultiplexer(sio.start_background_task)
 session_input = dict()
 pdata = dict()
 cdata = dict()
@@ -204,23 +207,17 @@ def create_pty_terminal(connection_data, server_id):
     return p, parent, fd
 
 
-def read_terminal_data(parent, data_ready, max_read_bytes, sid):
+def emit_terminal_data(sid, output, ack):
     """
-    Read the terminal output.
-    :param parent:
-    :param data_ready:
-    :param max_read_bytes:
+    Emit the terminal output.
     :param sid:
-    :return:
+    :param output:
+    :param ack: called when the client has received the output
     """
-    if parent in data_ready:
-        # Read the output from parent fd (terminal).
-        output = os.read(parent, max_read_bytes)
-
-        sio.emit('pty-output',
-                 {'result': output.decode(),
-                  'error': False},
-                 namespace='/pty', room=sid)
+    sio.emit('pty-output',
+             {'result': output,
+              'error': False},
+             namespace='/pty', to=sid, callback=ack)
 
 
 def read_stdout(process, sid, max_read_bytes, win_emit_output=True):
@@ -252,30 +249,13 @@ def windows_platform(connection_data, sid, max_read_bytes, server_id):
                     win_emit_output=True)
 
 
-def non_windows_platform(parent, p, fd, data, max_read_bytes, sid):
-    while p and p.poll() is None:
-        if request.sid in app.config['sessions']:
-            # This code is added to make this unit testable.
-            if "is_test" not in data:
-                sio.sleep(0.01)
-            else:
-                data['count'] += 1
-                if data['count'] == 5:
-                    break
-
-            timeout = 0
-            # module provides access to platform-specific I/O
-            # monitoring functions
-            try:
-                (data_ready, _, _) = select.select([parent, fd], [], [],
-                                                   timeout)
-
-                read_terminal_data(parent, data_ready, max_read_bytes, sid)
-            except OSError as e:
-                # If the process is killed, bad file descriptor exception may
-                # occur. Handle it gracefully
-                if p.poll() is not None:
-                    raise e
+def non_windows_platform(parent, p, sid):
+    """
+    Forward the output of the terminal to the client. The output of all the
+    terminals is read by a single thread (of pty_reader).
+    """
+    if p and request.sid in app.config['sessions']:
+        pty_reader.register(parent, partial(emit_terminal_data, sid))
 
 
 def pty_handel_io(connection_data, data, sid):
@@ -285,7 +265,7 @@ def pty_handel_io(connection_data, data, sid):
                          int(data['sid']))
     else:
         p, parent, fd = create_pty_terminal(connection_data, int(data['sid']))
-        non_windows_platform(parent, p, fd, data, max_read_bytes, sid)
+        non_windows_platform(parent, p, sid)
 
 
 @sio.on('start_process', namespace='/pty')
@@ -592,6 +572,7 @@ def disconnect_socket():
     else:
         os.write(app.config['sessions'][request.sid], r'\q\n'.encode())
         sio.sleep(1)
+        pty_reader.unregister(app.config['sessions'][request.sid])
         os.close(app.config['sessions'][request.sid])
         os.close(cdata[request.sid])
         del app.config['sessions'][request.sid]
@@ -0,0 +1,240 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2025, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""Reads the output of all the PSQL terminals of the process."""
+
+import codecs
+import os
+import selectors
+import threading
+import time
+from functools import partial
+
+# The output of a terminal is read in chunks of at most this many bytes.
+MAX_READ_BYTES = 64 * 1024
+# The output is sent in frames of at most FRAME_MAX_CHARS characters. A
+# frame is sent at the most FRAME_INTERVAL seconds after its first
+# character has been read.
+FRAME_MAX_CHARS = 64 * 1024
+FRAME_INTERVAL = 0.01
+# Reading the output of a terminal is paused while the client has not
+# acknowledged MAX_FRAMES_IN_FLIGHT frames, or for at the most ACK_TIMEOUT
+# seconds (if the client never does).
+MAX_FRAMES_IN_FLIGHT = 4
+ACK_TIMEOUT = 10
+
+
+class _PtyStream:
+    """
+    Output of a terminal, not sent to the client yet.
+    """
+
+    def __init__(self, fd, emit):
+        self.fd = fd
+        self.emit = emit
+        # The multibyte characters may be split between the reads.
+        self.decoder = codecs.getincrementaldecoder('utf-8')('replace')
+        self.pending = []
+        self.pending_size = 0
+        self.deadline = None
+        self.in_flight = 0
+        self.paused_at = None
+        self.reading = True
+        self.closed = False
+
+
+class PtyMultiplexer:
+    """
+    class PtyMultiplexer
+
+        Reads the output of all the registered terminals (the parent file
+        descriptors of the pseudo terminals), using a single background
+        thread waiting on a selector, and sends it to the clients in frames.
+
+        The thread wakes up only when any terminal has the output, a frame
+        is due, or a terminal is registered, or unregistered.
+    """
+
+    def __init__(self, start_thread):
+        """
+        Args:
+            start_thread: function starting the background thread, i.e.
+                socketio.start_background_task
+        """
+        self._start_thread = start_thread
+        self._lock = threading.Lock()
+        self._selector = None
+        self._wakeup_fds = None
+        self._streams = dict()
+
+    def register(self, fd, emit):
+        """
+        Starts reading the output of the terminal.
+
+        Args:
+            fd: parent file descriptor of the terminal
+            emit: function sending a frame to the client, called as
+                emit(text, ack); ack() must be called, when the client has
+                received the frame.
+        """
+        with self._lock:
+            if self._selector is None:
+                self._selector = selectors.DefaultSelector()
+                self._wakeup_fds = os.pipe()
+                for wakeup_fd in self._wakeup_fds:
+                    os.set_blocking(wakeup_fd, False)
+                self._selector.register(self._wakeup_fds[0],
+                                        selectors.EVENT_READ)
+                self._start_thread(self._run)
+
+            self._unregister(fd)
+            stream = _PtyStream(fd, emit)
+            self._streams[fd] = stream
+            self._selector.register(fd, selectors.EVENT_READ, stream)
+        self._wakeup()
+
+    def unregister(self, fd):
+        """
+        Stops reading the output of the terminal (before the file descriptor
+        is closed). The output not sent yet is discarded.
+
+        Args:
+            fd: parent file descriptor of the terminal
+        """
+        with self._lock:
+            self._unregister(fd)
+        self._wakeup()
+
+    def info(self):
+        with self._lock:
+            return {
+                'terminals': len(self._streams),
+                'paused': sum(1 for stream in self._streams.values()
+                              if stream.paused_at is not None),
+            }
+
+    def _unregister(self, fd):
+        stream = self._streams.pop(fd, None)
+        if stream is None:
+            return
+        stream.closed = True
+        if stream.reading:
+            self._selector.unregister(fd)
+            stream.reading = False
+
+    def _wakeup(self):
+        if self._wakeup_fds is None:
+            return
+        try:
+            os.write(self._wakeup_fds[1], b'\0')
+        except BlockingIOError:
+            # The thread will wake up anyway.
+            pass
+
+    def _set_reading(self, stream, reading):
+        if stream.closed or stream.reading == reading:
+            return
+        if reading:
+            self._selector.register(stream.fd, selectors.EVENT_READ, stream)
+        else:
+            self._selector.unregister(stream.fd)
+        stream.reading = reading
+
+    def _timeout(self):
+        deadlines = []
+        for stream in self._streams.values():
+            if stream.deadline is not None:
+                deadlines.append(stream.deadline)
+            if stream.paused_at is not None:
+                deadlines.append(stream.paused_at + ACK_TIMEOUT)
+        if not deadlines:
+            return None
+        return max(min(deadlines) - time.monotonic(), 0)
+
+    def _read(self, stream, now):
+        try:
+            data = os.read(stream.fd, MAX_READ_BYTES)
+        except OSError:
+            # The terminal has been closed (EIO).
+            data = b''
+
+        if data:
+            text = stream.decoder.decode(data)
+        else:
+            text = stream.decoder.decode(b'', True)
+            self._set_reading(stream, False)
+            stream.closed = True
+
+        if text:
+            stream.pending.append(text)
+            stream.pending_size += len(text)
+            if stream.deadline is None:
+                stream.deadline = now + FRAME_INTERVAL
+
+    def _frames(self, now):
+        """
+        Returns the frames to be sent, and pauses (or resumes) reading the
+        terminals.
+        """
+        frames = []
+        for stream in list(self._streams.values()):
+            if stream.paused_at is not None and \
+                    now >= stream.paused_at + ACK_TIMEOUT:
+                # Do not wait for the client forever.
+                stream.in_flight = 0
+                self._resume(stream)
+
+            if stream.pending and (
+                stream.closed or now >= stream.deadline or
+                    stream.pending_size >= FRAME_MAX_CHARS):
+                frames.append((stream, ''.join(stream.pending)))
+                stream.pending = []
+                stream.pending_size = 0
+                stream.deadline = None
+                stream.in_flight += 1
+
+                if stream.in_flight >= MAX_FRAMES_IN_FLIGHT:
+                    stream.paused_at = now
+                    self._set_reading(stream, False)
+        return frames
+
+    def _resume(self, stream):
+        stream.paused_at = None
+        self._set_reading(stream, True)
+
+    def _ack(self, stream, *args):
+        with self._lock:
+            stream.in_flight = max(stream.in_flight - 1, 0)
+            if stream.paused_at is None or \
+                    stream.in_flight >= MAX_FRAMES_IN_FLIGHT:
+                return
+            self._resume(stream)
+        self._wakeup()
+
+    def _run(self):
+        while True:
+            with self._lock:
+                timeout = self._timeout()
+
+            events = self._selector.select(timeout)
+            now = time.monotonic()
+            with self._lock:
+                for key, _ in events:
+                    if key.fd == self._wakeup_fds[0]:
+                        try:
+                            while os.read(key.fd, 1024):
+                                pass
+                        except BlockingIOError:
+                            pass
+                    elif not key.data.closed and key.data.reading:
+                        self._read(key.data, now)
+                frames = self._frames(now)
+
+            for stream, text in frames:
+                stream.emit(text, partial(self._ack, stream))
@@ -34,11 +34,13 @@ const Root = styled(Box)(()=>({
 function psql_socket_io(socket, is_enable, sid, db, server_type, fitAddon, term, role){
   // Listen all the socket events emit from server.
   let init_psql = true;
-  socket.on('pty-output', function(data){
+  socket.on('pty-output', function(data, ack){
     if(data.error) {
       term.write('\r\n');
     }
-    term.write(data.result);
+    /* Acknowledge the output once the terminal has processed it, the server
+     * stops reading the psql output while the client falls behind. */
+    term.write(data.result, ack);
     if(data.error) {
       term.write('\r\n');
     }
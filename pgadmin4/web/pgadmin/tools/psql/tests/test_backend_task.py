@@ -42,9 +42,7 @@ class PSQLBackend(BaseTestGenerator):
             'sid': self.sid,
             'db': 'postgres',
             'pwd': self.server['db_password'],
-            'user': self.server['username'],
-            'is_test': True,
-            'count': 0
+            'user': self.server['username']
         }
 
         self.test_client.emit('start_process', data, namespace='/pty')
@@ -0,0 +1,194 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2025, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import os
+import sys
+import threading
+import time
+
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.tools.psql import pty_multiplexer as multiplexer
+from pgadmin.tools.psql.pty_multiplexer import PtyMultiplexer
+
+
+def start_thread(target):
+    threading.Thread(target=target, daemon=True).start()
+
+
+class Client:
+    """ Receives the frames of a terminal, like the browser. """
+
+    def __init__(self, auto_ack=True):
+        self.auto_ack = auto_ack
+        self.frames = []
+        self.acks = []
+
+    def emit(self, text, ack):
+        self.frames.append(text)
+        if self.auto_ack:
+            ack()
+        else:
+            self.acks.append(ack)
+
+    def text(self):
+        return ''.join(self.frames)
+
+
+def wait_for(condition, timeout=5):
+    end = time.monotonic() + timeout
+    while not condition() and time.monotonic() < end:
+        time.sleep(0.005)
+    return condition()
+
+
+LINES = ''.join('line {0}\n'.format(idx) for idx in range(20000))
+
+
+class MultiplexerTestMixin:
+    """ Creates the multiplexer reading the pipes of the PSQL terminal
+    tests. """
+
+    def setUp(self):
+        if sys.platform == 'win32':
+            self.skipTest('PSQL disabled for windows')
+        self.multiplexer = PtyMultiplexer(start_thread)
+        self.fds = []
+
+    def pipe(self, client):
+        read_fd, write_fd = os.pipe()
+        self.fds.extend([read_fd, write_fd])
+        self.multiplexer.register(read_fd, client.emit)
+        return read_fd, write_fd
+
+    def tearDown(self):
+        for fd in self.fds:
+            self.multiplexer.unregister(fd)
+            os.close(fd)
+
+
+class TestPtyMultiplexerOutput(MultiplexerTestMixin, BaseTestGenerator):
+    """ This class tests decoding, and framing the output of the PSQL
+    terminals. """
+
+    expected_max_frames = None
+
+    scenarios = [
+        ('Decode the characters split between the reads',
+         dict(writes=[b'caf\xc3', b'\xa9 \xe2\x82', b'\xac bad \xff'],
+              pause=True, expected='café € bad \ufffd')),
+        ('Coalesce the output in frames',
+         dict(writes=[LINES[idx:idx + 100].encode()
+                      for idx in range(0, len(LINES), 100)],
+              pause=False, expected=LINES,
+              expected_max_frames=len(LINES) / 100 / 4)),
+    ]
+
+    def runTest(self):
+        client = Client()
+        _, write_fd = self.pipe(client)
+
+        for idx, data in enumerate(self.writes):
+            if idx and self.pause:
+                time.sleep(multiplexer.FRAME_INTERVAL * 3)
+            os.write(write_fd, data)
+
+        self.assertTrue(wait_for(lambda: client.text() == self.expected))
+        if self.expected_max_frames is not None:
+            self.assertLess(len(client.frames), self.expected_max_frames)
+        self.assertLessEqual(max(map(len, client.frames)),
+                             multiplexer.FRAME_MAX_CHARS +
+                             multiplexer.MAX_READ_BYTES)
+
+
+class TestPtyMultiplexerBackpressure(MultiplexerTestMixin,
+                                     BaseTestGenerator):
+    """ This class tests pausing reading a terminal, when the client falls
+    behind. """
+
+    scenarios = [
+        ('Pause reading when the client falls behind',
+         dict(frames=multiplexer.MAX_FRAMES_IN_FLIGHT + 2,
+              expected_paused=1,
+              expected_frames=multiplexer.MAX_FRAMES_IN_FLIGHT)),
+        ('Keep reading while the client keeps up',
+         dict(frames=multiplexer.MAX_FRAMES_IN_FLIGHT - 1,
+              expected_paused=0,
+              expected_frames=multiplexer.MAX_FRAMES_IN_FLIGHT - 1)),
+    ]
+
+    def runTest(self):
+        client = Client(auto_ack=False)
+        _, write_fd = self.pipe(client)
+
+        for idx in range(self.frames):
+            os.write(write_fd, 'frame {0};'.format(idx).encode())
+            time.sleep(multiplexer.FRAME_INTERVAL * 3)
+
+        # The rest of the output waits in the terminal.
+        self.assertTrue(wait_for(
+            lambda: len(client.frames) == self.expected_frames and
+            self.multiplexer.info()['paused'] == self.expected_paused))
+
+        for ack in client.acks:
+            ack()
+        self.assertTrue(wait_for(
+            lambda: client.text().endswith(
+                'frame {0};'.format(self.frames - 1))))
+        self.assertEqual(self.multiplexer.info()['paused'], 0)
+
+
+class TestPtyMultiplexerTerminals(MultiplexerTestMixin, BaseTestGenerator):
+    """ This class tests multiplexing the terminals, and stop reading the
+    closed ones. """
+
+    exited = []
+    unregistered = []
+
+    scenarios = [
+        ('Multiplex the terminals',
+         dict(terminals=20, expected_terminals=20)),
+        ('Keep the exited terminal until unregistered',
+         dict(terminals=3, exited=[0], expected_terminals=3)),
+        ('Stop reading the unregistered terminal',
+         dict(terminals=3, unregistered=[1], expected_terminals=2)),
+    ]
+
+    def runTest(self):
+        clients = [Client() for _ in range(self.terminals)]
+        pipes = [self.pipe(client) for client in clients]
+        for idx, (_, write_fd) in enumerate(pipes):
+            os.write(write_fd, 'terminal {0}'.format(idx).encode())
+
+        for idx, client in enumerate(clients):
+            self.assertTrue(wait_for(
+                lambda: client.text() == 'terminal {0}'.format(idx)))
+
+        # The terminal exits.
+        for idx in self.exited:
+            os.close(pipes[idx][1])
+            self.fds.remove(pipes[idx][1])
+        for idx in self.unregistered:
+            self.multiplexer.unregister(pipes[idx][0])
+
+        expected = []
+        for idx, (_, write_fd) in enumerate(pipes):
+            if idx in self.exited:
+                expected.append('terminal {0}'.format(idx))
+                continue
+            os.write(write_fd, b' again')
+            expected.append('terminal {0}'.format(idx) + (
+                '' if idx in self.unregistered else ' again'))
+
+        self.assertTrue(wait_for(
+            lambda: [client.text() for client in clients] == expected))
+        # Not read after a while either.
+        time.sleep(multiplexer.FRAME_INTERVAL * 3)
+        self.assertEqual([client.text() for client in clients], expected)
+        self.assertEqual(self.multiplexer.info()['terminals'],
+                         self.expected_terminals)
@@ -24,6 +24,8 @@ from pgadmin.utils.ajax import make_json_response, bad_request, \
 from pgadmin.model import Server, SharedServer
 from pgadmin.tools.schema_diff.node_registry import SchemaDiffRegistry
 from pgadmin.tools.schema_diff.model import SchemaDiffModel
+from pgadmin.tools.schema_diff.compare_engine import CompareEngine
+import config
 from config import PG_DEFAULT_DRIVER
 from pgadmin.utils.driver import get_driver
 from pgadmin.utils.constants import PREF_LABEL_DISPLAY, MIMETYPE_APP_JS,\
@@ -485,104 +487,40 @@ def compare_database(params):
             fetch_compare_schemas(params['source_sid'], params['source_did'],
                                   params['target_sid'], params['target_did'])
 
-        total_schema = len(schema_result['source_only']) + len(
-            schema_result['target_only']) + len(
-            schema_result['in_both_database'])
-
-        node_percent = 0
-        if total_schema > 0:
-            node_percent = round(100 / (total_schema * len(
-                SchemaDiffRegistry.get_registered_nodes())), 2)
-        total_percent = 0
+        engine = get_compare_engine(params)
+        compare_kwargs = dict(
+            source_sid=params['source_sid'],
+            source_did=params['source_did'],
+            target_sid=params['target_sid'],
+            target_did=params['target_did'],
+            ignore_owner=ignore_owner,
+            ignore_whitespaces=ignore_whitespaces,
+            ignore_tablespace=ignore_tablespace,
+            ignore_grants=ignore_grants)
 
         # Compare Database objects
-        comparison_schema_result, total_percent = \
-            compare_database_objects(
-                trans_id=params['trans_id'], session_obj=session_obj,
-                source_sid=params['source_sid'],
-                source_did=params['source_did'],
-                target_sid=params['target_sid'],
-                target_did=params['target_did'],
-                diff_model_obj=diff_model_obj, total_percent=total_percent,
-                node_percent=node_percent, ignore_owner=ignore_owner,
-                ignore_whitespaces=ignore_whitespaces,
-                ignore_tablespace=ignore_tablespace,
-                ignore_grants=ignore_grants)
-        comparison_result = \
-            comparison_result + comparison_schema_result
+        compare_database_objects(engine=engine, **compare_kwargs)
 
         # Compare Schema objects
-        if 'source_only' in schema_result and \
-                len(schema_result['source_only']) > 0:
-            for item in schema_result['source_only']:
-                comparison_schema_result, total_percent = \
-                    compare_schema_objects(
-                        trans_id=params['trans_id'], session_obj=session_obj,
-                        source_sid=params['source_sid'],
-                        source_did=params['source_did'],
-                        source_scid=item['scid'],
-                        target_sid=params['target_sid'],
-                        target_did=params['target_did'], target_scid=None,
-                        schema_name=item['schema_name'],
-                        diff_model_obj=diff_model_obj,
-                        total_percent=total_percent,
-                        node_percent=node_percent,
-                        is_schema_source_only=True,
-                        ignore_owner=ignore_owner,
-                        ignore_whitespaces=ignore_whitespaces,
-                        ignore_tablespace=ignore_tablespace,
-                        ignore_grants=ignore_grants)
-
-                comparison_result = \
-                    comparison_result + comparison_schema_result
-
-        if 'target_only' in schema_result and \
-                len(schema_result['target_only']) > 0:
-            for item in schema_result['target_only']:
-                comparison_schema_result, total_percent = \
-                    compare_schema_objects(
-                        trans_id=params['trans_id'], session_obj=session_obj,
-                        source_sid=params['source_sid'],
-                        source_did=params['source_did'],
-                        source_scid=None, target_sid=params['target_sid'],
-                        target_did=params['target_did'],
-                        target_scid=item['scid'],
-                        schema_name=item['schema_name'],
-                        diff_model_obj=diff_model_obj,
-                        total_percent=total_percent,
-                        node_percent=node_percent,
-                        ignore_owner=ignore_owner,
-                        ignore_whitespaces=ignore_whitespaces,
-                        ignore_tablespace=ignore_tablespace,
-                        ignore_grants=ignore_grants)
-
-                comparison_result = \
-                    comparison_result + comparison_schema_result
+        for item in schema_result['source_only']:
+            compare_schema_objects(
+                engine=engine, source_scid=item['scid'], target_scid=None,
+                schema_name=item['schema_name'], is_schema_source_only=True,
+                **compare_kwargs)
+
+        for item in schema_result['target_only']:
+            compare_schema_objects(
+                engine=engine, source_scid=None, target_scid=item['scid'],
+                schema_name=item['schema_name'], **compare_kwargs)
 
         # Compare the two schema present in both the databases
-        if 'in_both_database' in schema_result and \
-                len(schema_result['in_both_database']) > 0:
-            for item in schema_result['in_both_database']:
-                comparison_schema_result, total_percent = \
-                    compare_schema_objects(
-                        trans_id=params['trans_id'], session_obj=session_obj,
-                        source_sid=params['source_sid'],
-                        source_did=params['source_did'],
-                        source_scid=item['src_scid'],
-                        target_sid=params['target_sid'],
-                        target_did=params['target_did'],
-                        target_scid=item['tar_scid'],
-                        schema_name=item['schema_name'],
-                        diff_model_obj=diff_model_obj,
-                        total_percent=total_percent,
-                        node_percent=node_percent,
-                        ignore_owner=ignore_owner,
-                        ignore_whitespaces=ignore_whitespaces,
-                        ignore_tablespace=ignore_tablespace,
-                        ignore_grants=ignore_grants)
-
-                comparison_result = \
-                    comparison_result + comparison_schema_result
+        for item in schema_result['in_both_database']:
+            compare_schema_objects(
+                engine=engine, source_scid=item['src_scid'],
+                target_scid=item['tar_scid'],
+                schema_name=item['schema_name'], **compare_kwargs)
+
+        comparison_result = engine.run()
 
         # Update the message and total percentage done in session object
         update_session_diff_transaction(params['trans_id'], session_obj,
@@ -624,30 +562,22 @@ def compare_schema(params):
         ignore_whitespaces = bool(params['ignore_whitespaces'])
         ignore_tablespace = bool(params['ignore_tablespace'])
         ignore_grants = bool(params['ignore_grants'])
-        all_registered_nodes = SchemaDiffRegistry.get_registered_nodes()
-        node_percent = round(100 / len(all_registered_nodes), 2)
-        total_percent = 0
-
-        comparison_schema_result, total_percent = \
-            compare_schema_objects(
-                trans_id=params['trans_id'], session_obj=session_obj,
-                source_sid=params['source_sid'],
-                source_did=params['source_did'],
-                source_scid=params['source_scid'],
-                target_sid=params['target_sid'],
-                target_did=params['target_did'],
-                target_scid=params['target_scid'],
-                schema_name=gettext(SCH_OBJ_STR),
-                diff_model_obj=diff_model_obj,
-                total_percent=total_percent,
-                node_percent=node_percent,
-                ignore_owner=ignore_owner,
-                ignore_whitespaces=ignore_whitespaces,
-                ignore_tablespace=ignore_tablespace,
-                ignore_grants=ignore_grants)
-
-        comparison_result = \
-            comparison_result + comparison_schema_result
+        engine = get_compare_engine(params)
+        compare_schema_objects(
+            engine=engine,
+            source_sid=params['source_sid'],
+            source_did=params['source_did'],
+            source_scid=params['source_scid'],
+            target_sid=params['target_sid'],
+            target_did=params['target_did'],
+            target_scid=params['target_scid'],
+            schema_name=gettext(SCH_OBJ_STR),
+            ignore_owner=ignore_owner,
+            ignore_whitespaces=ignore_whitespaces,
+            ignore_tablespace=ignore_tablespace,
+            ignore_grants=ignore_grants)
+
+        comparison_result = engine.run()
 
         # Update the message and total percentage done in session object
         update_session_diff_transaction(params['trans_id'], session_obj,
@@ -760,27 +690,46 @@ def get_schemas(sid, did):
     return None
 
 
+def get_compare_engine(params):
+    """
+    This function returns the engine to compare the objects of the source
+    and the target database, which reports the progress to the client.
+
+    :param params: Parameters of the comparison.
+    :return:
+    """
+    client_sid = request.sid
+
+    def on_progress(percentage, msg):
+        socketio.emit('compare_status', {'diff_percentage': percentage,
+                      'compare_msg': msg}, namespace=SOCKETIO_NAMESPACE,
+                      to=client_sid)
+
+    return CompareEngine(
+        params['source_sid'], params['source_did'],
+        params['target_sid'], params['target_did'],
+        conn_id_prefix='schema_diff.{0}'.format(params['trans_id']),
+        max_workers=config.SCHEMA_DIFF_MAX_WORKERS,
+        on_progress=on_progress)
+
+
 def compare_database_objects(**kwargs):
     """
-    This function is used to compare the specified schema and their children.
+    This function is used to add the tasks to compare the database objects
+    to the compare engine.
 
     :param kwargs:
     :return:
     """
-    trans_id = kwargs.get('trans_id')
-    session_obj = kwargs.get('session_obj')
+    engine = kwargs.get('engine')
     source_sid = kwargs.get('source_sid')
     source_did = kwargs.get('source_did')
     target_sid = kwargs.get('target_sid')
     target_did = kwargs.get('target_did')
-    diff_model_obj = kwargs.get('diff_model_obj')
-    total_percent = kwargs.get('total_percent')
-    node_percent = kwargs.get('node_percent')
     ignore_owner = kwargs.get('ignore_owner')
     ignore_whitespaces = kwargs.get('ignore_whitespaces')
     ignore_tablespace = kwargs.get('ignore_tablespace')
     ignore_grants = kwargs.get('ignore_grants')
-    comparison_result = []
 
     all_registered_nodes = SchemaDiffRegistry.get_registered_nodes(None,
                                                                    'Database')
@@ -789,40 +738,27 @@ def compare_database_objects(**kwargs):
         if hasattr(view, 'compare'):
             msg = gettext('Comparing {0}'). \
                 format(gettext(view.blueprint.collection_label))
-            app.logger.debug(msg)
-            socketio.emit('compare_status', {'diff_percentage': total_percent,
-                          'compare_msg': msg}, namespace=SOCKETIO_NAMESPACE,
-                          to=request.sid)
-            # Update the message and total percentage in session object
-            update_session_diff_transaction(trans_id, session_obj,
-                                            diff_model_obj)
-
-            res = view.compare(source_sid=source_sid,
-                               source_did=source_did,
-                               target_sid=target_sid,
-                               target_did=target_did,
-                               group_name=gettext('Database Objects'),
-                               ignore_owner=ignore_owner,
-                               ignore_whitespaces=ignore_whitespaces,
-                               ignore_tablespace=ignore_tablespace,
-                               ignore_grants=ignore_grants)
-
-            if res is not None:
-                comparison_result = comparison_result + res
-        total_percent = total_percent + node_percent
-
-    return comparison_result, total_percent
+            engine.add(view, msg,
+                       source_sid=source_sid,
+                       source_did=source_did,
+                       target_sid=target_sid,
+                       target_did=target_did,
+                       group_name=gettext('Database Objects'),
+                       ignore_owner=ignore_owner,
+                       ignore_whitespaces=ignore_whitespaces,
+                       ignore_tablespace=ignore_tablespace,
+                       ignore_grants=ignore_grants)
 
 
 def compare_schema_objects(**kwargs):
     """
-    This function is used to compare the specified schema and their children.
+    This function is used to add the tasks to compare the specified schema
+    and their children to the compare engine.
 
     :param kwargs:
     :return:
     """
-    trans_id = kwargs.get('trans_id')
-    session_obj = kwargs.get('session_obj')
+    engine = kwargs.get('engine')
     source_sid = kwargs.get('source_sid')
     source_did = kwargs.get('source_did')
     source_scid = kwargs.get('source_scid')
@@ -830,9 +766,6 @@ def compare_schema_objects(**kwargs):
     target_did = kwargs.get('target_did')
     target_scid = kwargs.get('target_scid')
     schema_name = kwargs.get('schema_name')
-    diff_model_obj = kwargs.get('diff_model_obj')
-    total_percent = kwargs.get('total_percent')
-    node_percent = kwargs.get('node_percent')
     is_schema_source_only = kwargs.get('is_schema_source_only', False)
     ignore_owner = kwargs.get('ignore_owner')
     ignore_whitespaces = kwargs.get('ignore_whitespaces')
@@ -844,8 +777,6 @@ def compare_schema_objects(**kwargs):
         driver = get_driver(PG_DEFAULT_DRIVER)
         source_schema_name = driver.qtIdent(None, schema_name)
 
-    comparison_result = []
-
     all_registered_nodes = SchemaDiffRegistry.get_registered_nodes()
     for node_name, node_view in all_registered_nodes.items():
         view = SchemaDiffRegistry.get_node_view(node_name)
@@ -857,35 +788,19 @@ def compare_schema_objects(**kwargs):
                 msg = gettext('Comparing {0} of schema \'{1}\''). \
                     format(gettext(view.blueprint.collection_label),
                            gettext(schema_name))
-            app.logger.debug(msg)
-            socketio.emit('compare_status', {'diff_percentage': total_percent,
-                          'compare_msg': msg}, namespace=SOCKETIO_NAMESPACE,
-                          to=request.sid)
-            # Update the message and total percentage in session object
-            update_session_diff_transaction(trans_id, session_obj,
-                                            diff_model_obj)
-
-            res = view.compare(source_sid=source_sid,
-                               source_did=source_did,
-                               source_scid=source_scid,
-                               target_sid=target_sid,
-                               target_did=target_did,
-                               target_scid=target_scid,
-                               group_name=gettext(schema_name),
-                               source_schema_name=source_schema_name,
-                               ignore_owner=ignore_owner,
-                               ignore_whitespaces=ignore_whitespaces,
-                               ignore_tablespace=ignore_tablespace,
-                               ignore_grants=ignore_grants)
-
-            if res is not None:
-                comparison_result = comparison_result + res
-        total_percent = total_percent + node_percent
-        # if total_percent is more than 100 then set it to less than 100
-        if total_percent >= 100:
-            total_percent = 96
-
-    return comparison_result, total_percent
+            engine.add(view, msg,
+                       source_sid=source_sid,
+                       source_did=source_did,
+                       source_scid=source_scid,
+                       target_sid=target_sid,
+                       target_did=target_did,
+                       target_scid=target_scid,
+                       group_name=gettext(schema_name),
+                       source_schema_name=source_schema_name,
+                       ignore_owner=ignore_owner,
+                       ignore_whitespaces=ignore_whitespaces,
+                       ignore_tablespace=ignore_tablespace,
+                       ignore_grants=ignore_grants)
 
 
 def fetch_compare_schemas(source_sid, source_did, target_sid, target_did):
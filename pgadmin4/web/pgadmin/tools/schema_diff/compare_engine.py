@@ -0,0 +1,193 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2025, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""Run the schema diff comparison of the objects concurrently."""
+
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+
+from flask import current_app, copy_current_request_context
+
+from config import PG_DEFAULT_DRIVER
+from pgadmin.utils.driver import get_driver
+
+
+class CompareEngine:
+    """
+    class CompareEngine
+
+    Collects the comparison tasks (one for each type of objects of the
+    database, or of a schema), and runs them using a pool of worker threads.
+
+    Every worker owns a connection to the source, and the target database,
+    which are opened before starting the comparison, and released at the
+    end. Hence - the number of the additional connections opened on each
+    server is bounded by the number of the workers. When no additional
+    connection can be opened, or only one worker is allowed, the tasks are
+    run one after another using the default database connections.
+    """
+
+    def __init__(self, source_sid, source_did, target_sid, target_did,
+                 conn_id_prefix, max_workers=1, on_progress=None):
+        """
+        :param conn_id_prefix: Prefix of the connection ids of the workers.
+        :param max_workers: Maximum number of tasks running at the same time.
+        :param on_progress: Function called with the percentage of the
+                            completed tasks, and the message of a task, when
+                            that task starts.
+        """
+        self.databases = [(source_sid, source_did)]
+        if (target_sid, target_did) != (source_sid, source_did):
+            self.databases.append((target_sid, target_did))
+        self.conn_id_prefix = conn_id_prefix
+        self.max_workers = max(max_workers or 1, 1)
+        self.on_progress = on_progress
+        self.tasks = []
+        self._done = 0
+        self._lock = threading.Lock()
+
+    def add(self, view, msg, **kwargs):
+        """
+        Add a task to compare the objects of the given view, the keyword
+        arguments are passed to its compare function.
+        """
+        self.tasks.append((view, msg, kwargs))
+
+    def _report(self, msg):
+        with self._lock:
+            percentage = round(self._done * 100 / len(self.tasks), 2)
+
+        current_app.logger.debug(msg)
+        if self.on_progress is not None:
+            self.on_progress(percentage, msg)
+
+    def _run_task(self, index):
+        view, msg, kwargs = self.tasks[index]
+        self._report(msg)
+
+        res = view.compare(**kwargs)
+
+        with self._lock:
+            self._done += 1
+
+        return res
+
+    def _open_worker_connections(self, count):
+        """
+        Open the connections of the workers, a worker (slot) is only added
+        when it could connect to all the databases.
+
+        :return: list of slots (connection ids by the database id by the
+                 server id), and the list of the opened connections.
+        """
+        driver = get_driver(PG_DEFAULT_DRIVER)
+        slots = []
+        opened = []
+
+        for idx in range(count):
+            slot = dict()
+            for sid, did in self.databases:
+                conn_id = '{0}.{1}.{2}'.format(self.conn_id_prefix, did, idx)
+                manager = driver.connection_manager(sid)
+                try:
+                    conn = manager.connection(
+                        did=did, conn_id=conn_id, async_=False
+                    )
+                    opened.append((sid, conn_id))
+                    status, errmsg = conn.connect()
+                except Exception as e:
+                    status, errmsg = False, str(e)
+
+                if not status:
+                    current_app.logger.warning(
+                        'Schema Diff could not open the connection of worker '
+                        '#{0} to the server (#{1}), using {2} worker(s): '
+                        '{3}'.format(idx, sid, len(slots), errmsg)
+                    )
+                    return slots, opened
+
+                slot.setdefault(sid, dict())[did] = conn_id
+            slots.append(slot)
+
+        return slots, opened
+
+    @staticmethod
+    def _release_worker_connections(opened):
+        driver = get_driver(PG_DEFAULT_DRIVER)
+        for sid, conn_id in opened:
+            try:
+                driver.connection_manager(sid).release(conn_id=conn_id)
+            except Exception as e:
+                current_app.logger.exception(e)
+
+    def _run_concurrently(self, slots):
+        free_slots = queue.Queue()
+        for slot in slots:
+            free_slots.put(slot)
+
+        def run_task(index):
+            driver = get_driver(PG_DEFAULT_DRIVER)
+            slot = free_slots.get()
+            try:
+                with ExitStack() as stack:
+                    for sid, conn_ids in slot.items():
+                        stack.enter_context(
+                            driver.connection_manager(sid).routed_connections(
+                                conn_ids
+                            )
+                        )
+                    return self._run_task(index)
+            finally:
+                free_slots.put(slot)
+
+        with ThreadPoolExecutor(max_workers=len(slots)) as executor:
+            # Every task needs its own copy of the request context, as they
+            # can not be pushed in more than one thread at the same time.
+            futures = [
+                executor.submit(copy_current_request_context(run_task), idx)
+                for idx in range(len(self.tasks))
+            ]
+            return [future.result() for future in futures]
+
+    def run(self):
+        """
+        Run all the tasks.
+
+        :return: Comparison result of all the tasks (in order of the tasks).
+        """
+        self._done = 0
+        if len(self.tasks) == 0:
+            return []
+
+        results = None
+        workers = min(self.max_workers, len(self.tasks))
+        if workers > 1:
+            slots, opened = self._open_worker_connections(workers)
+            try:
+                if len(slots) > 1:
+                    results = self._run_concurrently(slots)
+            finally:
+                self._release_worker_connections(opened)
+
+        if results is None:
+            results = [self._run_task(idx) for idx in range(len(self.tasks))]
+
+        comparison_result = []
+        for res in results:
+            if res is not None:
+                comparison_result = comparison_result + res
+
+        # The objects were numbered by the tasks running at the same time,
+        # number them again to keep the ids unique.
+        for idx, item in enumerate(comparison_result, start=1):
+            item['id'] = idx
+
+        return comparison_result
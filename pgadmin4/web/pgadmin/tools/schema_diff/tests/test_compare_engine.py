@@ -0,0 +1,149 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2025, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import threading
+import time
+from contextlib import contextmanager
+from unittest.mock import patch
+
+from flask import Flask
+
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.tools.schema_diff.compare_engine import CompareEngine
+
+
+class FakeView:
+    def __init__(self, engine, label):
+        self.engine = engine
+        self.label = label
+
+    def compare(self, **kwargs):
+        # Let the other workers start their tasks.
+        time.sleep(0.01)
+        routes = getattr(self.engine.routes, 'conn_ids', None)
+        return [{'id': 1, 'label': self.label, 'kwargs': kwargs,
+                 'routes': routes}]
+
+
+class FakeManager:
+    def __init__(self, test, sid):
+        self.test = test
+        self.sid = sid
+
+    @contextmanager
+    def routed_connections(self, conn_ids):
+        self.test.routes.conn_ids = dict(
+            getattr(self.test.routes, 'conn_ids', None) or {},
+            **{str(self.sid): conn_ids}
+        )
+        with self.test.lock:
+            self.test.running += 1
+            self.test.max_running = max(self.test.max_running,
+                                        self.test.running)
+        try:
+            yield self
+        finally:
+            with self.test.lock:
+                self.test.running -= 1
+            self.test.routes.conn_ids = None
+
+
+class FakeDriver:
+    def __init__(self, test):
+        self.test = test
+
+    def connection_manager(self, sid):
+        return FakeManager(self.test, sid)
+
+
+class TestCompareEngine(BaseTestGenerator):
+    """ This class tests running the schema diff comparison tasks. """
+
+    scenarios = [
+        ('Compare the objects one after another',
+         dict(max_workers=1, workers=0, expected_running=0)),
+        ('Compare the objects using 3 workers',
+         dict(max_workers=3, workers=3, expected_running=6)),
+        ('Compare the objects using the connected workers only',
+         dict(max_workers=4, workers=2, expected_running=4)),
+        ('Compare the objects one after another, no worker connected',
+         dict(max_workers=4, workers=1, expected_running=0)),
+    ]
+
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.routes = threading.local()
+        self.lock = threading.Lock()
+        self.running = 0
+        self.max_running = 0
+        self.progress = []
+        self.released = []
+
+    def open_worker_connections(self, engine, count):
+        self.assertEqual(count, self.max_workers)
+        slots = [
+            {1: {10: 'w.10.{0}'.format(idx)}, 2: {20: 'w.20.{0}'.format(idx)}}
+            for idx in range(self.workers)
+        ]
+        return slots, ['opened']
+
+    def runTest(self):
+        engine = CompareEngine(
+            1, 10, 2, 20, conn_id_prefix='w', max_workers=self.max_workers,
+            on_progress=lambda pct, msg: self.progress.append((pct, msg))
+        )
+        engine.routes = self.routes
+        for idx in range(12):
+            engine.add(FakeView(engine, idx), 'Comparing {0}'.format(idx),
+                       source_scid=idx)
+
+        with patch.object(
+            CompareEngine, '_open_worker_connections',
+            lambda engine, count: self.open_worker_connections(engine, count)
+        ), patch.object(
+            CompareEngine, '_release_worker_connections',
+            staticmethod(lambda opened: self.released.extend(opened))
+        ), patch('pgadmin.tools.schema_diff.compare_engine.get_driver',
+                 return_value=FakeDriver(self)), \
+                self.app.test_request_context('/'):
+            result = engine.run()
+
+        # Results are kept in order of the tasks, and numbered again.
+        self.assertEqual([item['label'] for item in result], list(range(12)))
+        self.assertEqual([item['id'] for item in result], list(range(1, 13)))
+        self.assertEqual([item['kwargs']['source_scid'] for item in result],
+                         list(range(12)))
+
+        # Every worker routes the source and the target connection.
+        if self.expected_running:
+            for item in result:
+                self.assertEqual(set(item['routes']), {'1', '2'})
+                self.assertEqual(item['routes']['1'][10].split('.')[-1],
+                                 item['routes']['2'][20].split('.')[-1])
+            self.assertEqual(self.released, ['opened'])
+        else:
+            for item in result:
+                self.assertIsNone(item['routes'])
+
+        # Two routed managers (source, target) per running task.
+        self.assertLessEqual(self.max_running, self.expected_running)
+
+        # The progress of the completed tasks, reported for each task.
+        self.assertEqual(len(self.progress), 12)
+        self.assertEqual(
+            sorted(msg for _, msg in self.progress),
+            sorted('Comparing {0}'.format(idx) for idx in range(12))
+        )
+        percentages = [pct for pct, _ in self.progress]
+        self.assertEqual(min(percentages), 0)
+        self.assertLess(max(percentages), 100)
+        if not self.expected_running:
+            self.assertEqual(
+                percentages, [round(idx * 100 / 12, 2) for idx in range(12)]
+            )
@@ -18,6 +18,7 @@ from pgadmin.utils.ajax import make_json_response, bad_request,\
     internal_server_error
 from pgadmin.utils.preferences import Preferences
 from pgadmin.tools.search_objects.utils import SearchObjectsHelper
+from pgadmin.tools.search_objects.search_index import MATCH_TYPES
 
 MODULE_NAME = 'search_objects'
 
@@ -73,13 +74,28 @@ def search(sid, did):
     URL args:
         text <required>: search text
         type <optional>: type of object to be searched.
+        match <optional>: contains (default), prefix or similar.
+        offset, limit <optional>: page of the ranked objects to be returned.
     """
     text = request.args.get('text', None)
     obj_type = request.args.get('type', None)
+    match = request.args.get('match', None)
+
+    try:
+        offset = int(request.args.get('offset', 0))
+        limit = request.args.get('limit', None)
+        limit = None if limit is None else int(limit)
+    except ValueError:
+        offset = limit = -1
+
+    if match not in (None,) + MATCH_TYPES or offset < 0 or \
+            (limit is not None and limit < 0):
+        return bad_request(errormsg=gettext(
+            "Invalid match, offset or limit."))
 
     so_obj = SearchObjectsHelper(sid, did, blueprint.show_system_objects())
 
-    status, res = so_obj.search(text, obj_type)
+    status, res = so_obj.search(text, obj_type, match, offset, limit)
 
     if not status:
         return internal_server_error(errormsg=res)
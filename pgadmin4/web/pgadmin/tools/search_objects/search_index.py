@@ -0,0 +1,395 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2025, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""
+In-process index of the objects of a database, for the Search Objects tool.
+"""
+
+import re
+import threading
+import time
+from bisect import bisect_right
+from collections import Counter, defaultdict
+from itertools import accumulate
+
+from flask import current_app
+
+import config
+from pgadmin.utils.lru_cache import LRUCache
+
+MATCH_CONTAINS = 'contains'
+MATCH_PREFIX = 'prefix'
+MATCH_SIMILAR = 'similar'
+MATCH_TYPES = (MATCH_CONTAINS, MATCH_PREFIX, MATCH_SIMILAR)
+
+# Same as the default of pg_trgm.similarity_threshold.
+SIMILARITY_THRESHOLD = 0.3
+
+# The catalog views used by the search queries, and the catalogs they read
+# (the statistics are only collected for the catalogs).
+CATALOG_VIEWS = {
+    'pg_policies': 'pg_policy',
+    'pg_user_mappings': 'pg_user_mapping',
+}
+
+CATALOG_RE = re.compile(r'\b((?:pg|edb)_[a-z_]+)\b(?!\s*\()')
+WORD_RE = re.compile(r'[^\W_]+')
+
+
+def catalogs_of(sql):
+    """
+    Returns the names of the catalogs (and, the catalogs read by the catalog
+    views) used by the query. Names of the functions are not included.
+    """
+    return set(
+        CATALOG_VIEWS.get(name, name) for name in CATALOG_RE.findall(sql)
+    )
+
+
+def trigrams(text):
+    """
+    Returns the trigrams of the text, like pg_trgm - every word (of the
+    letters and digits) of the lowercased text is padded with two spaces
+    before it, and a space after it.
+    """
+    result = set()
+    for word in WORD_RE.findall(text.lower()):
+        word = '  ' + word + ' '
+        result.update([word[i:i + 3] for i in range(len(word) - 2)])
+    return result
+
+
+def like_regex(pattern):
+    """
+    Returns the regular expression matching (within a line) like
+    LIKE '%pattern%' in the search query - % and _ are the wildcards, and
+    the backslash escapes the next character. None is returned for a pattern
+    without any wildcard, to be searched as it is.
+    """
+    if not re.search(r'[%_\\]', pattern):
+        return None
+
+    regex = []
+    chars = iter(pattern)
+    for char in chars:
+        if char == '\\':
+            regex.append(re.escape(next(chars, '\\')))
+        elif char == '%':
+            regex.append('[^\\n]*?')
+        elif char == '_':
+            regex.append('[^\\n]')
+        else:
+            regex.append(re.escape(char))
+    return re.compile(''.join(regex))
+
+
+class SearchIndex():
+    """
+    class SearchIndex
+
+        Objects of a database (as returned by the search), with the lowercased
+        names joined by new lines (searched at once), and the trigrams of the
+        names (built on demand, for the similarity search).
+
+        An index is not changed once built - the refreshed index is a new
+        one (see replace), hence it can be searched without any lock.
+    """
+
+    def __init__(self, rows, counters=None, dependencies=None, built=None):
+        self.rows = rows
+        self.names = [row['name'].lower() for row in rows]
+        self.types = [row['type'] for row in rows]
+
+        # The name of the object i starts at starts[i] in the joined names.
+        self.joined = '\n' + '\n'.join(self.names)
+        self.starts = list(accumulate(
+            (len(name) + 1 for name in self.names), initial=1))
+
+        # Change counters of the catalogs, and the catalogs used to search
+        # the objects of every type.
+        self.counters = counters or dict()
+        self.dependencies = dependencies or dict()
+        self.built = self.checked = \
+            time.monotonic() if built is None else built
+        self._trigrams = None
+
+    def __len__(self):
+        return len(self.rows)
+
+    def changed_types(self, counters):
+        """
+        Returns the types of the objects to be fetched again, as per the
+        change counters of the catalogs. The objects of a type, using none of
+        the known catalogs, are fetched again after any change.
+        """
+        changed = set(
+            name for name in set(counters) | set(self.counters)
+            if counters.get(name) != self.counters.get(name)
+        )
+        if not changed:
+            return set()
+
+        return set(
+            obj_type for obj_type, catalogs in self.dependencies.items()
+            if catalogs & changed or not catalogs & set(counters)
+        )
+
+    def replace(self, obj_types, rows, counters, checked=None):
+        """
+        Returns a new index, with the objects of the given types replaced.
+        """
+        rows = [row for row in self.rows if row['type'] not in obj_types] + \
+            [row for row in rows if row['type'] in obj_types]
+        rows.sort(key=lambda row: (row['type'], row['name'], row['path']))
+
+        index = SearchIndex(rows, counters, self.dependencies, self.built)
+        index.checked = time.monotonic() if checked is None else checked
+        return index
+
+    def _find(self, text, match):
+        """
+        Yields the ids of the objects with the matching names, and the
+        positions of the (first) matches in the names.
+        """
+        joined, starts = self.joined, self.starts
+        regex = None if match == MATCH_PREFIX else like_regex(text)
+
+        if match == MATCH_PREFIX:
+            text = '\n' + text
+            offset = -1
+        else:
+            offset = 0
+
+        position = 1
+        while True:
+            if regex is None:
+                found = joined.find(text, position + offset)
+                if found < 0:
+                    return
+                found -= offset
+            else:
+                found = regex.search(joined, position)
+                if found is None:
+                    return
+                found = found.start()
+
+            i = bisect_right(starts, found) - 1
+            # Not a match spanning the names (of a text with a new line).
+            if regex or found + len(text) + offset < starts[i + 1]:
+                yield i, found - starts[i]
+            position = starts[i + 1]
+            if position >= len(joined):
+                return
+
+    def _trigram_index(self):
+        if self._trigrams is None:
+            postings = defaultdict(list)
+            counts = []
+            for i, name in enumerate(self.names):
+                grams = trigrams(name)
+                counts.append(len(grams))
+                for gram in grams:
+                    postings[gram].append(i)
+            self._trigrams = (postings, counts)
+        return self._trigrams
+
+    def _similar(self, text, obj_types):
+        grams = trigrams(text)
+        if not grams:
+            return
+
+        postings, counts = self._trigram_index()
+        shared = Counter()
+        for gram in grams:
+            shared.update(postings.get(gram, ()))
+
+        for i, common in shared.items():
+            if obj_types is not None and self.types[i] not in obj_types:
+                continue
+            similarity = common / (len(grams) + counts[i] - common)
+            if similarity >= SIMILARITY_THRESHOLD:
+                yield i, similarity
+
+    def search(self, text, obj_types=None, match=MATCH_CONTAINS,
+               ranked=False):
+        """
+        Returns the objects (of the given types, or of all the types) with
+        the names matching the text:
+            contains - like the search query (LIKE '%text%').
+            prefix - starting with the text.
+            similar - similar to the text (like pg_trgm, i.e. sharing at
+                least 30% of the trigrams).
+
+        The objects are returned in the order of the type, name and path,
+        or ranked - the exact matches first, then the prefix matches, and
+        the other matches by the position of the match and the length of
+        the name (or, by the similarity).
+        """
+        text = text.lower()
+        names = self.names
+        if obj_types is not None:
+            obj_types = set(obj_types)
+
+        if match == MATCH_SIMILAR:
+            matches = [
+                ((-similarity, len(names[i]), names[i], i), i)
+                for i, similarity in self._similar(text, obj_types)
+            ]
+        else:
+            matches = [
+                ((0 if names[i] == text else 1 if position == 0 else 2,
+                  position, len(names[i]), names[i], i), i)
+                for i, position in self._find(text, match)
+                if obj_types is None or self.types[i] in obj_types
+            ]
+
+        if ranked:
+            matches.sort()
+        elif match == MATCH_SIMILAR:
+            matches.sort(key=lambda match: match[1])
+
+        return [self.rows[i] for _, i in matches]
+
+
+class SearchIndexCache():
+    """
+    class SearchIndexCache
+
+        Search indexes by the user, the database and the search settings,
+        for the most recently used config.SEARCH_OBJECTS_INDEX_SIZE of them.
+
+        The change counters of the catalogs are checked (at most every
+        config.SEARCH_OBJECTS_INDEX_CHECK_INTERVAL seconds) before an index is
+        used, and the objects of the types using the changed catalogs are
+        fetched again. The statistics are reported lazily, so an index may
+        miss the changes of the last few seconds. None is returned (i.e. the
+        live query is to be used), when the statistics of the catalogs are
+        not collected, another request is building the index, or building it
+        failed.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._indexes = LRUCache('SEARCH_OBJECTS_INDEX_SIZE')
+        self._build_locks = dict()
+        self.hits = 0
+        self.misses = 0
+        self.refreshes = 0
+
+    @staticmethod
+    def enabled():
+        return getattr(config, 'SEARCH_OBJECTS_INDEX', False) and \
+            getattr(config, 'SEARCH_OBJECTS_INDEX_SIZE', 0) > 0
+
+    def index(self, key, source):
+        """
+        Returns the up-to-date index for the key, built (or refreshed) using
+        the source - providing the change counters of the catalogs
+        (counters), the catalogs used for every type (dependencies), and the
+        objects of all or the given types (fetch).
+        """
+        if not self.enabled():
+            return None
+
+        index = self._indexes.get(key, count=False)
+        with self._lock:
+            build_lock = self._build_locks.setdefault(key, threading.Lock())
+
+        now = time.monotonic()
+        max_age = getattr(config, 'SEARCH_OBJECTS_INDEX_MAX_AGE', 0)
+        if max_age and index is not None and now - index.built >= max_age:
+            index = None
+
+        if index is not None and now - index.checked < getattr(
+                config, 'SEARCH_OBJECTS_INDEX_CHECK_INTERVAL', 0):
+            self.hits += 1
+            return index
+
+        if not build_lock.acquire(blocking=False):
+            return None
+
+        try:
+            index = self._refresh(index, source, now)
+        except Exception as e:
+            current_app.logger.exception(e)
+            index = None
+        finally:
+            build_lock.release()
+
+        if index is None:
+            self.discard(key)
+            return None
+
+        evicted = self._indexes.put(key, index)
+        with self._lock:
+            for evicted_key in evicted:
+                self._build_locks.pop(evicted_key, None)
+
+        return index
+
+    def _refresh(self, index, source, now):
+        # Taken before fetching the objects, so that a change made while
+        # fetching them is seen the next time.
+        counters = source.counters()
+        if not counters:
+            return None
+
+        if index is None:
+            self.misses += 1
+            return SearchIndex(source.fetch(), counters, source.dependencies(),
+                               now)
+
+        obj_types = index.changed_types(counters)
+        if not obj_types:
+            self.hits += 1
+            index.checked = now
+            return index
+
+        self.refreshes += 1
+        if len(obj_types) * 2 > len(index.dependencies):
+            index = SearchIndex(source.fetch(), counters, index.dependencies,
+                                now)
+        else:
+            index = index.replace(obj_types, source.fetch(obj_types),
+                                  counters, now)
+        return index
+
+    def discard(self, key):
+        """
+        Forget the index for the given key, it is built again when used next.
+        """
+        self._indexes.pop(key)
+        with self._lock:
+            self._build_locks.pop(key, None)
+
+    def invalidate(self, sid=None):
+        """
+        Forget the indexes of the databases of the given server (or, all the
+        indexes, when not specified).
+        """
+        keys = self._indexes.discard(
+            None if sid is None else lambda key: key[1] == sid)
+        with self._lock:
+            for key in keys:
+                self._build_locks.pop(key, None)
+
+    def info(self):
+        """
+        Returns the cache statistics.
+        """
+        return dict(
+            self._indexes.info(),
+            hits=self.hits,
+            misses=self.misses,
+            refreshes=self.refreshes,
+            objects=sum(len(index) for index in self._indexes.values())
+        )
+
+
+search_indexes = SearchIndexCache()
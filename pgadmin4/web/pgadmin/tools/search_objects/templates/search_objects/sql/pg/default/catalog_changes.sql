@@ -0,0 +1,7 @@
+{# Change counters of the catalogs (none, when the statistics are not collected).
+   A change is seen once the server reports it to the statistics, i.e. the
+   index may miss the changes of the last few seconds. #}
+SELECT relname, n_tup_ins + n_tup_upd + n_tup_del AS changes
+FROM pg_catalog.pg_stat_sys_tables
+WHERE schemaname = 'pg_catalog'
+AND pg_catalog.current_setting('track_counts')::boolean
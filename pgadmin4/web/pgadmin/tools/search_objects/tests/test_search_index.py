@@ -0,0 +1,252 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2025, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+from unittest.mock import patch
+
+import config
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.tools.search_objects.search_index import SearchIndex, \
+    SearchIndexCache, catalogs_of, trigrams
+
+
+def make_row(obj_type, name):
+    return dict(name=name, type=obj_type, type_label=obj_type,
+                path='/' + obj_type + '/' + name, show_node=True,
+                other_info=None, catalog_level='N')
+
+
+ROWS = [
+    make_row('column', 'emp_id'),
+    make_row('column', 'employee_name'),
+    make_row('function', 'get_emp'),
+    make_row('table', 'dept'),
+    make_row('table', 'emp'),
+    make_row('table', 'employee'),
+    make_row('view', 'v_employees'),
+]
+
+LIKE_ROWS = [make_row('function', name)
+             for name in ('get_emp', 'gettemp', 'x\ny', 'emp')]
+
+KEY = (1, 1, 2)
+
+
+def names(rows):
+    return [row['name'] for row in rows]
+
+
+class FakeSource:
+    def __init__(self):
+        self.rows = list(ROWS)
+        self.catalog_counters = dict(pg_class=1, pg_attribute=1, pg_proc=1)
+        self.fetched = []
+
+    def counters(self):
+        return dict(self.catalog_counters)
+
+    def dependencies(self):
+        return dict(column={'pg_class', 'pg_attribute'},
+                    function={'pg_proc'}, table={'pg_class'},
+                    view={'pg_class', 'pg_rewrite'})
+
+    def fetch(self, obj_types=None):
+        self.fetched.append(obj_types)
+        return [row for row in self.rows
+                if obj_types is None or row['type'] in obj_types]
+
+
+class TestSearchIndexLike(BaseTestGenerator):
+    """ This class tests the search index matches the names like the search
+    query. """
+
+    scenarios = [
+        ('Match the names containing the text',
+         dict(text='emp', match='contains',
+              expected=['get_emp', 'gettemp', 'emp'])),
+        ('Match any character',
+         dict(text='e_p', match='contains',
+              expected=['get_emp', 'gettemp', 'emp'])),
+        ('Match any characters',
+         dict(text='g%p', match='contains', expected=['get_emp', 'gettemp'])),
+        ('Match the escaped wildcard',
+         dict(text='t\\_e', match='contains', expected=['get_emp'])),
+        ('Do not match across the lines',
+         dict(text='p\ng', match='contains', expected=[])),
+        ('Match the new line',
+         dict(text='x\ny', match='contains', expected=['x\ny'])),
+        ('Match the names starting with the text',
+         dict(text='emp', match='prefix', expected=['emp'])),
+        ('Match the names starting with the text, and more',
+         dict(text='get', match='prefix', expected=['get_emp', 'gettemp'])),
+        ('Match all the names',
+         dict(text='', match='contains',
+              expected=['get_emp', 'gettemp', 'x\ny', 'emp'])),
+    ]
+
+    def runTest(self):
+        index = SearchIndex(LIKE_ROWS)
+        self.assertEqual(names(index.search(self.text, match=self.match)),
+                         self.expected)
+
+
+class TestSearchIndexRank(BaseTestGenerator):
+    """ This class tests the order, and the ranking of the matching
+    objects. """
+
+    obj_types = None
+    match = 'contains'
+    ranked = False
+
+    scenarios = [
+        ('Order by the type, name and path',
+         dict(text='EMP', expected=[
+             'emp_id', 'employee_name', 'get_emp', 'emp', 'employee',
+             'v_employees'
+         ])),
+        ('Match the objects of the types',
+         dict(text='emp', obj_types=['table', 'view'],
+              expected=['emp', 'employee', 'v_employees'])),
+        ('Rank the names starting with the text',
+         dict(text='emp', match='prefix', ranked=True,
+              expected=['emp', 'emp_id', 'employee', 'employee_name'])),
+        ('Rank the names containing the text',
+         dict(text='emp', ranked=True, expected=[
+             'emp', 'emp_id', 'employee', 'employee_name', 'v_employees',
+             'get_emp'
+         ])),
+        ('Match none of the types',
+         dict(text='emp', obj_types=['schema'], expected=[])),
+        ('Rank the similar names',
+         dict(text='employe', match='similar', ranked=True,
+              expected=['employee', 'v_employees', 'employee_name', 'emp'])),
+        ('Match the similar names of the types',
+         dict(text='employe', obj_types=['view'], match='similar',
+              expected=['v_employees'])),
+        ('Match no similar names without the trigrams',
+         dict(text='--', match='similar', expected=[])),
+    ]
+
+    def runTest(self):
+        index = SearchIndex(ROWS)
+        self.assertEqual(
+            names(index.search(self.text, self.obj_types, match=self.match,
+                               ranked=self.ranked)),
+            self.expected
+        )
+
+
+class TestSearchIndexHelpers(BaseTestGenerator):
+    """ This class tests the catalogs used by a query, and the trigrams of a
+    name. """
+
+    scenarios = [
+        ('Find the catalogs of the query',
+         dict(function=catalogs_of,
+              value='SELECT pg_catalog.pg_get_function_arguments(p.oid) '
+                    'FROM pg_catalog.pg_proc p, pg_catalog.pg_policies',
+              expected={'pg_catalog', 'pg_proc', 'pg_policy'})),
+        ('Split the name into the trigrams',
+         dict(function=trigrams, value='a_B',
+              expected={'  a', ' a ', '  b', ' b '})),
+    ]
+
+    def runTest(self):
+        self.assertEqual(self.function(self.value), self.expected)
+
+
+class TestSearchIndexCache(BaseTestGenerator):
+    """ This class tests the cache of the search indexes, refreshed when the
+    catalogs change. """
+
+    enabled = True
+    new_rows = []
+    changed_catalogs = []
+    no_counters = False
+    invalidate = None
+    other_key = None
+    building = False
+    expected_names = None
+
+    scenarios = [
+        ('Reuse the unchanged index',
+         dict(expected='same', expected_fetched=[None],
+              expected_info=dict(size=1, hits=1, misses=1, refreshes=0))),
+        ('Refresh the changed types',
+         dict(new_rows=[('function', 'emp_count')],
+              changed_catalogs=['pg_proc'], expected='new',
+              expected_fetched=[None, {'function'}],
+              expected_names=['emp_count', 'get_emp'],
+              expected_info=dict(size=1, hits=0, misses=1, refreshes=1))),
+        ('Build again, when most of the types changed',
+         dict(changed_catalogs=['pg_class'], expected='new',
+              expected_fetched=[None, None],
+              expected_info=dict(size=1, hits=0, misses=1, refreshes=1))),
+        ('Skip, while another request builds the index',
+         dict(building=True, expected=None, expected_fetched=[None],
+              expected_info=dict(size=1, hits=0, misses=1, refreshes=0))),
+        ('Forget the index, when the statistics are not collected',
+         dict(no_counters=True, expected=None, expected_fetched=[None],
+              expected_info=dict(size=0, hits=0, misses=1, refreshes=0))),
+        ('Forget the least recently used index',
+         dict(other_key=(1, 2, 2), expected='new',
+              expected_fetched=[None, None, None],
+              expected_info=dict(size=1, hits=0, misses=3, refreshes=0))),
+        ('Forget the indexes of the server',
+         dict(invalidate=1, expected='new', expected_fetched=[None, None],
+              expected_info=dict(size=1, hits=0, misses=2, refreshes=0))),
+        ('Do not index, when disabled',
+         dict(enabled=False, expected=None, expected_fetched=[],
+              expected_info=dict(size=0, hits=0, misses=0, refreshes=0))),
+    ]
+
+    def runTest(self):
+        cache = SearchIndexCache()
+        source = FakeSource()
+
+        with patch.object(config, 'SEARCH_OBJECTS_INDEX', self.enabled), \
+                patch.object(config, 'SEARCH_OBJECTS_INDEX_SIZE', 1), \
+                patch.object(config, 'SEARCH_OBJECTS_INDEX_CHECK_INTERVAL',
+                             0):
+            index = cache.index(KEY, source)
+            self.assertEqual(index is None, not self.enabled)
+
+            for obj_type, name in self.new_rows:
+                source.rows.append(make_row(obj_type, name))
+            for catalog in self.changed_catalogs:
+                source.catalog_counters[catalog] += 1
+            if self.no_counters:
+                source.catalog_counters = dict()
+            if self.invalidate is not None:
+                cache.invalidate(self.invalidate)
+            if self.other_key is not None:
+                cache.index(self.other_key, source)
+
+            if self.building:
+                with cache._build_locks[KEY]:
+                    found = cache.index(KEY, source)
+            else:
+                found = cache.index(KEY, source)
+            info = cache.info()
+
+        if self.expected is None:
+            self.assertIsNone(found)
+        elif self.expected == 'same':
+            self.assertIs(found, index)
+        else:
+            self.assertIsNotNone(found)
+            self.assertIsNot(found, index)
+
+        self.assertEqual(source.fetched, self.expected_fetched)
+        self.assertEqual(
+            dict((name, info[name]) for name in self.expected_info),
+            self.expected_info
+        )
+        if self.expected_names is not None:
+            self.assertEqual(names(found.search('emp', ['function'])),
+                             self.expected_names)
@@ -0,0 +1,74 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2025, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+from unittest.mock import patch, MagicMock
+
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.tools.search_objects import utils
+from pgadmin.tools.search_objects.search_index import SearchIndex
+from pgadmin.tools.search_objects.utils import SearchObjectsHelper
+
+from .test_search_index import ROWS, make_row
+
+INDEX_KEY = (1, 1, 2)
+
+
+class TestSearchIndexFallback(BaseTestGenerator):
+    """ This class tests searching the objects not found in the search
+    index using the search query. """
+
+    scenarios = [
+        ('Found in the index',
+         dict(text='emp', live_rows=[], paged=False,
+              expected=['emp_id', 'employee_name', 'get_emp', 'emp',
+                        'employee', 'v_employees'],
+              live_query=False, discarded=False)),
+        ('Created after the last check of the index',
+         dict(text='new_table', live_rows=[make_row('table', 'new_table')],
+              paged=False, expected=['new_table'], live_query=True,
+              discarded=True)),
+        ('Created after the last check of the index, paged',
+         dict(text='new_t',
+              live_rows=[make_row('table', 'new_table'),
+                         make_row('table', 'new_t')],
+              paged=True, expected=['new_t', 'new_table'], live_query=True,
+              discarded=True)),
+        ('Not found at all',
+         dict(text='nothing', live_rows=[], paged=False, expected=[],
+              live_query=True, discarded=False)),
+    ]
+
+    def setUp(self):
+        pass
+
+    def runTest(self):
+        helper = SearchObjectsHelper.__new__(SearchObjectsHelper)
+        helper.did = 2
+        helper.manager = MagicMock()
+        helper.get_show_node_prefs = MagicMock(return_value={})
+        helper.get_supported_types = MagicMock(return_value={})
+        helper.get_index_key = MagicMock(return_value=INDEX_KEY)
+        helper._check_permission = MagicMock(return_value=[])
+        helper.fetch = MagicMock(return_value=(True, self.live_rows))
+
+        search_indexes = MagicMock()
+        search_indexes.index.return_value = SearchIndex(ROWS)
+        with patch.object(utils, 'search_indexes', search_indexes):
+            status, res = helper.search(
+                self.text, limit=10 if self.paged else None)
+
+        self.assertTrue(status)
+        if self.paged:
+            self.assertFalse(res['indexed'])
+            res = res['items']
+        self.assertEqual([row['name'] for row in res], self.expected)
+        self.assertEqual(helper.fetch.called, self.live_query)
+        self.assertEqual(search_indexes.discard.called, self.discarded)
+        if self.discarded:
+            search_indexes.discard.assert_called_with(INDEX_KEY)
@@ -9,10 +9,18 @@
 
 from flask import current_app, render_template
 from flask_babel import gettext
+from flask_security import current_user
 
 from pgadmin.utils.driver import get_driver
 from config import PG_DEFAULT_DRIVER
 from pgadmin.utils.constants import DATABASE_LAST_SYSTEM_OID
+from pgadmin.tools.search_objects.search_index import SearchIndex, \
+    search_indexes, catalogs_of, MATCH_CONTAINS, MATCH_SIMILAR
+
+CONSTRAINT_TYPES = [
+    'check_constraint', 'foreign_key', 'primary_key', 'unique_constraint',
+    'exclusion_constraint'
+]
 
 
 def get_node_blueprint(node_type):
@@ -109,17 +117,36 @@ class SearchObjectsHelper:
 
         return skip_obj_type
 
-    def search(self, text, obj_type=None):
-        skip_obj_type = []
-        conn = self.manager.connection(did=self.did)
-        last_system_oid = DATABASE_LAST_SYSTEM_OID
+    def get_index_key(self, show_node_prefs):
+        """
+        Returns the key of the search index of the database, for the user
+        and the search settings.
+        """
+        return (current_user.id, self.sid, self.did,
+                self.show_system_objects,
+                tuple(sorted(show_node_prefs.items())),
+                self.get_template_path())
 
-        show_node_prefs = self.get_show_node_prefs()
-        node_labels = self.get_supported_types(skip_check=True)
+    @staticmethod
+    def get_index_types(obj_type):
+        """
+        Returns the types of the objects (in the search index) searched for
+        the given type (None for all the types).
+        """
+        if obj_type is None or obj_type == 'all':
+            return None
+        if obj_type == 'constraints':
+            return CONSTRAINT_TYPES
+        return [obj_type]
+
+    def fetch(self, conn, text, obj_type, show_node_prefs, node_labels,
+              skip_obj_type):
+        """
+        Returns the objects (of the given type) with the names matching the
+        text, using the search query.
+        """
         # escape the single quote from search text
         text = text.replace("'", "''")
-        skip_obj_type = self._check_permission(obj_type, conn,
-                                               skip_obj_type)
 
         # Column catalog_level has values as
         # N - Not a catalog schema
@@ -130,14 +157,14 @@ class SearchObjectsHelper:
                          search_text=text.lower(), obj_type=obj_type,
                          show_system_objects=self.show_system_objects,
                          show_node_prefs=show_node_prefs, _=gettext,
-                         last_system_oid=last_system_oid,
+                         last_system_oid=DATABASE_LAST_SYSTEM_OID,
                          skip_obj_type=skip_obj_type)
         )
 
         if not status:
             return status, res
 
-        ret_val = [
+        return True, [
             {
                 'name': row['obj_name'],
                 'type': row['obj_type'],
@@ -149,4 +176,130 @@ class SearchObjectsHelper:
             }
             for row in res['rows']
         ]
-        return True, ret_val
+
+    def search(self, text, obj_type=None, match=None, offset=0, limit=None):
+        """
+        Returns the objects (of the given type) with the names matching the
+        text, in the order of the type, name and path.
+
+        When any of match (see SearchIndex.search), offset, or limit is
+        given, a page of the ranked objects is returned instead, with the
+        total number of the matching objects.
+
+        The objects are searched in the search index of the database (when
+        enabled), or using the search query. The index is refreshed using the
+        statistics of the catalogs, hence - it may miss the changes made in
+        the last config.SEARCH_OBJECTS_INDEX_CHECK_INTERVAL seconds (plus the
+        delay of the statistics). The search query is used, when nothing
+        matches in the index.
+        """
+        conn = self.manager.connection(did=self.did)
+        show_node_prefs = self.get_show_node_prefs()
+        node_labels = self.get_supported_types(skip_check=True)
+        paged = match is not None or offset or limit is not None
+        match = match or MATCH_CONTAINS
+
+        index = None
+        if search_indexes.enabled():
+            index_key = self.get_index_key(show_node_prefs)
+            index = search_indexes.index(
+                index_key,
+                SearchIndexSource(self, conn, show_node_prefs, node_labels)
+            )
+        indexed = index is not None
+
+        res = None
+        if indexed:
+            res = index.search(text, self.get_index_types(obj_type), match,
+                               ranked=paged)
+            # The statistics of the catalogs are reported lazily, an object
+            # created after the last check may not be indexed yet. Only the
+            # search not matching anything is checked using the search
+            # query, the other results may still be stale.
+            indexed = len(res) > 0
+
+        if not indexed:
+            skip_obj_type = self._check_permission(obj_type, conn, [])
+            # The similar names are found among all the objects.
+            status, res = self.fetch(
+                conn, '' if match == MATCH_SIMILAR else text, obj_type,
+                show_node_prefs, node_labels, skip_obj_type
+            )
+            if not status:
+                return status, res
+            if paged:
+                res = SearchIndex(res).search(
+                    text, self.get_index_types(obj_type), match, ranked=True)
+            if res and index is not None:
+                # Found by the search query only, the index is stale.
+                search_indexes.discard(index_key)
+
+        if not paged:
+            return True, res
+
+        return True, {
+            'items': res[offset:None if limit is None else offset + limit],
+            'total': len(res),
+            'offset': offset,
+            'limit': limit,
+            'indexed': indexed,
+        }
+
+
+class SearchIndexSource:
+    """
+    The objects of a database, the catalogs used to search the objects of
+    every type, and the change counters of the catalogs, for the search
+    index of the database (see SearchIndexCache.index).
+    """
+
+    def __init__(self, helper, conn, show_node_prefs, node_labels):
+        self.helper = helper
+        self.conn = conn
+        self.show_node_prefs = show_node_prefs
+        self.node_labels = node_labels
+        self._skip_obj_type = None
+
+    @property
+    def skip_obj_type(self):
+        if self._skip_obj_type is None:
+            self._skip_obj_type = self.helper._check_permission(
+                'all', self.conn, [])
+        return self._skip_obj_type
+
+    @property
+    def obj_types(self):
+        return [obj_type for obj_type in self.node_labels
+                if obj_type != 'constraints' and
+                obj_type not in self.skip_obj_type]
+
+    def counters(self):
+        status, res = self.conn.execute_dict(
+            self.helper.get_sql('catalog_changes.sql'))
+        if not status:
+            raise RuntimeError(res)
+
+        return dict((row['relname'], row['changes']) for row in res['rows'])
+
+    def dependencies(self):
+        return dict(
+            (obj_type, catalogs_of(self.helper.get_sql(
+                'search.sql', search_text='', obj_type=obj_type,
+                show_system_objects=self.helper.show_system_objects,
+                show_node_prefs=self.show_node_prefs, _=gettext,
+                last_system_oid=DATABASE_LAST_SYSTEM_OID,
+                skip_obj_type=self.skip_obj_type)))
+            for obj_type in self.obj_types
+        )
+
+    def fetch(self, obj_types=None):
+        rows = []
+        for obj_type in ['all'] if obj_types is None else sorted(obj_types):
+            status, res = self.helper.fetch(
+                self.conn, '', obj_type, self.show_node_prefs,
+                self.node_labels, self.skip_obj_type
+            )
+            if not status:
+                raise RuntimeError(res)
+            rows.extend(res)
+        return rows
@@ -21,7 +21,8 @@ import json
 
 from sqlalchemy import or_
 
-from config import PG_DEFAULT_DRIVER, ALLOW_SAVE_PASSWORD, SHARED_STORAGE
+from config import PG_DEFAULT_DRIVER, ALLOW_SAVE_PASSWORD, SHARED_STORAGE, \
+    QUERY_TOOL_SERVER_CURSOR
 from werkzeug.user_agent import UserAgent
 from flask import Response, url_for, render_template, session, current_app
 from flask import request
@@ -55,6 +56,8 @@ from pgadmin.tools.sqleditor.utils.query_tool_fs_utils import \
     read_file_generator
 from pgadmin.tools.sqleditor.utils.filter_dialog import FilterDialog
 from pgadmin.tools.sqleditor.utils.query_history import QueryHistory
+from pgadmin.tools.sqleditor.utils.columnar_result import \
+    RESULT_FORMAT_COLUMNAR, columnar_format_requested, encode_columnar_result
 from pgadmin.tools.sqleditor.utils.macros import get_macros, \
     get_user_macros, set_macros
 from pgadmin.utils.constants import MIMETYPE_APP_JS, \
@@ -888,7 +891,8 @@ def start_view_data(trans_id):
         update_session_grid_transaction(trans_id, session_obj)
 
         # Execute sql asynchronously
-        status, result = conn.execute_async(sql)
+        status, result = conn.execute_async(
+            sql, server_cursor=QUERY_TOOL_SERVER_CURSOR)
     else:
         status = False
         result = error_msg
@@ -1170,25 +1174,26 @@ def poll(trans_id):
         'rows_to': rows_fetched_to
     }
 
-    return make_json_response(
-        data={
-            'status': status, 'result': result,
-            'rows_affected': rows_affected,
-            'rows_fetched_from': rows_fetched_from,
-            'rows_fetched_to': rows_fetched_to,
-            'additional_messages': additional_messages,
-            'notifies': notifies,
-            'colinfo': columns_info,
-            'primary_keys': primary_keys,
-            'types': types,
-            'client_primary_key': client_primary_key,
-            'has_oids': has_oids,
-            'oids': oids,
-            'transaction_status': transaction_status,
-            'data_obj': data_obj,
-            'pagination': pagination,
-        }
-    )
+    data = {
+        'status': status, 'result': result,
+        'rows_affected': rows_affected,
+        'rows_fetched_from': rows_fetched_from,
+        'rows_fetched_to': rows_fetched_to,
+        'additional_messages': additional_messages,
+        'notifies': notifies,
+        'colinfo': columns_info,
+        'primary_keys': primary_keys,
+        'types': types,
+        'client_primary_key': client_primary_key,
+        'has_oids': has_oids,
+        'oids': oids,
+        'transaction_status': transaction_status,
+        'data_obj': data_obj,
+        'pagination': pagination,
+    }
+    set_result_format(data)
+
+    return make_json_response(data=data)
 
 
 @blueprint.route(
@@ -1238,14 +1243,15 @@ def fetch_window(trans_id, from_rownum=0, to_rownum=0):
         'rows_to': rows_fetched_to
     }
 
-    return make_json_response(
-        data={
-            'status': status,
-            'result': result,
-            'pagination': pagination,
-            'row_count': conn.row_count,
-        }
-    )
+    data = {
+        'status': status,
+        'result': result,
+        'pagination': pagination,
+        'row_count': conn.row_count,
+    }
+    set_result_format(data)
+
+    return make_json_response(data=data)
 
 
 @blueprint.route(
@@ -1291,6 +1297,22 @@ def fetch_all_from_start(trans_id, limit=-1):
     )
 
 
+def set_result_format(data):
+    """
+    This function encodes the rows of the result page in the columnar
+    format, when the grid asked for it. The other results (i.e. the
+    messages) are sent as they are.
+
+    Args:
+        data: Response data, with the status, and the result
+    """
+    result = data['result']
+    if data['status'] == 'Success' and isinstance(result, list) and \
+            result and columnar_format_requested():
+        data['result'] = encode_columnar_result(result)
+        data['result_format'] = RESULT_FORMAT_COLUMNAR
+
+
 def fetch_pg_types(columns_info, trans_obj):
     """
     This method is used to fetch the pg types, which is required
@@ -2720,11 +2742,27 @@ def get_query_history(trans_id):
     Args:
         sid: server id
         did: database id
+
+    URL args:
+        search <optional>: text to be searched in the queries.
+        offset, limit <optional>: page of the history to be returned, the
+            latest first.
     """
 
     _, _, conn, trans_obj, _ = check_transaction_status(trans_id)
 
-    return QueryHistory.get(current_user.id, trans_obj.sid, conn.db)
+    try:
+        offset = int(request.args.get('offset', 0))
+        limit = request.args.get('limit', None)
+        limit = None if limit is None else int(limit)
+    except ValueError:
+        offset = limit = -1
+
+    if offset < 0 or (limit is not None and limit < 0):
+        return bad_request(errormsg=gettext("Invalid offset or limit."))
+
+    return QueryHistory.get(current_user.id, trans_obj.sid, conn.db,
+                            request.args.get('search', None), offset, limit)
 
 
 @blueprint.route(
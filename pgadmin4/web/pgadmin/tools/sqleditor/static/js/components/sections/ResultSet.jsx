@@ -40,6 +40,8 @@ const StyledBox = styled(Box)(({theme}) => ({
   backgroundColor: theme.otherVars.qtDatagridBg,
 }));
 
+const RESULT_FORMAT_COLUMNAR = 'columnar';
+
 export class ResultSetUtils {
   constructor(api, queryToolCtx, transId, isQueryTool=true) {
     this.api = api;
@@ -115,6 +117,32 @@ export class ResultSetUtils {
     return httpMessage.data.data.status === 'NotConnected';
   }
 
+  /* The rows of the result pages are requested in the columnar format,
+   * when enabled in the preferences, and converted back to the rows here. */
+  static decodeColumnarResult(result) {
+    const columns = result.columns.map((col)=>col.values ?? col.codes);
+    const dictionaries = result.columns.map((col)=>col.dictionary);
+    let rows = new Array(result.rows);
+    for(let rowIdx = 0; rowIdx < result.rows; rowIdx++) {
+      let row = new Array(columns.length);
+      for(let colIdx = 0; colIdx < columns.length; colIdx++) {
+        const val = columns[colIdx][rowIdx];
+        row[colIdx] = dictionaries[colIdx] ? dictionaries[colIdx][val] : val;
+      }
+      rows[rowIdx] = row;
+    }
+    return rows;
+  }
+
+  static decodeResultFormat(httpMessage) {
+    let data = httpMessage.data.data;
+    if(data?.result_format === RESULT_FORMAT_COLUMNAR) {
+      data.result = ResultSetUtils.decodeColumnarResult(data.result);
+      delete data.result_format;
+    }
+    return httpMessage;
+  }
+
   setStartTime(start) {
     this.startTime = start;
   }
@@ -155,6 +183,11 @@ export class ResultSetUtils {
     this.qtPref = pref;
   }
 
+  getResultParams() {
+    return this.qtPref?.columnar_result_format ?
+      {params: {format: RESULT_FORMAT_COLUMNAR}} : {};
+  }
+
   setStartData(data) {
     this.startData = data;
   }
@@ -348,8 +381,9 @@ export class ResultSetUtils {
         resolve(this.api.get(
           url_for('sqleditor.poll', {
             'trans_id': this.transId,
-          })
-        ));
+          }),
+          this.getResultParams()
+        ).then(ResultSetUtils.decodeResultFormat));
       }, delay);
     });
   }
@@ -436,7 +470,8 @@ export class ResultSetUtils {
       'from_rownum': fromRownum,
       'to_rownum': toRownum,
     });
-    return this.api.get(url);
+    return this.api.get(url, this.getResultParams())
+      .then(ResultSetUtils.decodeResultFormat);
   }
 
   stopExecution() {
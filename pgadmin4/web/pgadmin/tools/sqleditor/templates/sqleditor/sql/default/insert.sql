@@ -6,5 +6,6 @@ INSERT INTO {{ conn|qtIdent(nsp_name, object_name) | replace("%", "%%") }} (
 {% for col in data_to_be_saved %}
 {% if not loop.first %}, {% endif %}{% if data_to_be_saved[col] == 'set_default' and use_default %} DEFAULT {% else %}%({{ pgadmin_alias[col] }})s{% if type_cast_required[col] %}::{{ data_type[col] }}{% endif %}{% endif %}{% endfor %}
 )
-{% if pk_names and not has_oids %} returning {{pk_names | replace("%", "%%")}}{% endif %}
-{% if has_oids %} returning oid{% endif %};
+{% if return_row %} returning {% if has_oids %}oid, {% endif %}*
+{% elif pk_names and not has_oids %} returning {{pk_names | replace("%", "%%")}}
+{% elif has_oids %} returning oid{% endif %};
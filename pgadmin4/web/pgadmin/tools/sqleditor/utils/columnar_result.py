@@ -0,0 +1,139 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2025, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""
+Encodes the rows of a result page of the Query Tool in the columnar format.
+
+The grid asks for it, when the 'Columnar result format?' preference is set,
+with the 'format=columnar' argument of the poll, and the fetch_window
+requests. The result is sent as:
+
+    {
+        "rows": <number of the rows>,
+        "columns": [
+            {"values": [<value of every row>]},
+            {"dictionary": [<distinct values>], "codes": [<index>]},
+            ...
+        ]
+    }
+
+A column of strings (and nulls) with many repeated values is sent as the
+dictionary of the distinct values, and the index of the value of every row.
+The values not supported by JSON (e.g. Decimal, datetime, bytes, etc.) are
+converted once per column, the same way as DataTypeJSONEncoder converts
+them, so that the encoder never has to call default() for them.
+"""
+
+import datetime
+import decimal
+from functools import partial
+
+from flask import request
+
+from pgadmin.utils.ajax import DataTypeJSONEncoder
+
+RESULT_FORMAT_COLUMNAR = 'columnar'
+
+# Use a dictionary for the column, only when the distinct values are at the
+# most this fraction of the rows.
+DICTIONARY_MAX_RATIO = 0.5
+# Rows looked at, before building the dictionary of a column.
+DICTIONARY_SAMPLE_SIZE = 64
+
+_JSON_TYPES = frozenset((str, int, float, bool, type(None)))
+_to_json = DataTypeJSONEncoder().default
+
+
+def columnar_format_requested():
+    """
+    Returns True, when the grid asked for the result in the columnar format.
+    """
+    return request.args.get('format') == RESULT_FORMAT_COLUMNAR
+
+
+def _json_value(value):
+    if type(value) in _JSON_TYPES:
+        return value
+    if isinstance(value, (list, tuple)):
+        return [_json_value(val) for val in value]
+    if isinstance(value, dict):
+        return {key: _json_value(val) for key, val in value.items()}
+    return _to_json(value)
+
+
+def _converter(typ):
+    """
+    Returns the function converting the values of the type, like
+    DataTypeJSONEncoder.default() does.
+    """
+    if hasattr(typ, 'isoformat'):
+        return typ.isoformat
+    if issubclass(typ, datetime.timedelta):
+        return lambda val: (datetime.datetime.min + val).time().isoformat()
+    if issubclass(typ, decimal.Decimal):
+        return float
+    if issubclass(typ, bytes):
+        return partial(bytes.decode, encoding='utf-8')
+    return _to_json
+
+
+def _json_column(values, types):
+    """
+    Returns the values of the column, converted to the JSON types.
+    """
+    types = types - {type(None)}
+    if len(types) == 1:
+        typ = next(iter(types))
+        if not issubclass(typ, (list, tuple, dict)):
+            convert = _converter(typ)
+            return [None if val is None else convert(val) for val in values]
+    return [_json_value(val) for val in values]
+
+
+def _dictionary_column(values):
+    """
+    Returns the dictionary encoded column, or None when the column has too
+    many distinct values for it.
+    """
+    max_size = len(values) * DICTIONARY_MAX_RATIO
+    if len(set(values[:DICTIONARY_SAMPLE_SIZE])) > \
+            DICTIONARY_SAMPLE_SIZE * DICTIONARY_MAX_RATIO:
+        return None
+
+    dictionary = list(dict.fromkeys(values))
+    if len(dictionary) > max_size:
+        return None
+
+    index = {val: code for code, val in enumerate(dictionary)}
+    return {'dictionary': dictionary,
+            'codes': list(map(index.__getitem__, values))}
+
+
+def encode_columnar_result(rows):
+    """
+    Returns the rows (a list of lists, or tuples of the same length), in
+    the columnar format. The values of a column are sent as the tuple of
+    the transposed rows, when they need no conversion.
+
+    Args:
+        rows: rows of the result page
+    """
+    columns = []
+    for values in zip(*rows):
+        types = set(map(type, values))
+
+        if not types <= _JSON_TYPES:
+            columns.append({'values': _json_column(values, types)})
+            continue
+
+        column = _dictionary_column(values) \
+            if types <= {str, type(None)} and len(values) > 1 else None
+        columns.append(column or {'values': values})
+
+    return {'rows': len(rows), 'columns': columns}
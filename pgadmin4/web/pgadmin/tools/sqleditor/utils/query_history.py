@@ -1,32 +1,231 @@
+import atexit
+import json
+import threading
+import time
+
+from flask import current_app
+
+import config
 from pgadmin.utils.ajax import make_json_response
 from pgadmin.model import db, QueryHistoryModel
 from config import MAX_QUERY_HIST_STORED
-import json
+
+
+def _history_filter(key):
+    uid, sid, dbname = key
+    return [QueryHistoryModel.uid == uid,
+            QueryHistoryModel.sid == sid,
+            QueryHistoryModel.dbname == dbname]
+
+
+def _history_query(query_info):
+    """
+    Returns the query text of the history entry (or, the entry itself, when
+    it is not a valid JSON).
+    """
+    try:
+        query_info = query_info.decode() \
+            if isinstance(query_info, bytes) else query_info
+        return str(json.loads(query_info).get('query', ''))
+    except Exception:
+        return str(query_info)
+
+
+class QueryHistoryBuffer:
+    """
+    class QueryHistoryBuffer
+
+        Buffers the new history entries in memory, and writes them to the
+        configuration database in batches - every
+        config.QUERY_HISTORY_FLUSH_INTERVAL seconds, from a background
+        thread (or, right away when set to 0).
+
+        The position of the last entry in the ring of the
+        MAX_QUERY_HIST_STORED entries of every user/server/database is read
+        (and locked) in the transaction writing the entries, so that the
+        processes serving pgAdmin do not overwrite the entries of each other.
+        The entries failed to be written are kept, and written with the next
+        batch. Before the entries are read, changed or deleted, the buffered
+        entries are written.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._pending = []
+        self._thread = None
+
+    @staticmethod
+    def _position(key):
+        """
+        Returns the position of the last entry (0 when none), read from the
+        database, and locked until the end of the transaction (and removes
+        the entries beyond MAX_QUERY_HIST_STORED, if the limit was lowered).
+        """
+        filters = _history_filter(key)
+        last_updated_rec = db.session.query(QueryHistoryModel.srno) \
+            .filter(*filters, QueryHistoryModel.last_updated_flag == 'Y') \
+            .with_for_update() \
+            .first()
+
+        db.session.query(QueryHistoryModel) \
+            .filter(*filters,
+                    QueryHistoryModel.srno > MAX_QUERY_HIST_STORED) \
+            .delete(synchronize_session=False)
+
+        # Without a last updated record, the ring starts from sr no 1.
+        if last_updated_rec is None or \
+                last_updated_rec.srno > MAX_QUERY_HIST_STORED:
+            return 0
+        return last_updated_rec.srno
+
+    def add(self, key, query_info):
+        with self._lock:
+            self._pending.append((key, query_info))
+
+        interval = getattr(config, 'QUERY_HISTORY_FLUSH_INTERVAL', 0)
+        if not interval:
+            self.flush()
+            return
+
+        if self._thread is None or not self._thread.is_alive():
+            with self._lock:
+                if self._thread is None or not self._thread.is_alive():
+                    app = current_app._get_current_object()
+                    self._thread = threading.Thread(
+                        target=self._run, name='QueryHistoryBuffer',
+                        args=(app, interval), daemon=True
+                    )
+                    self._thread.start()
+                    atexit.register(self._flush_in_context, app)
+
+    def _flush_in_context(self, app):
+        with app.app_context():
+            self.flush()
+
+    def _run(self, app, interval):
+        while True:
+            time.sleep(interval)
+            self._flush_in_context(app)
+
+    def flush(self):
+        """
+        Writes the buffered entries - a delete of the entries being
+        replaced, and an insert of the new entries, for every
+        user/server/database, in a single transaction.
+        """
+        with self._flush_lock:
+            with self._lock:
+                pending, self._pending = self._pending, []
+            if not pending:
+                return
+
+            queries = dict()
+            for key, query_info in pending:
+                queries.setdefault(key, []).append(query_info)
+
+            try:
+                for key, key_queries in queries.items():
+                    filters = _history_filter(key)
+                    srno = self._position(key)
+                    entries = dict()
+                    for query_info in key_queries:
+                        # The later entry replaces the earlier one at a
+                        # position.
+                        srno = srno % MAX_QUERY_HIST_STORED + 1
+                        entries[srno] = query_info
+
+                    db.session.query(QueryHistoryModel) \
+                        .filter(*filters,
+                                QueryHistoryModel.last_updated_flag == 'Y') \
+                        .update({QueryHistoryModel.last_updated_flag: 'N'},
+                                synchronize_session=False)
+                    db.session.query(QueryHistoryModel) \
+                        .filter(*filters,
+                                QueryHistoryModel.srno.in_(list(entries))) \
+                        .delete(synchronize_session=False)
+                    db.session.add_all([
+                        QueryHistoryModel(
+                            srno=entry_srno, uid=key[0], sid=key[1],
+                            dbname=key[2], query_info=query_info,
+                            last_updated_flag='Y' if entry_srno == srno
+                            else 'N')
+                        for entry_srno, query_info in entries.items()
+                    ])
+                db.session.commit()
+            except Exception as e:
+                db.session.rollback()
+                current_app.logger.exception(e)
+                # do not affect query execution if history saving fails, the
+                # entries (at most a ring of them) are written with the next
+                # batch.
+                with self._lock:
+                    self._pending[:0] = [
+                        (key, query_info)
+                        for key, key_queries in queries.items()
+                        for query_info in key_queries[-MAX_QUERY_HIST_STORED:]
+                    ]
+
+
+history_buffer = QueryHistoryBuffer()
 
 
 class QueryHistory:
     @staticmethod
-    def get(uid, sid, dbname):
+    def get(uid, sid, dbname, search=None, offset=0, limit=None):
+        """
+        Returns the history entries of the user/server/database. When
+        search, offset, or limit is given, a page of the entries (with the
+        query containing the search text) is returned, the latest first,
+        with the total number of the matching entries.
+        """
+        history_buffer.flush()
 
         result = db.session \
-            .query(QueryHistoryModel.query_info) \
+            .query(QueryHistoryModel.srno, QueryHistoryModel.query_info,
+                   QueryHistoryModel.last_updated_flag) \
             .filter(QueryHistoryModel.uid == uid,
                     QueryHistoryModel.sid == sid,
                     QueryHistoryModel.dbname == dbname) \
             .all()
 
-        result = [rec.query_info for rec in list(result)]
+        if search is None and not offset and limit is None:
+            return make_json_response(
+                data={
+                    'status': True,
+                    'msg': '',
+                    'result': [rec.query_info for rec in list(result)]
+                }
+            )
+
+        position = next((rec.srno for rec in result
+                         if rec.last_updated_flag == 'Y'), 0)
+        result = sorted(
+            result,
+            key=lambda rec: (position - rec.srno) % MAX_QUERY_HIST_STORED
+        )
+        if search:
+            search = search.lower()
+            result = [rec for rec in result
+                      if search in _history_query(rec.query_info).lower()]
 
         return make_json_response(
             data={
                 'status': True,
                 'msg': '',
-                'result': result
+                'result': [
+                    rec.query_info for rec in
+                    result[offset:None if limit is None else offset + limit]
+                ],
+                'total': len(result),
+                'offset': offset,
+                'limit': limit
             }
         )
 
     @staticmethod
     def update_history_dbname(uid, sid, old_dbname, new_dbname):
+        history_buffer.flush()
         try:
             db.session \
                 .query(QueryHistoryModel) \
@@ -43,59 +242,7 @@ class QueryHistory:
     @staticmethod
     def save(uid, sid, dbname, request):
         try:
-            max_srno = db.session\
-                .query(db.func.max(QueryHistoryModel.srno)) \
-                .filter(QueryHistoryModel.uid == uid,
-                        QueryHistoryModel.sid == sid,
-                        QueryHistoryModel.dbname == dbname)\
-                .scalar()
-
-            # if no records present
-            if max_srno is None:
-                new_srno = 1
-            else:
-                new_srno = max_srno + 1
-
-                # last updated flag is used to recognise the last
-                # inserted/updated record.
-                # It is helpful to cycle the records
-                last_updated_rec = db.session.query(QueryHistoryModel) \
-                    .filter(QueryHistoryModel.uid == uid,
-                            QueryHistoryModel.sid == sid,
-                            QueryHistoryModel.dbname == dbname,
-                            QueryHistoryModel.last_updated_flag == 'Y') \
-                    .first()
-
-                # there should be a last updated record
-                # if not present start from sr no 1
-                if last_updated_rec is not None:
-                    last_updated_rec.last_updated_flag = 'N'
-
-                    # if max limit reached then recycle
-                    if new_srno > MAX_QUERY_HIST_STORED:
-                        new_srno = (
-                            last_updated_rec.srno % MAX_QUERY_HIST_STORED) + 1
-                else:
-                    new_srno = 1
-
-                # if the limit is lowered and number of records present is
-                # more, then cleanup
-                if max_srno > MAX_QUERY_HIST_STORED:
-                    db.session.query(QueryHistoryModel)\
-                        .filter(QueryHistoryModel.uid == uid,
-                                QueryHistoryModel.sid == sid,
-                                QueryHistoryModel.dbname == dbname,
-                                QueryHistoryModel.srno >
-                                MAX_QUERY_HIST_STORED)\
-                        .delete()
-
-            history_entry = QueryHistoryModel(
-                srno=new_srno, uid=uid, sid=sid, dbname=dbname,
-                query_info=request.data, last_updated_flag='Y')
-
-            db.session.merge(history_entry)
-
-            db.session.commit()
+            history_buffer.add((uid, sid, dbname), request.data)
         except Exception:
             db.session.rollback()
             # do not affect query execution if history saving fails
@@ -109,6 +256,7 @@ class QueryHistory:
 
     @staticmethod
     def clear_history(uid, sid, dbname=None, filter=None):
+        history_buffer.flush()
         try:
             filters = [
                 QueryHistoryModel.uid == uid,
@@ -375,6 +375,16 @@ def register_query_tool_preferences(self):
                          ' rows with alternating background colors.')
     )
 
+    self.columnar_result_format = self.preference.register(
+        'Results_grid', 'columnar_result_format',
+        gettext("Columnar result format?"), 'boolean',
+        False, category_label=PREF_LABEL_RESULTS_GRID,
+        help_str=gettext('If set to true, the rows of the result are sent'
+                         ' to the result grid column by column, with the'
+                         ' repeated strings sent once. It takes less time'
+                         ' to send the wide results.')
+    )
+
     self.sql_font_size = self.preference.register(
         'Editor', 'sql_font_size',
         gettext("Font size"), 'numeric', '1',
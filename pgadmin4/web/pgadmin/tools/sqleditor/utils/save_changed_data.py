@@ -10,6 +10,8 @@
 from flask import render_template
 from collections import OrderedDict
 
+import config
+
 from pgadmin.tools.sqleditor.utils.constant_definition import TX_STATUS_IDLE
 from pgadmin.utils.exception import ExecuteError
 
@@ -103,7 +105,7 @@ def save_changed_data(changed_data, columns_info, conn, command_obj,
             # no_default_value, set column to blank, instead
             # of not null which is set by default.
             column_data = {}
-            pk_names, primary_keys = command_obj.get_primary_keys()
+            pk_names, _ = command_obj.get_primary_keys()
 
             for each_row in added_index:
                 # Get the row index to match with the added rows
@@ -139,22 +141,16 @@ def save_changed_data(changed_data, columns_info, conn, command_obj,
                     pk_names=pk_names,
                     has_oids=command_obj.has_oids(),
                     type_cast_required=type_cast_required,
-                    use_default=use_default
-                )
-
-                select_sql = render_template(
-                    "/".join([command_obj.sql_path, 'select.sql']),
-                    object_name=command_obj.object_name,
-                    nsp_name=command_obj.nsp_name,
-                    pgadmin_alias=pgadmin_alias,
-                    primary_keys=primary_keys,
-                    has_oids=command_obj.has_oids()
+                    use_default=use_default,
+                    return_row=True
                 )
 
+                # The inserted row is returned by the INSERT statement
+                # itself, hence - no need to select it again.
                 list_of_sql[of_type].append({
                     'sql': sql, 'data': data,
                     'client_row': tmp_row_index,
-                    'select_sql': select_sql,
+                    'returns_row': True,
                     'row_id': data.get(client_primary_key)
                 })
                 # Reset column data
@@ -229,92 +225,62 @@ def save_changed_data(changed_data, columns_info, conn, command_obj,
             )
             list_of_sql[of_type].append({'sql': sql, 'data': {}})
 
-    def failure_handle(res, row_id):
-        mogrified_sql = conn.mogrify(item['sql'], item['data'])
-        mogrified_sql = mogrified_sql if mogrified_sql is not None \
-            else item['sql']
-        query_results.append({
-            'status': False,
-            'result': res,
-            'sql': mogrified_sql,
-            'rows_affected': 0,
-            'row_added': None
-        })
-
-        if is_savepoint:
-            sql = 'ROLLBACK TO SAVEPOINT save_data;'
-            msg = 'A ROLLBACK was done for the save operation only. ' \
-                  'The active transaction is not affected.'
+    items = [
+        item for sqls in list_of_sql.values() for item in sqls if item['sql']
+    ]
+    for item in items:
+        item['data'] = {
+            pgadmin_alias[k] if k in pgadmin_alias else k: v
+            for k, v in item['data'].items()
+        }
+
+    failure = None
+    if len(items) > 1 and config.QUERY_TOOL_SAVE_PIPELINE and \
+            conn.pipeline_supported():
+        # Run all the statements in a single round trip. On failure, the
+        # changes are rolled back, and the statements are executed again
+        # one by one to find and report the failing row.
+        try:
+            status, res = conn.execute_pipeline(
+                [(item['sql'], item['data']) for item in items]
+            )
+        except Exception:
+            rollback_and_report(
+                conn, res, {'sql': '', 'data': {}}, query_results,
+                is_savepoint
+            )
+            raise
+
+        if status:
+            for item, result in zip(items, res):
+                add_query_result(conn, item, result['rows'],
+                                 result['rows_affected'], None,
+                                 query_results)
+            res = None
         else:
-            sql = 'ROLLBACK;'
-            msg = 'A ROLLBACK was done for the save transaction.'
-
-        rollback_status, rollback_result = \
-            execute_void_wrapper(conn, sql, query_results)
-        if not rollback_status:
-            return rollback_status, rollback_result, query_results, None
-
-        # If we roll backed every thing then update the
-        # message for each sql query.
-        for query in query_results:
-            if query['status']:
-                query['result'] = msg
-
-        return False, res, query_results, row_id
-
-    for opr, sqls in list_of_sql.items():
-        for item in sqls:
-            if item['sql']:
-                item['data'] = {
-                    pgadmin_alias[k] if k in pgadmin_alias else k: v
-                    for k, v in item['data'].items()
-                }
-
-                row_added = None
+            status, res = conn.execute_void(
+                'ROLLBACK TO SAVEPOINT save_data;' if is_savepoint
+                else 'ROLLBACK;'
+            )
+            if not status:
+                return status, res, query_results, None
+            # The savepoint is kept after rolling back to it, but the
+            # transaction needs to be started again.
+            if not is_savepoint:
+                status, res = conn.execute_void('BEGIN;')
+                if not status:
+                    return status, res, query_results, None
 
-                try:
-                    # Fetch oids/primary keys
-                    if 'select_sql' in item and item['select_sql']:
-                        status, res = conn.execute_dict(
-                            item['sql'], item['data'])
-                    else:
-                        status, res = conn.execute_void(
-                            item['sql'], item['data'])
-                except Exception:
-                    failure_handle(res, item.get('row_id', 0))
-                    raise
+            failure = execute_sequentially(
+                conn, items, query_results, is_savepoint
+            )
+    else:
+        failure = execute_sequentially(
+            conn, items, query_results, is_savepoint
+        )
 
-                if not status:
-                    return failure_handle(res, item.get('row_id', 0))
-
-                # Select added row from the table
-                if 'select_sql' in item:
-                    params = {
-                        pgadmin_alias[k] if k in pgadmin_alias else k: v
-                        for k, v in res['rows'][0].items()
-                    }
-                    status, sel_res = conn.execute_dict(
-                        item['select_sql'], params)
-
-                    if not status:
-                        return failure_handle(sel_res, item.get('row_id', 0))
-
-                    if 'rows' in sel_res and len(sel_res['rows']) > 0:
-                        row_added = {
-                            item['client_row']: sel_res['rows'][0]}
-
-                rows_affected = conn.rows_affected()
-                mogrified_sql = conn.mogrify(item['sql'], item['data'])
-                mogrified_sql = mogrified_sql if mogrified_sql is not None \
-                    else item['sql']
-                # store the result of each query in dictionary
-                query_results.append({
-                    'status': status,
-                    'result': None if row_added else res,
-                    'sql': mogrified_sql,
-                    'rows_affected': rows_affected,
-                    'row_added': row_added
-                })
+    if failure is not None:
+        return failure
 
     # Commit the transaction if no error is found & autocommit is activated
     if auto_commit:
@@ -326,6 +292,113 @@ def save_changed_data(changed_data, columns_info, conn, command_obj,
     return status, res, query_results, _rowid
 
 
+def execute_sequentially(conn, items, query_results, is_savepoint):
+    """
+    Executes the statements of the save operation one by one, and stops at
+    the first failing statement.
+
+    :param conn: The connection object
+    :param items: List of the statements (with data) to be executed
+    :param query_results: A list of query results in the save operation
+    :param is_savepoint: True, if the save operation uses a savepoint
+    :return: None on success, else the result of the save operation
+    """
+    res = None
+    for item in items:
+        try:
+            # Fetch the added row
+            if item.get('returns_row'):
+                status, res = conn.execute_dict(item['sql'], item['data'])
+            else:
+                status, res = conn.execute_void(item['sql'], item['data'])
+        except Exception:
+            rollback_and_report(conn, res, item, query_results, is_savepoint)
+            raise
+
+        if not status:
+            return rollback_and_report(
+                conn, res, item, query_results, is_savepoint
+            )
+
+        add_query_result(
+            conn, item, res['rows'] if item.get('returns_row') else None,
+            conn.rows_affected(), res, query_results
+        )
+
+    return None
+
+
+def add_query_result(conn, item, rows, rows_affected, res, query_results):
+    """
+    Adds the result of the successfully executed statement to query_results
+    :param conn: The connection object
+    :param item: The executed statement (with data)
+    :param rows: Rows returned by the statement
+    :param rows_affected: Number of the affected rows
+    :param res: Result of the statement execution
+    :param query_results: A list of query results in the save operation
+    """
+    row_added = None
+    if item.get('returns_row') and rows:
+        row_added = {item['client_row']: rows[0]}
+
+    mogrified_sql = conn.mogrify(item['sql'], item['data'])
+    mogrified_sql = mogrified_sql if mogrified_sql is not None \
+        else item['sql']
+    # store the result of each query in dictionary
+    query_results.append({
+        'status': True,
+        'result': None if row_added else res,
+        'sql': mogrified_sql,
+        'rows_affected': rows_affected,
+        'row_added': row_added
+    })
+
+
+def rollback_and_report(conn, res, item, query_results, is_savepoint):
+    """
+    Adds the failed statement to query_results, and rolls back the save
+    operation.
+    :param conn: The connection object
+    :param res: Error of the failed statement
+    :param item: The failed statement (with data)
+    :param query_results: A list of query results in the save operation
+    :param is_savepoint: True, if the save operation uses a savepoint
+    :return: status, result, query_results, row_id of the failed row
+    """
+    mogrified_sql = conn.mogrify(item['sql'], item['data'])
+    mogrified_sql = mogrified_sql if mogrified_sql is not None \
+        else item['sql']
+    query_results.append({
+        'status': False,
+        'result': res,
+        'sql': mogrified_sql,
+        'rows_affected': 0,
+        'row_added': None
+    })
+
+    if is_savepoint:
+        sql = 'ROLLBACK TO SAVEPOINT save_data;'
+        msg = 'A ROLLBACK was done for the save operation only. ' \
+              'The active transaction is not affected.'
+    else:
+        sql = 'ROLLBACK;'
+        msg = 'A ROLLBACK was done for the save transaction.'
+
+    rollback_status, rollback_result = \
+        execute_void_wrapper(conn, sql, query_results)
+    if not rollback_status:
+        return rollback_status, rollback_result, query_results, None
+
+    # If we roll backed every thing then update the
+    # message for each sql query.
+    for query in query_results:
+        if query['status']:
+            query['result'] = msg
+
+    return False, res, query_results, item.get('row_id', 0)
+
+
 def execute_void_wrapper(conn, sql, query_results):
     """
     Executes a sql query with no return and adds it to query_results
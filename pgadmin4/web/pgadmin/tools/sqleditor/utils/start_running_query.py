@@ -15,7 +15,7 @@ from threading import Thread
 from flask import Response, current_app, copy_current_request_context
 from flask_babel import gettext
 
-from config import PG_DEFAULT_DRIVER
+from config import PG_DEFAULT_DRIVER, QUERY_TOOL_SERVER_CURSOR
 from pgadmin.tools.sqleditor.utils.apply_explain_plan_wrapper import \
     apply_explain_plan_wrapper_if_needed
 from pgadmin.tools.sqleditor.utils.constant_definition import TX_STATUS_IDLE, \
@@ -153,7 +153,8 @@ class StartRunningQuery:
             # and formatted_error is True.
             with app.app_context():
                 try:
-                    _, _ = conn.execute_async(sql)
+                    _, _ = conn.execute_async(
+                        sql, server_cursor=QUERY_TOOL_SERVER_CURSOR)
                     # # If the transaction aborted for some reason and
                     # # Auto RollBack is True then issue a rollback to cleanup.
                     if is_rollback_req:
@@ -0,0 +1,94 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2025, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import datetime
+import decimal
+import json
+
+from flask import Flask
+
+from pgadmin.utils.ajax import DataTypeJSONEncoder
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.tools.sqleditor import set_result_format
+from pgadmin.tools.sqleditor.utils.columnar_result import \
+    encode_columnar_result
+
+
+def decode_columnar_result(result):
+    """ Converts the columnar result back to the rows, like the grid. """
+    columns = [
+        [col['dictionary'][code] for code in col['codes']]
+        if 'dictionary' in col else col['values']
+        for col in result['columns']
+    ]
+    return [list(row) for row in zip(*columns)]
+
+
+class TestColumnarResult(BaseTestGenerator):
+    """ This class tests encoding the result pages of the Query Tool in the
+    columnar format. """
+
+    scenarios = [
+        ('Encode the columns', dict(
+            rows=[
+                (1, 'active', 'a@example.com', 1.5, True, None),
+                (2, 'active', 'b@example.com', None, False, None),
+                (3, None, 'c@example.com', 2.5, None, None),
+                (4, 'active', 'd@example.com', 3.0, True, None),
+            ],
+            dictionary_columns=[1, 5]
+        )),
+        ('Convert the values not supported by JSON', dict(
+            rows=[
+                (decimal.Decimal('1.25'), datetime.date(2025, 1, 2),
+                 datetime.timedelta(hours=1, seconds=5), b'abc',
+                 [decimal.Decimal('2.5'), None], {'a': [1, 'x']}),
+                (None, None, None, None, None, None),
+                (decimal.Decimal('3'), datetime.date(2025, 1, 3),
+                 datetime.timedelta(minutes=2), b'def', [], {'b': None}),
+            ],
+            dictionary_columns=[]
+        )),
+        ('Encode a single row', dict(
+            rows=[['text', 10]],
+            dictionary_columns=[]
+        )),
+    ]
+
+    def setUp(self):
+        pass
+
+    def runTest(self):
+        result = encode_columnar_result(self.rows)
+        self.assertEqual(result['rows'], len(self.rows))
+        self.assertEqual(
+            [idx for idx, col in enumerate(result['columns'])
+             if 'dictionary' in col],
+            self.dictionary_columns
+        )
+
+        # No value is left for DataTypeJSONEncoder.default(), and the rows
+        # are the same as the ones sent in the row format.
+        self.assertEqual(
+            decode_columnar_result(json.loads(json.dumps(result))),
+            json.loads(json.dumps(self.rows, cls=DataTypeJSONEncoder))
+        )
+
+        app = Flask(__name__)
+        for query, result_format in (('?format=columnar', 'columnar'),
+                                     ('', None)):
+            with app.test_request_context('/poll/1' + query):
+                data = {'status': 'Success', 'result': self.rows}
+                set_result_format(data)
+                self.assertEqual(data.get('result_format'), result_format)
+
+                # The messages are not encoded.
+                data = {'status': 'Success', 'result': 'SELECT 0'}
+                set_result_format(data)
+                self.assertNotIn('result_format', data)
@@ -0,0 +1,158 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2025, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import json
+from unittest.mock import patch, MagicMock
+
+import config
+from pgadmin.model import db, QueryHistoryModel
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.tools.sqleditor.utils import query_history
+from pgadmin.tools.sqleditor.utils.query_history import QueryHistory, \
+    QueryHistoryBuffer, history_buffer
+
+UID = -1
+SID = -1
+DBNAME = 'test_query_history'
+
+
+def make_request(query):
+    return MagicMock(data=json.dumps(
+        dict(query=query, start_time='2025-01-01T00:00:00.000Z')
+    ).encode())
+
+
+def stored():
+    return dict(
+        (rec.srno, (json.loads(rec.query_info.decode())['query'],
+                    rec.last_updated_flag))
+        for rec in db.session.query(QueryHistoryModel).filter(
+            QueryHistoryModel.uid == UID, QueryHistoryModel.sid == SID,
+            QueryHistoryModel.dbname == DBNAME)
+    )
+
+
+class QueryHistoryTestMixin:
+    """ Clears the query history of the test server, before and after the
+    query history tests. """
+
+    def setUp(self):
+        self.clear()
+
+    def tearDown(self):
+        self.clear()
+
+    def clear(self):
+        with self.app.app_context():
+            QueryHistory.clear_history(UID, SID)
+
+
+class TestQueryHistory(QueryHistoryTestMixin, BaseTestGenerator):
+    """ This class tests the ring of the query history entries, written in
+    batches. """
+
+    flush_interval = 0
+    saved_again = None
+    failed_commits = 0
+    expected_buffered = False
+
+    scenarios = [
+        ('Cycle the history entries',
+         dict(queries=['q1', 'q2', 'q3', 'q4', 'q5'],
+              expected={1: ('q4', 'N'), 2: ('q5', 'Y'), 3: ('q3', 'N')})),
+        ('Continue the ring written by another process',
+         dict(queries=['q1', 'q2', 'q3', 'q4', 'q5'], saved_again='q6',
+              expected={1: ('q7', 'Y'), 2: ('q5', 'N'), 3: ('q6', 'N')})),
+        ('Keep the history entries failed to be written',
+         dict(queries=['q1', 'q2'], failed_commits=1,
+              expected={1: ('q1', 'N'), 2: ('q2', 'Y')})),
+        ('Buffer the history entries',
+         dict(queries=['q1', 'q2', 'q3', 'q4', 'q5'], flush_interval=60,
+              expected_buffered=True,
+              expected={1: ('q4', 'N'), 2: ('q5', 'Y'), 3: ('q3', 'N')})),
+    ]
+
+    def runTest(self):
+        with self.app.test_request_context(), \
+                patch.object(query_history, 'MAX_QUERY_HIST_STORED', 3), \
+                patch.object(config, 'QUERY_HISTORY_FLUSH_INTERVAL',
+                             self.flush_interval), \
+                patch.object(history_buffer, '_thread', None), \
+                patch.object(query_history.threading, 'Thread') as thread:
+            thread.return_value.is_alive.return_value = True
+            commit = db.session.commit
+            commits = iter([Exception('failed')] * self.failed_commits)
+
+            def fail_commit():
+                error = next(commits, None)
+                if error is not None:
+                    raise error
+                commit()
+
+            with patch.object(db.session, 'commit', fail_commit):
+                for query in self.queries:
+                    QueryHistory.save(UID, SID, DBNAME, make_request(query))
+
+            if self.saved_again is not None:
+                # The buffer of another process reads the position from the
+                # database.
+                history_buffer.flush()
+                with patch.object(query_history, 'history_buffer',
+                                  QueryHistoryBuffer()):
+                    QueryHistory.save(UID, SID, DBNAME,
+                                      make_request(self.saved_again))
+                QueryHistory.save(UID, SID, DBNAME, make_request('q7'))
+
+            self.assertEqual(stored(),
+                             {} if self.expected_buffered else self.expected)
+            self.assertEqual(thread.call_count, int(self.expected_buffered))
+
+            # Written before the history is read.
+            response = QueryHistory.get(UID, SID, DBNAME)
+            self.assertEqual(len(json.loads(response.data)['data']['result']),
+                             len(self.expected))
+            self.assertEqual(stored(), self.expected)
+
+
+class TestQueryHistoryPage(QueryHistoryTestMixin, BaseTestGenerator):
+    """ This class tests searching, and paging the query history. """
+
+    scenarios = [
+        ('Page the history',
+         dict(options=dict(offset=0, limit=2),
+              expected=dict(status=True, msg='',
+                            result=['select 3', 'update t'], total=3,
+                            offset=0, limit=2))),
+        ('Search the history ignoring the case',
+         dict(options=dict(search='SELECT'),
+              expected=dict(result=['select 3', 'SELECT 2'], total=2))),
+        ('Search and page the history',
+         dict(options=dict(search='select', offset=1),
+              expected=dict(result=['SELECT 2'], total=2))),
+        ('Search the history matching nothing',
+         dict(options=dict(search='delete'),
+              expected=dict(result=[], total=0))),
+    ]
+
+    def runTest(self):
+        with self.app.test_request_context(), \
+                patch.object(query_history, 'MAX_QUERY_HIST_STORED', 3), \
+                patch.object(config, 'QUERY_HISTORY_FLUSH_INTERVAL', 0):
+            for query in ('select 1', 'SELECT 2', 'update t', 'select 3'):
+                QueryHistory.save(UID, SID, DBNAME, make_request(query))
+
+            response = QueryHistory.get(UID, SID, DBNAME, **self.options)
+
+        data = json.loads(response.data)['data']
+        data['result'] = [json.loads(entry)['query']
+                          for entry in data['result']]
+        self.assertEqual(
+            dict((name, data[name]) for name in self.expected),
+            self.expected
+        )
@@ -0,0 +1,113 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2025, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+from unittest.mock import MagicMock, patch
+
+from pgadmin.tools.sqleditor.tests.test_view_data_templates import FakeApp
+from pgadmin.tools.sqleditor.utils.constant_definition import \
+    TX_STATUS_IDLE
+from pgadmin.tools.sqleditor.utils.save_changed_data import \
+    save_changed_data
+from pgadmin.utils.route import BaseTestGenerator
+
+
+class TestSaveChangedDataPipeline(BaseTestGenerator):
+    """ This class tests saving the data changes using the pipeline mode """
+    scenarios = [
+        ('Save the added rows in a single round trip', dict(
+            pipeline=True,
+            pipeline_result=(True, [
+                {'rows': [{'id': 0}], 'rows_affected': 1},
+                {'rows': [{'id': 1}], 'rows_affected': 1},
+            ]),
+            failing_row=None,
+            expected_status=True,
+            expected_pipeline_calls=1,
+            expected_sequential_calls=0
+        )),
+        ('Save the added rows one by one, when pipeline is disabled', dict(
+            pipeline=False,
+            pipeline_result=None,
+            failing_row=None,
+            expected_status=True,
+            expected_pipeline_calls=0,
+            expected_sequential_calls=2
+        )),
+        ('Report the failing row, when the pipeline fails', dict(
+            pipeline=True,
+            pipeline_result=(False, 'duplicate key'),
+            failing_row=1,
+            expected_status=False,
+            expected_pipeline_calls=1,
+            expected_sequential_calls=2
+        )),
+    ]
+
+    def setUp(self):
+        pass
+
+    def _execute_dict(self, sql, params):
+        row_id = params['id']
+        if row_id == self.failing_row:
+            return False, 'duplicate key'
+        return True, {'rows': [{'id': row_id}]}
+
+    def runTest(self):
+        conn = MagicMock()
+        conn.transaction_status.return_value = TX_STATUS_IDLE
+        conn.execute_void.return_value = (True, None)
+        conn.execute_dict.side_effect = self._execute_dict
+        conn.execute_pipeline.return_value = self.pipeline_result
+        conn.pipeline_supported.return_value = True
+        conn.mogrify.side_effect = lambda sql, params: sql
+        conn.rows_affected.return_value = 1
+
+        command_obj = MagicMock()
+        command_obj.sql_path = 'sqleditor/sql/default'
+        command_obj.object_name = 'test_table'
+        command_obj.nsp_name = 'test_schema'
+        command_obj.has_oids.return_value = False
+        command_obj.get_primary_keys.return_value = ('id', {'id': 'int4'})
+
+        changed_data = {
+            'added': {
+                '0': {'data': {'id': 0, '__temp_PK': '0'}},
+                '1': {'data': {'id': 1, '__temp_PK': '1'}},
+            },
+            'added_index': {'0': '0', '1': '1'},
+        }
+        columns_info = {
+            'id': {'pgadmin_alias': 'id', 'not_null': True,
+                   'has_default_val': False, 'type_name': 'integer'}
+        }
+
+        with FakeApp().app_context(), \
+                patch('config.QUERY_TOOL_SAVE_PIPELINE', self.pipeline):
+            status, _, query_results, row_id = save_changed_data(
+                changed_data, columns_info, conn, command_obj, '__temp_PK'
+            )
+
+        self.assertEqual(status, self.expected_status)
+        self.assertEqual(conn.execute_pipeline.call_count,
+                         self.expected_pipeline_calls)
+        self.assertEqual(conn.execute_dict.call_count,
+                         self.expected_sequential_calls)
+
+        if self.pipeline_result is not None:
+            sqls = [sql for sql, _ in conn.execute_pipeline.call_args[0][0]]
+            self.assertTrue(all('returning *' in sql for sql in sqls))
+
+        if self.expected_status:
+            added = [q['row_added'] for q in query_results
+                     if q['row_added']]
+            self.assertEqual(added, [{'0': {'id': 0}}, {'1': {'id': 1}}])
+            self.assertEqual(query_results[-1]['sql'], 'COMMIT;')
+        else:
+            self.assertEqual(query_results[-2]['result'], 'duplicate key')
+            self.assertEqual(query_results[-1]['sql'], 'ROLLBACK;')
@@ -56,13 +56,15 @@ Agreement.
 # Handle the null value if value is None or equal to
 # 'replace_nulls_with' then it represents the null value, so no need to
 # quote it.
+# Added RowEncoder to encode the large number of rows in bulk for the most
+# commonly used dialects.
 ############################################################################
 
 __all__ = ["QUOTE_MINIMAL", "QUOTE_ALL", "QUOTE_NONNUMERIC", "QUOTE_NONE",
            "Error", "Dialect", "__doc__", "Excel", "ExcelTab",
            "field_size_limit", "Reader", "Writer", "register_dialect",
            "get_dialect", "list_dialects", "unregister_dialect",
-           "__version__", "DictReader", "DictWriter"]
+           "__version__", "DictReader", "DictWriter", "RowEncoder"]
 
 import re
 import numbers
@@ -253,6 +255,104 @@ class Writer():
             self.writerow(row)
 
 
+class RowEncoder():
+    """
+    Encodes the rows (sequences of the field values) into the CSV text in
+    bulk, producing the same output as the Writer.
+
+    Instead of running the quoting strategy for each field, it decides
+    whether to quote the values once per type, and escapes the quote
+    character using str.replace(), which makes it many times faster than the
+    Writer for the large result sets.
+
+    Only the dialects without an escapechar, quoting all or non-numeric
+    fields (with doublequote set), or no fields at all are supported, use
+    the Writer for the rest.
+    """
+
+    def __init__(self, dialect='excel', **fmtparams):
+        if isinstance(dialect, str):
+            dialect = get_dialect(dialect)
+
+        try:
+            self.dialect = Dialect.combine(dialect, fmtparams)
+        except Error as e:
+            raise TypeError(*e.args)
+
+        if not self.supports(self.dialect):
+            raise Error('dialect is not supported by RowEncoder')
+
+        # Type -> whether to quote the values of that type
+        self._quote_type = dict()
+
+    @staticmethod
+    def supports(dialect):
+        """Check whether the dialect is supported by RowEncoder."""
+        if dialect.escapechar:
+            return False
+        return dialect.quoting == QUOTE_NONE or (
+            dialect.quoting in (QUOTE_ALL, QUOTE_NONNUMERIC) and
+            bool(dialect.doublequote)
+        )
+
+    def _quoted(self, value_type):
+        quoted = self.dialect.quoting == QUOTE_ALL or (
+            self.dialect.quoting == QUOTE_NONNUMERIC and
+            not issubclass(value_type, numbers.Number)
+        )
+        self._quote_type[value_type] = quoted
+        return quoted
+
+    def encode(self, rows):
+        """Encode the rows, and return them as a single string."""
+        dialect = self.dialect
+        delimiter = dialect.delimiter
+        lineterminator = dialect.lineterminator
+        quotechar = dialect.quotechar
+        escaped_quotechar = (quotechar or '') * 2
+        replace_nulls_with = dialect.replace_nulls_with
+        null_field = str(replace_nulls_with) \
+            if replace_nulls_with is not None else ''
+        quote_none = dialect.quoting == QUOTE_NONE
+        quote_type = self._quote_type
+
+        lines = []
+        for row in rows:
+            fields = []
+            for value in row:
+                # The null values (and, the values same as the null
+                # representation) are never quoted.
+                if value is None:
+                    fields.append(null_field)
+                    continue
+
+                field = value if value.__class__ is str else str(value)
+                if quote_none or (
+                    replace_nulls_with is not None and
+                    value == replace_nulls_with
+                ):
+                    fields.append(field)
+                    continue
+
+                quoted = quote_type.get(value.__class__)
+                if quoted is None:
+                    quoted = self._quoted(value.__class__)
+
+                if quoted:
+                    if quotechar in field:
+                        field = field.replace(quotechar, escaped_quotechar)
+                    field = quotechar + field + quotechar
+                fields.append(field)
+
+            if quote_none and len(fields) == 1 and fields[0] == '':
+                raise Error('single empty field record must be quoted')
+
+            lines.append(delimiter.join(fields))
+            lines.append(lineterminator)
+
+        return ''.join(lines)
+
+
 START_RECORD = 0
 START_FIELD = 1
 ESCAPED_CHAR = 2
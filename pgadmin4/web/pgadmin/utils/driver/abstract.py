@@ -106,6 +106,11 @@ class BaseConnection(metaclass=ABCMeta):
       - Implement this method to execute the given query and returns the result
         as an array of dict (column name -> value) format.
 
+    * execute_pipeline(queries, formatted_exception_msg)
+      - Implement this method to execute the given list of (query, params)
+        in a single round trip (if supported by the driver), and returns the
+        list of results (columns, rows and affected rows) for each of them.
+
     * def async_fetchmany_2darray(records=-1, formatted_exception_msg=False):
       - Implement this method to retrieve result of asynchronous connection and
         polling with no_result flag set to True.
@@ -198,6 +203,10 @@ class BaseConnection(metaclass=ABCMeta):
                      formatted_exception_msg=False):
         pass
 
+    @abstractmethod
+    def execute_pipeline(self, queries, formatted_exception_msg=False):
+        pass
+
     @abstractmethod
     def async_fetchmany_2darray(self, records=-1,
                                 formatted_exception_msg=False):
@@ -15,7 +15,8 @@ object.
 """
 import datetime
 import re
-from flask import session
+import time
+from flask import session, g
 from flask_login import current_user
 from werkzeug.exceptions import InternalServerError
 import psycopg
@@ -25,10 +26,43 @@ import config
 from pgadmin.model import Server
 from .keywords import scan_keyword
 from ..abstract import BaseDriver
-from .connection import Connection
+from .connection import Connection, release_pooled_connections
+from .connection_pool import pool
+from .latency import latency_counters
+from .server_cache import known_servers
 from .server_manager import ServerManager
 
 connection_restore_lock = Lock()
+RESTORE_COUNTER = 'connection_manager.restore'
+
+
+def _start_request_timer():
+    g._request_started = time.perf_counter()
+
+
+def _record_request_latency(exception=None):
+    started = g.pop('_request_started', None)
+    if started is not None:
+        latency_counters.record(
+            'request.session_write'
+            if g.pop('_server_manager_session_write', False) else 'request',
+            time.perf_counter() - started
+        )
+
+
+def init_app(app):
+    if app is None or release_pooled_connections in \
+            app.teardown_appcontext_funcs:
+        return
+
+    # Return the connections borrowed from the pool (if any) at the end of
+    # every request.
+    app.teardown_appcontext(release_pooled_connections)
+
+    # Measure the requests, writing the state of the connection managers to
+    # the session or not.
+    app.before_request(_start_request_timer)
+    app.teardown_request(_record_request_latency)
 
 
 class Driver(BaseDriver):
@@ -98,14 +132,19 @@ class Driver(BaseDriver):
             - Server ID
         """
         assert (sid is not None and isinstance(sid, int))
+
+        with latency_counters.measure('connection_manager'):
+            return self._connection_manager(sid)
+
+    def _connection_manager(self, sid):
         managers = None
 
-        server_data = Server.query.filter_by(id=sid).first()
-        if server_data is None:
+        if not known_servers.exists(sid):
             return None
 
         if session.sid not in self.managers:
-            with connection_restore_lock:
+            with latency_counters.measure(RESTORE_COUNTER), \
+                    connection_restore_lock:
                 # The wait is over but the object might have been loaded
                 # by some other thread check again
                 managers = self._restore_connections_from_session()
@@ -113,8 +152,13 @@ class Driver(BaseDriver):
             managers = self.managers[session.sid]
             if str(sid) in managers:
                 manager = managers[str(sid)]
-                with connection_restore_lock:
-                    manager._restore_connections()
+                # Only take the lock, when a connection is to be restored.
+                if manager.needs_restore():
+                    with latency_counters.measure(RESTORE_COUNTER), \
+                            connection_restore_lock:
+                        manager._restore_connections()
+                        manager.update_session()
+                else:
                     manager.update_session()
 
         managers['pinged'] = datetime.datetime.now()
@@ -122,6 +166,7 @@ class Driver(BaseDriver):
             s = Server.query.filter_by(id=sid).first()
 
             if not s:
+                known_servers.invalidate(sid)
                 return None
 
             managers[str(sid)] = ServerManager(s)
@@ -130,6 +175,17 @@ class Driver(BaseDriver):
 
         return managers[str(sid)]
 
+    def stats(self):
+        """
+        Returns the statistics of the server cache, the connection pool, and
+        the latency counters of the connection managers.
+        """
+        return {
+            'server_cache': known_servers.info(),
+            'connection_pool': pool.info(),
+            'latency': latency_counters.info(),
+        }
+
     def version(self):
         """
         version(...)
@@ -228,6 +284,7 @@ class Driver(BaseDriver):
         manager = self.connection_manager(sid)
         if manager is not None:
             manager.release()
+        known_servers.invalidate(sid)
         if session.sid in self.managers and \
                 str(sid) in self.managers[session.sid]:
             del self.managers[session.sid][str(sid)]
@@ -235,8 +292,11 @@ class Driver(BaseDriver):
     def gc_timeout(self):
         """
         Release the connections for the sessions, which have not pinged the
-        server for more than config.MAX_SESSION_IDLE_TIME.
+        server for more than config.MAX_SESSION_IDLE_TIME, and close the
+        pooled connections idle for more than
+        config.BROWSER_CONNECTION_POOL_IDLE_TIMEOUT seconds.
         """
+        pool.gc()
 
         # Minimum session idle is 20 minutes
         max_idle_time = max(config.MAX_SESSION_IDLE_TIME or 60, 20)
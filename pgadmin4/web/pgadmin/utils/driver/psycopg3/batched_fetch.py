@@ -0,0 +1,276 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2025, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""
+Fetch the catalog details of many objects at once, by running the queries
+of all the objects in batches (using the pipeline mode).
+"""
+
+import copy
+from contextvars import ContextVar
+from functools import wraps
+
+# Maximum number of the rounds, after which the objects are fetched using
+# the results of the previous rounds, and one query at a time.
+MAX_ROUNDS = 10
+
+_current_batch = ContextVar('batched_fetch', default=None)
+
+
+def batchable(kind):
+    """
+    This function will behave as a decorator of the execute_* functions of
+    the connection (of the given kind - dict, 2darray, or scalar), which
+    hands the query over to the BatchedFetch running in the current context
+    (if any).
+    """
+    def decorator(f):
+        @wraps(f)
+        def wrap(self, query, params=None, formatted_exception_msg=False):
+            batch = _current_batch.get()
+            if batch is not None:
+                return batch.execute(self, kind, query, params,
+                                     formatted_exception_msg)
+            return f(self, query, params, formatted_exception_msg)
+        return wrap
+    return decorator
+
+
+def _empty_result(kind):
+    if kind == 'scalar':
+        return True, None
+    return True, {'columns': [], 'rows': []}
+
+
+def _pipeline_result(kind, result):
+    """
+    Returns the result of a query executed in the pipeline, like the
+    execute_<kind> function of the connection returns it.
+    """
+    rows = result['rows']
+    if kind == 'scalar':
+        if len(rows) > 0 and len(rows[0]) > 0:
+            return True, next(iter(rows[0].values()))
+        return True, None
+    return True, {'columns': result.get('columns', []), 'rows': rows}
+
+
+class BatchedFetch():
+    """
+    class BatchedFetch
+
+        Runs the given function for every object (see run), such that the
+        queries run by them (execute_dict, execute_2darray, and
+        execute_scalar of any connection) are sent to the database server
+        together, i.e. a round trip per batch_size queries, instead of a
+        round trip per query.
+
+        The function runs for all the objects in rounds. A query not run yet
+        is only recorded, and an empty result is returned for it, hence the
+        function goes on to record the other queries, not depending on that
+        result. All the recorded queries are run at the end of the round, and
+        the objects are fetched again in the next round, using the results
+        of the queries run so far. The object is fetched, when the function
+        runs without any new query. i.e. the number of the round trips
+        depends on the depth of the queries (of a query using the result of
+        another query), and not on the number of the objects.
+
+        The queries must only read the data (e.g. the catalog queries), as
+        they may run with the empty results of the other queries, and are
+        not run in the order of the function.
+
+        A query recorded after the function got an empty result (for a query
+        not run yet) is speculative - the function might not run it with the
+        real results. A batch failing because of a speculative query is sent
+        again without the speculative queries, i.e. they are treated as not
+        run yet, instead of failing the batch. When the batches of a
+        connection fail, while its queries succeed on their own, its queries
+        are run one by one from then on.
+    """
+
+    def __init__(self, batch_size=1000, max_rounds=MAX_ROUNDS):
+        self.batch_size = max(batch_size, 1)
+        self.max_rounds = max_rounds
+        self._results = dict()
+        self._pending = dict()
+        self._speculative = False
+        self._missed = False
+        # Connections failing to run the batches.
+        self._unbatched = set()
+        self.rounds = 0
+        self.round_trips = 0
+        self.queries = 0
+
+    @staticmethod
+    def supported(conn):
+        """
+        Returns True, if the queries of the connection can be run in batches.
+        """
+        pipeline_supported = getattr(conn, 'pipeline_supported', None)
+        return pipeline_supported is not None and pipeline_supported()
+
+    @staticmethod
+    def _key(conn, kind, query, params):
+        return conn, kind, query, repr(params)
+
+    def execute(self, conn, kind, query, params=None,
+                formatted_exception_msg=False):
+        """
+        Returns the result of the query (as returned by the execute_<kind>
+        function of the connection), if it has been run already.
+        """
+        key = self._key(conn, kind, query, params)
+        if key in self._results:
+            # The caller may change the rows, and the same query may be run
+            # for another object, or in the next round.
+            return copy.deepcopy(self._results[key])
+
+        if not self._speculative or conn in self._unbatched:
+            return copy.deepcopy(
+                self._execute(conn, kind, query, params,
+                              formatted_exception_msg)
+            )
+
+        pending = self._pending.setdefault(
+            (conn, query, repr(params)),
+            [params, formatted_exception_msg, set(), True]
+        )
+        pending[2].add(kind)
+        # Run by the function using the real results only, if not after an
+        # empty result.
+        pending[3] = pending[3] and self._missed
+        self._missed = True
+
+        return _empty_result(kind)
+
+    def _execute(self, conn, kind, query, params, formatted_exception_msg):
+        """
+        Runs the query on its own, and keeps the result.
+        """
+        token = _current_batch.set(None)
+        try:
+            result = getattr(conn, 'execute_' + kind)(
+                query, params, formatted_exception_msg
+            )
+        finally:
+            _current_batch.reset(token)
+
+        self.round_trips += 1
+        self.queries += 1
+        self._results[self._key(conn, kind, query, params)] = result
+        return result
+
+    def flush(self):
+        """
+        Runs the recorded queries, in batches of batch_size queries per
+        connection (the speculative queries last).
+
+        A failed batch is sent again without its speculative queries, which
+        are left to be recorded again (using the real results) in the next
+        round. When it still fails, its queries are run one by one, so that
+        every query gets its own result (or, error).
+        """
+        by_conn = dict()
+        for (conn, query, _), \
+                (params, formatted_exception_msg, kinds, speculative) \
+                in self._pending.items():
+            by_conn.setdefault(conn, []).append(
+                (query, params, formatted_exception_msg, kinds, speculative)
+            )
+        self._pending = dict()
+
+        for conn, pending in by_conn.items():
+            pending.sort(key=lambda query: query[4])
+            for idx in range(0, len(pending), self.batch_size):
+                batch = pending[idx:idx + self.batch_size]
+                status, res = self._run_batch(conn, batch)
+
+                if not status and any(query[4] for query in batch):
+                    batch = [query for query in batch if not query[4]]
+                    if not batch:
+                        continue
+                    status, res = self._run_batch(conn, batch)
+
+                if not status:
+                    failed = False
+                    for query, params, formatted_exception_msg, kinds, _ \
+                            in batch:
+                        for kind in kinds:
+                            failed = not self._execute(
+                                conn, kind, query, params,
+                                formatted_exception_msg)[0] or failed
+                    if not failed:
+                        self._unbatched.add(conn)
+                    continue
+
+                self.queries += len(batch)
+                for (query, params, _, kinds, _), result in zip(batch, res):
+                    for kind in kinds:
+                        self._results[self._key(conn, kind, query, params)] = \
+                            _pipeline_result(kind, result)
+
+    def _run_batch(self, conn, batch):
+        self.round_trips += 1
+        return conn.execute_pipeline(
+            [(query, params) for query, params, _, _, _ in batch]
+        )
+
+    def run(self, fetch, objects):
+        """
+        Returns the list of the results of fetch(object) for every object (in
+        the same order).
+        """
+        results = [None] * len(objects)
+        todo = list(range(len(objects)))
+        token = _current_batch.set(self)
+
+        try:
+            self._speculative = True
+            while todo and self.rounds < self.max_rounds:
+                self.rounds += 1
+                incomplete = []
+
+                for idx in todo:
+                    self._missed = False
+                    try:
+                        result = fetch(objects[idx])
+                    except Exception:
+                        # Failed because of the empty result of a query not
+                        # run yet.
+                        if not self._missed:
+                            raise
+
+                    if self._missed:
+                        incomplete.append(idx)
+                    else:
+                        results[idx] = result
+
+                todo = incomplete
+                self.flush()
+
+            # Still fetching (rare), run the new queries one by one.
+            self._speculative = False
+            for idx in todo:
+                results[idx] = fetch(objects[idx])
+        finally:
+            self._speculative = False
+            self._pending = dict()
+            _current_batch.reset(token)
+
+        return results
+
+    def info(self):
+        """
+        Returns the statistics of the fetch.
+        """
+        return {
+            'rounds': self.rounds,
+            'round_trips': self.round_trips,
+            'queries': self.queries,
+        }
@@ -19,7 +19,10 @@ import datetime
 import asyncio
 from collections import deque
 import psycopg
-from flask import g, current_app
+from psycopg.rows import dict_row
+import sqlparse
+from sqlparse import tokens as sql_tokens
+from flask import g, current_app, has_app_context
 from flask_babel import gettext
 from flask_security import current_user
 from pgadmin.utils.crypto import decrypt
@@ -30,11 +33,14 @@ from pgadmin.model import User
 from pgadmin.utils.exception import ConnectionLost, CryptKeyMissing
 from pgadmin.utils import get_complete_file_path
 from ..abstract import BaseConnection
-from .cursor import DictCursor, AsyncDictCursor
+from .cursor import DictCursor, AsyncDictCursor, AsyncDictServerCursor
 from .typecast import register_global_typecasters,\
     register_string_typecasters, register_binary_typecasters, \
     register_array_to_string_typecasters, ALL_JSON_TYPES
 from .encoding import get_encoding, configure_driver_encodings
+from .event_loop import run_coroutine
+from .batched_fetch import batchable
+from .connection_pool import pool, pool_key, poolable, PoolTimeout
 from pgadmin.utils import csv_lib as csv
 from pgadmin.utils.master_password import get_crypt_key
 from io import StringIO
@@ -51,11 +57,51 @@ if os.name == 'nt':
 
 _ = gettext
 
+# Name of the request (application context) global, keeping the connections
+# borrowed from the pool by the request.
+POOLED_CONNECTIONS = '_pooled_connections'
+
 # Register global type caster which will be applicable to all connections.
 register_global_typecasters()
 configure_driver_encodings(encodings)
 
 
+def get_server_cursor_query(query):
+    """
+    Returns the query (without the trailing semicolon), when it is a single
+    SELECT statement, which can be declared as a scrollable cursor, else
+    returns None.
+
+    Args:
+        query: SQL query to run.
+    """
+    statements = [
+        stmt for stmt in sqlparse.parse(query)
+        if stmt.token_first(skip_cm=True) is not None
+    ]
+    if len(statements) != 1 or statements[0].get_type() != 'SELECT':
+        return None
+
+    tokens = list(statements[0].flatten())
+    for token in tokens:
+        # Data modifying CTEs, SELECT INTO, and the locking clauses can not be
+        # used with a scrollable cursor.
+        if token.ttype in sql_tokens.DML and token.normalized != 'SELECT':
+            return None
+        if token.ttype in sql_tokens.Keyword and \
+                token.normalized in ('INTO', 'SHARE'):
+            return None
+
+    # Remove the trailing semicolon (and, comments), as the query will be a
+    # part of the DECLARE statement.
+    while tokens and (tokens[-1].is_whitespace or
+                      tokens[-1].ttype in sql_tokens.Comment or
+                      tokens[-1].match(sql_tokens.Punctuation, ';')):
+        tokens.pop()
+
+    return ''.join(token.value for token in tokens)
+
+
 class Connection(BaseConnection):
     """
     class Connection(object)
@@ -72,8 +118,11 @@ class Connection(BaseConnection):
     * execute_scalar(query, params, formatted_exception_msg)
       - Execute the given query and returns single datum result
 
-    * execute_async(query, params, formatted_exception_msg)
+    * execute_async(query, params, formatted_exception_msg, server_cursor)
       - Execute the given query asynchronously and returns result.
+        When server_cursor is True, and the query is a single SELECT
+        statement, the result set is kept in a server side cursor, and
+        fetched on demand.
 
     * execute_void(query, params, formatted_exception_msg)
       - Execute the given query with no result.
@@ -89,6 +138,8 @@ class Connection(BaseConnection):
     * connected()
       - Get the status of the connection.
         Returns True if connected, otherwise False.
+        A pooled connection (see connection_pool) borrows a connection from
+        the pool for the current request, when connected before.
 
     * reset()
       - Reconnect the database server (if possible)
@@ -167,7 +218,11 @@ class Connection(BaseConnection):
         self.conn_id = conn_id
         self.manager = manager
         self.db = db if db is not None else manager.db
-        self.conn = None
+        # The connection is borrowed from the pool for every request, when
+        # pooled.
+        self.pooled = poolable(manager, conn_id, async_)
+        self._pool_key = None
+        self._conn = None
         self.auto_reconnect = auto_reconnect
         self.async_ = async_
         self.__async_cursor = None
@@ -209,6 +264,37 @@ class Connection(BaseConnection):
 
         return res
 
+    @property
+    def conn(self):
+        if self.pooled and has_app_context():
+            lease = g.get(POOLED_CONNECTIONS, {}).get(id(self))
+            return lease[1] if lease else None
+        return self._conn
+
+    @conn.setter
+    def conn(self, pg_conn):
+        if not (self.pooled and has_app_context()):
+            self._conn = pg_conn
+            return
+
+        leases = g.setdefault(POOLED_CONNECTIONS, dict())
+        lease = leases.pop(id(self), None)
+        if lease is not None and lease[1] is not pg_conn:
+            self._return_to_pool(lease[1])
+        if pg_conn is not None:
+            leases[id(self)] = (self, pg_conn)
+
+    def _return_to_pool(self, pg_conn):
+        for remove, handler in (
+            (pg_conn.remove_notify_handler, self.check_notifies),
+            (pg_conn.remove_notice_handler, self.get_notices),
+        ):
+            try:
+                remove(handler)
+            except ValueError:
+                pass
+        pool.release(pg_conn)
+
     def __repr__(self):
         return "PG Connection: {0} ({1}) -> {2} (ajax:{3})".format(
             self.conn_id, self.db,
@@ -318,6 +404,10 @@ class Connection(BaseConnection):
             if manager.passexec:
                 password = manager.passexec.get()
 
+        pooled = self.pooled and has_app_context()
+        key = None
+        reused = False
+
         try:
             database = self.db
             if 'user' in kwargs and kwargs['user']:
@@ -357,13 +447,39 @@ class Connection(BaseConnection):
                             autocommit=autocommit,
                             prepare_threshold=manager.prepare_threshold
                         )
-                    pg_conn = asyncio.run(connectdbserver())
+                    pg_conn = run_coroutine(connectdbserver())
+                elif pooled:
+                    key = pool_key(
+                        manager, database, user,
+                        kwargs.get('role', None) or manager.role,
+                        connection_string,
+                        use_binary_placeholder=self.use_binary_placeholder,
+                        array_to_string=self.array_to_string
+                    )
+                    pg_conn, reused = pool.acquire(
+                        key, lambda: psycopg.Connection.connect(
+                            connection_string,
+                            cursor_factory=DictCursor,
+                            prepare_threshold=manager.prepare_threshold)
+                    )
                 else:
                     pg_conn = psycopg.Connection.connect(
                         connection_string,
                         cursor_factory=DictCursor,
                         prepare_threshold=manager.prepare_threshold)
 
+        except PoolTimeout:
+            current_app.logger.warning(
+                "Timed out waiting for a pooled connection to the database "
+                "server(#{server_id}) for connection ({conn_id})".format(
+                    server_id=self.manager.sid,
+                    conn_id=conn_id
+                )
+            )
+            return False, _(
+                "Timed out waiting for a free connection to the database "
+                "server, please try again."
+            )
         except psycopg.Error as e:
             manager.stop_ssh_tunnel()
             if hasattr(e, 'pgerror'):
@@ -391,6 +507,18 @@ class Connection(BaseConnection):
 
         self.conn = pg_conn
         self.wasConnected = True
+
+        if reused and key == self._pool_key:
+            # Set up by this connection before, only the state of the
+            # request is reset.
+            self.execution_aborted = False
+            self.__backend_pid = pg_conn.info.backend_pid
+            setattr(g, self.ARGS_STR.format(
+                self.manager.sid,
+                self.conn_id.encode('utf-8')
+            ), None)
+            return True, None
+
         try:
             status, msg = self._initialize(conn_id, **kwargs)
         except Exception as e:
@@ -401,6 +529,9 @@ class Connection(BaseConnection):
                 self.wasConnected = False
             raise e
 
+        if status and pooled:
+            self._pool_key = key
+
         if status and is_update_password:
             manager._update_password(encpass)
         else:
@@ -867,34 +998,11 @@ WHERE db.datname = current_database()""")
             return False, \
                 gettext('The query executed did not return any data.')
 
-        def handle_null_values(results, replace_nulls_with):
-            """
-            This function is used to replace null values with the given string
-
-            :param results:
-            :param replace_nulls_with: null values will be replaced by this
-            string.
-            :return: modified result
-            """
-
-            temp_results = []
-            for row in results:
-                res = dict()
-                for k, v in row.items():
-                    if v is None:
-                        res[k] = replace_nulls_with
-                    else:
-                        res[k] = v
-                temp_results.append(res)
-            results = temp_results
-
-            return results
-
         def gen(conn_obj, trans_obj, quote='strings', quote_char="'",
                 field_separator=',', replace_nulls_with=None):
 
             cur.scroll(0, mode='absolute')
-            results = cur.fetchmany(records)
+            results = cur.fetchmany(records, _tupples=True)
             if not results:
                 yield gettext('The query executed did not return any data.')
                 return
@@ -909,8 +1017,6 @@ WHERE db.datname = current_database()""")
                 if c.to_dict()['type_code'] in ALL_JSON_TYPES:
                     json_columns.append(column_name)
 
-            res_io = StringIO()
-
             if quote == 'strings':
                 quote = csv.QUOTE_NONNUMERIC
             elif quote == 'all':
@@ -918,40 +1024,41 @@ WHERE db.datname = current_database()""")
             else:
                 quote = csv.QUOTE_NONE
 
-            csv_writer = csv.DictWriter(
-                res_io, fieldnames=header, delimiter=field_separator,
+            dialect = csv.Dialect.combine('excel', dict(
+                delimiter=field_separator,
                 quoting=quote,
                 quotechar=quote_char,
                 replace_nulls_with=replace_nulls_with
-            )
+            ))
 
-            csv_writer.writeheader()
-            # Replace the null values with given string if configured.
-            if replace_nulls_with is not None:
-                results = handle_null_values(results, replace_nulls_with)
-            csv_writer.writerows(results)
+            # The rows are encoded in bulk, straight from the tuples fetched
+            # from the cursor, for the supported dialects.
+            if csv.RowEncoder.supports(dialect):
+                encode = csv.RowEncoder(dialect).encode
+            else:
+                def encode(rows):
+                    res_io = StringIO()
+                    csv_writer = csv.Writer(res_io, dialect)
+                    # Replace the null values with given string if
+                    # configured.
+                    if replace_nulls_with is not None:
+                        rows = (
+                            [replace_nulls_with if val is None else val
+                             for val in row]
+                            for row in rows
+                        )
+                    csv_writer.writerows(rows)
+                    return res_io.getvalue()
 
-            yield res_io.getvalue()
+            yield encode([header]) + encode(results)
 
             while True:
-                results = cur.fetchmany(records)
+                results = cur.fetchmany(records, _tupples=True)
 
                 if not results:
                     break
-                res_io = StringIO()
-
-                csv_writer = csv.DictWriter(
-                    res_io, fieldnames=header, delimiter=field_separator,
-                    quoting=quote,
-                    quotechar=quote_char,
-                    replace_nulls_with=replace_nulls_with
-                )
 
-                # Replace the null values with given string if configured.
-                if replace_nulls_with is not None:
-                    results = handle_null_values(results, replace_nulls_with)
-                csv_writer.writerows(results)
-                yield res_io.getvalue()
+                yield encode(results)
 
             try:
                 # try to reset the cursor scroll back to where it was,
@@ -970,6 +1077,7 @@ WHERE db.datname = current_database()""")
         register_string_typecasters(self.conn)
         return True, gen, self
 
+    @batchable('scalar')
     def execute_scalar(self, query, params=None,
                        formatted_exception_msg=False):
         status, cur = self.__cursor()
@@ -1037,7 +1145,46 @@ WHERE db.datname = current_database()""")
 
         return True, None
 
-    def execute_async(self, query, params=None, formatted_exception_msg=True):
+    def __server_cursor(self):
+        """
+        Create a scrollable named cursor, which keeps the result set on the
+        database server. It is declared WITH HOLD, so that it remains
+        usable after the transaction is committed.
+        """
+        # Make sure the connection is usable (and, reconnect if required)
+        status, cur = self.__cursor()
+        if not status:
+            return status, cur
+
+        return True, AsyncDictServerCursor(
+            self.conn,
+            "pgadmin_cursor_{0}".format(secrets.token_hex(8)),
+            read_ahead=config.QUERY_TOOL_SERVER_CURSOR_READ_AHEAD,
+            scrollable=True,
+            withhold=True
+        )
+
+    def __close_server_cursor(self):
+        """
+        Close the server side cursor of the last asynchronous query (if any)
+        to release the result set held by the database server.
+        """
+        cur = self.__async_cursor
+        if not isinstance(cur, AsyncDictServerCursor) or cur.closed or \
+                not self.connected():
+            return
+
+        try:
+            cur.close_cursor()
+        except psycopg.Error as pe:
+            current_app.logger.warning(
+                "Failed to close the server cursor '{0}': {1}".format(
+                    cur.name, str(pe)
+                )
+            )
+
+    def execute_async(self, query, params=None, formatted_exception_msg=True,
+                      server_cursor=False):
         """
         This function executes the given query asynchronously and returns
         result.
@@ -1047,11 +1194,21 @@ WHERE db.datname = current_database()""")
             params: extra parameters to the function
             formatted_exception_msg: if True then function return the
             formatted exception message
+            server_cursor: if True then keep the result set in a server side
+            cursor (when possible), and fetch the rows on demand
         """
 
+        self.__close_server_cursor()
         self.__async_cursor = None
         self.__async_query_error = None
-        status, cur = self.__cursor(scrollable=True)
+
+        cursor_query = get_server_cursor_query(query) \
+            if server_cursor else None
+        if cursor_query is not None:
+            query = cursor_query
+            status, cur = self.__server_cursor()
+        else:
+            status, cur = self.__cursor(scrollable=True)
 
         if not status:
             return False, str(cur)
@@ -1202,6 +1359,7 @@ WHERE db.datname = current_database()""")
             None if self.conn_id[0:3] == 'DB:' else self.conn_id[5:]
         )
 
+    @batchable('2darray')
     def execute_2darray(self, query, params=None,
                         formatted_exception_msg=False):
         status, cur = self.__cursor()
@@ -1261,6 +1419,7 @@ WHERE db.datname = current_database()""")
 
         return True, {'columns': columns, 'rows': rows}
 
+    @batchable('dict')
     def execute_dict(self, query, params=None, formatted_exception_msg=False):
         status, cur = self.__cursor()
         self.row_count = 0
@@ -1329,6 +1488,142 @@ WHERE db.datname = current_database()""")
 
         return True, {'columns': columns, 'rows': rows}
 
+    def pipeline_supported(self):
+        """
+        Returns True, if the libpq in use supports the pipeline mode.
+        """
+        return psycopg.Pipeline.is_supported()
+
+    def __run_pipeline(self, queries):
+        """
+        Sends all the queries to the server without waiting for the result
+        of the previous ones, and returns the rows and the number of the
+        affected rows for each of them.
+        """
+        queries = [
+            (query.encode(self.python_encoding), params)
+            for query, params in queries
+        ]
+
+        def _result(cur, rows):
+            return {
+                'columns': [
+                    {'name': desc.name, 'type_code': desc.type_code,
+                     'display_name': desc.name}
+                    for desc in cur.description or []
+                ],
+                'rows': rows,
+                'rows_affected': cur.rowcount
+            }
+
+        if self.async_ == 0:
+            cursors = []
+            with self.conn.pipeline():
+                for query, params in queries:
+                    cur = psycopg.Cursor(self.conn, row_factory=dict_row)
+                    cur.execute(query, params)
+                    cursors.append(cur)
+
+            results = []
+            for cur in cursors:
+                results.append(
+                    _result(cur, cur.fetchall() if cur.description else [])
+                )
+                cur.close()
+            return results
+
+        async def _run_pipeline():
+            cursors = []
+            async with self.conn.pipeline():
+                for query, params in queries:
+                    cur = psycopg.AsyncCursor(self.conn, row_factory=dict_row)
+                    await cur.execute(query, params)
+                    cursors.append(cur)
+
+            results = []
+            for cur in cursors:
+                results.append(_result(
+                    cur, await cur.fetchall() if cur.description else []
+                ))
+                await cur.close()
+            return results
+
+        return run_coroutine(_run_pipeline())
+
+    def execute_pipeline(self, queries, formatted_exception_msg=False):
+        """
+        This function executes the given queries using the pipeline mode,
+        i.e. in a single round trip to the database server.
+
+        The execution stops at the first failing query (the following
+        queries are not executed), and the error is returned, hence - the
+        caller is responsible to rollback the transaction (or the
+        savepoint).
+
+        Args:
+            queries: list of (query, params) tuples to run.
+            formatted_exception_msg: if True then function return the
+            formatted exception message
+
+        Returns:
+            status, list of {'columns', 'rows', 'rows_affected'} for each
+            query (or the error message on failure)
+        """
+        status, cur = self.__cursor()
+        self.row_count = 0
+
+        if not status:
+            return False, str(cur)
+
+        if not self.pipeline_supported():
+            return False, gettext(
+                "Pipeline mode is not supported by the libpq in use."
+            )
+
+        query_id = str(secrets.choice(range(1, 9999999)))
+        current_app.logger.log(
+            25,
+            "Execute (pipeline) by {pga_user} on "
+            "{db_user}@{db_host}/{db_name} #{server_id} - "
+            "{conn_id} (Query-id: {query_id}): {count} queries".format(
+                pga_user=current_user.email,
+                db_user=self.conn.info.user,
+                db_host=self.conn.info.host,
+                db_name=self.conn.info.dbname,
+                server_id=self.manager.sid,
+                conn_id=self.conn_id,
+                count=len(queries),
+                query_id=query_id
+            )
+        )
+
+        try:
+            results = self.__run_pipeline(queries)
+        except psycopg.Error as pe:
+            if not self.connected():
+                raise ConnectionLost(
+                    self.manager.sid,
+                    self.db,
+                    None if self.conn_id[0:3] == 'DB:' else self.conn_id[5:]
+                )
+            errmsg = self._formatted_exception_msg(pe, formatted_exception_msg)
+            current_app.logger.error(
+                "Failed to execute query (execute_pipeline) for the server "
+                "#{server_id} - {conn_id} (Query-id: {query_id}):\n"
+                "Error Message:{errmsg}".format(
+                    server_id=self.manager.sid,
+                    conn_id=self.conn_id,
+                    query_id=query_id,
+                    errmsg=errmsg
+                )
+            )
+            return False, errmsg
+
+        if results:
+            self.row_count = results[-1]['rows_affected']
+
+        return True, results
+
     def async_fetchmany_2darray(self, records=2000,
                                 from_rownum=0, to_rownum=0,
                                 formatted_exception_msg=False):
@@ -1389,6 +1684,9 @@ WHERE db.datname = current_database()""")
             if not self.conn.closed:
                 return True
             self.conn = None
+        if self.pooled and self.wasConnected and has_app_context():
+            # Borrow a connection from the pool for this request.
+            return self.connect()[0]
         return False
 
     def _decrypt_password(self, manager):
@@ -1469,19 +1767,23 @@ Failed to reset the connection to the server due to following error:
     def _release(self):
         if self.wasConnected:
             if self.conn:
-                if self.async_ == 0:
+                if self.pooled and has_app_context():
+                    # Returned to the pool (when healthy) below.
+                    pass
+                elif self.async_ == 0:
                     self.conn.close()
                 elif self.async_ == 1:
                     self._close_async()
                 self.conn = None
             self.password = None
             self.wasConnected = False
+            self._pool_key = None
 
     def _close_async(self):
         async def _close_conn(conn):
             if conn:
                 await conn.close()
-        asyncio.run(_close_conn(self.conn))
+        run_coroutine(_close_conn(self.conn))
 
     def _wait(self, conn):
         pass  # This function is empty
@@ -1572,6 +1874,8 @@ Failed to reset the connection to the server due to following error:
     def total_rows(self):
         if self.__async_cursor is None:
             return 0
+        if isinstance(self.__async_cursor, AsyncDictServerCursor):
+            return max(self.__async_cursor.get_rowcount(), 0)
         return self.__async_cursor.rowcount
 
     def get_column_info(self):
@@ -1893,3 +2197,12 @@ Failed to reset the connection to the server due to following error:
                     return _cur.mogrify(query, parameters)
             else:
                 return query
+
+
+def release_pooled_connections(exception=None):
+    """
+    Return the connections borrowed from the pool by the current request.
+    """
+    leases = g.pop(POOLED_CONNECTIONS, None)
+    for connection, pg_conn in (leases or {}).values():
+        connection._return_to_pool(pg_conn)
@@ -0,0 +1,271 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2025, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""
+Pool of the database connections shared by the sessions connected to the
+same server with the same credentials.
+"""
+
+import hashlib
+import threading
+import time
+from collections import deque
+
+from psycopg.pq import TransactionStatus
+
+import config
+
+
+class PoolTimeout(Exception):
+    """
+    No connection was returned to the pool within the wait timeout.
+    """
+    pass
+
+
+def poolable(manager, conn_id, async_):
+    """
+    Returns True, when the connection (with the given id) of the server
+    manager can be borrowed from the pool - i.e. the pool is enabled, it is a
+    synchronous database connection (not the dedicated connection of a tool),
+    and the server does not use Kerberos authentication, or an SSH tunnel
+    (both bound to the session).
+    """
+    return bool(getattr(config, 'BROWSER_CONNECTION_POOL', False)) and \
+        async_ == 0 and conn_id.startswith('DB:') and \
+        not manager.kerberos_conn and manager.use_ssh_tunnel != 1
+
+
+def pool_key(manager, database, user, role, connection_string, **kwargs):
+    """
+    Returns the key of the connections for the given credentials. The
+    connection string (including the password), and the setup of the
+    connection (post connection SQL, and the type casters) are hashed, so
+    that only the sessions using the same credentials share them.
+    """
+    digest = hashlib.sha256('\0'.join(str(value) for value in (
+        connection_string, manager.post_connection_sql,
+        kwargs.get('use_binary_placeholder', False),
+        kwargs.get('array_to_string', False),
+    )).encode('utf-8')).hexdigest()
+
+    return (manager.host, manager.port, database, user, role, digest)
+
+
+class ConnectionPool():
+    """
+    class ConnectionPool
+
+        Bounded pool of the (synchronous, autocommit) psycopg connections,
+        by key (see pool_key).
+
+        At most config.BROWSER_CONNECTION_POOL_MAX_SIZE connections are
+        opened per key, a borrower waits (up to
+        config.BROWSER_CONNECTION_POOL_WAIT_TIMEOUT seconds) for one of them
+        to be returned, once the limit is reached. The idle connections are
+        reused most recently returned first, so that the ones not needed
+        any more stay idle, and are closed after
+        config.BROWSER_CONNECTION_POOL_IDLE_TIMEOUT seconds by gc().
+
+        A connection is checked when returned, and when borrowed - it is
+        closed, when the server closed it, or it is not idle (e.g. a
+        transaction was left open).
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        # Idle connections, and the time they were returned, by key.
+        self._idle = dict()
+        # Number of the open (idle, and borrowed) connections by key.
+        self._open = dict()
+        # Keys of the borrowed connections.
+        self._borrowed = dict()
+        self._reset_stats()
+
+    def _reset_stats(self):
+        self.acquired = 0
+        self.created = 0
+        self.reused = 0
+        self.waits = 0
+        self.wait_time = 0.0
+        self.max_wait_time = 0.0
+        self.timeouts = 0
+        self.closed = 0
+
+    @staticmethod
+    def _healthy(conn):
+        return not conn.closed and \
+            conn.info.transaction_status == TransactionStatus.IDLE
+
+    @staticmethod
+    def _close(connections):
+        for conn in connections:
+            try:
+                conn.close()
+            except Exception:
+                pass
+
+    def _discard(self, key):
+        # The caller holds the lock.
+        self.closed += 1
+        self._open[key] -= 1
+        if not self._open[key]:
+            del self._open[key]
+        self._cond.notify()
+
+    def acquire(self, key, connect):
+        """
+        Borrow an idle connection for the given key, or open a new one using
+        the given function, when allowed.
+
+        :return: The connection, and whether it was reused.
+        """
+        max_size = max(
+            getattr(config, 'BROWSER_CONNECTION_POOL_MAX_SIZE', 1), 1
+        )
+        timeout = getattr(config, 'BROWSER_CONNECTION_POOL_WAIT_TIMEOUT', 0)
+        waited_since = None
+        unhealthy = []
+
+        try:
+            with self._cond:
+                while True:
+                    idle = self._idle.get(key)
+                    while idle:
+                        conn, _ = idle.pop()
+                        if self._healthy(conn):
+                            self._borrowed[id(conn)] = key
+                            self._acquired(waited_since, reused=True)
+                            return conn, True
+                        unhealthy.append(conn)
+                        self._discard(key)
+
+                    if self._open.get(key, 0) < max_size:
+                        self._open[key] = self._open.get(key, 0) + 1
+                        self._acquired(waited_since, reused=False)
+                        break
+
+                    now = time.monotonic()
+                    if waited_since is None:
+                        waited_since = now
+                        self.waits += 1
+                    remaining = waited_since + timeout - now
+                    if remaining <= 0:
+                        self.timeouts += 1
+                        self._waited(waited_since)
+                        raise PoolTimeout()
+                    self._cond.wait(remaining)
+        finally:
+            self._close(unhealthy)
+
+        try:
+            conn = connect()
+        except BaseException:
+            with self._cond:
+                self._open[key] -= 1
+                if not self._open[key]:
+                    del self._open[key]
+                self._cond.notify()
+            raise
+
+        with self._cond:
+            self._borrowed[id(conn)] = key
+        return conn, False
+
+    def _acquired(self, waited_since, reused):
+        # The caller holds the lock.
+        self.acquired += 1
+        if reused:
+            self.reused += 1
+        else:
+            self.created += 1
+        if waited_since is not None:
+            self._waited(waited_since)
+
+    def _waited(self, waited_since):
+        # The caller holds the lock.
+        waited = time.monotonic() - waited_since
+        self.wait_time += waited
+        self.max_wait_time = max(self.max_wait_time, waited)
+
+    def release(self, conn):
+        """
+        Return the borrowed connection to the pool, it is closed when not
+        healthy (or, not borrowed from the pool).
+        """
+        with self._cond:
+            key = self._borrowed.pop(id(conn), None)
+            if key is not None:
+                if self._healthy(conn):
+                    self._idle.setdefault(key, deque()).append(
+                        (conn, time.monotonic())
+                    )
+                    self._cond.notify()
+                    return
+                self._discard(key)
+
+        self._close([conn])
+
+    def gc(self, idle_timeout=None):
+        """
+        Close the connections idle for more than the given number of seconds
+        (config.BROWSER_CONNECTION_POOL_IDLE_TIMEOUT, when not specified).
+        """
+        if idle_timeout is None:
+            idle_timeout = getattr(
+                config, 'BROWSER_CONNECTION_POOL_IDLE_TIMEOUT', 0
+            )
+        expired = []
+        expire_before = time.monotonic() - idle_timeout
+
+        with self._cond:
+            for key in list(self._idle):
+                idle = self._idle[key]
+                # The least recently returned connections are on the left.
+                while idle and idle[0][1] <= expire_before:
+                    expired.append(idle.popleft()[0])
+                    self._discard(key)
+                if not idle:
+                    del self._idle[key]
+
+        self._close(expired)
+        return len(expired)
+
+    def clear(self):
+        """
+        Close all the idle connections.
+        """
+        return self.gc(idle_timeout=-1)
+
+    def info(self):
+        """
+        Returns the pool statistics.
+        """
+        with self._cond:
+            idle = sum(len(conns) for conns in self._idle.values())
+            return {
+                'keys': len(self._open),
+                'open': sum(self._open.values()),
+                'idle': idle,
+                'borrowed': len(self._borrowed),
+                'acquired': self.acquired,
+                'created': self.created,
+                'reused': self.reused,
+                'waits': self.waits,
+                'wait_time': self.wait_time,
+                'max_wait_time': self.max_wait_time,
+                'timeouts': self.timeouts,
+                'closed': self.closed,
+                'max_size': getattr(
+                    config, 'BROWSER_CONNECTION_POOL_MAX_SIZE', 0
+                ),
+            }
+
+
+pool = ConnectionPool()
@@ -13,15 +13,16 @@ fetching results from it, and also takes care of the duplicate column name in
 result.
 """
 
-import asyncio
 from collections import OrderedDict
 import psycopg
 from flask import g, current_app
-from psycopg import Cursor as _cursor, AsyncCursor as _async_cursor
+from psycopg import Cursor as _cursor, AsyncCursor as _async_cursor, \
+    AsyncServerCursor as _async_server_cursor, sql
 from typing import Any, Sequence
 from psycopg.rows import dict_row, tuple_row
 from psycopg._encodings import py_codecs as encodings
 from .encoding import configure_driver_encodings
+from .event_loop import run_coroutine
 
 configure_driver_encodings(encodings)
 
@@ -278,7 +279,7 @@ class AsyncDictCursor(_async_cursor):
         Execute function
         """
         try:
-            return asyncio.run(self._execute(query, params))
+            return run_coroutine(self._execute(query, params))
         except RuntimeError as e:
             current_app.logger.exception(e)
 
@@ -289,7 +290,7 @@ class AsyncDictCursor(_async_cursor):
         if params is not None and len(params) == 0:
             params = None
 
-        return await _async_cursor.execute(self, query, params)
+        return await super().execute(query, params)
 
     def executemany(self, query, params=None):
         """
@@ -303,13 +304,13 @@ class AsyncDictCursor(_async_cursor):
          Close the cursor.
         """
 
-        await _async_cursor.close(self)
+        await super().close()
 
     def close_cursor(self):
         """
         Close the cursor.
         """
-        asyncio.run(self._close_cursor())
+        run_coroutine(self._close_cursor())
 
     def fetchmany(self, size=None, _tupples=False):
         """
@@ -317,7 +318,7 @@ class AsyncDictCursor(_async_cursor):
         """
         self._odt_desc = None
         self.row_factory = tuple_row
-        res = asyncio.run(self._fetchmany(size))
+        res = run_coroutine(self._fetchmany(size))
         if not _tupples and res is not None:
             res = [self._dict_tuple(t) for t in res]
 
@@ -328,13 +329,13 @@ class AsyncDictCursor(_async_cursor):
         """
         Fetch many tuples as ordered dictionary list.
         """
-        return await _async_cursor.fetchmany(self, size)
+        return await super().fetchmany(size)
 
     async def _fetchall(self):
         """
         Fetch all tuples as ordered dictionary list.
         """
-        return await _async_cursor.fetchall(self)
+        return await super().fetchall()
 
     def fetchall(self, _tupples=False):
         """
@@ -342,7 +343,7 @@ class AsyncDictCursor(_async_cursor):
         """
         self._odt_desc = None
         self.row_factory = tuple_row
-        res = asyncio.run(self._fetchall())
+        res = run_coroutine(self._fetchall())
         if not _tupples and res is not None:
             res = [self._dict_tuple(t) for t in res]
 
@@ -353,14 +354,14 @@ class AsyncDictCursor(_async_cursor):
         """
         Fetch all tuples as ordered dictionary list.
         """
-        return await _async_cursor.fetchone(self)
+        return await super().fetchone()
 
     def fetchone(self):
         """
         Execute function
         """
         self.row_factory = tuple_row
-        res = asyncio.run(self._fetchone())
+        res = run_coroutine(self._fetchone())
         self.row_factory = dict_row
         return res
 
@@ -370,28 +371,170 @@ class AsyncDictCursor(_async_cursor):
         """
         self._odt_desc = None
         self.row_factory = tuple_row
-        asyncio.run(self._scrollcur(from_rownum, "absolute"))
-        res = asyncio.run(self._fetchmany(to_rownum - from_rownum + 1))
+        res = run_coroutine(
+            self._fetchwindow(from_rownum, to_rownum - from_rownum + 1)
+        )
         if not _tupples and res is not None:
             res = [self._dict_tuple(t) for t in res]
 
         self.row_factory = dict_row
         return res
 
+    async def _fetchwindow(self, position, size):
+        """
+        Scroll to the given position, and fetch the window from there.
+        """
+        await super().scroll(position, mode="absolute")
+        return await super().fetchmany(size)
+
     async def _scrollcur(self, position, mode):
         """
         Fetch all tuples as ordered dictionary list.
         """
-        return await _async_cursor.scroll(self, position, mode=mode)
+        return await super().scroll(position, mode=mode)
 
     def scroll(self, position, mode="absolute"):
         """
         Fetch all tuples as ordered dictionary list.
         """
-        return asyncio.run(self._scrollcur(position, mode))
+        return run_coroutine(self._scrollcur(position, mode))
 
     def get_rowcount(self):
         if self.pgresult:
             return self.pgresult.ntuples
         else:
             return -1
+
+
+class AsyncDictServerCursor(AsyncDictCursor, _async_server_cursor):
+    """
+    AsyncDictServerCursor
+
+    A scrollable named (server-side) cursor, which keeps the result set on
+    the database server, and fetches the rows on demand, instead of loading
+    the complete result set in pgAdmin's memory.
+
+    Methods:
+    -------
+    * __init__(connection, name, read_ahead)
+    - Initialize the cursor object, 'read_ahead' is the maximum number of
+      extra rows to be fetched (and kept) with each window.
+
+    * fetchwindow(from_rownum, to_rownum)
+    - Fetch the rows from the server, unless they have already been fetched
+      in the read-ahead buffer by the previous call.
+
+    * get_rowcount()
+    - Total number of rows in the result set, which is counted on the server
+      once the cursor has been declared.
+    """
+
+    def __init__(self, connection, name, read_ahead=0, **kwargs):
+        self._odt_desc = None
+        self._total_rows = -1
+        self._read_ahead = max(read_ahead, 0)
+        self._buffer_start = 0
+        self._buffer = []
+        self._position = 0
+        kwargs['row_factory'] = dict_row
+        _async_server_cursor.__init__(self, connection, name, **kwargs)
+
+    async def _execute(self, query, params=None):
+        """
+        Declare the cursor, and count the rows of the result set on the
+        server without transferring them.
+        """
+        self._total_rows = -1
+        self._buffer = []
+
+        res = await super()._execute(query, params)
+
+        if self.description is not None:
+            self._total_rows = await self._move("FORWARD ALL")
+            await self._move("ABSOLUTE 0")
+        return res
+
+    async def _move(self, direction):
+        """
+        Move the cursor on the server, and return the number of rows it has
+        been moved through.
+        """
+        async with _async_cursor(self.connection) as cur:
+            await cur.execute(
+                sql.SQL("MOVE {} FROM {}").format(
+                    sql.SQL(direction), sql.Identifier(self.name)
+                )
+            )
+            return cur.rowcount
+
+    def _drop_buffer(self, scroll_back=True):
+        """
+        Drop the read-ahead buffer, and scroll the cursor on the server back
+        to the row after the last one returned by fetchwindow (the read-ahead
+        has moved it further).
+        """
+        if self._buffer:
+            self._buffer = []
+            if scroll_back:
+                AsyncDictCursor.scroll(self, self._position)
+
+    def fetchmany(self, size=None, _tupples=False):
+        """
+        Fetch many tuples as ordered dictionary list.
+        """
+        self._drop_buffer()
+        return AsyncDictCursor.fetchmany(self, size, _tupples)
+
+    def fetchall(self, _tupples=False):
+        """
+        Fetch all tuples as ordered dictionary list.
+        """
+        self._drop_buffer()
+        return AsyncDictCursor.fetchall(self, _tupples)
+
+    def fetchone(self):
+        """
+        Fetch the next tuple.
+        """
+        self._drop_buffer()
+        return AsyncDictCursor.fetchone(self)
+
+    def scroll(self, position, mode="absolute"):
+        """
+        Scroll the cursor on the server.
+        """
+        self._drop_buffer(scroll_back=mode != "absolute")
+        return AsyncDictCursor.scroll(self, position, mode)
+
+    def fetchwindow(self, from_rownum=0, to_rownum=0, _tupples=False):
+        """
+        Fetch many tuples as ordered dictionary list, reusing the rows
+        fetched by the previous call in the read-ahead buffer (if any).
+        """
+        size = to_rownum - from_rownum + 1
+        offset = from_rownum - self._buffer_start
+
+        if self._buffer and 0 <= offset and \
+                (offset + size <= len(self._buffer) or
+                 self._buffer_start + len(self._buffer) >= self._total_rows):
+            res = self._buffer[offset:offset + size]
+        else:
+            self._buffer = []
+            res = AsyncDictCursor.fetchwindow(
+                self, from_rownum, to_rownum + self._read_ahead, True
+            )
+            if res and self._read_ahead:
+                self._buffer_start = from_rownum
+                self._buffer = res
+            res = res[:size] if res is not None else res
+
+        if res is not None:
+            self._position = from_rownum + len(res)
+
+        self._odt_desc = None
+        if not _tupples and res is not None:
+            res = [self._dict_tuple(t) for t in res]
+        return res
+
+    def get_rowcount(self):
+        return self._total_rows
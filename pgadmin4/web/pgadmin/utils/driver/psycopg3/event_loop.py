@@ -0,0 +1,87 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2025, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""
+Long-lived, per-thread event loop used to drive the asynchronous psycopg
+connections and cursors.
+
+asyncio.run() creates and tears down a complete event loop for every call,
+which is a noticeable overhead for the Query Tool poll/fetch endpoints. The
+helpers below keep one event loop per thread, and reuse it for every
+coroutine run from that thread.
+"""
+
+import asyncio
+import threading
+
+_thread_data = threading.local()
+
+
+class _LoopHolder(object):
+    """
+    Owns the event loop of a thread, and closes it when the thread (and,
+    hence, its thread local data) goes away.
+    """
+
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+
+    def __del__(self):
+        if not self.loop.is_closed():
+            self.loop.close()
+
+
+def get_event_loop():
+    """
+    Return the persistent event loop of the current thread, creating it on
+    the first use (or when the previous one has been closed).
+    """
+    holder = getattr(_thread_data, 'holder', None)
+    if holder is None or holder.loop.is_closed():
+        holder = _LoopHolder()
+        _thread_data.holder = holder
+    return holder.loop
+
+
+def run_coroutine(coro):
+    """
+    Run the coroutine to completion on the persistent event loop of the
+    current thread, and return its result.
+
+    Same as asyncio.run(), it raises RuntimeError when called from a thread
+    already running an event loop.
+    """
+    loop = get_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    except RuntimeError:
+        # Do not leave the coroutine un-awaited, when the loop refused to
+        # run it.
+        if asyncio.iscoroutine(coro):
+            coro.close()
+        raise
+
+
+def close_event_loop():
+    """
+    Close the persistent event loop of the current thread (if any).
+    """
+    holder = getattr(_thread_data, 'holder', None)
+    if holder is None:
+        return
+
+    _thread_data.holder = None
+    loop = holder.loop
+    if loop.is_closed():
+        return
+
+    try:
+        loop.run_until_complete(loop.shutdown_asyncgens())
+    finally:
+        loop.close()
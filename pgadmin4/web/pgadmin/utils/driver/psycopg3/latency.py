@@ -0,0 +1,78 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2025, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""
+Latency counters of the connection managers, and the requests using them.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+
+
+class LatencyCounters():
+    """
+    class LatencyCounters
+
+        Number, total, and maximum duration (in seconds) of the measured
+        operations, by name. e.g.
+
+        * connection_manager - Driver.connection_manager() calls.
+        * connection_manager.restore - calls restoring the connections of
+          the session (holding the restore lock, including the wait for it).
+        * session.write - the connection manager state stored in the
+          session (rewritten at the end of the request).
+        * session.unchanged - the session update skipped, as the connection
+          manager state did not change.
+        * request, request.session_write - the requests not writing, and
+          writing the connection manager state to the session.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters = dict()
+
+    def record(self, name, seconds=0.0):
+        with self._lock:
+            counter = self._counters.get(name)
+            if counter is None:
+                counter = self._counters[name] = [0, 0.0, 0.0]
+            counter[0] += 1
+            counter[1] += seconds
+            counter[2] = max(counter[2], seconds)
+
+    @contextmanager
+    def measure(self, name):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - started)
+
+    def reset(self):
+        with self._lock:
+            self._counters.clear()
+
+    def info(self):
+        """
+        Returns the counters (with the average duration in milliseconds).
+        """
+        with self._lock:
+            return dict(
+                (name, {
+                    'count': count,
+                    'total': total,
+                    'max': max_time,
+                    'avg_ms': (total / count) * 1000 if count else 0,
+                })
+                for name, (count, total, max_time) in self._counters.items()
+            )
+
+
+latency_counters = LatencyCounters()
@@ -0,0 +1,93 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2025, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""
+Cache of the registered servers looked up by the connection managers.
+"""
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from pgadmin.model import Server
+from pgadmin.utils.lru_cache import LRUCache
+
+
+class ServerCache():
+    """
+    class ServerCache
+
+        Ids of the servers known to exist in the configuration database
+        (the most recently used config.SERVER_CACHE_SIZE of them), shared by
+        all the sessions of this process.
+
+        The driver checks the server exists every time a connection manager
+        is asked for, but only needs the row itself when a new connection
+        manager is created for the session. The cached entry is forgotten,
+        when the server is updated, or deleted (using the ORM, or a bulk
+        update, or delete statement).
+    """
+
+    def __init__(self):
+        self._servers = LRUCache('SERVER_CACHE_SIZE')
+
+    def exists(self, sid):
+        """
+        Returns True when the server exists. The configuration database is
+        only queried, when the server is not cached.
+        """
+        if self._servers.get(sid, False):
+            return True
+
+        if Server.query.filter_by(id=sid).first() is None:
+            return False
+
+        self._servers.put(sid, True)
+        return True
+
+    def invalidate(self, sid=None):
+        """
+        Forget the given server (or, all the servers, when not specified).
+        """
+        if sid is None:
+            self._servers.discard()
+        else:
+            self._servers.pop(sid)
+
+    def info(self):
+        """
+        Returns the cache statistics.
+        """
+        return self._servers.info()
+
+
+known_servers = ServerCache()
+
+
+@event.listens_for(Server, 'after_update')
+@event.listens_for(Server, 'after_delete')
+def _invalidate_server(mapper, connection, target):
+    known_servers.invalidate(target.id)
+
+
+@event.listens_for(Session, 'do_orm_execute')
+def _bulk_changed(orm_execute_state):
+    # The bulk update, and delete statements (i.e. Query.delete()) do not
+    # emit the events of the changed rows, forget all the servers once the
+    # transaction ends.
+    if (orm_execute_state.is_update or orm_execute_state.is_delete) and \
+            any(mapper.class_ is Server
+                for mapper in orm_execute_state.all_mappers):
+        orm_execute_state.session.info['servers_changed'] = True
+
+
+@event.listens_for(Session, 'after_commit')
+@event.listens_for(Session, 'after_rollback')
+def _invalidate_bulk_changed(session):
+    if session.info.pop('servers_changed', False):
+        known_servers.invalidate()
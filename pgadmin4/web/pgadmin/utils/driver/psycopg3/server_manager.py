@@ -12,9 +12,11 @@ Implementation of ServerManager
 """
 import os
 import datetime
+import threading
 import config
 import logging
-from flask import current_app, session
+from contextlib import contextmanager
+from flask import current_app, session, g
 from flask_security import current_user
 from flask_babel import gettext
 from werkzeug.exceptions import InternalServerError
@@ -23,6 +25,7 @@ from pgadmin.utils import get_complete_file_path
 from pgadmin.utils.crypto import decrypt
 from pgadmin.utils.master_password import process_masterpass_disabled
 from .connection import Connection
+from .latency import latency_counters
 from pgadmin.model import Server, User
 from pgadmin.utils.exception import ConnectionLost, SSHTunnelConnectionLost,\
     CryptKeyMissing
@@ -54,6 +57,9 @@ class ServerManager(object):
         self.tunnel_object = None
         self.tunnel_created = False
         self.display_connection_string = ''
+        # Connections used by the current thread, in place of the default
+        # database connections (see routed_connections).
+        self._routes = threading.local()
 
         self.update(server)
 
@@ -204,6 +210,13 @@ class ServerManager(object):
         use_binary_placeholder = kwargs.get('use_binary_placeholder', False)
         array_to_string = kwargs.get('array_to_string', False)
 
+        routes = getattr(self._routes, 'conn_ids', None)
+        if routes and conn_id is None and database is None and \
+                did in routes:
+            conn_id = routes[did]
+            if async_ is None:
+                async_ = False
+
         if database is not None:
             if did is not None and did in self.db_info:
                 self.db_info[did]['datname'] = database
@@ -277,6 +290,25 @@ WHERE db.oid = {0}""".format(did))
 
             return self.connections[my_id]
 
+    @contextmanager
+    def routed_connections(self, conn_ids):
+        """
+        Use the connections with the given connection ids (per database id),
+        instead of the default database connections, for the current thread.
+
+        It allows the worker threads to call the object views, which always
+        ask for the default connection of a database, without sharing that
+        connection between them.
+
+        :param conn_ids: Dictionary of the connection id by the database id.
+        """
+        previous = getattr(self._routes, 'conn_ids', None)
+        self._routes.conn_ids = conn_ids
+        try:
+            yield self
+        finally:
+            self._routes.conn_ids = previous
+
     @staticmethod
     def _get_password_to_conn(data, masterpass_processed):
         """
@@ -395,10 +427,11 @@ WHERE db.oid = {0}""".format(did))
         for conn_id in self.connections:
             conn = self.connections[conn_id]
             # only try to reconnect if connection was connected previously
-            # and auto_reconnect is true.
+            # and auto_reconnect is true. The pooled connections are borrowed
+            # from the pool, when used.
             was_connected = conn.wasConnected
             auto_reconnect = conn.auto_reconnect
-            if conn.wasConnected and conn.auto_reconnect:
+            if conn.wasConnected and conn.auto_reconnect and not conn.pooled:
                 try:
                     # Check SSH Tunnel needs to be created
                     if self.use_ssh_tunnel == 1 and \
@@ -490,8 +523,8 @@ WHERE db.oid = {0}""".format(did))
             conn = self.connections[con_key]
             # Cancel the ongoing transaction before closing the connection
             # as it may hang forever
-            if conn.connected() and conn.conn_id is not None and \
-               conn.conn_id.startswith('CONN:'):
+            if conn.conn_id is not None and \
+                    conn.conn_id.startswith('CONN:') and conn.connected():
                 conn.cancel_transaction(conn.conn_id[5:])
             conn._release()
 
@@ -513,11 +546,34 @@ WHERE db.oid = {0}""".format(did))
             if conn.conn is not None or conn.wasConnected is True:
                 conn.password = passwd
 
+    def needs_restore(self):
+        """
+        Returns True, when any of the connections (connected before, and
+        to be reconnected automatically) is not connected - i.e. it must be
+        restored by _restore_connections().
+        """
+        return any(
+            conn.wasConnected and conn.auto_reconnect and not conn.pooled and
+            not conn.connected()
+            for conn in list(self.connections.values())
+        )
+
     def update_session(self):
+        """
+        Store the state of the connection manager in the session, the
+        session is only marked to be written, when it has changed.
+        """
         managers = session['__pgsql_server_managers'] \
             if '__pgsql_server_managers' in session else dict()
         updated_mgr = self.as_dict()
 
+        if managers.get(self.sid) == updated_mgr:
+            latency_counters.record('session.unchanged')
+            return
+
+        latency_counters.record('session.write')
+        g._server_manager_session_write = True
+
         if not updated_mgr:
             if self.sid in managers:
                 managers.pop(self.sid)
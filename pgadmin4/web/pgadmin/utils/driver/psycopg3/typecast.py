@@ -11,11 +11,15 @@
 Typecast various data types so that they can be compatible with Javascript
 data types.
 """
+import codecs
+from codecs import utf_8_decode
+from functools import lru_cache
+
 import psycopg
 from psycopg.types.string import TextLoader
 from psycopg.types.json import JsonDumper, _JsonDumper, _JsonLoader
 from psycopg._encodings import py_codecs as encodings
-from .encoding import get_encoding, configure_driver_encodings
+from .encoding import get_encoding, configure_driver_encodings, encode_dict
 from psycopg.types.net import InetLoader
 from psycopg.adapt import Loader
 from ipaddress import ip_address, ip_interface
@@ -24,6 +28,8 @@ from psycopg.pq import Format as _pq_Format
 
 configure_driver_encodings(encodings)
 
+SQL_ASCII_ENCODINGS = ('SQLASCII', 'SQL_ASCII')
+
 # OIDs of data types which need to typecast as string to avoid JavaScript
 # compatibility issues.
 # e.g JavaScript does not support 64 bit integers. It has 64-bit double
@@ -226,30 +232,60 @@ class ByteaBinaryLoader(Loader):
         return 'binary data' if data is not None else None
 
 
+@lru_cache(maxsize=32)
+def _text_loader_class(encoding):
+    """
+    Returns the text loader class for the (python) encoding of the
+    connection.
+    """
+    postgres_encoding, _ = get_encoding(encoding)
+    if postgres_encoding in SQL_ASCII_ENCODINGS:
+        return TextLoaderSQLASCII
+    if codecs.lookup(encoding).name == 'utf-8':
+        return TextLoaderUTF8
+    return TextLoaderpgAdmin
+
+
 class TextLoaderpgAdmin(TextLoader):
-    def load(self, data):
-        postgres_encoding, python_encoding = get_encoding(
-            self.connection.info.encoding)
-        if postgres_encoding not in ['SQLASCII', 'SQL_ASCII']:
-            # In case of errors while decoding data, instead of raising error
-            # replace errors with empty space.
-            # Error - utf-8 code'c can not decode byte 0x7f:
-            # invalid continuation byte
-            if isinstance(data, memoryview):
-                return bytes(data).decode(self._encoding, errors='replace')
-            else:
-                return data.decode(self._encoding, errors='replace')
-        else:
-            # SQL_ASCII Database
-            try:
-                if isinstance(data, memoryview):
-                    return bytes(data).decode(python_encoding)
-                return data.decode(python_encoding)
-            except Exception:
-                if isinstance(data, memoryview):
-                    return bytes(data).decode('UTF-8')
-                return data.decode('UTF-8')
+    """
+    Loads the values as text (in the encoding of the connection).
+
+    The loader for the encoding of the connection (UTF-8, SQL_ASCII, or any
+    other encoding) is chosen once, when psycopg creates the loaders of a
+    result, instead of checking the encoding for every value. It is not
+    chosen when registering the loader, as the client encoding of the
+    connection may be changed later.
+    """
+
+    def __new__(cls, oid, context=None):
+        if cls is TextLoaderpgAdmin:
+            connection = context.connection if context else None
+            if connection is not None:
+                cls = _text_loader_class(connection.info.encoding)
             else:
-                if isinstance(data, memoryview):
-                    return bytes(data).decode('ascii', errors='replace')
-                return data.decode('ascii', errors='replace')
+                cls = TextLoaderUTF8
+        return super().__new__(cls)
+
+    def load(self, data):
+        # In case of errors while decoding data, instead of raising error
+        # replace errors with empty space.
+        # Error - utf-8 code'c can not decode byte 0x7f:
+        # invalid continuation byte
+        return str(data, self._encoding, 'replace')
+
+
+class TextLoaderUTF8(TextLoaderpgAdmin):
+    def load(self, data):
+        # Decodes the memoryview without copying it to bytes first.
+        return utf_8_decode(data, 'replace', True)[0]
+
+
+class TextLoaderSQLASCII(TextLoaderpgAdmin):
+    # raw_unicode_escape used for SQL ASCII will escape the characters.
+    python_encoding = encode_dict['SQL_ASCII'][1]
+
+    def load(self, data):
+        try:
+            return str(data, self.python_encoding)
+        except Exception:
+            return str(data, 'UTF-8')
@@ -11,41 +11,129 @@
 Kerberos Environment Locker class
 """
 
-from threading import Lock
+from threading import Condition, Lock
 from os import environ
 from flask import session, current_app
 
 import config
 from pgadmin.utils.constants import KERBEROS
 
+try:
+    # Sets the Kerberos credential cache of the GSSAPI library for the
+    # calling thread only (MIT Kerberos), which is then used by libpq.
+    from gssapi.raw import krb5_ccache_name
+except (ImportError, OSError):
+    krb5_ccache_name = None
+
+
+class SharedExclusiveLock:
+    """
+    A lock, which can either be held by any number of shared owners, or
+    by a single exclusive owner. Waiting exclusive owners are preferred over
+    the new shared owners.
+    """
+
+    def __init__(self):
+        self._cond = Condition(Lock())
+        self._shared_owners = 0
+        self._exclusive_owner = False
+        self._exclusive_waiters = 0
+
+    def acquire_shared(self):
+        with self._cond:
+            while self._exclusive_owner or self._exclusive_waiters:
+                self._cond.wait()
+            self._shared_owners += 1
+
+    def release_shared(self):
+        with self._cond:
+            self._shared_owners -= 1
+            if self._shared_owners == 0:
+                self._cond.notify_all()
+
+    def acquire_exclusive(self):
+        with self._cond:
+            self._exclusive_waiters += 1
+            try:
+                while self._exclusive_owner or self._shared_owners:
+                    self._cond.wait()
+            finally:
+                self._exclusive_waiters -= 1
+            self._exclusive_owner = True
+
+    def release_exclusive(self):
+        with self._cond:
+            self._exclusive_owner = False
+            self._cond.notify_all()
+
 
 class ConnectionLocker:
-    """Implementing lock while setting/unsetting
-     the Kerberos environ variables."""
-    lock = Lock()
+    """
+    Makes the Kerberos credential cache of the current user available to
+    libpq while connecting to the database server.
+
+    When the GSSAPI library allows to set the credential cache for the
+    calling thread, the connections are established concurrently, and the
+    process environment is not touched. Otherwise, the KRB5CCNAME environment
+    variable is set under an exclusive lock, while the other (non Kerberos)
+    connections wait for it to be unset.
+    """
+    lock = SharedExclusiveLock()
 
     def __init__(self, _is_kerberos_conn=False):
         self.is_kerberos_conn = _is_kerberos_conn
+        self.exclusive = False
+        self.ccache_set = False
+        self.prev_ccache = None
+
+    def _get_ccache(self):
+        if self.is_kerberos_conn and 'auth_source_manager' in session and \
+            session['auth_source_manager']['current_source'] == \
+                KERBEROS and 'KRB5CCNAME' in session:
+            return session['KRB5CCNAME']
+        return None
 
     def __enter__(self):
-        if config.SERVER_MODE:
+        if not config.SERVER_MODE:
+            return self
+
+        ccache = self._get_ccache()
+        if ccache is not None and krb5_ccache_name is None:
             current_app.logger.info("Waiting for a lock.")
-            self.lock.acquire()
+            self.lock.acquire_exclusive()
+            self.exclusive = True
             current_app.logger.info("Acquired a lock.")
+            environ['KRB5CCNAME'] = ccache
+            return self
 
-            if 'auth_source_manager' in session and \
-                session['auth_source_manager']['current_source'] == \
-                KERBEROS and 'KRB5CCNAME' in session \
-                    and self.is_kerberos_conn:
-                environ['KRB5CCNAME'] = session['KRB5CCNAME']
-            else:
-                environ.pop('KRB5CCNAME', None)
+        self.lock.acquire_shared()
+        try:
+            # No exclusive owner can be running at this point, hence - the
+            # variable can only be a leftover from the process startup.
+            environ.pop('KRB5CCNAME', None)
+            if ccache is not None:
+                self.prev_ccache = krb5_ccache_name(ccache.encode())
+                self.ccache_set = True
+        except Exception:
+            self.lock.release_shared()
+            raise
 
         return self
 
     def __exit__(self, type, value, traceback):
-        if config.SERVER_MODE:
+        if not config.SERVER_MODE:
+            return
+
+        if self.exclusive:
             environ.pop('KRB5CCNAME', None)
-            if self.lock.locked():
-                current_app.logger.info("Released a lock.")
-                self.lock.release()
+            self.exclusive = False
+            self.lock.release_exclusive()
+            current_app.logger.info("Released a lock.")
+            return
+
+        try:
+            if self.ccache_set:
+                krb5_ccache_name(self.prev_ccache)
+                self.ccache_set = False
+        finally:
+            self.lock.release_shared()
@@ -0,0 +1,149 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2025, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""Bounded LRU cache shared by the threads of the process."""
+
+import threading
+import time
+from collections import OrderedDict
+
+import config
+
+
+class LRUCache():
+    """
+    class LRUCache
+
+        Thread safe LRU cache of at most config.<size_setting> entries, with
+        the hits, and misses statistics. The settings are read on every use,
+        so that they can be changed at runtime - the cache is disabled, when
+        the size is 0.
+
+        An entry is expired after config.<ttl_setting> seconds (when given,
+        and not 0).
+    """
+
+    def __init__(self, size_setting, ttl_setting=None):
+        self.size_setting = size_setting
+        self.ttl_setting = ttl_setting
+        # Held by the compound operations of the callers (i.e. get, and put
+        # the value created when missing).
+        self.lock = threading.RLock()
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def max_size(self):
+        return getattr(config, self.size_setting, 0) or 0
+
+    @property
+    def ttl(self):
+        if self.ttl_setting is None:
+            return 0
+        return getattr(config, self.ttl_setting, 0) or 0
+
+    def enabled(self):
+        return self.max_size > 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key, default=None, valid=None, count=True):
+        """
+        Returns the value for the key (marked as the most recently used), or
+        the default when not cached, expired, or not valid (as per the given
+        function called with the value).
+        """
+        with self.lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, stored = entry
+                ttl = self.ttl
+                if (ttl and time.monotonic() - stored >= ttl) or \
+                        (valid is not None and not valid(value)):
+                    del self._entries[key]
+                    entry = None
+
+            if entry is None:
+                if count:
+                    self.misses += 1
+                return default
+
+            self._entries.move_to_end(key)
+            if count:
+                self.hits += 1
+            return value
+
+    def put(self, key, value):
+        """
+        Store the value for the key (not stored, when the cache is disabled).
+
+        :return: The keys of the least recently used entries evicted.
+        """
+        max_size = self.max_size
+        if not max_size:
+            return []
+
+        evicted = []
+        with self.lock:
+            self._entries[key] = (value, time.monotonic())
+            self._entries.move_to_end(key)
+            while len(self._entries) > max_size:
+                evicted.append(self._entries.popitem(last=False)[0])
+        return evicted
+
+    def setdefault(self, key, create, valid=None):
+        """
+        Returns the value for the key, created (using the given function),
+        and stored when not cached.
+        """
+        with self.lock:
+            value = self.get(key, valid=valid)
+            if value is None:
+                value = create()
+                self.put(key, value)
+            return value
+
+    def pop(self, key):
+        with self.lock:
+            entry = self._entries.pop(key, None)
+        return None if entry is None else entry[0]
+
+    def discard(self, match=None):
+        """
+        Forget the entries with the keys matching the given function (or, all
+        the entries, when not specified).
+
+        :return: The keys of the entries forgotten.
+        """
+        with self.lock:
+            keys = [key for key in self._entries
+                    if match is None or match(key)]
+            for key in keys:
+                del self._entries[key]
+        return keys
+
+    def values(self):
+        with self.lock:
+            return [value for value, _ in self._entries.values()]
+
+    def info(self):
+        """
+        Returns the cache statistics.
+        """
+        with self.lock:
+            size = len(self._entries)
+
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'size': size,
+            'max_size': self.max_size
+        }
@@ -16,13 +16,85 @@ import decimal
 import json
 
 import dateutil.parser as dateutil_parser
-from flask import current_app
+from flask import current_app, g, has_app_context
 from flask_babel import gettext
 from flask_security import current_user
 
 from pgadmin.model import db, Preferences as PrefTable, \
     ModulePreference as ModulePrefTable, UserPreference as UserPrefTable, \
     PreferenceCategory as PrefCategoryTbl
+from pgadmin.utils.lru_cache import LRUCache
+
+
+class _UserPreferenceCache():
+    """
+    Cache of the preference values of the users.
+
+    All the preference values of a user are loaded from the configuration
+    table in a single query, and memoized for the current request. The values
+    of the most recently used config.PREFERENCES_CACHE_SIZE users are also
+    kept across the requests, and forgotten whenever the preferences of the
+    user are saved or, reset - or after config.PREFERENCES_CACHE_TTL
+    seconds, as they may have been saved by another process.
+    """
+
+    def __init__(self):
+        self._users = LRUCache('PREFERENCES_CACHE_SIZE',
+                               'PREFERENCES_CACHE_TTL')
+
+    def get(self, uid, pid):
+        """
+        Returns the value (in string format) of the preference for the user,
+        or None when the user has not set it.
+        """
+        return self._user_values(uid).get(pid)
+
+    def _user_values(self, uid):
+        memo = getattr(g, '_user_preferences', None) \
+            if has_app_context() else None
+
+        if memo is not None and uid in memo:
+            return memo[uid]
+
+        values = self._users.get(uid)
+        if values is None:
+            values = dict(
+                (pref.pid, pref.value) for pref in
+                UserPrefTable.query.filter_by(uid=uid).all()
+            )
+            self._users.put(uid, values)
+
+        if has_app_context():
+            if memo is None:
+                memo = g._user_preferences = dict()
+            memo[uid] = values
+
+        return values
+
+    def invalidate(self, uid=None):
+        """
+        Forget the cached preference values of the given user (or, all the
+        users, when not specified).
+        """
+        if uid is None:
+            self._users.discard()
+        else:
+            self._users.pop(uid)
+
+        if has_app_context() and getattr(g, '_user_preferences', None):
+            if uid is None:
+                g._user_preferences.clear()
+            else:
+                g._user_preferences.pop(uid, None)
+
+    def info(self):
+        """
+        Returns the statistics of the cache across the requests.
+        """
+        return self._users.info()
+
+
+_user_preference_cache = _UserPreferenceCache()
 
 
 class _Preference():
@@ -105,21 +177,19 @@ class _Preference():
 
         :returns: value for this preference.
         """
-        res = UserPrefTable.query.filter_by(
-            pid=self.pid
-        ).filter_by(uid=current_user.id).first()
+        value = _user_preference_cache.get(current_user.id, self.pid)
 
         # Could not find any preference for this user, return default value.
-        if res is None:
+        if value is None:
             return self.default
 
         # The data stored in the configuration will be in string format, we
         # need to convert them in proper format.
-        is_format_data, data = self._get_format_data(res)
+        is_format_data, data = self._get_format_data(value)
         if is_format_data:
             return data
 
-        if self._type == 'text' and res.value == '' and not self.allow_blanks:
+        if self._type == 'text' and value == '' and not self.allow_blanks:
             return self.default
 
         parser_map = {
@@ -130,37 +200,37 @@ class _Preference():
             'keyboardshortcut': json.loads
         }
         try:
-            return parser_map.get(self._type, lambda v: v)(res.value)
+            return parser_map.get(self._type, lambda v: v)(value)
         except Exception as e:
             current_app.logger.exception(e)
             return self.default
 
-    def _get_format_data(self, res):
+    def _get_format_data(self, value):
         """
         Configuration data get stored in string format, convert it in to
         required format.
-        :param res: type value.
+        :param value: stored value.
         """
         if self._type in ('boolean', 'switch', 'node'):
-            return True, res.value == 'True'
+            return True, value == 'True'
         if self._type == 'options':
             for opt in self.options:
-                if 'value' in opt and opt['value'] == res.value:
-                    return True, res.value
+                if 'value' in opt and opt['value'] == value:
+                    return True, value
 
             if self.control_props and 'creatable' in self.control_props and \
                     self.control_props['creatable']:
-                return True, res.value
+                return True, value
 
             if self.select and 'tags' in self.select and self.select['tags']:
-                return True, res.value
+                return True, value
             return True, self.default
         if self._type == 'select':
-            if res.value:
-                res.value = res.value.replace('[', '')
-                res.value = res.value.replace(']', '')
-                res.value = res.value.replace('\'', '')
-                return True, [val.strip() for val in res.value.split(',')]
+            if value:
+                value = value.replace('[', '')
+                value = value.replace(']', '')
+                value = value.replace('\'', '')
+                return True, [val.strip() for val in value.split(',')]
             return True, None
 
         return False, None
@@ -230,6 +300,7 @@ class _Preference():
         else:
             pref.value = value
         db.session.commit()
+        _user_preference_cache.invalidate(current_user.id)
 
         return True, None
 
@@ -619,6 +690,7 @@ class Preferences():
         else:
             pref.value = value
         db.session.commit()
+        _user_preference_cache.invalidate(user_id)
 
         return True, None
 
@@ -694,6 +766,27 @@ class Preferences():
             pref.value = converter_func(pref.value)
 
         db.session.commit()
+        _user_preference_cache.invalidate()
+
+    @classmethod
+    def cache_info(cls):
+        """
+        cache_info
+        Returns the hits/misses statistics of the user preferences cache.
+        A miss costs a query against the configuration database.
+        """
+        return _user_preference_cache.info()
+
+    @classmethod
+    def invalidate_cache(cls, user_id=None):
+        """
+        invalidate_cache
+        Forget the cached preference values of the given user (or, all the
+        users), when they have been modified outside of this class.
+
+        :param user_id: User ID
+        """
+        _user_preference_cache.invalidate(user_id)
 
     @classmethod
     def reset(cls):
@@ -705,6 +798,7 @@ class Preferences():
             db.session.query(UserPrefTable).filter(
                 UserPrefTable.uid == current_user.id).delete()
             db.session.commit()
+            _user_preference_cache.invalidate(current_user.id)
         except Exception as e:
             db.session.rollback()
             current_app.logger.exception(e)
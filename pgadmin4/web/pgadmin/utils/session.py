@@ -21,6 +21,7 @@ import hmac
 import hashlib
 import os
 import secrets
+import shutil
 import string
 import time
 import config
@@ -29,7 +30,7 @@ from threading import Lock
 from flask import current_app, request, flash, redirect
 from flask_login import login_url
 
-from pickle import dump, load
+from pickle import dump, dumps, load, loads
 from collections import OrderedDict
 
 from flask.sessions import SessionInterface, SessionMixin
@@ -50,6 +51,9 @@ def _calc_hmac(body, secret):
 
 sess_lock = Lock()
 LAST_CHECK_SESSION_FILES = None
+# Interval (in seconds) to refresh the expiration date of an unaltered
+# session.
+SESSION_REFRESH_INTERVAL = 60 * 60
 
 
 class ManagedSession(CallbackDict, SessionMixin):
@@ -283,6 +287,338 @@ class FileBackedSessionManager(SessionManager):
             )
 
 
+class SessionStore():
+    """
+    Interface of the key-value stores used by KeyValueSessionManager.
+
+    A session is stored as a set of fields (field name -> pickled value),
+    which can be updated individually.
+    """
+
+    def exists(self, sid):
+        'Does the given session-id exist?'
+        raise NotImplementedError
+
+    def load(self, sid):
+        'Return all the fields of the session, None if it does not exist'
+        raise NotImplementedError
+
+    def update(self, sid, changed, removed):
+        'Store the changed fields, and remove the removed fields'
+        raise NotImplementedError
+
+    def remove(self, sid):
+        'Remove the session'
+        raise NotImplementedError
+
+    def cleanup(self, max_age):
+        'Remove the sessions not updated in the last max_age seconds'
+        raise NotImplementedError
+
+
+class MemorySessionStore(SessionStore):
+    """
+    Keeps the sessions in the memory of the current process, hence - it must
+    only be used when pgAdmin is served by a single process.
+    """
+
+    def __init__(self):
+        self._sessions = dict()
+        self._lock = Lock()
+
+    def exists(self, sid):
+        return sid in self._sessions
+
+    def load(self, sid):
+        with self._lock:
+            if sid not in self._sessions:
+                return None
+            return dict(self._sessions[sid][1])
+
+    def update(self, sid, changed, removed):
+        with self._lock:
+            _, fields = self._sessions.get(sid, (None, dict()))
+            fields.update(changed)
+            for field in removed:
+                fields.pop(field, None)
+            self._sessions[sid] = (time.time(), fields)
+
+    def remove(self, sid):
+        with self._lock:
+            self._sessions.pop(sid, None)
+
+    def cleanup(self, max_age):
+        expired_time = time.time() - max_age
+        with self._lock:
+            for sid in [
+                sid for sid, (updated, _) in self._sessions.items()
+                if updated < expired_time
+            ]:
+                del self._sessions[sid]
+
+
+class DirectorySessionStore(SessionStore):
+    """
+    Stores every session as a directory, having a file for each field, which
+    can be shared by multiple processes. Use a directory on a memory backed
+    file system (e.g. /dev/shm) to avoid the disk I/O.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        if not os.path.exists(self.path):
+            os.makedirs(self.path)
+
+    def _session_dir(self, sid):
+        dirname = safe_join(self.path, sid)
+        if dirname is None:
+            raise InternalServerError('Invalid session id')
+        return dirname
+
+    @staticmethod
+    def _file_name(field):
+        return base64.urlsafe_b64encode(field.encode()).decode()
+
+    def exists(self, sid):
+        dirname = safe_join(self.path, sid)
+        return dirname is not None and os.path.isdir(dirname)
+
+    def load(self, sid):
+        dirname = self._session_dir(sid)
+        fields = dict()
+        try:
+            file_names = os.listdir(dirname)
+        except FileNotFoundError:
+            return None
+
+        for file_name in file_names:
+            if file_name.startswith('.'):
+                continue
+            try:
+                with open(os.path.join(dirname, file_name), 'rb') as f:
+                    fields[
+                        base64.urlsafe_b64decode(file_name).decode()
+                    ] = f.read()
+            except (OSError, ValueError):
+                continue
+        return fields
+
+    def update(self, sid, changed, removed):
+        dirname = self._session_dir(sid)
+        os.makedirs(dirname, mode=0o700, exist_ok=True)
+
+        for field, value in changed.items():
+            fname = os.path.join(dirname, self._file_name(field))
+            # Write a temporary file, and rename it to replace the field
+            # atomically for the other processes.
+            tmp_fname = os.path.join(
+                dirname, '.{0}.tmp'.format(uuid4().hex)
+            )
+            with open(tmp_fname, 'wb') as f:
+                f.write(value)
+            os.replace(tmp_fname, fname)
+
+        for field in removed:
+            try:
+                os.unlink(os.path.join(dirname, self._file_name(field)))
+            except FileNotFoundError:
+                pass
+
+        # The modification time of the directory is the last update time of
+        # the session (used by cleanup).
+        os.utime(dirname)
+
+    def remove(self, sid):
+        dirname = safe_join(self.path, sid)
+        if dirname is not None and os.path.isdir(dirname):
+            shutil.rmtree(dirname, ignore_errors=True)
+
+    def cleanup(self, max_age):
+        expired_time = time.time() - max_age
+        for entry in os.scandir(self.path):
+            try:
+                if entry.is_dir() and entry.stat().st_mtime < expired_time:
+                    shutil.rmtree(entry.path, ignore_errors=True)
+            except FileNotFoundError:
+                continue
+
+
+class RedisSessionStore(SessionStore):
+    """
+    Stores every session as a hash in a Redis (or, a compatible) server,
+    which can be shared by multiple processes and hosts. The sessions expire
+    automatically, when not updated for max_age seconds.
+    """
+
+    def __init__(self, url, max_age, prefix='pga4_session:'):
+        try:
+            import redis
+        except ImportError:
+            raise RuntimeError(
+                "The 'redis' package is required to store the sessions in "
+                "a Redis server, install it using 'pip install redis'."
+            )
+
+        self.client = redis.Redis.from_url(url)
+        self.max_age = int(max_age)
+        self.prefix = prefix
+
+    def _key(self, sid):
+        return self.prefix + sid
+
+    def exists(self, sid):
+        return bool(self.client.exists(self._key(sid)))
+
+    def load(self, sid):
+        fields = self.client.hgetall(self._key(sid))
+        if not fields:
+            return None
+        return dict(
+            (field.decode(), value) for field, value in fields.items()
+        )
+
+    def update(self, sid, changed, removed):
+        key = self._key(sid)
+        pipe = self.client.pipeline()
+        if changed:
+            pipe.hset(key, mapping=changed)
+        if removed:
+            pipe.hdel(key, *removed)
+        pipe.expire(key, self.max_age)
+        pipe.execute()
+
+    def remove(self, sid):
+        self.client.delete(self._key(sid))
+
+    def cleanup(self, max_age):
+        # The keys expire on their own.
+        pass
+
+
+class KeyValueSessionManager(SessionManager):
+    """
+    Stores the sessions in a SessionStore, keeping every key of the session
+    as a separate field. The values of the SPLIT_KEYS (e.g. the transaction
+    objects of the Query Tool tabs in 'gridData') are further split into a
+    field per item, hence - only the changed items are written back to the
+    store.
+    """
+    META_FIELD = '__meta__'
+    SPLIT_KEYS = ('gridData',)
+    SPLIT_SEPARATOR = '/'
+
+    def __init__(self, store, secret, disk_write_delay, skip_paths=None):
+        self.store = store
+        self.secret = secret
+        self.disk_write_delay = disk_write_delay
+        self.skip_paths = [] if skip_paths is None else skip_paths
+
+    def exists(self, sid):
+        return self.store.exists(sid)
+
+    def remove(self, sid):
+        self.store.remove(sid)
+
+    def new_session(self):
+        sid = str(uuid4())
+        while self.store.exists(sid):
+            sid = str(uuid4())
+
+        # The session will be stored on the first update.
+        return ManagedSession(sid=sid)
+
+    @staticmethod
+    def _digest(value):
+        # Only compared within the process to detect the changed fields,
+        # hence - the fast (randomly seeded) hash of the bytes is enough.
+        return hash(value)
+
+    def _fields(self, session):
+        fields = {
+            self.META_FIELD: dumps((session.randval, session.hmac_digest))
+        }
+        for key, value in session.items():
+            if key in self.SPLIT_KEYS and isinstance(value, dict):
+                # Keep the list of the items (in order) in the key itself.
+                fields[key] = dumps(list(value.keys()))
+                for item_key, item_value in value.items():
+                    fields[
+                        self.SPLIT_SEPARATOR.join([key, str(item_key)])
+                    ] = dumps(item_value)
+            else:
+                fields[key] = dumps(value)
+        return fields
+
+    def get(self, sid, digest):
+        'Retrieve a managed session by session-id, checking the HMAC digest'
+        fields = self.store.load(sid)
+
+        try:
+            randval, hmac_digest = loads(fields[self.META_FIELD])
+        except Exception:
+            return self.new_session()
+
+        if hmac_digest != digest:
+            return self.new_session()
+
+        data = dict()
+        try:
+            for field, value in fields.items():
+                if field == self.META_FIELD or \
+                        self.SPLIT_SEPARATOR in field:
+                    continue
+
+                data[field] = loads(value)
+                if field in self.SPLIT_KEYS:
+                    data[field] = dict(
+                        (item_key, loads(fields[
+                            self.SPLIT_SEPARATOR.join([field, str(item_key)])
+                        ]))
+                        for item_key in data[field]
+                    )
+        except Exception:
+            return self.new_session()
+
+        session = ManagedSession(
+            data, sid=sid, randval=randval, hmac_digest=hmac_digest
+        )
+        session.stored_digests = dict(
+            (field, self._digest(value)) for field, value in fields.items()
+        )
+        return session
+
+    def put(self, session):
+        """Store the changed fields of a managed session"""
+        current_time = time.time()
+        if not session.hmac_digest:
+            session.sign(self.secret)
+        elif not session.force_write and session.last_write is not None and \
+            (current_time - float(session.last_write)) < \
+                self.disk_write_delay:
+            return
+
+        session.last_write = current_time
+        session.force_write = False
+
+        # Do not store the session if skip paths
+        for sp in self.skip_paths:
+            if request.path.startswith(sp):
+                return
+
+        stored_digests = getattr(session, 'stored_digests', dict())
+        digests = dict()
+        changed = dict()
+        for field, value in self._fields(session).items():
+            digests[field] = self._digest(value)
+            if stored_digests.get(field) != digests[field]:
+                changed[field] = value
+
+        removed = [field for field in stored_digests if field not in digests]
+        if changed or removed:
+            self.store.update(session.sid, changed, removed)
+        session.stored_digests = digests
+
+
 class ManagedSessionInterface(SessionInterface):
     def __init__(self, manager):
         self.manager = manager
@@ -310,10 +646,13 @@ class ManagedSessionInterface(SessionInterface):
             return
 
         if not session.modified:
-            # No need to save an unaltered session
-            # TODO: put logic here to test if the cookie is older than N days,
-            # if so, update the expiration date
-            return
+            # No need to save an unaltered session, but refresh its
+            # expiration date (of the cookie, and the stored session) once in
+            # a while, as the session is not rewritten on every request.
+            if session.last_write is not None and \
+                    time.time() - float(session.last_write) < \
+                    SESSION_REFRESH_INTERVAL:
+                return
 
         self.manager.put(session)
         session.modified = False
@@ -331,15 +670,60 @@ class ManagedSessionInterface(SessionInterface):
         )
 
 
+def get_session_store_path():
+    """
+    Returns the path of the directory used by the 'directory' session store.
+    """
+    return config.SESSION_STORE_PATH or \
+        os.path.join(config.SESSION_DB_PATH, 'store')
+
+
+def create_session_store(app):
+    """
+    Returns the session store for the configured SESSION_STORE_TYPE, None
+    for the 'file' type.
+    """
+    store_type = config.SESSION_STORE_TYPE
+
+    if store_type == 'file':
+        return None
+    if store_type == 'memory':
+        return MemorySessionStore()
+    if store_type == 'directory':
+        return DirectorySessionStore(get_session_store_path())
+    if store_type == 'redis':
+        return RedisSessionStore(
+            config.SESSION_STORE_REDIS_URL,
+            app.permanent_session_lifetime.total_seconds() + 86400
+        )
+
+    raise ValueError(
+        'Invalid SESSION_STORE_TYPE: {0}'.format(store_type)
+    )
+
+
 def create_session_interface(app, skip_paths=[]):
+    store = create_session_store(app)
+    disk_write_delay = app.config.get('PGADMIN_SESSION_DISK_WRITE_DELAY', 10)
+
+    if store is None:
+        manager = FileBackedSessionManager(
+            app.config['SESSION_DB_PATH'],
+            app.config['SECRET_KEY'],
+            disk_write_delay,
+            skip_paths
+        )
+    else:
+        manager = KeyValueSessionManager(
+            store,
+            app.config['SECRET_KEY'],
+            disk_write_delay,
+            skip_paths
+        )
+
     return ManagedSessionInterface(
         CachingSessionManager(
-            FileBackedSessionManager(
-                app.config['SESSION_DB_PATH'],
-                app.config['SECRET_KEY'],
-                app.config.get('PGADMIN_SESSION_DISK_WRITE_DELAY', 10),
-                skip_paths
-            ),
+            manager,
             1000,
             skip_paths
         ))
@@ -393,8 +777,22 @@ def cleanup_session_files():
         LAST_CHECK_SESSION_FILES = datetime.datetime.now()
 
     if iterate_session_files:
+        store_path = os.path.realpath(get_session_store_path())
+        if config.SESSION_STORE_TYPE == 'directory' and \
+                os.path.isdir(store_path):
+            DirectorySessionStore(store_path).cleanup(
+                (current_app.permanent_session_lifetime +
+                 datetime.timedelta(days=1)).total_seconds()
+            )
+
         for root, dirs, files in os.walk(
                 current_app.config['SESSION_DB_PATH']):
+            # The session store removes its own expired sessions.
+            dirs[:] = [
+                dirname for dirname in dirs
+                if os.path.realpath(os.path.join(root, dirname)) !=
+                store_path
+            ]
             for file_name in files:
                 absolute_file_name = os.path.join(root, file_name)
                 st = os.stat(absolute_file_name)
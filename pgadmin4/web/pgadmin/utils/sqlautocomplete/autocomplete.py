@@ -35,9 +35,12 @@ from .parseutils.utils import last_word
 from .parseutils.tables import TableReference
 from .prioritization import PrevalenceCounter
 from flask import render_template
+from psycopg.pq import TransactionStatus
 from pgadmin.utils.driver import get_driver
 from config import PG_DEFAULT_DRIVER
 from pgadmin.utils.preferences import Preferences
+from .metadata_cache import CatalogMetadata, metadata_cache
+from .candidate_index import CandidateIndex
 
 Match = namedtuple("Match", ["completion", "priority"])
 
@@ -111,8 +114,6 @@ class SQLAutoComplete():
         self.databases = []
         self.functions = []
         self.datatypes = []
-        self.dbmetadata = \
-            {"tables": {}, "views": {}, "functions": {}, "datatypes": {}}
         self.text_before_cursor = None
 
         manager = get_driver(PG_DEFAULT_DRIVER).connection_manager(self.sid)
@@ -121,43 +122,40 @@ class SQLAutoComplete():
         self.sql_path = 'sqlautocomplete/sql/#{0}#'.format(manager.version)
 
         self.search_path = []
-        schema_names = []
         if self.conn.connected():
             # Fetch the search path
             self._set_search_path()
 
-            # Fetch the schema names
-            self._fetch_schema_name(schema_names)
-
             pref = Preferences.module('sqleditor')
             keywords_in_uppercase = \
                 pref.preference('keywords_in_uppercase').get()
 
-            # Fetch the keywords
-            query = render_template("/".join([self.sql_path, 'keywords.sql']))
-            # If setting 'Keywords in uppercase' is set to True in
-            # Preferences then fetch the keywords in upper case.
-            if keywords_in_uppercase:
-                query = render_template(
-                    "/".join([self.sql_path, 'keywords.sql']), upper_case=True)
-            status, res = self.conn.execute_dict(query)
-            if status:
-                for record in res['rows']:
-                    # 'public' is a keyword in EPAS database server. Don't add
-                    # this into the list of keywords.
-                    # This is a hack to fix the issue in autocomplete.
-                    if record['word'].lower() == 'public':
-                        continue
-                    self.keywords.append(record['word'])
+            # The metadata is shared with the other tabs connected to the
+            # same database as the same role, and using the same search path.
+            self.metadata = metadata_cache.get((
+                self.sid, self.conn.db, manager.user, manager.role,
+                tuple(self.search_path), keywords_in_uppercase
+            ))
+            self._check_metadata()
+            with self.metadata.lock:
+                if self.metadata.keywords is None:
+                    self.metadata.keywords = \
+                        self._fetch_keywords(keywords_in_uppercase)
+                    self.all_completions.update(self.metadata.keywords)
+        else:
+            self.metadata = CatalogMetadata(shared=False)
+            self.metadata.keywords = []
 
+        self.keywords = list(self.metadata.keywords)
         self.prioritizer = PrevalenceCounter(self.keywords)
 
         self.reserved_words = set()
         for x in self.keywords:
             self.reserved_words.update(x.split())
 
-        self.all_completions = set(self.keywords)
-        self.extend_schemata(schema_names)
+        with self.metadata.lock:
+            if self.metadata.schema_names is None:
+                self._load_schemata()
 
         # Below are the configurable options in pgcli which we don't have
         # in pgAdmin4 at the moment. Setting the default value from the pgcli's
@@ -174,6 +172,88 @@ class SQLAutoComplete():
         self.qualify_columns = 'if_more_than_one_table'
         self.asterisk_column_order = 'table_order'
 
+    @property
+    def dbmetadata(self):
+        return self.metadata.dbmetadata
+
+    @dbmetadata.setter
+    def dbmetadata(self, value):
+        self.metadata.dbmetadata = value
+
+    @property
+    def all_completions(self):
+        return self.metadata.all_completions
+
+    @all_completions.setter
+    def all_completions(self, value):
+        self.metadata.all_completions = value
+
+    @property
+    def _arg_list_cache(self):
+        return self.metadata.arg_list_cache
+
+    @_arg_list_cache.setter
+    def _arg_list_cache(self, value):
+        self.metadata.arg_list_cache = value
+
+    def _fetch_keywords(self, keywords_in_uppercase):
+        keywords = []
+        # Fetch the keywords
+        query = render_template("/".join([self.sql_path, 'keywords.sql']))
+        # If setting 'Keywords in uppercase' is set to True in
+        # Preferences then fetch the keywords in upper case.
+        if keywords_in_uppercase:
+            query = render_template(
+                "/".join([self.sql_path, 'keywords.sql']), upper_case=True)
+        status, res = self.conn.execute_dict(query)
+        if status:
+            for record in res['rows']:
+                # 'public' is a keyword in EPAS database server. Don't add
+                # this into the list of keywords.
+                # This is a hack to fix the issue in autocomplete.
+                if record['word'].lower() == 'public':
+                    continue
+                keywords.append(record['word'])
+        return keywords
+
+    def _load_schemata(self):
+        schema_names = []
+        if self.conn.connected():
+            # Fetch the schema names
+            self._fetch_schema_name(schema_names)
+        self.metadata.schema_names = schema_names
+        self.extend_schemata(schema_names)
+
+    def _check_metadata(self):
+        """
+        Check the watermarks of the catalogs, and forget the cached objects,
+        which might have been changed since the last check.
+
+        The watermarks are fetched without holding the lock of the metadata,
+        so that the other tabs are not blocked by the query.
+        """
+        if not self.metadata.needs_check() or not self.conn.connected():
+            return
+
+        # The statistics are read once per transaction, unless the snapshot
+        # is discarded.
+        if self.conn.transaction_status() == TransactionStatus.INTRANS:
+            self.conn.execute_scalar(
+                'SELECT pg_catalog.pg_stat_clear_snapshot()')
+
+        status, res = self.conn.execute_2darray(
+            render_template("/".join([self.sql_path, 'watermarks.sql']))
+        )
+        if not status:
+            return
+
+        watermarks = dict()
+        for row in res['rows']:
+            watermarks[row['name']] = \
+                watermarks.get(row['name'], ()) + (row['watermark'],)
+        with self.metadata.lock:
+            self.metadata.update_watermarks(watermarks)
+
     def _set_search_path(self):
         query = render_template(
             "/".join([self.sql_path, 'schema.sql']), search_path=True)
@@ -226,6 +306,7 @@ class SQLAutoComplete():
         metadata = self.dbmetadata["tables"]
         for schema in schemata:
             metadata[schema] = {}
+        self.metadata.forget_indexes()
 
         # dbmetadata.values() are the 'tables' and 'functions' dicts
         for metadata in self.dbmetadata.values():
@@ -257,6 +338,7 @@ class SQLAutoComplete():
         # dbmetadata['tables']['schema_name']['table_name'] should be an
         # OrderedDict {column_name:ColumnMetaData}.
         metadata = self.dbmetadata[kind]
+        self.metadata.forget_indexes(kind)
         for schema, relname in data:
             try:
                 metadata[schema][relname] = OrderedDict()
@@ -297,12 +379,14 @@ class SQLAutoComplete():
         # dbmetadata['schema_name']['functions']['function_name'] should return
         # the function metadata namedtuple for the corresponding function
         metadata = self.dbmetadata["functions"]
+        self.metadata.forget_indexes("functions")
 
         for f in func_data:
             schema, func = self.escaped_names([f.schema_name, f.func_name])
 
             if func in metadata[schema]:
-                metadata[schema][func].append(f)
+                if f not in metadata[schema][func]:
+                    metadata[schema][func].append(f)
             else:
                 metadata[schema][func] = [f]
 
@@ -364,6 +448,7 @@ class SQLAutoComplete():
         # metadata, such as composite type field names. Currently, we're not
         # storing any metadata beyond typename, so just store None
         meta = self.dbmetadata["datatypes"]
+        self.metadata.forget_indexes("datatypes")
 
         for t in type_data:
             schema, type_name = self.escaped_names(t)
@@ -377,10 +462,24 @@ class SQLAutoComplete():
         self.databases = []
         self.special_commands = []
         self.search_path = []
-        self.dbmetadata = \
-            {"tables": {}, "views": {}, "functions": {}, "datatypes": {}}
+        # Stop sharing the metadata with the other tabs.
+        self.metadata = CatalogMetadata(shared=False)
+        self.metadata.keywords = self.keywords
         self.all_completions = set(self.keywords + self.functions)
 
+    @staticmethod
+    def _matching_text(text):
+        """Returns the lowered last word of the text, the completions are
+        matched on."""
+        text = last_word(text, include="most_punctuations").lower()
+
+        if text and text[0] == '"':
+            # text starts with double quote; user is manually escaping a name
+            # Match on everything that follows the double-quote.
+            text = text[1:]
+
+        return text
+
     def find_matches(self, text, collection, mode="strict", meta=None):
         """Find completion matches for the given text.
 
@@ -389,7 +488,7 @@ class SQLAutoComplete():
         text.
 
         `collection` can be either a list of strings or a list of Candidate
-        namedtuples.
+        namedtuples, or a CandidateIndex of them.
         `mode` can be either 'fuzzy', or 'strict'
             'fuzzy': fuzzy matching, ties broken by name prevalance
             `keyword`: start only matching, ties broken by keyword prevalance
@@ -416,15 +515,10 @@ class SQLAutoComplete():
             "table format",
         ]
         type_priority = prio_order.index(meta) if meta in prio_order else -1
-        text = last_word(text, include="most_punctuations").lower()
-        text_len = len(text)
-
-        if text and text[0] == '"':
-            # text starts with double quote; user is manually escaping a name
-            # Match on everything that follows the double-quote. Note that
-            # text_len is calculated before removing the quote, so the
-            # Completion.position value is correct
-            text = text[1:]
+        text_len = len(last_word(text, include="most_punctuations").lower())
+        # Note that text_len is calculated before removing the quote, so the
+        # Completion.position value is correct
+        text = self._matching_text(text)
 
         if mode == "fuzzy":
             fuzzy = True
@@ -433,6 +527,10 @@ class SQLAutoComplete():
             fuzzy = False
             priority_func = self.prioritizer.keyword_count
 
+        # Look at the candidates, which may match the text, only.
+        if isinstance(collection, CandidateIndex):
+            collection = collection.match(text, fuzzy)
+
         # Construct a `_match` function for either fuzzy or non-fuzzy matching
         # The match function returns a 2-tuple used for sorting the matches,
         # or None if the item doesn't match
@@ -526,6 +624,13 @@ class SQLAutoComplete():
         return matches
 
     def get_completions(self, text, text_before_cursor):
+        self._check_metadata()
+        with self.metadata.lock:
+            if self.metadata.schema_names is None:
+                self._load_schemata()
+            return self._get_completions(text, text_before_cursor)
+
+    def _get_completions(self, text, text_before_cursor):
         self.text_before_cursor = text_before_cursor
 
         word_before_cursor = self.get_word_before_cursor(word=True)
@@ -805,7 +910,8 @@ class SQLAutoComplete():
 
         # Function overloading means we way have multiple functions of the same
         # name at this point, so keep unique names only
-        all_functions = self.populate_functions(suggestion.schema, filt)
+        all_functions = self.populate_functions(suggestion.schema, filt,
+                                                word_before_cursor)
         funcs = {self._make_cand(f, alias, suggestion, arg_mode)
                  for f in all_functions}
 
@@ -919,7 +1025,8 @@ class SQLAutoComplete():
         return Candidate(item, synonyms=synonyms, prio2=prio2, display=display)
 
     def get_table_matches(self, suggestion, word_before_cursor, alias=False):
-        tables = self.populate_schema_objects(suggestion.schema, "tables")
+        tables = self.populate_schema_objects(suggestion.schema, "tables",
+                                              word_before_cursor)
         tables.extend(
             SchemaObject(tbl.name) for tbl in suggestion.local_tables)
 
@@ -932,7 +1039,8 @@ class SQLAutoComplete():
         return self.find_matches(word_before_cursor, tables, meta="table")
 
     def get_view_matches(self, suggestion, word_before_cursor, alias=False):
-        views = self.populate_schema_objects(suggestion.schema, "views")
+        views = self.populate_schema_objects(suggestion.schema, "views",
+                                             word_before_cursor)
 
         if not suggestion.schema and (
                 not word_before_cursor.startswith("pg_")):
@@ -950,12 +1058,16 @@ class SQLAutoComplete():
                                  meta="database")
 
     def get_keyword_matches(self, suggestion, word_before_cursor):
-        return self.find_matches(word_before_cursor, self.keywords,
+        keywords = self.metadata.name_index(
+            ("keywords", None), lambda: CandidateIndex(self.keywords)
+        )
+        return self.find_matches(word_before_cursor, keywords or self.keywords,
                                  meta="keyword")
 
     def get_datatype_matches(self, suggestion, word_before_cursor):
         # suggest custom datatypes
-        types = self.populate_schema_objects(suggestion.schema, "datatypes")
+        types = self.populate_schema_objects(suggestion.schema, "datatypes",
+                                             word_before_cursor)
         types = [self._make_cand(t, False, suggestion) for t in types]
         matches = self.find_matches(word_before_cursor, types, meta="datatype")
 
@@ -1086,10 +1198,35 @@ class SQLAutoComplete():
     def _maybe_schema(self, schema, parent):
         return None if parent or schema in self.search_path else schema
 
-    def populate_schema_objects(self, schema, obj_type):
+    def _object_names(self, obj_type, schema, text=None):
+        """Returns the names of the objects of the schema, which may match
+        the given text (all the names, when not specified).
+
+        The index of the names (and, their aliases) is built when used first
+        after the objects are loaded, and shared with the other tabs.
+
+        """
+        names = self.dbmetadata[obj_type][schema]
+        if text is None:
+            return names.keys()
+
+        index = self.metadata.name_index(
+            (obj_type, schema),
+            lambda: CandidateIndex(
+                list(names), lambda name: (name, generate_alias(name))
+            )
+        )
+        if index is None:
+            return names.keys()
+
+        return index.match(self._matching_text(text))
+
+    def populate_schema_objects(self, schema, obj_type, text=None):
         """Returns a list of SchemaObjects representing tables or views.
 
         :param schema is the schema qualification input by the user (if any)
+        :param text is the text typed by the user, only the objects which
+        may match it are returned (if specified)
 
         """
         # Fetch the schema objects first
@@ -1101,15 +1238,17 @@ class SQLAutoComplete():
                 schema=(self._maybe_schema(schema=sch, parent=schema))
             )
             for sch in self._get_schemas(obj_type, schema)
-            for obj in self.dbmetadata[obj_type][sch].keys()
+            for obj in self._object_names(obj_type, sch, text)
         ]
 
-    def populate_functions(self, schema, filter_func):
+    def populate_functions(self, schema, filter_func, text=None):
         """Returns a list of function SchemaObjects.
 
         :param filter_func is a function that accepts a FunctionMetadata
         namedtuple and returns a boolean indicating whether that
         function should be kept or discarded
+        :param text is the text typed by the user, only the functions which
+        may match it are returned (if specified)
 
         """
 
@@ -1126,8 +1265,8 @@ class SQLAutoComplete():
                 meta=meta,
             )
             for sch in self._get_schemas("functions", schema)
-            for (func, metas) in self.dbmetadata["functions"][sch].items()
-            for meta in metas
+            for func in self._object_names("functions", sch, text)
+            for meta in self.dbmetadata["functions"][sch][func]
             if filter_func(meta)
         ]
 
@@ -1172,6 +1311,8 @@ class SQLAutoComplete():
         """
         data = []
         query, in_clause = self._get_schema_obj_query(schema, obj_type)
+        if self.metadata.is_loaded(obj_type, in_clause):
+            return
 
         if self.conn.connected():
             status, res = self.conn.execute_dict(query)
@@ -1180,6 +1321,7 @@ class SQLAutoComplete():
                     data.append(
                         (record['schema_name'], record['object_name'])
                     )
+                self.metadata.set_loaded(obj_type, in_clause)
 
         if (obj_type == 'tables' or obj_type == 'views') and len(data) > 0:
             self.extend_relations(data, obj_type)
@@ -1245,12 +1387,15 @@ class SQLAutoComplete():
         :return:
         """
         data = []
-        query, _ = self._get_function_sql(schema)
+        query, in_clause = self._get_function_sql(schema)
+        if self.metadata.is_loaded('functions', in_clause):
+            return
 
         if self.conn.connected():
             status, res = self.conn.execute_dict(query)
             if status:
                 self._get_function_meta_data(res, data)
+                self.metadata.set_loaded('functions', in_clause)
 
         if len(data) > 0:
             self.extend_functions(data)
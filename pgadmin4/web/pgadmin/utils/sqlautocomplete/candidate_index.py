@@ -0,0 +1,122 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2025, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""Index of the names of the completion candidates."""
+
+import re
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+
+
+def unescape_name(name):
+    """ Unquote a string."""
+    if name and name[0] == '"' and name[-1] == '"':
+        name = name[1:-1]
+
+    return name
+
+
+class CandidateIndex():
+    """
+    class CandidateIndex
+
+        Index of the names (including the synonyms) of a collection of the
+        completion candidates, used to find the candidates which may match
+        the text typed by the user, without looking at all of them.
+
+        The strict (start only) matching uses a sorted array of the lowered,
+        and unescaped names. The fuzzy matching looks for the characters of
+        the text (in order) in all the lowered names, joined in a single
+        string, using a regular expression. The result is a superset of the
+        candidates matched by SQLAutoComplete.find_matches(...), which still
+        computes the priority of each of them.
+    """
+
+    def __init__(self, items, names=None):
+        """
+        Args:
+            items: list of the candidates (or, the objects to build them).
+            names: function returning the names of a candidate, the
+                   candidate itself is the only name by default.
+        """
+        self.items = items if isinstance(items, list) else list(items)
+        self._names = names
+        self._lowered = None
+
+        keys = []
+        owners = array('l')
+        for idx, name in self._iter_names():
+            keys.append(unescape_name(name.lower()))
+            owners.append(idx)
+
+        order = sorted(range(len(keys)), key=keys.__getitem__)
+        self._keys = [keys[pos] for pos in order]
+        self._key_owners = array('l', (owners[pos] for pos in order))
+
+    def __len__(self):
+        return len(self.items)
+
+    def _iter_names(self):
+        for idx, item in enumerate(self.items):
+            if self._names is None:
+                yield idx, item
+                continue
+            for name in self._names(item):
+                yield idx, name
+
+    def _build_lowered(self):
+        """
+        Join all the lowered names, one per line, for the fuzzy matching.
+        """
+        lines = []
+        starts = array('l')
+        owners = array('l')
+        offset = 0
+        for idx, name in self._iter_names():
+            # The names are matched one line at a time.
+            line = name.lower().replace('\n', ' ')
+            lines.append(line)
+            starts.append(offset)
+            owners.append(idx)
+            offset += len(line) + 1
+
+        self._lowered = ('\n'.join(lines), starts, owners)
+
+    def _prefix_owners(self, text):
+        lo = bisect_left(self._keys, text)
+        hi = bisect_right(self._keys, text + chr(sys.maxunicode), lo)
+        return self._key_owners[lo:hi]
+
+    def _fuzzy_owners(self, text):
+        if self._lowered is None:
+            self._build_lowered()
+
+        lowered, starts, owners = self._lowered
+        pattern = re.compile(
+            '^.*?' + '.*?'.join(map(re.escape, text)), re.MULTILINE
+        )
+        return [
+            owners[bisect_right(starts, match.start()) - 1]
+            for match in pattern.finditer(lowered)
+        ]
+
+    def match(self, text, fuzzy=False):
+        """
+        Returns the candidates (in order of the collection) which may match
+        the given (lowered) text.
+        """
+        if not text:
+            return self.items
+
+        found = set(self._prefix_owners(text))
+        if fuzzy:
+            found.update(self._fuzzy_owners(text))
+
+        return [self.items[idx] for idx in sorted(found)]
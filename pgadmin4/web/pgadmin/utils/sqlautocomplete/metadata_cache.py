@@ -0,0 +1,174 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2025, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""Process wide cache of the catalog metadata used by the autocomplete."""
+
+import threading
+import time
+
+import config
+from pgadmin.utils.lru_cache import LRUCache
+
+# Kind of the objects in the metadata, invalidated when the watermark of
+# the catalogs of the group changes.
+WATERMARK_GROUPS = {
+    'relations': ('tables', 'views'),
+    'functions': ('functions',),
+    'datatypes': ('datatypes',),
+}
+
+
+class CatalogMetadata():
+    """
+    Catalog metadata of a database (keywords, schemas, tables, views with
+    their columns, functions and data types), as seen by a role using a
+    search path.
+
+    The objects of a kind are loaded lazily (for a list of schemas), and
+    kept until the watermark of their catalogs changes. A metadata, which is
+    not shared, does not remember what is loaded, hence - the objects are
+    fetched from the database server every time.
+    """
+
+    def __init__(self, shared=True):
+        self.lock = threading.RLock()
+        self.shared = shared
+        self.keywords = None
+        self.schema_names = None
+        self.dbmetadata = \
+            {"tables": {}, "views": {}, "functions": {}, "datatypes": {}}
+        self.all_completions = set()
+        self.arg_list_cache = {}
+        self.watermarks = None
+        self.checked = None
+        self._loaded = set()
+        self._indexes = {}
+
+    def is_loaded(self, kind, schemas):
+        return (kind, schemas) in self._loaded
+
+    def set_loaded(self, kind, schemas):
+        if self.shared:
+            self._loaded.add((kind, schemas))
+
+    def name_index(self, key, build):
+        """
+        Returns the index of the names for the given key - (kind, schema),
+        built (using the given function) when used first after the objects
+        of the kind are loaded. Returns None for a metadata, which is not
+        shared, as it would be built again for every request.
+        """
+        if not self.shared:
+            return None
+
+        index = self._indexes.get(key)
+        if index is None:
+            index = self._indexes[key] = build()
+        return index
+
+    def forget_indexes(self, kind=None):
+        """
+        Forget the indexes of the names of the given kind (or, all the kinds,
+        when not specified).
+        """
+        if kind is None:
+            self._indexes.clear()
+        else:
+            for key in [key for key in self._indexes if key[0] == kind]:
+                del self._indexes[key]
+
+    def needs_check(self):
+        """
+        Returns True when the watermarks were not checked in the last
+        config.SQL_AUTOCOMPLETE_CACHE_CHECK_INTERVAL seconds.
+        """
+        return self.shared and (
+            self.checked is None or
+            time.monotonic() - self.checked >=
+            config.SQL_AUTOCOMPLETE_CACHE_CHECK_INTERVAL
+        )
+
+    def update_watermarks(self, watermarks):
+        """
+        Invalidate the objects of the groups, whose watermark has changed
+        since the last check.
+
+        :param watermarks: Dictionary of the watermark by the group name.
+        :return: Set of the changed groups.
+        """
+        changed = set()
+        if self.watermarks is not None:
+            changed = set(
+                name for name in set(watermarks) | set(self.watermarks)
+                if watermarks.get(name) != self.watermarks.get(name)
+            )
+        self.watermarks = watermarks
+        self.checked = time.monotonic()
+
+        if 'schemas' in changed:
+            # The schemas will be loaded again, along with everything else.
+            self.schema_names = None
+            for metadata in self.dbmetadata.values():
+                metadata.clear()
+            self._loaded.clear()
+            self.arg_list_cache = {}
+            self.forget_indexes()
+            return changed
+
+        for group in changed:
+            kinds = WATERMARK_GROUPS.get(group, ())
+            for kind in kinds:
+                metadata = self.dbmetadata[kind]
+                for schema in metadata:
+                    metadata[schema] = {}
+            self._loaded = set(
+                loaded for loaded in self._loaded if loaded[0] not in kinds
+            )
+            for kind in kinds:
+                self.forget_indexes(kind)
+            if 'functions' in kinds:
+                self.arg_list_cache = {}
+
+        return changed
+
+
+class MetadataCache():
+    """
+    Catalog metadata shared by the autocomplete of all the Query Tool tabs
+    connected to the same database, for the most recently used
+    config.SQL_AUTOCOMPLETE_CACHE_SIZE databases.
+    """
+
+    def __init__(self):
+        self._entries = LRUCache('SQL_AUTOCOMPLETE_CACHE_SIZE')
+
+    def get(self, key):
+        """
+        Returns the metadata for the given key - (server id, database name,
+        user, role, search path, keywords in uppercase).
+        """
+        return self._entries.setdefault(
+            key, lambda: CatalogMetadata(shared=self._entries.enabled()))
+
+    def invalidate(self, sid=None):
+        """
+        Forget the metadata of the databases of the given server (or, all the
+        servers, when not specified).
+        """
+        self._entries.discard(
+            None if sid is None else lambda key: key[0] == sid)
+
+    def info(self):
+        """
+        Returns the cache statistics.
+        """
+        return self._entries.info()
+
+
+metadata_cache = MetadataCache()
@@ -0,0 +1,130 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2025, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""
+Measure the startup of the application (the import of the pgadmin package,
+and create_app) in a new python process, optionally with the import time
+profile of the python interpreter (python -X importtime).
+"""
+
+import json
+import os
+import re
+import subprocess
+import sys
+import time
+from collections import namedtuple
+
+WEB_DIR = os.path.dirname(os.path.dirname(os.path.dirname(
+    os.path.realpath(__file__))))
+
+# Run in the new process, prints the timings (in seconds) as JSON.
+STARTUP_SCRIPT = '''
+import json, sys, time
+started = time.perf_counter()
+import config
+for key, value in json.loads(sys.argv[1]).items():
+    setattr(config, key, value)
+from pgadmin import create_app
+imported = time.perf_counter()
+app = create_app(sys.argv[2])
+created = time.perf_counter()
+print(json.dumps({
+    'import': imported - started,
+    'create_app': created - imported,
+    'blueprints': len(app.blueprints),
+    'rules': len(list(app.url_map.iter_rules())),
+}))
+'''
+
+IMPORT_TIME_RE = re.compile(
+    r'^import time:\s*(\d+)\s*\|\s*(\d+)\s*\|( *)(\S+)\s*$'
+)
+
+ImportTime = namedtuple(
+    'ImportTime', ['name', 'self_us', 'cumulative_us', 'depth']
+)
+
+
+def run_startup(app_name, overrides=None, importtime=False):
+    """
+    Create the application in a new python process.
+
+    :param app_name: Name of the application (e.g. config.APP_NAME + '-cli')
+    :param overrides: Configuration settings to override (JSON serializable)
+    :param importtime: Profile the imports (python -X importtime)
+    :return: The timings (in seconds, including the 'total' lifetime of the
+        process), and the list of ImportTime (when profiled).
+    """
+    command = [sys.executable]
+    if importtime:
+        command.extend(['-X', 'importtime'])
+    command.extend([
+        '-c', STARTUP_SCRIPT, json.dumps(overrides or dict()), app_name
+    ])
+
+    started = time.perf_counter()
+    process = subprocess.run(
+        command, cwd=WEB_DIR, stdin=subprocess.DEVNULL, capture_output=True,
+        text=True
+    )
+    total = time.perf_counter() - started
+
+    output = process.stdout.strip().splitlines()
+    if process.returncode != 0 or not output:
+        raise RuntimeError(
+            'The application could not be started:\n{0}'.format(
+                '\n'.join(process.stderr.strip().splitlines()[-20:])
+            )
+        )
+
+    timings = json.loads(output[-1])
+    timings['total'] = total
+
+    return timings, \
+        parse_importtime(process.stderr) if importtime else []
+
+
+def parse_importtime(output):
+    """
+    Parse the output of python -X importtime.
+
+    :return: The list of ImportTime (in the import order).
+    """
+    imports = []
+    for line in output.splitlines():
+        match = IMPORT_TIME_RE.match(line)
+        if match:
+            imports.append(ImportTime(
+                match.group(4), int(match.group(1)), int(match.group(2)),
+                len(match.group(3)) // 2
+            ))
+    return imports
+
+
+def group_importtime(imports, level=1):
+    """
+    Sum the self import time of the modules by package, the first given
+    number of components of the module name (e.g. 'pgadmin.browser' for the
+    level 2).
+
+    :return: The list of (package, self_us, number of modules), the slowest
+        first.
+    """
+    packages = dict()
+    for entry in imports:
+        package = '.'.join(entry.name.split('.')[:level])
+        self_us, count = packages.get(package, (0, 0))
+        packages[package] = (self_us + entry.self_us, count + 1)
+
+    return sorted(
+        ((package, self_us, count)
+         for package, (self_us, count) in packages.items()),
+        key=lambda item: item[1], reverse=True
+    )
@@ -0,0 +1,85 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2025, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.utils.sqlautocomplete.autocomplete import SQLAutoComplete, \
+    Candidate, generate_alias
+from pgadmin.utils.sqlautocomplete.candidate_index import CandidateIndex
+from pgadmin.utils.sqlautocomplete.prioritization import PrevalenceCounter
+
+NAMES = [
+    'users', 'user_roles', 'UserGroups', '"Users"', '"user data"',
+    'orders', 'order_items', 'customer_orders', 'us', 'u', '"U"',
+    'audit_log', 'accounts', 'account_users', 'pg_class', 'select',
+    '"line\nbreak"', 'münchen', 'zusammen',
+]
+
+
+class TestCandidateIndex(BaseTestGenerator):
+    """ This class tests that the autocomplete finds the same matches,
+    using the index of the candidate names. """
+
+    scenarios = [
+        ('Strict matching of the names', dict(
+            mode='strict', candidates=False,
+            texts=['', 'u', 'US', 'user', '"us', '"user d', 'ord', 'x',
+                   'SELECT * FROM acc', 'pg_', 'mü', 'u.'])),
+        ('Fuzzy matching of the names', dict(
+            mode='fuzzy', candidates=False,
+            texts=['', 'u', 'usr', 'ors', '"ud', 'sn', 'ue', 'ad', 'x',
+                   'SELECT * FROM ao', 'mn', 'lb'])),
+        ('Strict matching of the candidates, and their aliases', dict(
+            mode='strict', candidates=True,
+            texts=['', 'u', 'ug', 'UR', 'oi', 'co', '"u', 'al', 'x'])),
+        ('Fuzzy matching of the candidates, and their aliases', dict(
+            mode='fuzzy', candidates=True,
+            texts=['', 'u', 'ug', 'ui', 'oi', 'co', '"u', 'ag', 'x'])),
+    ]
+
+    def setUp(self):
+        self.completer = SQLAutoComplete.__new__(SQLAutoComplete)
+        self.completer.prioritizer = PrevalenceCounter([])
+
+    @staticmethod
+    def completions(matches):
+        return [(m.completion.text, m.priority) for m in matches]
+
+    def runTest(self):
+        if self.candidates:
+            collection = [
+                Candidate(name, synonyms=(name, generate_alias(name)))
+                for name in NAMES
+            ]
+            index = CandidateIndex(
+                NAMES, lambda name: (name, generate_alias(name))
+            )
+        else:
+            collection = NAMES
+            index = CandidateIndex(NAMES)
+
+        for text in self.texts:
+            expected = self.completions(self.completer.find_matches(
+                text, collection, mode=self.mode
+            ))
+
+            if self.candidates:
+                names = index.match(
+                    SQLAutoComplete._matching_text(text),
+                    fuzzy=(self.mode == 'fuzzy')
+                )
+                matches = self.completer.find_matches(text, [
+                    Candidate(name, synonyms=(name, generate_alias(name)))
+                    for name in names
+                ], mode=self.mode)
+            else:
+                matches = self.completer.find_matches(
+                    text, index, mode=self.mode
+                )
+
+            self.assertEqual(self.completions(matches), expected, text)
@@ -0,0 +1,178 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2025, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import threading
+from unittest.mock import MagicMock, patch
+
+from psycopg.pq import TransactionStatus
+
+import config
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.utils.sqlautocomplete import autocomplete
+from pgadmin.utils.sqlautocomplete.autocomplete import SQLAutoComplete
+from pgadmin.utils.sqlautocomplete.metadata_cache import metadata_cache
+
+SQL = 'SELECT * FROM '
+
+
+class FakeConnection():
+    def __init__(self, status):
+        self.db = 'postgres'
+        self.status = status
+        self.queries = []
+        self.tables = ['users']
+        self.watermark = '1:0:0'
+        # Locks held by another thread, while reading the watermarks.
+        self.locks = []
+        self.locked = []
+
+    def connected(self):
+        return True
+
+    def transaction_status(self):
+        return self.status
+
+    def execute_scalar(self, query):
+        self.queries.append(query)
+        return True, ''
+
+    def execute_dict(self, query):
+        template, object_name = query
+        self.queries.append(template)
+        rows = []
+        if template == 'schema.sql':
+            rows = [{'schema': 'public'}]
+        elif template == 'keywords.sql':
+            rows = [{'word': word} for word in ('select', 'from', 'where')]
+        elif template == 'tableview.sql' and object_name == 'tables':
+            rows = [{'schema_name': 'public', 'object_name': table}
+                    for table in self.tables]
+        elif template == 'columns.sql' and object_name == 'table':
+            rows = [{'schema_name': 'public', 'table_name': table,
+                     'column_name': 'id', 'type_name': 'integer',
+                     'has_default': False, 'default': None}
+                    for table in self.tables]
+        return True, {'rows': rows}
+
+    def try_lock(self, lock):
+        acquired = lock.acquire(blocking=False)
+        self.locked.append(not acquired)
+        if acquired:
+            lock.release()
+
+    def execute_2darray(self, query):
+        self.queries.append(query[0])
+        for lock in self.locks:
+            thread = threading.Thread(target=self.try_lock, args=(lock,))
+            thread.start()
+            thread.join()
+
+        # The rows are dicts, like the rows of the DictCursor.
+        rows = [('schemas', '5:0:0'), ('relations', self.watermark),
+                ('relations', '20:3:1')]
+        return True, {'rows': [{'name': name, 'watermark': watermark}
+                               for name, watermark in rows]}
+
+
+class TestAutoCompleteMetadataCache(BaseTestGenerator):
+    """ This class tests sharing the autocomplete metadata between the
+    Query Tool tabs. """
+
+    scenarios = [
+        ('Share the metadata between the tabs',
+         dict(cache_size=8, shared=True, status=TransactionStatus.IDLE,
+              expected_check=['watermarks.sql'])),
+        ('Read the latest statistics within a transaction',
+         dict(cache_size=8, shared=True, status=TransactionStatus.INTRANS,
+              expected_check=['SELECT pg_catalog.pg_stat_clear_snapshot()',
+                              'watermarks.sql'])),
+        ('Fetch the metadata for every request, when the cache is disabled',
+         dict(cache_size=0, shared=False, status=TransactionStatus.IDLE,
+              expected_check=[])),
+    ]
+
+    def setUp(self):
+        metadata_cache.invalidate()
+        self.conn = FakeConnection(self.status)
+        manager = MagicMock(version=160000, user='postgres', role=None)
+        driver = MagicMock()
+        driver.connection_manager.return_value = manager
+        preference = MagicMock()
+        preference.preference.return_value.get.return_value = False
+
+        self.patches = [
+            patch.object(autocomplete, 'get_driver', return_value=driver),
+            patch.object(autocomplete.Preferences, 'module',
+                         return_value=preference),
+            patch.object(autocomplete, 'render_template',
+                         lambda path, **kwargs: (path.split('/')[-1],
+                                                 kwargs.get('object_name'))),
+            patch.object(config, 'SQL_AUTOCOMPLETE_CACHE_SIZE',
+                         self.cache_size),
+            patch.object(config, 'SQL_AUTOCOMPLETE_CACHE_CHECK_INTERVAL',
+                         3600),
+        ]
+        for p in self.patches:
+            p.start()
+
+    def tearDown(self):
+        for p in reversed(self.patches):
+            p.stop()
+        metadata_cache.invalidate()
+
+    def completions(self, tab):
+        del self.conn.queries[:]
+        return set(tab.get_completions(SQL, SQL))
+
+    def runTest(self):
+        first_tab = SQLAutoComplete(sid=1, did=1, conn=self.conn)
+        self.assertIn('users', self.completions(first_tab))
+        self.assertIn('tableview.sql', self.conn.queries)
+
+        second_tab = SQLAutoComplete(sid=1, did=1, conn=self.conn)
+        self.assertIn('users', self.completions(second_tab))
+
+        if not self.shared:
+            self.assertIsNot(first_tab.metadata, second_tab.metadata)
+            self.assertIn('tableview.sql', self.conn.queries)
+            self.assertNotIn('watermarks.sql', self.conn.queries)
+            return
+
+        # The tables are fetched once, the second tab uses the same metadata.
+        self.assertIs(first_tab.metadata, second_tab.metadata)
+        self.assertEqual(self.conn.queries, [])
+        self.assertEqual(metadata_cache.info()['size'], 1)
+
+        # A new table is seen, once the watermark of the relations changes.
+        self.conn.tables.append('orders')
+        self.conn.locks.append(first_tab.metadata.lock)
+        with patch.object(config, 'SQL_AUTOCOMPLETE_CACHE_CHECK_INTERVAL', 0):
+            self.assertNotIn('orders', self.completions(second_tab))
+            self.assertEqual(self.conn.queries, self.expected_check)
+
+            # A column renamed.
+            self.conn.watermark = '1:1:0'
+            self.assertIn('orders', self.completions(first_tab))
+            # Tables (along with their columns and foreign keys), and views.
+            self.assertEqual(
+                self.conn.queries,
+                self.expected_check + ['tableview.sql', 'columns.sql',
+                                       'foreign_keys.sql', 'tableview.sql']
+            )
+
+        # The other tabs are not blocked, while reading the watermarks.
+        self.assertEqual(self.conn.locked, [False, False])
+
+        # Another search path uses its own metadata, evicted when not used.
+        with patch.object(config, 'SQL_AUTOCOMPLETE_CACHE_SIZE', 1), \
+                patch.object(autocomplete.SQLAutoComplete, '_set_search_path',
+                             lambda self: self.search_path.append('other')):
+            other_tab = SQLAutoComplete(sid=1, did=1, conn=self.conn)
+        self.assertIsNot(other_tab.metadata, first_tab.metadata)
+        self.assertEqual(metadata_cache.info()['size'], 1)
@@ -0,0 +1,215 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2025, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.utils.driver.psycopg3.batched_fetch import BatchedFetch, \
+    batchable
+
+# Columns of the tables (by the table oid).
+COLUMNS = {
+    1: ['id', 'name'],
+    2: ['id'],
+    3: ['id', 'parent_id', 'value'],
+}
+
+
+class FakeConnection:
+    """
+    Answers the queries of fetch_table, like 'columns 1', and 'acl 1.id'.
+    """
+
+    def __init__(self, pipeline=True):
+        self.pipeline = pipeline
+        self.executed = []
+        self.pipelines = []
+
+    def pipeline_supported(self):
+        return True
+
+    def _rows(self, query):
+        kind, _, arg = query.partition(' ')
+        if kind == 'columns' and int(arg) in COLUMNS:
+            return [{'name': name} for name in COLUMNS[int(arg)]]
+        if kind == 'acl' and not arg.endswith('.'):
+            return [{'grantee': 'public', 'column': arg}]
+        if kind == 'count':
+            return [{'count': int(arg) * 10}]
+        raise ValueError('invalid query: ' + query)
+
+    def _execute(self, query):
+        self.executed.append(query)
+        try:
+            return True, {'columns': [], 'rows': self._rows(query)}
+        except ValueError as e:
+            return False, str(e)
+
+    @batchable('dict')
+    def execute_dict(self, query, params=None, formatted_exception_msg=False):
+        return self._execute(query)
+
+    @batchable('2darray')
+    def execute_2darray(self, query, params=None,
+                        formatted_exception_msg=False):
+        return self._execute(query)
+
+    @batchable('scalar')
+    def execute_scalar(self, query, params=None,
+                       formatted_exception_msg=False):
+        status, res = self._execute(query)
+        if not status:
+            return status, res
+        return True, res['rows'][0]['count'] if res['rows'] else None
+
+    def execute_pipeline(self, queries, formatted_exception_msg=False):
+        self.pipelines.append([query for query, _ in queries])
+        if not self.pipeline:
+            return False, 'pipeline failed'
+        try:
+            return True, [
+                {'columns': [], 'rows': self._rows(query),
+                 'rows_affected': 0}
+                for query, _ in queries
+            ]
+        except ValueError as e:
+            return False, str(e)
+
+
+def fetch_table(conn, tid):
+    status, res = conn.execute_dict('columns {0}'.format(tid))
+    if not status:
+        return False, res
+
+    columns = res['rows']
+    for column in columns:
+        # The result is changed, like the object views do.
+        column['name'] = column['name'].upper()
+        status, acl = conn.execute_2darray(
+            'acl {0}.{1}'.format(tid, column['name'].lower()))
+        column['acl'] = acl['rows']
+
+    status, count = conn.execute_scalar('count {0}'.format(tid))
+    return True, {'columns': columns, 'count': count}
+
+
+def fetch_first_column(conn, tid):
+    return conn.execute_dict('columns {0}'.format(tid))[1]['rows'][0]
+
+
+def fetch_first_acl(conn, tid):
+    status, res = conn.execute_dict('columns {0}'.format(tid))
+    # The column is not known, until the columns are fetched.
+    name = res['rows'][0]['name'] if res['rows'] else ''
+    return conn.execute_2darray('acl {0}.{1}'.format(tid, name))[1]['rows']
+
+
+def fetch_missing_key(conn, tid):
+    return {}['key']
+
+
+def fetch_unbatched(tids):
+    conn = FakeConnection()
+    return [fetch_table(conn, tid) for tid in tids]
+
+
+class TestBatchedFetch(BaseTestGenerator):
+    """ This class tests fetching the objects with the queries run in
+    batches. """
+
+    options = dict()
+    pipeline = True
+    fetch = staticmethod(fetch_table)
+
+    scenarios = [
+        ('Fetch the objects in batches',
+         dict(options=dict(batch_size=4), tids=[1, 2, 3],
+              expected=fetch_unbatched([1, 2, 3]),
+              # The columns, then the counts (recorded after the empty
+              # columns), then the acls of all the columns.
+              expected_pipelines=[
+                  ['columns 1', 'columns 2', 'columns 3', 'count 1'],
+                  ['count 2', 'count 3'],
+                  ['acl 1.id', 'acl 2.id', 'acl 3.id', 'acl 1.name'],
+                  ['acl 3.parent_id', 'acl 3.value']],
+              expected_executed=[],
+              expected_info=dict(rounds=3, round_trips=4, queries=12))),
+        ('Run the queries of a failed batch one by one',
+         dict(pipeline=False, tids=[1, 2], expected=fetch_unbatched([1, 2]),
+              # Without the speculative queries, and then not batched.
+              expected_pipelines=[
+                  ['columns 1', 'columns 2', 'count 1', 'count 2'],
+                  ['columns 1', 'columns 2']],
+              expected_executed=[
+                  'columns 1', 'columns 2', 'acl 1.id', 'acl 1.name',
+                  'count 1', 'acl 2.id', 'count 2'],
+              expected_info=dict(rounds=2, round_trips=9, queries=7))),
+        ('Return the error, like without the batches',
+         dict(tids=[4], expected=[(False, 'invalid query: columns 4')],
+              expected_pipelines=[['columns 4', 'count 4'], ['columns 4']],
+              expected_executed=['columns 4'],
+              expected_info=dict(rounds=2, round_trips=3, queries=1))),
+        ('Do not fail because of the result of a query not run yet',
+         dict(fetch=staticmethod(fetch_first_column), tids=[1, 3],
+              expected=[{'name': 'id'}, {'name': 'id'}],
+              expected_pipelines=[['columns 1', 'columns 3']],
+              expected_executed=[],
+              expected_info=dict(rounds=2, round_trips=1, queries=2))),
+        ('Fetch the objects after the maximum rounds',
+         dict(options=dict(max_rounds=1), tids=[1, 2, 3],
+              expected=fetch_unbatched([1, 2, 3]),
+              expected_pipelines=[[
+                  'columns 1', 'columns 2', 'columns 3', 'count 1',
+                  'count 2', 'count 3']],
+              expected_executed=[
+                  'acl 1.id', 'acl 1.name', 'acl 2.id', 'acl 3.id',
+                  'acl 3.parent_id', 'acl 3.value'],
+              expected_info=dict(rounds=1, round_trips=7, queries=12))),
+        ('Send the batch again without the failing speculative queries',
+         dict(fetch=staticmethod(fetch_first_acl), tids=[1, 2],
+              expected=[[{'grantee': 'public', 'column': '1.id'}],
+                        [{'grantee': 'public', 'column': '2.id'}]],
+              expected_pipelines=[
+                  ['columns 1', 'columns 2', 'acl 1.', 'acl 2.'],
+                  ['columns 1', 'columns 2'],
+                  ['acl 1.id', 'acl 2.id']],
+              expected_executed=[],
+              expected_info=dict(rounds=3, round_trips=3, queries=4))),
+        ('Raise the exception of the fetch',
+         dict(fetch=staticmethod(fetch_missing_key), tids=[1],
+              expected=KeyError)),
+    ]
+
+    def setUp(self):
+        pass
+
+    def runTest(self):
+        conn = FakeConnection(pipeline=self.pipeline)
+        batch = BatchedFetch(**self.options)
+
+        def fetch(tid):
+            return self.fetch(conn, tid)
+
+        if self.expected is KeyError:
+            with self.assertRaises(KeyError):
+                batch.run(fetch, self.tids)
+            return
+
+        self.assertEqual(batch.run(fetch, self.tids), self.expected)
+        self.assertEqual(conn.pipelines, self.expected_pipelines)
+        self.assertEqual(conn.executed, self.expected_executed)
+        info = batch.info()
+        self.assertEqual(
+            dict((name, info[name]) for name in self.expected_info),
+            self.expected_info
+        )
+
+        # Not batched anymore.
+        del conn.executed[:]
+        self.assertEqual(conn.execute_dict('columns 2')[1]['rows'],
+                         [{'name': 'id'}])
+        self.assertEqual(conn.executed, ['columns 2'])
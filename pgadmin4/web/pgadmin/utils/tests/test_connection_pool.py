@@ -0,0 +1,293 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2025, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import threading
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from psycopg.pq import TransactionStatus
+
+import config
+from pgadmin.utils.driver.psycopg3.connection_pool import ConnectionPool, \
+    PoolTimeout, pool_key, poolable
+from pgadmin.utils.route import BaseTestGenerator
+
+
+class FakeConnection:
+    def __init__(self):
+        self.closed = False
+        self.info = SimpleNamespace(transaction_status=TransactionStatus.IDLE)
+
+    def close(self):
+        self.closed = True
+
+
+def fake_manager(**kwargs):
+    values = dict(host='localhost', port=5432, role=None,
+                  post_connection_sql=None, kerberos_conn=False,
+                  use_ssh_tunnel=0)
+    values.update(kwargs)
+    return SimpleNamespace(**values)
+
+
+def subset(info, expected):
+    return dict((name, info[name]) for name in expected)
+
+
+class PoolTestMixin:
+    """ Creates the pool for the connection pool tests, with the limits of
+    the scenario. """
+
+    max_size = 2
+
+    def setUp(self):
+        self.pool = ConnectionPool()
+        self.patches = [
+            patch.object(config, 'BROWSER_CONNECTION_POOL', True),
+            patch.object(config, 'BROWSER_CONNECTION_POOL_MAX_SIZE',
+                         self.max_size),
+            patch.object(config, 'BROWSER_CONNECTION_POOL_WAIT_TIMEOUT', 0.2),
+            patch.object(config, 'BROWSER_CONNECTION_POOL_IDLE_TIMEOUT', 60),
+        ]
+        for p in self.patches:
+            p.start()
+
+    def tearDown(self):
+        for p in reversed(self.patches):
+            p.stop()
+
+
+class TestConnectionPoolReuse(PoolTestMixin, BaseTestGenerator):
+    """ This class tests reusing the connections returned to the pool. """
+
+    scenarios = [
+        ('Reuse the returned connection',
+         dict(borrowed=2, returned='first', state=None,
+              expected_reused='first',
+              expected_info=dict(open=2, idle=0, borrowed=2, acquired=3,
+                                 created=2, reused=1, closed=0))),
+        ('Reuse the most recently returned connection first',
+         dict(borrowed=2, returned='both', state=None,
+              expected_reused='second',
+              expected_info=dict(open=2, idle=1, borrowed=1, acquired=3,
+                                 created=2, reused=1, closed=0))),
+        ('Open a new connection, when none is returned',
+         dict(borrowed=1, returned=None, state=None, expected_reused=None,
+              expected_info=dict(open=2, idle=0, borrowed=2, acquired=2,
+                                 created=2, reused=0, closed=0))),
+        ('Close the connection returned in a transaction',
+         dict(borrowed=1, returned='first', state='in_transaction',
+              expected_reused=None,
+              expected_info=dict(open=1, idle=0, borrowed=1, acquired=2,
+                                 created=2, reused=0, closed=1))),
+        ('Close the connection closed by the server, while idle',
+         dict(borrowed=1, returned='first', state='lost',
+              expected_reused=None,
+              expected_info=dict(open=1, idle=0, borrowed=1, acquired=2,
+                                 created=2, reused=0, closed=1))),
+        ('Close the connection not borrowed from the pool',
+         dict(borrowed=1, returned='other', state=None, expected_reused=None,
+              expected_info=dict(open=2, idle=0, borrowed=2, acquired=2,
+                                 created=2, reused=0, closed=0))),
+    ]
+
+    def runTest(self):
+        connections = dict()
+        for name in ('first', 'second')[:self.borrowed]:
+            connections[name], _ = self.pool.acquire('a', FakeConnection)
+        connections['other'] = FakeConnection()
+
+        if self.state == 'in_transaction':
+            connections['first'].info.transaction_status = \
+                TransactionStatus.INTRANS
+        if self.returned == 'both':
+            self.pool.release(connections['first'])
+            self.pool.release(connections['second'])
+        elif self.returned is not None:
+            self.pool.release(connections[self.returned])
+        if self.state == 'lost':
+            connections['first'].closed = True
+
+        conn, reused = self.pool.acquire('a', FakeConnection)
+
+        if self.expected_reused is None:
+            self.assertFalse(reused)
+            self.assertNotIn(conn, connections.values())
+        else:
+            self.assertTrue(reused)
+            self.assertIs(conn, connections[self.expected_reused])
+        if self.returned is not None and self.returned != 'both':
+            self.assertEqual(connections[self.returned].closed,
+                             self.expected_reused is None)
+        self.assertEqual(subset(self.pool.info(), self.expected_info),
+                         self.expected_info)
+
+
+class TestConnectionPoolFailedConnect(PoolTestMixin, BaseTestGenerator):
+    """ This class tests a failed connection attempt is not counted. """
+
+    scenarios = [
+        ('Do not count the failed connection attempt',
+         dict(error=RuntimeError('connection refused'),
+              expected_info=dict(open=0, borrowed=0))),
+    ]
+
+    def runTest(self):
+        def connect():
+            raise self.error
+
+        self.assertRaises(type(self.error), self.pool.acquire, 'a', connect)
+        self.assertEqual(subset(self.pool.info(), self.expected_info),
+                         self.expected_info)
+
+
+class TestConnectionPoolWait(PoolTestMixin, BaseTestGenerator):
+    """ This class tests waiting for a connection, once the limit of the
+    pool is reached. """
+
+    scenarios = [
+        ('Time out, when no connection is returned',
+         dict(max_size=2, other_keys=1, release_after=None,
+              expected_reused=False, expected_error=PoolTimeout,
+              expected_info=dict(waits=1, timeouts=1))),
+        ('Get the connection returned while waiting',
+         dict(max_size=2, other_keys=1, release_after=0.05,
+              expected_reused=True, expected_error=None,
+              expected_info=dict(waits=1, timeouts=0))),
+        ('Do not wait, below the limit',
+         dict(max_size=3, other_keys=0, release_after=None,
+              expected_reused=False, expected_error=None,
+              expected_info=dict(waits=0, timeouts=0))),
+    ]
+
+    def runTest(self):
+        first, _ = self.pool.acquire('a', FakeConnection)
+        self.pool.acquire('a', FakeConnection)
+        # Other keys have their own limit.
+        for key in range(self.other_keys):
+            self.pool.acquire(key, FakeConnection)
+
+        timer = None
+        if self.release_after is not None:
+            timer = threading.Timer(self.release_after, self.pool.release,
+                                    (first,))
+            timer.start()
+
+        try:
+            if self.expected_error is not None:
+                self.assertRaises(self.expected_error, self.pool.acquire,
+                                  'a', FakeConnection)
+            else:
+                conn, reused = self.pool.acquire('a', FakeConnection)
+                self.assertEqual(reused, self.expected_reused)
+                self.assertEqual(conn is first, self.expected_reused)
+        finally:
+            if timer is not None:
+                timer.join()
+
+        info = self.pool.info()
+        self.assertEqual(subset(info, self.expected_info),
+                         self.expected_info)
+        if self.expected_error is not None:
+            self.assertGreaterEqual(
+                info['max_wait_time'],
+                config.BROWSER_CONNECTION_POOL_WAIT_TIMEOUT)
+
+
+class TestConnectionPoolGC(PoolTestMixin, BaseTestGenerator):
+    """ This class tests closing the idle connections. """
+
+    scenarios = [
+        ('Keep the connections idle for less than the timeout',
+         dict(idle_timeout=None, clear=False, expected_closed=0,
+              expected_info=dict(keys=1, open=2, idle=1))),
+        ('Close the connections idle for longer than the timeout',
+         dict(idle_timeout=0, clear=False, expected_closed=1,
+              expected_info=dict(keys=1, open=1, idle=0))),
+        ('Close all the idle connections',
+         dict(idle_timeout=None, clear=True, expected_closed=1,
+              expected_info=dict(keys=1, open=1, idle=0))),
+    ]
+
+    def runTest(self):
+        idle, _ = self.pool.acquire('a', FakeConnection)
+        borrowed, _ = self.pool.acquire('a', FakeConnection)
+        self.pool.release(idle)
+
+        if self.clear:
+            closed = self.pool.clear()
+        else:
+            closed = self.pool.gc(idle_timeout=self.idle_timeout)
+
+        self.assertEqual(closed, self.expected_closed)
+        self.assertEqual(idle.closed, self.expected_closed > 0)
+        self.assertFalse(borrowed.closed)
+        self.assertEqual(subset(self.pool.info(), self.expected_info),
+                         self.expected_info)
+
+
+class TestConnectionPoolKey(BaseTestGenerator):
+    """ This class tests the connections are shared only between the
+    sessions using the same credentials, and settings. """
+
+    scenarios = [
+        ('Same server, and credentials',
+         dict(manager=dict(), role=None, connection_string='password=a',
+              expected_same=True)),
+        ('Another password',
+         dict(manager=dict(), role=None, connection_string='password=b',
+              expected_same=False)),
+        ('Another role',
+         dict(manager=dict(), role='reader', connection_string='password=a',
+              expected_same=False)),
+        ('Another post connection SQL',
+         dict(manager=dict(post_connection_sql='SET x = 1'), role=None,
+              connection_string='password=a', expected_same=False)),
+    ]
+
+    def runTest(self):
+        key = pool_key(fake_manager(), 'postgres', 'scott', None,
+                       'password=a')
+        self.assertNotIn('password=a', str(key))
+
+        other = pool_key(fake_manager(**self.manager), 'postgres', 'scott',
+                         self.role, self.connection_string)
+        self.assertEqual(key == other, self.expected_same)
+
+
+class TestConnectionPoolable(BaseTestGenerator):
+    """ This class tests which connections are borrowed from the pool. """
+
+    scenarios = [
+        ('Database connection', dict(
+            manager=dict(), conn_id='DB:postgres', async_=0, enabled=True,
+            expected=True)),
+        ('Query Tool connection', dict(
+            manager=dict(), conn_id='CONN:1234', async_=0, enabled=True,
+            expected=False)),
+        ('Asynchronous connection', dict(
+            manager=dict(), conn_id='DB:postgres', async_=1, enabled=True,
+            expected=False)),
+        ('Kerberos authentication', dict(
+            manager=dict(kerberos_conn=True), conn_id='DB:postgres',
+            async_=0, enabled=True, expected=False)),
+        ('SSH tunnel', dict(
+            manager=dict(use_ssh_tunnel=1), conn_id='DB:postgres', async_=0,
+            enabled=True, expected=False)),
+        ('Pool disabled', dict(
+            manager=dict(), conn_id='DB:postgres', async_=0, enabled=False,
+            expected=False)),
+    ]
+
+    def runTest(self):
+        with patch.object(config, 'BROWSER_CONNECTION_POOL', self.enabled):
+            self.assertEqual(
+                poolable(fake_manager(**self.manager), self.conn_id,
+                         self.async_),
+                self.expected)
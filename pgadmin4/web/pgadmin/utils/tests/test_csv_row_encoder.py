@@ -0,0 +1,65 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2025, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import datetime
+from decimal import Decimal
+from io import StringIO
+
+from pgadmin.utils import csv_lib as csv
+from pgadmin.utils.route import BaseTestGenerator
+
+ROWS = [
+    ('id', 'name', 'amount', 'created'),
+    (1, 'plain', Decimal('1.50'), datetime.date(2024, 1, 2)),
+    (2, 'with "double" quotes', 2.5, None),
+    (3, "with 'single' quotes", None, True),
+    (4, 'with, separator;', 0, ''),
+    (None, 'with\nnewline', -1, 'NULL'),
+]
+
+
+class TestCSVRowEncoder(BaseTestGenerator):
+    """ This class tests that RowEncoder generates the same output as the
+    Writer of csv_lib. """
+
+    scenarios = [
+        ('Quote non-numeric fields',
+         dict(fmtparams=dict(quoting=csv.QUOTE_NONNUMERIC))),
+        ('Quote all fields using the single quote',
+         dict(fmtparams=dict(quoting=csv.QUOTE_ALL, quotechar="'"))),
+        ('Quote no fields using the tab separator',
+         dict(fmtparams=dict(quoting=csv.QUOTE_NONE, delimiter='\t'))),
+        ('Quote non-numeric fields, and replace the nulls',
+         dict(fmtparams=dict(quoting=csv.QUOTE_NONNUMERIC,
+                             replace_nulls_with='NULL'))),
+        ('Quote all fields, and replace the nulls with an empty string',
+         dict(fmtparams=dict(quoting=csv.QUOTE_ALL, delimiter=';',
+                             replace_nulls_with=''))),
+    ]
+
+    def setUp(self):
+        pass
+
+    def runTest(self):
+        replace_nulls_with = self.fmtparams.get('replace_nulls_with')
+        res_io = StringIO()
+        csv.Writer(res_io, **self.fmtparams).writerows(
+            [replace_nulls_with if val is None else val for val in row]
+            for row in ROWS
+        )
+
+        encoder = csv.RowEncoder(**self.fmtparams)
+        self.assertEqual(
+            encoder.encode(ROWS[:1]) + encoder.encode(ROWS[1:]),
+            res_io.getvalue()
+        )
+
+        self.assertFalse(csv.RowEncoder.supports(csv.Dialect.combine(
+            'excel', dict(quoting=csv.QUOTE_MINIMAL)
+        )))
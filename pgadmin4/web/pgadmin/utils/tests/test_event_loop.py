@@ -0,0 +1,50 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2025, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import asyncio
+import threading
+
+from pgadmin.utils.driver.psycopg3.event_loop import run_coroutine, \
+    get_event_loop, close_event_loop
+from pgadmin.utils.route import BaseTestGenerator
+
+
+async def _current_loop():
+    return asyncio.get_running_loop()
+
+
+class TestPersistentEventLoop(BaseTestGenerator):
+    """ This class will test the per-thread event loop runner used by the
+    asynchronous psycopg3 cursor. """
+
+    scenarios = [
+        ('Reuse the same event loop within a thread', dict(scenario=1)),
+        ('Use a separate event loop for every thread', dict(scenario=2)),
+        ('Create a new event loop once closed', dict(scenario=3)),
+    ]
+
+    def runTest(self):
+        if self.scenario == 1:
+            first = run_coroutine(_current_loop())
+            second = run_coroutine(_current_loop())
+            self.assertIs(first, second)
+            self.assertIs(first, get_event_loop())
+        elif self.scenario == 2:
+            loops = []
+            thread = threading.Thread(
+                target=lambda: loops.append(run_coroutine(_current_loop()))
+            )
+            thread.start()
+            thread.join()
+            self.assertIsNot(loops[0], run_coroutine(_current_loop()))
+        elif self.scenario == 3:
+            first = run_coroutine(_current_loop())
+            close_event_loop()
+            self.assertTrue(first.is_closed())
+            self.assertIsNot(first, run_coroutine(_current_loop()))
@@ -0,0 +1,91 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2025, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import config
+from pgadmin.utils import lru_cache
+from pgadmin.utils.lru_cache import LRUCache
+from pgadmin.utils.route import BaseTestGenerator
+
+
+class TestLRUCache(BaseTestGenerator):
+    """ This class tests the bounded LRU cache. """
+
+    scenarios = [
+        ('Evict the least recently used entries',
+         dict(size=2, ttl=0,
+              operations=[('put', 'a', 1), ('put', 'b', 2), ('get', 'a', 1),
+                          ('put', 'c', 3), ('get', 'b', None),
+                          ('get', 'c', 3)],
+              expected_keys=['a', 'c'], hits=2, misses=1)),
+        ('Expire the entries after the ttl',
+         dict(size=2, ttl=10,
+              operations=[('put', 'a', 1), ('tick', 5, None),
+                          ('put', 'b', 2), ('tick', 6, None),
+                          ('get', 'a', None), ('get', 'b', 2)],
+              expected_keys=['b'], hits=1, misses=1)),
+        ('Forget the invalid entries',
+         dict(size=2, ttl=0,
+              operations=[('put', 'a', 1), ('get_valid', 'a', None),
+                          ('setdefault', 'a', 'created'),
+                          ('get', 'a', 'created')],
+              expected_keys=['a'], hits=1, misses=2)),
+        ('Forget the matching entries',
+         dict(size=4, ttl=0,
+              operations=[('put', (1, 'a'), 1), ('put', (2, 'b'), 2),
+                          ('put', (1, 'c'), 3),
+                          ('discard', 1, [(1, 'a'), (1, 'c')]),
+                          ('pop', (2, 'b'), 2)],
+              expected_keys=[], hits=0, misses=0)),
+        ('Store nothing, when disabled',
+         dict(size=0, ttl=0,
+              operations=[('put', 'a', 1), ('get', 'a', None),
+                          ('setdefault', 'a', 'created'),
+                          ('get', 'a', None)],
+              expected_keys=[], hits=0, misses=3)),
+    ]
+
+    def setUp(self):
+        self.now = 1000.0
+
+    def runTest(self):
+        cache = LRUCache('TEST_LRU_CACHE_SIZE', 'TEST_LRU_CACHE_TTL')
+        with patch.object(config, 'TEST_LRU_CACHE_SIZE', self.size,
+                          create=True), \
+                patch.object(config, 'TEST_LRU_CACHE_TTL', self.ttl,
+                             create=True), \
+                patch.object(lru_cache, 'time',
+                             SimpleNamespace(monotonic=lambda: self.now)):
+            for operation, key, value in self.operations:
+                if operation == 'put':
+                    cache.put(key, value)
+                elif operation == 'tick':
+                    self.now += key
+                elif operation == 'get':
+                    self.assertEqual(cache.get(key), value)
+                elif operation == 'get_valid':
+                    self.assertEqual(
+                        cache.get(key, valid=lambda value: False), value)
+                elif operation == 'setdefault':
+                    self.assertEqual(
+                        cache.setdefault(key, lambda: value), value)
+                elif operation == 'discard':
+                    self.assertEqual(
+                        cache.discard(lambda cache_key: cache_key[0] == key),
+                        value)
+                elif operation == 'pop':
+                    self.assertEqual(cache.pop(key), value)
+
+            self.assertEqual(list(cache._entries), self.expected_keys)
+            self.assertEqual(cache.info(), {
+                'hits': self.hits, 'misses': self.misses,
+                'size': len(self.expected_keys), 'max_size': self.size
+            })
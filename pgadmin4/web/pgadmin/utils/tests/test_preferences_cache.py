@@ -0,0 +1,86 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2025, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+from types import SimpleNamespace
+from unittest.mock import patch, MagicMock
+
+from flask import Flask
+
+import config
+from pgadmin.utils import lru_cache, preferences
+from pgadmin.utils.route import BaseTestGenerator
+
+
+class TestUserPreferenceCache(BaseTestGenerator):
+    """ This class will test the cache of the user preference values. """
+
+    scenarios = [
+        ('Memoize the preferences within a request',
+         dict(cache_size=0, ttl=5, requests=1, elapsed=0,
+              expected_value='old', expected_misses=1)),
+        ('Reload the preferences for every request, when not cached',
+         dict(cache_size=0, ttl=5, requests=2, elapsed=0,
+              expected_value='new', expected_misses=2)),
+        ('Reuse the preferences across the requests, without the ttl',
+         dict(cache_size=10, ttl=0, requests=2, elapsed=3600,
+              expected_value='old', expected_misses=1)),
+        ('Reuse the preferences saved by another process, within the ttl',
+         dict(cache_size=10, ttl=5, requests=2, elapsed=2,
+              expected_value='old', expected_misses=1)),
+        ('Reload the preferences saved by another process, after the ttl',
+         dict(cache_size=10, ttl=5, requests=2, elapsed=6,
+              expected_value='new', expected_misses=2)),
+    ]
+
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.cache = preferences._UserPreferenceCache()
+        self.now = 1000.0
+
+    def runTest(self):
+        rows = [SimpleNamespace(pid=1, value='old'),
+                SimpleNamespace(pid=2, value='True')]
+        user_pref_table = MagicMock()
+        user_pref_table.query.filter_by.return_value.all.side_effect = \
+            lambda: list(rows)
+
+        with patch.object(preferences, 'UserPrefTable', user_pref_table), \
+                patch.object(config, 'PREFERENCES_CACHE_SIZE',
+                             self.cache_size), \
+                patch.object(config, 'PREFERENCES_CACHE_TTL', self.ttl), \
+                patch.object(lru_cache, 'time',
+                             SimpleNamespace(monotonic=lambda: self.now)):
+            with self.app.app_context():
+                self.assertEqual(self.cache.get(1, 1), 'old')
+                self.assertEqual(self.cache.get(1, 2), 'True')
+                self.assertIsNone(self.cache.get(1, 3))
+
+                # Saved by another process.
+                rows[0] = SimpleNamespace(pid=1, value='new')
+                self.now += self.elapsed
+                if self.requests == 1:
+                    self.assertEqual(self.cache.get(1, 1),
+                                     self.expected_value)
+
+            if self.requests == 2:
+                with self.app.app_context():
+                    self.assertEqual(self.cache.get(1, 1),
+                                     self.expected_value)
+
+            self.assertEqual(self.cache.info()['misses'],
+                             self.expected_misses)
+            self.assertEqual(user_pref_table.query.filter_by.call_count,
+                             self.expected_misses)
+
+            # The values must be reloaded once invalidated.
+            self.cache.invalidate(1)
+            with self.app.app_context():
+                self.assertEqual(self.cache.get(1, 1), 'new')
+            self.assertEqual(self.cache.info()['misses'],
+                             self.expected_misses + 1)
@@ -0,0 +1,220 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2025, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import os
+import shutil
+import tempfile
+from types import SimpleNamespace
+from unittest.mock import patch, MagicMock
+
+from flask import Flask, session
+
+import config
+from pgadmin.model import db, Server
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.utils.driver.psycopg3 import server_cache as server_cache_module
+from pgadmin.utils.driver.psycopg3.latency import latency_counters
+from pgadmin.utils.driver.psycopg3.server_cache import ServerCache, \
+    known_servers
+from pgadmin.utils.driver.psycopg3.server_manager import ServerManager
+
+
+class FakeConnection:
+    def __init__(self, was_connected, connected, pooled=False,
+                 auto_reconnect=True):
+        self.wasConnected = was_connected
+        self.auto_reconnect = auto_reconnect
+        self.pooled = pooled
+        self.is_connected = connected
+
+    def connected(self):
+        return self.is_connected
+
+
+class TestServerCache(BaseTestGenerator):
+    """ This class tests the cache of the servers known to exist. """
+
+    scenarios = [
+        ('Cache the existing server',
+         dict(size=1, lookups=[1, 1], deleted=[], expected=[True, True],
+              expected_queries=1, expected_hits=1)),
+        ('Do not cache the missing server',
+         dict(size=1, lookups=[3, 3], deleted=[], expected=[False, False],
+              expected_queries=2, expected_hits=0)),
+        ('Forget the least recently used server',
+         dict(size=1, lookups=[1, 2, 1], deleted=[],
+              expected=[True, True, True], expected_queries=3,
+              expected_hits=0)),
+        ('Forget the deleted server',
+         dict(size=2, lookups=[1, 1], deleted=[1], expected=[True, False],
+              expected_queries=2, expected_hits=0)),
+        ('Query the configuration database every time, when disabled',
+         dict(size=0, lookups=[2, 2], deleted=[], expected=[True, True],
+              expected_queries=2, expected_hits=0)),
+    ]
+
+    def runTest(self):
+        rows = {1: SimpleNamespace(id=1), 2: SimpleNamespace(id=2)}
+        server = MagicMock()
+        server.query.filter_by.side_effect = lambda id: SimpleNamespace(
+            first=lambda: rows.get(id)
+        )
+        cache = ServerCache()
+
+        found = []
+        with patch.object(server_cache_module, 'Server', server), \
+                patch.object(config, 'SERVER_CACHE_SIZE', self.size):
+            for sid in self.lookups:
+                found.append(cache.exists(sid))
+                for deleted in self.deleted:
+                    rows.pop(deleted, None)
+                    cache.invalidate(deleted)
+
+        self.assertEqual(found, self.expected)
+        self.assertEqual(server.query.filter_by.call_count,
+                         self.expected_queries)
+        self.assertEqual(cache.info()['hits'], self.expected_hits)
+
+
+class TestServerCacheBulkStatements(BaseTestGenerator):
+    """ This class tests forgetting the servers changed by the bulk
+    statements of the ORM. """
+
+    scenarios = [
+        ('Forget the servers after a bulk delete',
+         dict(statement='delete', end='commit', expected_size=0,
+              expected_exists=False)),
+        ('Forget the servers after a bulk update',
+         dict(statement='update', end='commit', expected_size=0,
+              expected_exists=True)),
+        ('Forget the servers after a rolled back bulk delete',
+         dict(statement='delete', end='rollback', expected_size=0,
+              expected_exists=True)),
+        ('Keep the servers after a query',
+         dict(statement='select', end='commit', expected_size=1,
+              expected_exists=True)),
+    ]
+
+    def setUp(self):
+        self.data_dir = tempfile.mkdtemp()
+        self.app = Flask(__name__)
+        self.app.config['SQLALCHEMY_DATABASE_URI'] = \
+            'sqlite:///' + os.path.join(self.data_dir, 'pgadmin4.db')
+        self.app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {}
+        db.init_app(self.app)
+
+    def runTest(self):
+        with self.app.app_context(), \
+                patch.object(config, 'SERVER_CACHE_SIZE', 8):
+            db.create_all()
+            db.session.add(Server(
+                id=1, user_id=1, servergroup_id=1, name='adhoc',
+                host='localhost', port=5432, maintenance_db='postgres',
+                username='postgres', save_password=0, use_ssh_tunnel=0,
+                tunnel_authentication=0, shared=False, kerberos_conn=False,
+                is_adhoc=1))
+            db.session.commit()
+            known_servers.invalidate()
+            self.assertTrue(known_servers.exists(1))
+
+            query = db.session.query(Server).filter(Server.is_adhoc == 1)
+            if self.statement == 'delete':
+                query.delete()
+            elif self.statement == 'update':
+                query.update({Server.name: 'renamed'})
+            else:
+                query.all()
+            # Forgotten once the transaction ends.
+            self.assertEqual(known_servers.info()['size'], 1)
+            getattr(db.session, self.end)()
+
+            self.assertEqual(known_servers.info()['size'],
+                             self.expected_size)
+            self.assertEqual(known_servers.exists(1), self.expected_exists)
+            db.session.remove()
+
+    def tearDown(self):
+        known_servers.invalidate()
+        shutil.rmtree(self.data_dir, ignore_errors=True)
+
+
+class TestServerManagerSession(BaseTestGenerator):
+    """ This class tests writing the state of the connection manager to the
+    session, only when it has changed. """
+
+    scenarios = [
+        ('Write the state of a new manager',
+         dict(stored=None, state={'sid': 1, 'ver': '16'},
+              expected_written=True)),
+        ('Skip the unchanged state',
+         dict(stored={'sid': 1, 'ver': '16'}, state={'sid': 1, 'ver': '16'},
+              expected_written=False)),
+        ('Write the changed state',
+         dict(stored={'sid': 1, 'ver': '16'}, state={'sid': 1, 'ver': '17'},
+              expected_written=True)),
+        ('Remove the state of the disconnected manager',
+         dict(stored={'sid': 1, 'ver': '16'}, state=None,
+              expected_written=True)),
+        ('Skip the manager disconnected already',
+         dict(stored=None, state=None, expected_written=False)),
+    ]
+
+    def runTest(self):
+        app = Flask(__name__)
+        app.secret_key = 'secret'
+        manager = SimpleNamespace(sid=1, as_dict=lambda: self.state)
+        managers = dict() if self.stored is None else {1: self.stored}
+        latency_counters.reset()
+
+        with app.test_request_context():
+            session['__pgsql_server_managers'] = managers
+            session.modified = False
+            ServerManager.update_session(manager)
+            written = (session.modified,
+                       getattr(session, 'force_write', False))
+
+        self.assertEqual(written, (self.expected_written,) * 2)
+        self.assertEqual(managers.get(1), self.state)
+        self.assertEqual(
+            latency_counters.info()[
+                'session.write' if self.expected_written
+                else 'session.unchanged']['count'],
+            1)
+
+
+class TestServerManagerRestore(BaseTestGenerator):
+    """ This class tests the connections are restored, only when
+    required. """
+
+    scenarios = [
+        ('All the connections are connected',
+         dict(connection=dict(was_connected=True, connected=True),
+              expected=False)),
+        ('A connection is lost',
+         dict(connection=dict(was_connected=True, connected=False),
+              expected=True)),
+        ('A connection not to be reconnected is lost',
+         dict(connection=dict(was_connected=True, connected=False,
+                              auto_reconnect=False),
+              expected=False)),
+        ('A connection never connected',
+         dict(connection=dict(was_connected=False, connected=False),
+              expected=False)),
+        ('A pooled connection is returned',
+         dict(connection=dict(was_connected=True, connected=False,
+                              pooled=True),
+              expected=False)),
+    ]
+
+    def runTest(self):
+        manager = SimpleNamespace(connections={
+            'DB:postgres': FakeConnection(True, True),
+            'DB:other': FakeConnection(**self.connection),
+        })
+        self.assertEqual(ServerManager.needs_restore(manager), self.expected)
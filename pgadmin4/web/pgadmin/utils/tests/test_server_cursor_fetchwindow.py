@@ -0,0 +1,100 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2025, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+from unittest.mock import patch
+
+from pgadmin.utils.driver.psycopg3.cursor import AsyncDictCursor, \
+    AsyncDictServerCursor
+from pgadmin.utils.route import BaseTestGenerator
+
+TOTAL_ROWS = 10
+
+
+class FakeServerCursor:
+    """ Keeps the position of the cursor on the server, over the rows 0-9. """
+
+    def __init__(self):
+        self.rows = list(range(TOTAL_ROWS))
+        self.position = 0
+        self.fetched = []
+
+    def fetchwindow(self, cur, from_rownum, to_rownum, _tupples=False):
+        self.fetched.append((from_rownum, to_rownum))
+        self.position = min(to_rownum + 1, TOTAL_ROWS)
+        return self.rows[from_rownum:self.position]
+
+    def fetchmany(self, cur, size=None, _tupples=False):
+        res = self.rows[self.position:self.position + size]
+        self.position += len(res)
+        return res
+
+    def fetchone(self, cur):
+        return self.fetchmany(cur, 1)[0]
+
+    def scroll(self, cur, position, mode='absolute'):
+        self.position = position + (self.position if mode == 'relative'
+                                    else 0)
+
+
+class TestServerCursorFetchWindow(BaseTestGenerator):
+    """ This class tests the read-ahead of the server side cursor, and the
+    position of the cursor after the rows fetched from the buffer. """
+
+    scenarios = [
+        ('Fetch the next window from the buffer',
+         dict(calls=[('fetchwindow', 0, 2), ('fetchwindow', 3, 5)],
+              expected=[[0, 1, 2], [3, 4, 5]],
+              expected_fetched=[(0, 6)])),
+        ('Fetch the window beyond the buffer',
+         dict(calls=[('fetchwindow', 0, 2), ('fetchwindow', 6, 8)],
+              expected=[[0, 1, 2], [6, 7, 8]],
+              expected_fetched=[(0, 6), (6, 12)])),
+        ('Fetch many after the window',
+         dict(calls=[('fetchwindow', 0, 2), ('fetchmany', 2)],
+              expected=[[0, 1, 2], [3, 4]],
+              expected_fetched=[(0, 6)])),
+        ('Fetch one after the window from the buffer',
+         dict(calls=[('fetchwindow', 0, 2), ('fetchwindow', 3, 4),
+                     ('fetchone',)],
+              expected=[[0, 1, 2], [3, 4], 5],
+              expected_fetched=[(0, 6)])),
+        ('Scroll relative to the window',
+         dict(calls=[('fetchwindow', 0, 2), ('scroll', 1, 'relative'),
+                     ('fetchmany', 1)],
+              expected=[[0, 1, 2], None, [4]],
+              expected_fetched=[(0, 6)])),
+    ]
+
+    def setUp(self):
+        pass
+
+    def runTest(self):
+        server = FakeServerCursor()
+        cur = AsyncDictServerCursor.__new__(AsyncDictServerCursor)
+        cur._read_ahead = 4
+        cur._buffer_start = 0
+        cur._buffer = []
+        cur._position = 0
+        cur._total_rows = TOTAL_ROWS
+
+        with patch.object(AsyncDictCursor, 'fetchwindow',
+                          server.fetchwindow), \
+                patch.object(AsyncDictCursor, 'fetchmany',
+                             server.fetchmany), \
+                patch.object(AsyncDictCursor, 'fetchone', server.fetchone), \
+                patch.object(AsyncDictCursor, 'scroll', server.scroll):
+            results = [
+                getattr(cur, name)(*args, _tupples=True)
+                if name in ('fetchwindow', 'fetchmany')
+                else getattr(cur, name)(*args)
+                for name, *args in self.calls
+            ]
+
+        self.assertEqual(results, self.expected)
+        self.assertEqual(server.fetched, self.expected_fetched)
@@ -0,0 +1,49 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2025, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+from pgadmin.utils.driver.psycopg3.connection import get_server_cursor_query
+from pgadmin.utils.route import BaseTestGenerator
+
+
+class TestServerCursorQuery(BaseTestGenerator):
+    """ This class will test which queries can be executed using the server
+    side cursor in the query tool. """
+
+    scenarios = [
+        ('Single SELECT statement',
+         dict(query='SELECT * FROM pg_class;',
+              expected='SELECT * FROM pg_class')),
+        ('SELECT statement with trailing comments',
+         dict(query='SELECT 1; -- one\n/* two */\n',
+              expected='SELECT 1')),
+        ('SELECT statement with CTE',
+         dict(query='WITH a AS (SELECT 1) SELECT * FROM a',
+              expected='WITH a AS (SELECT 1) SELECT * FROM a')),
+        ('Semicolon inside a literal',
+         dict(query="SELECT ';' AS a;", expected="SELECT ';' AS a")),
+        ('Multiple statements',
+         dict(query='SELECT 1; SELECT 2;', expected=None)),
+        ('Data modifying statement',
+         dict(query='INSERT INTO t VALUES (1)', expected=None)),
+        ('Data modifying CTE',
+         dict(query='WITH d AS (DELETE FROM t RETURNING *) SELECT * FROM d',
+              expected=None)),
+        ('SELECT INTO',
+         dict(query='SELECT * INTO t2 FROM t', expected=None)),
+        ('SELECT with locking clause',
+         dict(query='SELECT * FROM t FOR UPDATE', expected=None)),
+        ('EXPLAIN statement',
+         dict(query='EXPLAIN SELECT 1', expected=None)),
+    ]
+
+    def setUp(self):
+        pass
+
+    def runTest(self):
+        self.assertEqual(get_server_cursor_query(self.query), self.expected)
@@ -0,0 +1,86 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2025, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import shutil
+import tempfile
+
+from flask import Flask
+
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.utils.session import DirectorySessionStore, \
+    KeyValueSessionManager, MemorySessionStore
+
+
+class TestKeyValueSessionManager(BaseTestGenerator):
+    """ This class tests storing the sessions in the key-value stores. """
+
+    scenarios = [
+        ('Store the sessions in the memory', dict(store_type='memory')),
+        ('Store the sessions in a directory', dict(store_type='directory')),
+    ]
+
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.path = tempfile.mkdtemp()
+        if self.store_type == 'memory':
+            self.store = MemorySessionStore()
+        else:
+            self.store = DirectorySessionStore(self.path)
+
+        self.updates = []
+        update = self.store.update
+
+        def record_update(sid, changed, removed):
+            self.updates.append((set(changed), set(removed)))
+            return update(sid, changed, removed)
+
+        self.store.update = record_update
+        self.manager = KeyValueSessionManager(self.store, 'secret', 0)
+
+    def tearDown(self):
+        shutil.rmtree(self.path, ignore_errors=True)
+
+    def runTest(self):
+        with self.app.test_request_context('/sqleditor/poll'):
+            session = self.manager.new_session()
+            session['_user_id'] = 1
+            session['gridData'] = {
+                '1': {'command_obj': b'one'},
+                '2': {'command_obj': b'two'},
+            }
+            self.manager.put(session)
+            self.assertTrue(self.manager.exists(session.sid))
+
+            # Only the changed transaction is written back.
+            session = self.manager.get(session.sid, session.hmac_digest)
+            self.assertEqual(session['_user_id'], 1)
+            self.assertEqual(list(session['gridData']), ['1', '2'])
+            session['gridData']['2'] = {'command_obj': b'changed'}
+            self.manager.put(session)
+            self.assertEqual(self.updates[-1], ({'gridData/2'}, set()))
+
+            # Closing a tab removes its transaction only.
+            session = self.manager.get(session.sid, session.hmac_digest)
+            self.assertEqual(session['gridData']['2'],
+                             {'command_obj': b'changed'})
+            del session['gridData']['1']
+            self.manager.put(session)
+            self.assertEqual(self.updates[-1], ({'gridData'}, {'gridData/1'}))
+
+            # Nothing changed, nothing to write.
+            self.manager.put(session)
+            self.assertEqual(len(self.updates), 3)
+
+            # A wrong digest gives a new session.
+            self.assertNotEqual(
+                self.manager.get(session.sid, 'wrong').sid, session.sid
+            )
+
+            self.manager.remove(session.sid)
+            self.assertFalse(self.manager.exists(session.sid))
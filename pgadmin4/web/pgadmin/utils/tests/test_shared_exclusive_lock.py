@@ -0,0 +1,53 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2025, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import threading
+
+from pgadmin.utils.locker import SharedExclusiveLock
+from pgadmin.utils.route import BaseTestGenerator
+
+
+class TestSharedExclusiveLock(BaseTestGenerator):
+    """ This class will test the lock used by the ConnectionLocker to let the
+    non Kerberos connections be established concurrently. """
+
+    scenarios = [
+        ('Shared owners do not block each other', dict(scenario=1)),
+        ('Exclusive owner waits for the shared owners', dict(scenario=2)),
+    ]
+
+    def setUp(self):
+        self.lock = SharedExclusiveLock()
+
+    def _run(self, target):
+        thread = threading.Thread(target=target)
+        thread.daemon = True
+        thread.start()
+        return thread
+
+    def runTest(self):
+        if self.scenario == 1:
+            self.lock.acquire_shared()
+            thread = self._run(self.lock.acquire_shared)
+            thread.join(5)
+            self.assertFalse(thread.is_alive())
+        elif self.scenario == 2:
+            acquired = threading.Event()
+
+            def acquire_exclusive():
+                self.lock.acquire_exclusive()
+                acquired.set()
+
+            self.lock.acquire_shared()
+            self._run(acquire_exclusive)
+            self.assertFalse(acquired.wait(0.2))
+
+            self.lock.release_shared()
+            self.assertTrue(acquired.wait(5))
+            self.lock.release_exclusive()
@@ -0,0 +1,124 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2025, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+from flask import Flask, url_for
+from werkzeug.routing import Map, Rule
+
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.utils.startup_profile import parse_importtime, group_importtime
+from pgadmin.utils.url_rule import LazyBuilderRule, lazy_builder_supported
+
+IMPORT_TIME = '''import time: self [us] | cumulative | imported package
+import time:       120 |        120 |     _io
+import time:        80 |        300 |   pgadmin.utils.ajax
+import time:      1500 |       1500 |     ldap3.core
+import time:       500 |       2000 |   ldap3
+import time:      1000 |       3300 | pgadmin.authenticate
+Not an import time line
+'''
+
+
+class TestLazyBuilderRule(BaseTestGenerator):
+    """ This class tests the URL rules compiling the URL builders on
+    demand build the same URLs as the werkzeug rules. """
+
+    scenarios = [
+        ('Build the URL without the arguments',
+         dict(rule='/browser/', values=dict(), append_unknown=True)),
+        ('Build the URL with the converters',
+         dict(rule='/obj/<int:gid>/<int:sid>/<path:name>',
+              values=dict(gid=1, sid=2, name='a/b c'),
+              append_unknown=True, path='/obj/1/2/a/b',
+              expected_match=dict(gid=1, sid=2, name='a/b'))),
+        ('Build the URL with the unknown arguments',
+         dict(rule='/sql/<int:sid>/<did>',
+              values=dict(sid=2, did='x', q='a'), append_unknown=True)),
+        ('Build the URL skipping the unknown arguments',
+         dict(rule='/sql/<int:sid>/<did>',
+              values=dict(sid=2, did='x', q='a'), append_unknown=False)),
+    ]
+
+    def runTest(self):
+        self.assertTrue(lazy_builder_supported())
+
+        lazy = Map([LazyBuilderRule(self.rule, endpoint='obj')])
+        eager = Map([Rule(self.rule, endpoint='obj')])
+        lazy_rule = lazy._rules_by_endpoint['obj'][0]
+        attr = '_build_unknown' if self.append_unknown else '_build'
+        self.assertEqual(getattr(lazy_rule, attr).__name__, '_lazy_build')
+
+        # Built once by the lazy builder, and then by the compiled one.
+        for _ in range(2):
+            self.assertEqual(
+                lazy.bind('localhost').build(
+                    'obj', self.values, append_unknown=self.append_unknown),
+                eager.bind('localhost').build(
+                    'obj', self.values, append_unknown=self.append_unknown)
+            )
+
+        # The compiled builder replaced the lazy one.
+        self.assertNotEqual(getattr(lazy_rule, attr).__name__,
+                            '_lazy_build')
+
+        if hasattr(self, 'path'):
+            self.assertEqual(lazy.bind('localhost').match(self.path),
+                             ('obj', self.expected_match))
+
+
+class TestLazyBuilderRuleFlask(BaseTestGenerator):
+    """ This class tests building the URLs of the lazy rules using Flask. """
+
+    scenarios = [
+        ('Build the URL', dict(values=dict(sid=1), expected='/obj/1')),
+        ('Build the URL with the query string',
+         dict(values=dict(sid=2, q='a'), expected='/obj/2?q=a')),
+        ('Build the external URL',
+         dict(values=dict(sid=3, _external=True),
+              expected='http://localhost/obj/3')),
+    ]
+
+    def runTest(self):
+        app = Flask(__name__)
+        app.url_rule_class = LazyBuilderRule
+        app.add_url_rule('/obj/<int:sid>', 'obj', lambda sid: str(sid))
+
+        with app.test_request_context():
+            self.assertEqual(url_for('obj', **self.values), self.expected)
+
+
+class TestImportTimeProfile(BaseTestGenerator):
+    """ This class tests the parsing, and grouping of the import time
+    profile. """
+
+    scenarios = [
+        ('Group the imports by the top level package',
+         dict(depth=1, expected=[
+             ('ldap3', 2000, 2), ('pgadmin', 1080, 2), ('_io', 120, 1)
+         ])),
+        ('Group the imports by the sub packages',
+         dict(depth=2, expected=[
+             ('ldap3.core', 1500, 1), ('pgadmin.authenticate', 1000, 1),
+             ('ldap3', 500, 1), ('_io', 120, 1),
+             ('pgadmin.utils', 80, 1)
+         ])),
+    ]
+
+    def runTest(self):
+        imports = parse_importtime(IMPORT_TIME)
+
+        self.assertEqual([
+            (entry.name, entry.self_us, entry.cumulative_us, entry.depth)
+            for entry in imports
+        ], [
+            ('_io', 120, 120, 2), ('pgadmin.utils.ajax', 80, 300, 1),
+            ('ldap3.core', 1500, 1500, 2), ('ldap3', 500, 2000, 1),
+            ('pgadmin.authenticate', 1000, 3300, 0)
+        ])
+        self.assertEqual(group_importtime(imports, self.depth),
+                         self.expected)
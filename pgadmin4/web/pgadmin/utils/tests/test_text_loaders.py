@@ -0,0 +1,58 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2025, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+from types import SimpleNamespace
+
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.utils.driver.psycopg3.typecast import TextLoaderpgAdmin, \
+    TextLoaderUTF8, TextLoaderSQLASCII
+
+
+def make_context(encoding):
+    connection = SimpleNamespace(
+        info=SimpleNamespace(encoding=encoding),
+        pgconn=SimpleNamespace(_encoding=encoding)
+    )
+    return SimpleNamespace(connection=connection)
+
+
+class TestTextLoaders(BaseTestGenerator):
+    """ This class tests the text loaders chosen for the encoding of the
+    connection. """
+
+    scenarios = [
+        ('UTF-8 connection', dict(
+            encoding='utf-8', loader_class=TextLoaderUTF8,
+            values=[(b'caf\xc3\xa9', 'café'), (b'bad \xff', 'bad \ufffd')]
+        )),
+        ('SQL_ASCII connection', dict(
+            encoding='raw-unicode-escape', loader_class=TextLoaderSQLASCII,
+            values=[(b'caf\xe9', 'café'), (b'\\u00e9', 'é')]
+        )),
+        ('LATIN1 connection', dict(
+            encoding='iso8859-1', loader_class=TextLoaderpgAdmin,
+            values=[(b'caf\xe9', 'café')]
+        )),
+        ('No connection', dict(
+            encoding=None, loader_class=TextLoaderUTF8,
+            values=[(b'caf\xc3\xa9', 'café')]
+        )),
+    ]
+
+    def setUp(self):
+        pass
+
+    def runTest(self):
+        context = make_context(self.encoding) if self.encoding else None
+        loader = TextLoaderpgAdmin(25, context)
+        self.assertIs(type(loader), self.loader_class)
+
+        for data, expected in self.values:
+            self.assertEqual(loader.load(data), expected)
+            self.assertEqual(loader.load(memoryview(data)), expected)
@@ -8,6 +8,7 @@
 ##########################################################################
 
 import os
+from unittest.mock import patch
 
 from flask import Flask
 from jinja2 import FileSystemLoader
@@ -42,6 +43,16 @@ class TestVersionedTemplateLoader(BaseTestGenerator):
             "Raise error when version is smaller than available templates",
             dict(scenario=5)
         ),
+        (
+            "Reuse the resolved template for the versions mapping to the "
+            "same directory",
+            dict(scenario=6)
+        ),
+        (
+            "Resolve the template again when the templates are reloaded on "
+            "change",
+            dict(scenario=7)
+        ),
     ]
 
     def setUp(self):
@@ -65,6 +76,14 @@ class TestVersionedTemplateLoader(BaseTestGenerator):
             # test_raise_not_found_exception_when_postgres_version_less_than_
             # all_available_sql_templates
             self.test_raise_not_found_exception()
+        if self.scenario == 6:
+            # test_get_source_when_the_version_is_13_again_does_not_probe_
+            # the_loaders
+            self.test_get_source_from_cache()
+        if self.scenario == 7:
+            # test_get_source_when_the_templates_are_auto_reloaded_probes_
+            # the_loaders_again
+            self.test_get_source_when_auto_reloaded()
 
     def test_get_source_returns_a_template(self):
         expected_content = "Some SQL" \
@@ -141,6 +160,57 @@ class TestVersionedTemplateLoader(BaseTestGenerator):
         except TemplateNotFound:
             return
 
+    def test_get_source_from_cache(self):
+        """Reuse the resolved template for the versions mapping to the same
+        directory"""
+        sql_path = os.path.join(
+            "some_feature", "sql", "12_plus", TEST_FILE_NAME
+        )
+        self.loader.get_source(
+            None, "some_feature/sql/#130000#/some_action.sql"
+        )
+
+        with patch.object(self.loader, '_iter_loaders') as iter_loaders:
+            content, filename, up_to_dateness = self.loader.get_source(
+                None, "some_feature/sql/#130500#/some_action.sql"
+            )
+            iter_loaders.assert_not_called()
+
+        self.assertEqual(
+            "Some 12 SQL\n", str(content).replace("\r", "")
+        )
+        self.assertIn(sql_path, filename)
+
+        self.assertRaises(
+            TemplateNotFound, self.loader.get_source,
+            None, "some_feature/sql/#10100#/some_action.sql"
+        )
+        with patch.object(self.loader, '_iter_loaders') as iter_loaders:
+            self.assertRaises(
+                TemplateNotFound, self.loader.get_source,
+                None, "some_feature/sql/#10100#/some_action.sql"
+            )
+            iter_loaders.assert_not_called()
+
+    def test_get_source_when_auto_reloaded(self):
+        """Resolve the template again, as it may have been added to another
+        version directory"""
+        self.loader.app.config['TEMPLATES_AUTO_RELOAD'] = True
+        self.loader.get_source(
+            None, "some_feature/sql/#130000#/some_action.sql"
+        )
+
+        with patch.object(self.loader, '_iter_loaders',
+                          wraps=self.loader._iter_loaders) as iter_loaders:
+            content, filename, up_to_dateness = self.loader.get_source(
+                None, "some_feature/sql/#130500#/some_action.sql"
+            )
+            iter_loaders.assert_called()
+
+        self.assertEqual(
+            "Some 12 SQL\n", str(content).replace("\r", "")
+        )
+
 
 class FakeApp(Flask):
     def __init__(self):
@@ -0,0 +1,47 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2025, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""
+URL rule compiling the URL builders on demand.
+"""
+
+from werkzeug.routing import Rule
+
+
+class LazyBuilderRule(Rule):
+    """
+    class LazyBuilderRule
+
+        Werkzeug compiles two URL builder functions (generated python code)
+        for every rule, when it is added to the URL map - which is most of the
+        application startup time, as only a fraction of the rules are ever
+        built (by url_for) in a worker.
+
+        This rule compiles the builder only when it is first used. The
+        matching of the requests is not affected.
+    """
+
+    def _compile_builder(self, append_unknown=True):
+        compile_builder = super()._compile_builder
+        attr = '_build_unknown' if append_unknown else '_build'
+
+        def _lazy_build(rule, **values):
+            build = compile_builder(append_unknown).__get__(rule, None)
+            setattr(rule, attr, build)
+            return build(**values)
+
+        return _lazy_build
+
+
+def lazy_builder_supported():
+    """
+    Returns True, when the installed version of Werkzeug compiles the URL
+    builders using Rule._compile_builder (i.e. LazyBuilderRule can be used).
+    """
+    return callable(getattr(Rule, '_compile_builder', None))
@@ -11,6 +11,32 @@ from jinja2 import TemplateNotFound
 
 
 class VersionedTemplateLoader(DispatchingJinjaLoader):
+    """
+    Loads the '<dir>/#<version>#/<file>' templates from the directory of the
+    highest version (see get_version_mapping_directories), which is not
+    greater than the given server version, and contains the template.
+
+    The template and the loader found for a version directory are
+    remembered, hence - the following lookups of the same template for any
+    server version mapping to the same directory do not probe the other
+    directories and loaders again (unless the templates are reloaded on
+    change).
+    """
+
+    def __init__(self, app):
+        super().__init__(app)
+        # (template dir, file name, version number) -> (loader, template
+        # path), or None when the template does not exist for the version.
+        self._resolved = dict()
+
+    def _auto_reload(self):
+        """
+        Returns True, when the templates are reloaded on change (see
+        TEMPLATES_AUTO_RELOAD, which defaults to the debug mode).
+        """
+        auto_reload = self.app.config['TEMPLATES_AUTO_RELOAD']
+        return self.app.debug if auto_reload is None else auto_reload
+
     def get_source(self, environment, template):
         specified_version_number, exists = parse_version(template)
         if not exists:
@@ -19,11 +45,63 @@ class VersionedTemplateLoader(DispatchingJinjaLoader):
             )
 
         template_dir, file_name = parse_template(template)
+        version_mappings = [
+            version_mapping
+            for version_mapping in get_version_mapping(template)
+            if version_mapping['number'] <= specified_version_number
+        ]
+
+        # Loading of the templates is being explained, do not skip any
+        # attempt. Do not remember the templates either, when they are
+        # reloaded on change (e.g. in the debug mode), as a template may be
+        # added to another version directory.
+        if self.app.config['EXPLAIN_TEMPLATE_LOADING'] or \
+                self._auto_reload():
+            return self._get_versioned_source(
+                environment, template, template_dir, file_name,
+                version_mappings
+            )
 
-        for version_mapping in get_version_mapping(template):
-            if version_mapping['number'] > specified_version_number:
-                continue
+        # All the versions mapping to the same directory get the same
+        # template.
+        key = (
+            template_dir, file_name,
+            version_mappings[0]['number'] if version_mappings else None
+        )
+        resolved = self._resolved.get(key, False)
+        if resolved is None:
+            raise TemplateNotFound(template)
+
+        if resolved is not False:
+            loader, template_path = resolved
+            try:
+                return loader.get_source(environment, template_path)
+            except TemplateNotFound:
+                # The template has been removed, resolve it again.
+                pass
+
+        for version_mapping in version_mappings:
+            template_path = '/'.join([
+                template_dir,
+                version_mapping['name'],
+                file_name
+            ])
+
+            for _, loader in self._iter_loaders(template_path):
+                try:
+                    source = loader.get_source(environment, template_path)
+                except TemplateNotFound:
+                    continue
+
+                self._resolved[key] = (loader, template_path)
+                return source
+
+        self._resolved[key] = None
+        raise TemplateNotFound(template)
 
+    def _get_versioned_source(self, environment, template, template_dir,
+                              file_name, version_mappings):
+        for version_mapping in version_mappings:
             template_path = '/'.join([
                 template_dir,
                 version_mapping['name'],
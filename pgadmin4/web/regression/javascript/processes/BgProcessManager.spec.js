@@ -11,7 +11,7 @@ import MockAdapter from 'axios-mock-adapter';
 import axios from 'axios';
 import pgAdmin from 'sources/pgadmin';
 import BgProcessManager from '../../../pgadmin/misc/bgprocess/static/js/BgProcessManager';
-import { BgProcessManagerProcessState } from '../../../pgadmin/misc/bgprocess/static/js/BgProcessConstants';
+import { BgProcessManagerEvents, BgProcessManagerProcessState } from '../../../pgadmin/misc/bgprocess/static/js/BgProcessConstants';
 import * as BgProcessNotify from '../../../pgadmin/misc/bgprocess/static/js/BgProcessNotify';
 
 
@@ -65,6 +65,25 @@ describe('BgProcessManager', ()=>{
   });
 
 
+  it('watchProcessLogs', async ()=>{
+    expect(obj.watchProcessLogs('12345', 0, 0, ()=>{/*This is intentional (SonarQube)*/})).toBeNull();
+
+    let emit = jest.fn();
+    let callback = jest.fn();
+    obj._socket = {emit: emit};
+    obj._socketConnected = true;
+    let stopWatching = obj.watchProcessLogs('12345', 10, 20, callback);
+    expect(emit).toHaveBeenCalledWith('subscribe', {pid: '12345', logs: true, out: 10, err: 20});
+
+    obj._eventManager.fireEvent(BgProcessManagerEvents.PROCESS_LOG, {pid: '12345'});
+    obj._eventManager.fireEvent(BgProcessManagerEvents.PROCESS_LOG, {pid: '54321'});
+    await new Promise((resolve)=>setTimeout(resolve, 0));
+    expect(callback).toHaveBeenCalledTimes(1);
+
+    stopWatching();
+    expect(emit).toHaveBeenCalledWith('unsubscribe', {pid: '12345', logs: true});
+  });
+
   it('stopProcess', (done)=>{
     obj._procList = [{
       id: '12345',
@@ -44,6 +44,7 @@ from pgadmin.utils import clear_database_servers, dump_database_servers, \
     load_database_servers, _handle_error
 from pgadmin.utils.session import cleanup_session_files
 from pgadmin.setup import db_upgrade, create_app_data_directory
+from pgadmin.utils.startup_profile import run_startup, group_importtime
 from typing import Optional, List
 from typing_extensions import Annotated
 from pgadmin.utils.constants import INTERNAL, LDAP, OAUTH2, \
@@ -647,6 +648,53 @@ class ManageSessions:
             cleanup_session_files()
 
 
+class ManageStartup:
+
+    @app.command()
+    def profile_startup(top: Optional[int] = 25,
+                        level: Optional[int] = 1,
+                        sqlite_path: Optional[str] = None):
+        """Profile the import time of the application startup."""
+        overrides = dict()
+        if sqlite_path is not None:
+            overrides['SQLITE_PATH'] = sqlite_path
+
+        try:
+            timings, imports = run_startup(
+                config.APP_NAME + '-cli', overrides, importtime=True)
+        except RuntimeError as e:
+            print(str(e))
+            raise typer.Exit(code=1)
+
+        table = Table(title="Slowest imports (cumulative)", box=box.ASCII)
+        table.add_column("Module", style="green")
+        table.add_column("Self (ms)", justify="right")
+        table.add_column("Cumulative (ms)", justify="right")
+        for entry in sorted(imports, key=lambda entry: entry.cumulative_us,
+                            reverse=True)[:top]:
+            table.add_row(entry.name,
+                          '{0:.1f}'.format(entry.self_us / 1000),
+                          '{0:.1f}'.format(entry.cumulative_us / 1000))
+        print(table)
+
+        table = Table(title="Import time by package (self)", box=box.ASCII)
+        table.add_column("Package", style="green")
+        table.add_column("Modules", justify="right")
+        table.add_column("Self (ms)", justify="right")
+        for package, self_us, count in group_importtime(imports,
+                                                        level)[:top]:
+            table.add_row(package, str(count),
+                          '{0:.1f}'.format(self_us / 1000))
+        print(table)
+
+        print('Modules imported: {0}'.format(len(imports)))
+        print('Import: {0:.3f}s, create_app: {1:.3f}s, total: {2:.3f}s '
+              '({3} blueprints, {4} routes)'.format(
+                  timings['import'], timings['create_app'],
+                  timings['total'], timings['blueprints'],
+                  timings['rules']))
+
+
 def main():
     app()
 